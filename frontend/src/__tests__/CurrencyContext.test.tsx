@@ -0,0 +1,32 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { render } from '@testing-library/react';
+
+vi.mock('react-redux', () => ({
+  useSelector: (select: (state: any) => unknown) => select({ auth: { isAuthenticated: true } }),
+}));
+vi.mock('../services/api', () => ({
+  default: { get: vi.fn() },
+}));
+
+import { CurrencyProvider, useCurrency } from '../context/CurrencyContext';
+import { RatesService } from '../services/analyticsService';
+
+const Price = () => {
+  const { format } = useCurrency();
+  return <span>{format(1)}</span>;
+};
+
+describe('CurrencyProvider', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it('loads rates only once something uses them', () => {
+    const ensureFresh = vi.spyOn(RatesService, 'ensureFresh').mockResolvedValue(RatesService.getTable());
+    const { rerender } = render(<CurrencyProvider><div /></CurrencyProvider>);
+    expect(ensureFresh).not.toHaveBeenCalled();
+
+    rerender(<CurrencyProvider><Price /><Price /></CurrencyProvider>);
+    expect(ensureFresh).toHaveBeenCalledTimes(1);
+  });
+});
@@ -0,0 +1,181 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { render, screen, fireEvent, waitFor, act } from '@testing-library/react';
+import { DataTable } from '../components/DataTable';
+import { exportRows, openExportSink } from '../utils/exportStream';
+
+vi.mock('../utils/exportStream', async (importOriginal) => ({
+  ...(await importOriginal<typeof import('../utils/exportStream')>()),
+  exportRows: vi.fn(),
+  openExportSink: vi.fn(),
+}));
+
+const sink = { write: vi.fn(), close: vi.fn(), abort: vi.fn(async () => undefined) };
+
+type Row = { id: number; name: string };
+
+const rows = (count: number): Row[] => Array.from({ length: count }, (_, i) => ({ id: i + 1, name: `Row ${i + 1}` }));
+const columns = [{ header: 'Name', accessor: 'name' as const, sortable: true }];
+
+describe('DataTable export', () => {
+  beforeEach(() => {
+    vi.mocked(exportRows).mockReset();
+    vi.mocked(openExportSink).mockResolvedValue(sink);
+  });
+
+  it('shows a failed export next to the export controls', async () => {
+    vi.mocked(exportRows).mockRejectedValue(new Error('Disk full'));
+    render(<DataTable data={rows(3)} columns={columns} enableExport />);
+
+    fireEvent.click(screen.getByText('Export CSV'));
+
+    expect(await screen.findByRole('alert')).toHaveTextContent('Disk full');
+    expect(screen.getByText('Export CSV')).toBeInTheDocument();
+  });
+
+  it('does not report a cancelled export', async () => {
+    vi.mocked(exportRows).mockRejectedValue(new DOMException('Cancelled', 'AbortError'));
+    render(<DataTable data={rows(3)} columns={columns} enableExport />);
+
+    fireEvent.click(screen.getByText('Export CSV'));
+
+    await waitFor(() => expect(exportRows).toHaveBeenCalled());
+    await screen.findByText('Export CSV');
+    expect(screen.queryByRole('alert')).not.toBeInTheDocument();
+  });
+});
+
+describe('DataTable virtualized', () => {
+  beforeEach(() => {
+    vi.stubGlobal('requestAnimationFrame', (callback: FrameRequestCallback) => {
+      callback(0);
+      return 1;
+    });
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  // Data rows only, not the spacer rows either side of the window
+  const mountedRows = (container: HTMLElement) => container.querySelectorAll('tbody tr:not([aria-hidden])');
+  const spacers = (container: HTMLElement) =>
+    Array.from(container.querySelectorAll<HTMLElement>('tbody tr[aria-hidden]')).map((row) => row.style.height);
+
+  it('mounts only the rows in view plus overscan', () => {
+    const { container } = render(
+      <DataTable data={rows(1000)} columns={columns} virtualized rowHeight={50} height={500} />
+    );
+
+    // 10 rows fill the viewport, 8 more below it
+    expect(mountedRows(container)).toHaveLength(18);
+    expect(mountedRows(container)[0]).toHaveTextContent('Row 1');
+    expect(spacers(container)).toEqual([`${(1000 - 18) * 50}px`]);
+  });
+
+  it('moves the window and its offsets on scroll', () => {
+    const { container } = render(
+      <DataTable data={rows(1000)} columns={columns} virtualized rowHeight={50} height={500} />
+    );
+
+    act(() => {
+      fireEvent.scroll(container.querySelector('.overflow-auto')!, { target: { scrollTop: 5000 } });
+    });
+
+    // Rows 101-110 are in view, with 8 rows of overscan either side
+    expect(mountedRows(container)).toHaveLength(26);
+    expect(mountedRows(container)[0]).toHaveTextContent('Row 93');
+    expect(spacers(container)).toEqual([`${92 * 50}px`, `${(1000 - 118) * 50}px`]);
+  });
+});
+
+describe('DataTable server-driven', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.mocked(exportRows).mockReset();
+    vi.mocked(openExportSink).mockReset().mockResolvedValue(sink);
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('debounces search before asking for a new query', () => {
+    const onQueryChange = vi.fn();
+    render(<DataTable data={rows(10)} columns={columns} onQueryChange={onQueryChange} totalCount={100} />);
+    act(() => {
+      vi.advanceTimersByTime(0);
+    });
+    expect(onQueryChange).toHaveBeenLastCalledWith({ page: 1, pageSize: 10, sort: null, search: '' });
+    onQueryChange.mockClear();
+
+    const input = screen.getByPlaceholderText('Search...');
+    fireEvent.change(input, { target: { value: 'r' } });
+    fireEvent.change(input, { target: { value: 'ro' } });
+    act(() => {
+      vi.advanceTimersByTime(299);
+    });
+    expect(onQueryChange).not.toHaveBeenCalled();
+
+    act(() => {
+      vi.advanceTimersByTime(1);
+    });
+    expect(onQueryChange).toHaveBeenCalledTimes(1);
+    expect(onQueryChange).toHaveBeenCalledWith({ page: 1, pageSize: 10, sort: null, search: 'ro' });
+  });
+
+  it('only offers export when every row can be fetched', () => {
+    render(<DataTable data={rows(10)} columns={columns} onQueryChange={vi.fn()} totalCount={100} enableExport />);
+
+    expect(screen.queryByText('Export CSV')).not.toBeInTheDocument();
+  });
+
+  it('exports every matching row, not just the loaded page', async () => {
+    vi.useRealTimers();
+    const everyRow = rows(100);
+    const onExportAll = vi.fn().mockResolvedValue(everyRow);
+    vi.mocked(exportRows).mockResolvedValue(undefined);
+    render(
+      <DataTable
+        data={rows(10)}
+        columns={columns}
+        onQueryChange={vi.fn()}
+        onExportAll={onExportAll}
+        totalCount={100}
+        enableExport
+      />
+    );
+
+    fireEvent.click(screen.getByText('Export CSV'));
+    // The save dialog opens within the click, before the rows are fetched
+    expect(openExportSink).toHaveBeenCalledWith('export.csv', expect.any(String));
+    expect(vi.mocked(openExportSink).mock.invocationCallOrder[0]).toBeLessThan(
+      onExportAll.mock.invocationCallOrder[0] ?? Infinity
+    );
+
+    await waitFor(() => expect(exportRows).toHaveBeenCalled());
+    expect(onExportAll).toHaveBeenCalledWith({ sort: null, search: '' }, expect.any(AbortSignal));
+    expect(vi.mocked(exportRows).mock.calls[0][0]).toBe(everyRow);
+    expect(vi.mocked(exportRows).mock.calls[0][2]).toMatchObject({ sink });
+  });
+
+  it('discards the opened file when the rows cannot be fetched', async () => {
+    vi.useRealTimers();
+    const onExportAll = vi.fn().mockRejectedValue(new Error('Server error'));
+    render(
+      <DataTable
+        data={rows(10)}
+        columns={columns}
+        onQueryChange={vi.fn()}
+        onExportAll={onExportAll}
+        totalCount={100}
+        enableExport
+      />
+    );
+
+    fireEvent.click(screen.getByText('Export CSV'));
+
+    expect(await screen.findByRole('alert')).toHaveTextContent('Server error');
+    expect(sink.abort).toHaveBeenCalled();
+    expect(exportRows).not.toHaveBeenCalled();
+  });
+});
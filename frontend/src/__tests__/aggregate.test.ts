@@ -0,0 +1,123 @@
+import { describe, it, expect } from 'vitest';
+import { aggregateColumns, concatColumns, parseColumnsPage, toColumns } from '../utils/aggregate';
+import { ComputePool, createAggregationChannel } from '../services/computePool';
+
+const rows = [
+  { account: 'cash', amount: 100, date: '2024-01-15' },
+  { account: 'bank', amount: 50, date: '2024-01-03' },
+  { account: 'cash', amount: -30, date: '2024-01-02' },
+  { account: 'cash', amount: 20, date: '2024-02-01' },
+  { account: 'bank', amount: '5', date: null },
+];
+
+const accessors = {
+  amount: (r: (typeof rows)[number]) => r.amount,
+  key: (r: (typeof rows)[number]) => r.account,
+  date: (r: (typeof rows)[number]) => r.date,
+};
+
+describe('aggregateColumns', () => {
+  it('sums per group and overall', () => {
+    const { columns, keys } = toColumns(rows, accessors);
+    const result = aggregateColumns(columns, { groupSums: true });
+    expect(keys).toEqual(['cash', 'bank']);
+    expect(Array.from(result.groupSums!)).toEqual([90, 55]);
+    expect(Array.from(result.groupCounts!)).toEqual([3, 2]);
+    expect(result.total).toBe(145);
+  });
+
+  it('computes running balances per group in date order', () => {
+    const { columns } = toColumns(rows, accessors);
+    const result = aggregateColumns(columns, { runningBalance: true });
+    // cash: -30 (Jan 2), +100 (Jan 15), +20 (Feb 1); bank: 50, then the undated 5
+    expect(Array.from(result.runningBalance!)).toEqual([70, 50, -30, 90, 55]);
+  });
+
+  it('buckets dated rows by period, with per-group sums', () => {
+    const { columns } = toColumns(rows, accessors);
+    const { periods } = aggregateColumns(columns, { period: 'month', groupSums: true });
+    expect(Array.from(periods!.starts)).toEqual([Date.UTC(2024, 0, 1), Date.UTC(2024, 1, 1)]);
+    expect(Array.from(periods!.sums)).toEqual([120, 20]);
+    expect(Array.from(periods!.counts)).toEqual([3, 1]);
+    expect(Array.from(periods!.groupSums!)).toEqual([70, 50, 20, 0]);
+  });
+
+  it('parses a JSON page into columns and joins pages by key', () => {
+    const fields = { amount: 'amount', key: 'account', date: 'date' };
+    const first = parseColumnsPage(JSON.stringify({ results: rows.slice(0, 2), next: '/rows/?page=2' }), fields);
+    const second = parseColumnsPage(JSON.stringify(rows.slice(2)), fields);
+    expect(first.next).toBe('/rows/?page=2');
+    expect(second.next).toBeNull();
+    expect(second.keys).toEqual(['cash', 'bank']);
+
+    const { columns, keys } = concatColumns([first, second]);
+    const result = aggregateColumns(columns, { groupSums: true });
+    expect(keys).toEqual(['cash', 'bank']);
+    expect(Array.from(result.groupSums!)).toEqual([90, 55]);
+  });
+});
+
+class FakeWorker {
+  static created: FakeWorker[] = [];
+  onmessage: ((event: MessageEvent) => void) | null = null;
+  onerror: ((event: ErrorEvent) => void) | null = null;
+  posted: any[] = [];
+  terminated = false;
+
+  constructor() {
+    FakeWorker.created.push(this);
+  }
+
+  postMessage(message: any) {
+    this.posted.push(message);
+  }
+
+  terminate() {
+    this.terminated = true;
+  }
+
+  reply(index = 0) {
+    const { id, columns, request } = this.posted[index];
+    this.onmessage?.({ data: { id, result: aggregateColumns(columns, request) } } as MessageEvent);
+  }
+}
+
+const fakePool = (size: number) => {
+  FakeWorker.created = [];
+  return new ComputePool(() => new FakeWorker() as unknown as Worker, size);
+};
+
+describe('ComputePool', () => {
+  it('queues jobs beyond the pool size and runs them as workers free up', async () => {
+    const pool = fakePool(1);
+    const first = pool.run(toColumns(rows, accessors).columns, { groupSums: true }, { useWorker: true });
+    const second = pool.run(toColumns(rows, accessors).columns, { groupSums: true }, { useWorker: true });
+
+    const [worker] = FakeWorker.created;
+    expect(worker.posted).toHaveLength(1);
+    worker.reply(0);
+    expect((await first).total).toBe(145);
+    expect(worker.posted).toHaveLength(2);
+    worker.reply(1);
+    expect((await second).total).toBe(145);
+  });
+
+  it('drops superseded jobs from a channel and replaces a busy worker', async () => {
+    const pool = fakePool(1);
+    const channel = createAggregationChannel(pool);
+    const stale = channel.run(toColumns(rows, accessors).columns, {}, { useWorker: true });
+    const latest = channel.run(toColumns(rows, accessors).columns, {}, { useWorker: true });
+
+    await expect(stale).rejects.toMatchObject({ name: 'AbortError' });
+    expect(FakeWorker.created[0].terminated).toBe(true);
+    FakeWorker.created[1].reply(0);
+    expect((await latest).total).toBe(145);
+  });
+
+  it('aggregates small inputs inline', async () => {
+    const pool = fakePool(2);
+    const result = await pool.run(toColumns(rows, accessors).columns, { groupSums: true }, { useWorker: false });
+    expect(result.total).toBe(145);
+    expect(FakeWorker.created).toHaveLength(0);
+  });
+});
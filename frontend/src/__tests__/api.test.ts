@@ -0,0 +1,45 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import type { InternalAxiosRequestConfig } from 'axios';
+import api, { authTokens } from '../services/api';
+
+// Answers every request locally and records the headers it was sent with
+const capture = () =>
+  vi.fn(async (config: InternalAxiosRequestConfig) => ({ data: {}, status: 200, statusText: 'OK', headers: {}, config }));
+
+const sentAuthorization = (adapter: ReturnType<typeof capture>) =>
+  adapter.mock.calls[0][0].headers.Authorization;
+
+describe('api auth header', () => {
+  afterEach(() => {
+    delete api.defaults.headers.common.Authorization;
+    authTokens.clear();
+  });
+
+  it('sends the current access token', async () => {
+    authTokens.set('fresh-token');
+    const adapter = capture();
+
+    await api.get('/users/me/', { adapter });
+
+    expect(sentAuthorization(adapter)).toBe('Bearer fresh-token');
+  });
+
+  it('does not let a default header shadow the current token', async () => {
+    api.defaults.headers.common.Authorization = 'Bearer stale-token';
+    authTokens.set('fresh-token');
+    const adapter = capture();
+
+    await api.get('/users/me/', { adapter });
+
+    expect(sentAuthorization(adapter)).toBe('Bearer fresh-token');
+  });
+
+  it('keeps an explicit per-request header', async () => {
+    authTokens.set('fresh-token');
+    const adapter = capture();
+
+    await api.get('/users/me/', { adapter, headers: { Authorization: 'Bearer explicit-token' } });
+
+    expect(sentAuthorization(adapter)).toBe('Bearer explicit-token');
+  });
+});
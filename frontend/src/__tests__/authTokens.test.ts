@@ -0,0 +1,92 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { AuthTokens, tokenExpiry } from '../services/authTokens';
+
+const jwt = (exp: number) => `header.${btoa(JSON.stringify({ exp }))}.signature`;
+
+const inSeconds = (seconds: number) => Math.floor(Date.now() / 1000) + seconds;
+
+describe('tokenExpiry', () => {
+  it('reads exp from the JWT payload', () => {
+    expect(tokenExpiry(jwt(1700000000))).toBe(1700000000 * 1000);
+    expect(tokenExpiry('not-a-jwt')).toBeNull();
+    expect(tokenExpiry(null)).toBeNull();
+  });
+});
+
+describe('AuthTokens', () => {
+  beforeEach(() => {
+    localStorage.clear();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('shares one refresh between concurrent callers', async () => {
+    let resolve!: (value: { access: string }) => void;
+    const refresh = vi.fn(() => new Promise<{ access: string }>((r) => (resolve = r)));
+    const tokens = new AuthTokens({ refresh });
+    tokens.set(jwt(inSeconds(3600)), 'refresh-1');
+
+    const calls = [tokens.refresh(), tokens.refresh(), tokens.refresh()];
+    expect(tokens.isRefreshing).toBe(true);
+    resolve({ access: 'renewed' });
+
+    expect(await Promise.all(calls)).toEqual(['renewed', 'renewed', 'renewed']);
+    expect(refresh).toHaveBeenCalledTimes(1);
+    expect(refresh).toHaveBeenCalledWith('refresh-1');
+    expect(tokens.isRefreshing).toBe(false);
+    expect(localStorage.getItem('access')).toBe('renewed');
+  });
+
+  it('renews shortly before the token expires', async () => {
+    vi.useFakeTimers();
+    const refresh = vi.fn(async () => ({ access: jwt(inSeconds(3600)) }));
+    const tokens = new AuthTokens({ refresh, leewayMs: 60 * 1000 });
+    tokens.set(jwt(inSeconds(300)), 'refresh-1');
+
+    expect(tokens.expiresSoon()).toBe(false);
+    await vi.advanceTimersByTimeAsync(230 * 1000);
+    expect(refresh).not.toHaveBeenCalled();
+    expect(tokens.expiresSoon()).toBe(true);
+
+    await vi.advanceTimersByTimeAsync(10 * 1000);
+    expect(refresh).toHaveBeenCalledTimes(1);
+    expect(tokens.expiresSoon()).toBe(false);
+  });
+
+  it('waits out tokens that expire beyond the longest timer delay', async () => {
+    vi.useFakeTimers();
+    const refresh = vi.fn(async () => ({ access: jwt(inSeconds(3600)) }));
+    const tokens = new AuthTokens({ refresh, leewayMs: 60 * 1000 });
+    const day = 24 * 60 * 60;
+    tokens.set(jwt(inSeconds(30 * day)), 'refresh-1');
+
+    await vi.advanceTimersByTimeAsync(60 * 1000);
+    expect(refresh).not.toHaveBeenCalled();
+    await vi.advanceTimersByTimeAsync((29 * day - 60) * 1000);
+    expect(refresh).not.toHaveBeenCalled();
+
+    await vi.advanceTimersByTimeAsync(day * 1000);
+    expect(refresh).toHaveBeenCalledTimes(1);
+  });
+
+  it('notifies listeners and stops renewing once cleared', async () => {
+    vi.useFakeTimers();
+    const refresh = vi.fn(async () => ({ access: 'renewed' }));
+    const tokens = new AuthTokens({ refresh });
+    const listener = vi.fn();
+    tokens.subscribe(listener);
+
+    const access = jwt(inSeconds(120));
+    tokens.set(access, 'refresh-1');
+    tokens.clear();
+    await vi.advanceTimersByTimeAsync(120 * 1000);
+
+    expect(listener.mock.calls.map(([access]) => access)).toEqual([access, null]);
+    expect(refresh).not.toHaveBeenCalled();
+    expect(tokens.canRefresh).toBe(false);
+    expect(localStorage.getItem('access')).toBeNull();
+    await expect(tokens.refresh()).rejects.toThrow('No refresh token');
+  });
+});
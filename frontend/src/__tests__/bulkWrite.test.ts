@@ -0,0 +1,101 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+vi.mock('../services/api', () => ({ default: { post: vi.fn() } }));
+
+import api from '../services/api';
+import { bulkWrite, resumableBulkJob } from '../services/bulkWrite';
+import { csvRecords, parseCsv } from '../utils/csvImport';
+
+const post = api.post as unknown as ReturnType<typeof vi.fn>;
+
+const httpError = (status: number) =>
+  Object.assign(new Error(`HTTP ${status}`), { response: { status, data: { detail: 'nope' } } });
+
+const rows = (count: number) => Array.from({ length: count }, (_, i) => ({ sku: `SKU-${i}` }));
+
+describe('bulkWrite', () => {
+  beforeEach(() => {
+    post.mockReset();
+    localStorage.clear();
+  });
+
+  it('sends chunks to the bulk route and maps row failures to input indexes', async () => {
+    post.mockImplementation(async (_url: string, body: { items: any[] }) => ({
+      data: {
+        results: body.items.map((item, index) =>
+          item.sku === 'SKU-7' ? { index, errors: { sku: ['duplicate'] } } : { index, id: index }
+        ),
+      },
+    }));
+
+    const progress = vi.fn();
+    const result = await bulkWrite('/products/', rows(10), { chunkSize: 4, onProgress: progress });
+
+    expect(post).toHaveBeenCalledTimes(3);
+    expect(post.mock.calls.every(([url]) => url === '/products/bulk/')).toBe(true);
+    expect(new Set(post.mock.calls.map(([, , config]) => config.headers['Idempotency-Key'])).size).toBe(3);
+    expect(result).toEqual({
+      succeeded: 9,
+      failed: [{ index: 7, error: 'sku: duplicate' }],
+      resumed: 0,
+      interrupted: false,
+    });
+    expect(progress).toHaveBeenLastCalledWith(expect.objectContaining({ done: 10, chunksDone: 3, failed: 1 }));
+  });
+
+  it('resumes an interrupted job without resending completed chunks', async () => {
+    post.mockImplementation(async (_url: string, body: { items: any[] }) => {
+      if (body.items[0].sku === 'SKU-4') throw httpError(400);
+      return { data: { results: body.items.map((_, index) => ({ index, id: index })) } };
+    });
+
+    const first = await bulkWrite('/items/', rows(8), { chunkSize: 4, concurrency: 1, jobId: 'items.csv' });
+    expect(first.interrupted).toBe(true);
+    expect(resumableBulkJob('items.csv')).toEqual({ done: 4, total: 8 });
+
+    post.mockClear();
+    post.mockImplementation(async (_url: string, body: { items: any[] }) => ({
+      data: { results: body.items.map((_, index) => ({ index, id: index })) },
+    }));
+    const second = await bulkWrite('/items/', rows(8), { chunkSize: 4, jobId: 'items.csv' });
+
+    expect(post).toHaveBeenCalledTimes(1);
+    expect(post.mock.calls[0][1].items[0].sku).toBe('SKU-4');
+    expect(second).toMatchObject({ succeeded: 8, resumed: 4, interrupted: false });
+    expect(resumableBulkJob('items.csv')).toBeNull();
+  });
+
+  it('falls back to one POST per row when the bulk route is missing', async () => {
+    post.mockImplementation(async (url: string, body: any) => {
+      if (url.endsWith('bulk/')) throw httpError(404);
+      if (body.sku === 'SKU-1') throw httpError(400);
+      return { data: { id: 1 } };
+    });
+
+    const result = await bulkWrite('/customers/', rows(3));
+
+    expect(post.mock.calls.filter(([url]) => url === '/customers/')).toHaveLength(3);
+    expect(result.succeeded).toBe(2);
+    expect(result.failed).toEqual([{ index: 1, error: 'nope' }]);
+
+    post.mockClear();
+    await bulkWrite('/customers/', rows(1));
+    expect(post.mock.calls.map(([url]) => url)).toEqual(['/customers/']);
+  });
+});
+
+describe('csvImport', () => {
+  it('handles quotes, embedded newlines and CRLF', () => {
+    expect(parseCsv('a,"b ""x""",c\r\n1,"two\nlines",3\r\n')).toEqual([
+      ['a', 'b "x"', 'c'],
+      ['1', 'two\nlines', '3'],
+    ]);
+  });
+
+  it('keys records by snake_case headers and skips blank lines', () => {
+    expect(csvRecords('\uFEFFProduct Code,Unit Price\nA1,2.50\n\nB2,3\n')).toEqual([
+      { product_code: 'A1', unit_price: '2.50' },
+      { product_code: 'B2', unit_price: '3' },
+    ]);
+  });
+});
@@ -0,0 +1,63 @@
+import { describe, it, expect } from 'vitest';
+import { CatalogIndex } from '../utils/catalogIndex';
+
+type Item = { id: number; name: string; barcode?: string; category?: string };
+
+const createIndex = () =>
+  new CatalogIndex<Item>({
+    getId: (item) => item.id,
+    getCodes: (item) => [item.barcode],
+    getText: (item) => [item.name],
+    getCategory: (item) => item.category,
+  });
+
+const items: Item[] = [
+  { id: 1, name: 'Coca-Cola 500ml', barcode: '6001234000011', category: 'Drinks' },
+  { id: 2, name: 'Cooking Oil 2L', barcode: '6001234000028', category: 'Groceries' },
+  { id: 3, name: 'Bread Loaf', barcode: 'BRD-01', category: 'Bakery' },
+  { id: 4, name: 'Gift Card' },
+];
+
+describe('CatalogIndex', () => {
+  it('finds items by exact barcode regardless of case and whitespace', () => {
+    const index = createIndex();
+    index.sync(items);
+    expect(index.lookupCode('6001234000028')?.id).toBe(2);
+    expect(index.lookupCode(' brd-01 ')?.id).toBe(3);
+    expect(index.lookupCode('600123')).toBeUndefined();
+  });
+
+  it('matches every search word as a token prefix, in catalogue order', () => {
+    const index = createIndex();
+    index.sync(items);
+    expect(index.search('co').map((i) => i.id)).toEqual([1, 2]);
+    expect(index.search('cola 500').map((i) => i.id)).toEqual([1]);
+    expect(index.search('600123').map((i) => i.id)).toEqual([1, 2]);
+    expect(index.search('oil bread')).toEqual([]);
+  });
+
+  it('filters by category and lists uncategorised items everywhere', () => {
+    const index = createIndex();
+    index.sync(items);
+    expect(index.search('', 'drinks').map((i) => i.id)).toEqual([1, 4]);
+    expect(index.search('c', 'Groceries').map((i) => i.id)).toEqual([2, 4]);
+    expect(index.search('', 'all')).toHaveLength(4);
+  });
+
+  it('re-indexes only changed items on sync', () => {
+    const index = createIndex();
+    index.sync(items);
+    const version = index.version;
+
+    index.sync([...items]);
+    expect(index.version).toBe(version);
+
+    const renamed = { ...items[2], name: 'Brown Bread', barcode: 'BRD-02' };
+    index.sync([items[0], items[1], renamed]);
+    expect(index.lookupCode('BRD-01')).toBeUndefined();
+    expect(index.lookupCode('BRD-02')).toBe(renamed);
+    expect(index.search('brown').map((i) => i.id)).toEqual([3]);
+    expect(index.search('gift')).toEqual([]);
+    expect(index.size).toBe(3);
+  });
+});
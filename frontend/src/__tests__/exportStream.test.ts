@@ -0,0 +1,66 @@
+import { describe, it, expect, vi } from 'vitest';
+import { csvChunks, xlsxChunks, exportRows, isAbortError } from '../utils/exportStream';
+
+const decoder = new TextDecoder();
+const columns = [
+  { header: 'Name', key: 'name' },
+  { header: 'Qty', key: 'qty' },
+];
+const rows = Array.from({ length: 25 }, (_, i) => ({ name: `Item "${i}"`, qty: i }));
+
+describe('exportStream', () => {
+  it('encodes CSV in row chunks with quoted cells', () => {
+    const chunks = Array.from(csvChunks(rows, columns, 10));
+    expect(chunks.map((c) => c.rows)).toEqual([0, 10, 20, 25]);
+
+    const lines = chunks.map((c) => decoder.decode(c.data)).join('').split('\n');
+    expect(lines).toHaveLength(26);
+    expect(lines[0]).toBe('Name,Qty');
+    expect(lines[1]).toBe('"Item ""0""","0"');
+  });
+
+  it('writes empty cells for missing values', () => {
+    const text = Array.from(csvChunks([{ name: null }], columns))
+      .map((c) => decoder.decode(c.data))
+      .join('');
+    expect(text.split('\n')[1]).toBe('"",""');
+  });
+
+  it('produces a zip archive with the worksheet rows for XLSX', () => {
+    const parts = Array.from(xlsxChunks(rows, columns, 10)).map((c) => c.data);
+    const bytes = new Uint8Array(parts.reduce((n, p) => n + p.length, 0));
+    parts.reduce((offset, p) => (bytes.set(p, offset), offset + p.length), 0);
+
+    const view = new DataView(bytes.buffer);
+    expect(view.getUint32(0, true)).toBe(0x04034b50);
+    expect(view.getUint32(bytes.length - 22, true)).toBe(0x06054b50);
+    expect(view.getUint16(bytes.length - 12, true)).toBe(5);
+
+    const text = decoder.decode(bytes);
+    expect(text).toContain('xl/worksheets/sheet1.xml');
+    expect(text).toContain('<t xml:space="preserve">Item &quot;24&quot;</t>');
+    expect(text).toContain('<c><v>24</v></c>');
+  });
+
+  it('reports progress and stops when aborted', async () => {
+    const createObjectURL = vi.fn(() => 'blob:export');
+    vi.stubGlobal('URL', Object.assign(URL, { createObjectURL, revokeObjectURL: vi.fn() }));
+    const controller = new AbortController();
+    const progress: number[] = [];
+
+    const result = exportRows(rows, columns, {
+      chunkSize: 5,
+      signal: controller.signal,
+      onProgress: ({ rows: written }) => {
+        progress.push(written);
+        if (written >= 10) controller.abort();
+      },
+    });
+
+    const error = await result.catch((e) => e);
+    expect(isAbortError(error)).toBe(true);
+    expect(progress).toEqual([0, 5, 10]);
+    expect(createObjectURL).not.toHaveBeenCalled();
+    vi.unstubAllGlobals();
+  });
+});
@@ -0,0 +1,35 @@
+import { bench, describe } from 'vitest';
+import { formatCurrency, formatCurrencyMany, formatDate } from '../utils/formatters';
+
+// One 100k-cell render: 20k rows x 5 money columns
+const CELLS = 100_000;
+const amounts = Float64Array.from({ length: CELLS }, (_, i) => (i * 7919) % 1_000_000 / 100);
+const dates = Array.from({ length: CELLS / 10 }, (_, i) => new Date(Date.UTC(2024, 0, 1 + (i % 365))));
+
+describe('currency cells (100k)', () => {
+  bench('new Intl.NumberFormat per cell', () => {
+    for (let i = 0; i < CELLS; i++) {
+      new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD' }).format(amounts[i]);
+    }
+  });
+
+  bench('formatCurrency (cached)', () => {
+    for (let i = 0; i < CELLS; i++) formatCurrency(amounts[i]);
+  });
+
+  bench('formatCurrencyMany (column)', () => {
+    formatCurrencyMany(amounts);
+  });
+});
+
+describe('date cells (10k)', () => {
+  bench('new Intl.DateTimeFormat per cell', () => {
+    for (const date of dates) {
+      new Intl.DateTimeFormat('en-US', { year: 'numeric', month: 'long', day: 'numeric' }).format(date);
+    }
+  });
+
+  bench('formatDate (cached)', () => {
+    for (const date of dates) formatDate(date);
+  });
+});
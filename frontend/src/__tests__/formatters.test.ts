@@ -1,5 +1,14 @@
 import { describe, it, expect } from 'vitest';
-import { formatCurrency, formatDate, formatDateTime } from '../utils/formatters';
+import {
+  formatCurrency,
+  formatCurrencyMany,
+  formatDate,
+  formatDateMany,
+  formatDateTime,
+  getFormatLocale,
+  getNumberFormat,
+  setFormatLocale,
+} from '../utils/formatters';
 
 describe('Formatters', () => {
   describe('formatCurrency', () => {
@@ -76,4 +85,27 @@ describe('Formatters', () => {
       expect(formatDateTime('2024-03-01T09:09:00')).toBe('March 1, 2024, 09:09 AM');
     });
   });
-}); 
\ No newline at end of file
+
+  describe('formatter cache', () => {
+    it('reuses one formatter per locale and options, whatever the key order', () => {
+      const a = getNumberFormat({ minimumFractionDigits: 2, maximumFractionDigits: 2 });
+      const b = getNumberFormat({ maximumFractionDigits: 2, minimumFractionDigits: 2 });
+      expect(a).toBe(b);
+      expect(getNumberFormat({ minimumFractionDigits: 2, maximumFractionDigits: 2 }, 'en-ZW')).not.toBe(a);
+    });
+
+    it('formats a column the same as cell by cell', () => {
+      const amounts = new Float64Array([1000, -0.99, 1234.5678]);
+      expect(formatCurrencyMany(amounts)).toEqual(Array.from(amounts, (n) => formatCurrency(n)));
+      expect(formatDateMany(['2024-03-01', '2024-12-31'])).toEqual(['March 1, 2024', 'December 31, 2024']);
+    });
+
+    it('follows the i18next language', () => {
+      setFormatLocale('sn');
+      expect(getFormatLocale()).toBe('sn-ZW');
+      setFormatLocale('en');
+      expect(getFormatLocale()).toBe('en-US');
+      expect(formatCurrency(1000)).toBe('$1,000.00');
+    });
+  });
+});
@@ -0,0 +1,148 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+vi.mock('../services/api', () => ({ default: { post: vi.fn() } }));
+
+import { FiscalPipeline, InvoiceNumberBlocks, generateInvoiceNumber } from '../utils/invoice';
+import type { FiscalPayload, FiscalSubmit } from '../utils/invoice';
+import { MemoryQueueStore } from '../services/offlineQueue';
+
+const invoice = (n: number): FiscalPayload => ({
+  invoiceNumber: `SALE-${n}`,
+  amount: 11.5,
+  taxAmount: 1.5,
+  currency: 'USD',
+  items: [{ description: 'Tea', qty: 1, unitPrice: 10, taxRate: 15 }],
+});
+
+const httpError = (status?: number) => Object.assign(new Error(status ? `HTTP ${status}` : 'Network Error'), {
+  response: status ? { status, data: { detail: 'nope' } } : undefined,
+});
+
+describe('generateInvoiceNumber', () => {
+  it('pads the next sequence', () => {
+    expect(generateInvoiceNumber(122, { prefix: 'INV-', pad: 6 })).toBe('INV-000123');
+  });
+});
+
+describe('InvoiceNumberBlocks', () => {
+  beforeEach(() => {
+    localStorage.clear();
+  });
+
+  it('hands out numbers from reserved blocks and reserves ahead', async () => {
+    let next = 1;
+    const reserve = vi.fn(async (_prefix: string, size: number) => {
+      const start = next;
+      next += size;
+      return { start, end: start + size - 1 };
+    });
+    const numbers = new InvoiceNumberBlocks({ prefix: 'SALE-', pad: 4, blockSize: 5, lowWater: 2, reserve });
+    await numbers.reserveAhead();
+
+    const issued: Array<string | null> = [];
+    for (let i = 0; i < 4; i += 1) issued.push(numbers.next());
+    expect(issued).toEqual(['SALE-0001', 'SALE-0002', 'SALE-0003', 'SALE-0004']);
+    // The second block was reserved in the background once two numbers were left
+    await vi.waitFor(() => expect(numbers.remaining()).toBe(6));
+    expect(reserve).toHaveBeenCalledTimes(2);
+
+    // Unused numbers survive a reload
+    const reloaded = new InvoiceNumberBlocks({ prefix: 'SALE-', pad: 4, blockSize: 5, reserve });
+    expect(reloaded.next()).toBe('SALE-0005');
+  });
+
+  it('returns null without waiting when nothing is reserved', async () => {
+    let resolve!: (block: { start: number; end: number }) => void;
+    const reserve = vi.fn(() => new Promise<{ start: number; end: number }>((r) => { resolve = r; }));
+    const numbers = new InvoiceNumberBlocks({ prefix: 'INV-', pad: 4, reserve });
+
+    expect(numbers.next()).toBeNull();
+    expect(reserve).toHaveBeenCalledTimes(1);
+    resolve({ start: 1, end: 50 });
+    await numbers.reserveAhead();
+    expect(numbers.next()).toBe('INV-0001');
+  });
+
+  it('backs off after a failed reservation', async () => {
+    const reserve = vi.fn().mockRejectedValue(httpError());
+    const numbers = new InvoiceNumberBlocks({ prefix: 'INV-', pad: 4, reserve });
+    await numbers.reserveAhead();
+    // Does not retry on every sale
+    expect(numbers.next()).toBeNull();
+    expect(numbers.next()).toBeNull();
+    expect(reserve).toHaveBeenCalledTimes(1);
+  });
+
+  it('stops reserving once the server has no reservation endpoint', async () => {
+    vi.useFakeTimers();
+    try {
+      const reserve = vi.fn().mockRejectedValue(httpError(404));
+      const numbers = new InvoiceNumberBlocks({ prefix: 'INV-', pad: 4, reserve });
+      await numbers.reserveAhead();
+      vi.advanceTimersByTime(60 * 60 * 1000);
+      expect(numbers.next()).toBeNull();
+      await numbers.reserveAhead();
+      expect(reserve).toHaveBeenCalledTimes(1);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+});
+
+describe('FiscalPipeline', () => {
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('submits queued invoices in bounded batches and reports each result', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const submit: FiscalSubmit = vi.fn(async (payloads: FiscalPayload[]) => {
+      inFlight += 1;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 1));
+      inFlight -= 1;
+      return payloads.map((payload) => ({ success: true, fiscalCode: `FC-${payload.invoiceNumber}` }));
+    });
+    const pipeline = new FiscalPipeline(new MemoryQueueStore(), submit, { batchSize: 4, concurrency: 2, lingerMs: 60000 });
+    const fiscalized: string[] = [];
+    pipeline.onResult((invoiceNumber) => fiscalized.push(invoiceNumber));
+
+    for (let i = 0; i < 10; i += 1) await pipeline.enqueue(invoice(i));
+    expect(pipeline.getProgress().pending).toBe(10);
+    await pipeline.drain();
+
+    expect((submit as any).mock.calls.map(([payloads]: [FiscalPayload[]]) => payloads.length)).toEqual([4, 4, 2]);
+    expect(maxInFlight).toBe(2);
+    expect(fiscalized).toHaveLength(10);
+    expect(pipeline.resultFor('SALE-3')?.fiscalCode).toBe('FC-SALE-3');
+    expect(pipeline.getProgress()).toMatchObject({ pending: 0, fiscalized: 10, running: false });
+  });
+
+  it('keeps rejected invoices for review and retries device failures later', async () => {
+    vi.useFakeTimers();
+    const submit = vi
+      .fn()
+      .mockRejectedValueOnce(httpError(503))
+      .mockImplementation(async (payloads: FiscalPayload[]) =>
+        payloads.map((payload) =>
+          payload.invoiceNumber === 'SALE-1' ? { success: false, error: 'Bad TIN' } : { success: true, fiscalCode: 'FC' }
+        )
+      );
+    const store = new MemoryQueueStore();
+    const pipeline = new FiscalPipeline(store, submit, { highWaterMark: 3, lingerMs: 60000 });
+
+    for (let i = 0; i < 3; i += 1) await pipeline.enqueue(invoice(i));
+    expect(pipeline.getProgress().backlogged).toBe(true);
+
+    await pipeline.drain();
+    expect(pipeline.getProgress().pending).toBe(3);
+    expect(pipeline.getProgress().retryAt).not.toBeNull();
+
+    await vi.runOnlyPendingTimersAsync();
+    await pipeline.drain();
+    expect(pipeline.getProgress()).toMatchObject({ pending: 0, rejected: 1, backlogged: false });
+    const [rejected] = await store.list();
+    expect(rejected).toMatchObject({ id: 'SALE-1', lastError: 'Bad TIN', attempts: 2 });
+  });
+});
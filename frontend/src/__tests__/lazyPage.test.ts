@@ -0,0 +1,28 @@
+import { describe, it, expect, vi } from 'vitest';
+import { lazyPage } from '../utils/lazyPage';
+
+const Page = () => null;
+
+describe('lazyPage', () => {
+  it('loads the chunk only once across preloads', async () => {
+    const loader = vi.fn().mockResolvedValue({ default: Page });
+    const page = lazyPage(loader);
+
+    await Promise.all([page.preload(), page.preload()]);
+    await page.preload();
+
+    expect(loader).toHaveBeenCalledTimes(1);
+  });
+
+  it('retries after a failed load', async () => {
+    const loader = vi
+      .fn()
+      .mockRejectedValueOnce(new Error('offline'))
+      .mockResolvedValue({ default: Page });
+    const page = lazyPage(loader);
+
+    await expect(page.preload()).rejects.toThrow('offline');
+    await expect(page.preload()).resolves.toEqual({ default: Page });
+    expect(loader).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,151 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+
+vi.mock('../services/api', () => ({ default: { request: vi.fn() } }));
+
+import { OfflineQueue, MemoryQueueStore } from '../services/offlineQueue';
+import type { QueueItem } from '../services/offlineQueue';
+
+const httpError = (status?: number) => Object.assign(new Error(status ? `HTTP ${status}` : 'Network Error'), {
+  response: status ? { status, data: { error: 'nope' } } : undefined,
+});
+
+describe('OfflineQueue', () => {
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('ignores a second enqueue with the same idempotency key', async () => {
+    const queue = new OfflineQueue(new MemoryQueueStore(), vi.fn());
+    await queue.enqueue('/pos/make-sale/', { total: 1 }, { idempotencyKey: 'SALE-1' });
+    await queue.enqueue('/pos/make-sale/', { total: 1 }, { idempotencyKey: 'SALE-1' });
+    expect(await queue.peekAll()).toHaveLength(1);
+    expect(queue.getProgress().pending).toBe(1);
+  });
+
+  it('replays in order with bounded concurrency and reports throughput', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const order: string[] = [];
+    const send = vi.fn(async (item: QueueItem) => {
+      inFlight += 1;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      order.push(item.id);
+      await new Promise((resolve) => setTimeout(resolve, 1));
+      inFlight -= 1;
+    });
+    const queue = new OfflineQueue(new MemoryQueueStore(), send);
+    for (let i = 0; i < 10; i += 1) {
+      await queue.enqueue('/pos/make-sale/', { i }, { idempotencyKey: `SALE-${i}` });
+    }
+
+    await queue.replay({ batchSize: 4, concurrency: 2 });
+
+    expect(send).toHaveBeenCalledTimes(10);
+    expect(maxInFlight).toBe(2);
+    expect(order[0]).toBe('SALE-0');
+    expect(await queue.peekAll()).toEqual([]);
+    expect(queue.getProgress()).toMatchObject({ running: false, pending: 0, sent: 10 });
+    expect(queue.getProgress().throughput).toBeGreaterThan(0);
+  });
+
+  it('keeps rejected items aside and treats conflicts as already applied', async () => {
+    const send = vi.fn(async (item: QueueItem) => {
+      if (item.id === 'bad') throw httpError(400);
+      if (item.id === 'dup') throw httpError(409);
+    });
+    const queue = new OfflineQueue(new MemoryQueueStore(), send);
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'bad' });
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'dup' });
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'ok' });
+
+    await queue.replay();
+
+    const left = await queue.peekAll();
+    expect(left.map((item) => item.id)).toEqual(['bad']);
+    expect(left[0].failedAt).toBeTruthy();
+    expect(queue.getProgress()).toMatchObject({ pending: 0, rejected: 1, sent: 2 });
+  });
+
+  it('runs follow-ups only for writes the server accepted', async () => {
+    const send = vi.fn(async (item: QueueItem) => {
+      if (item.id === 'bad') throw httpError(400);
+      if (item.id === 'dup') throw httpError(409);
+      return { data: { id: item.id } };
+    });
+    const queue = new OfflineQueue(new MemoryQueueStore(), send);
+    const followUps: Array<[string, unknown, unknown]> = [];
+    queue.onSent(async (item, response) => {
+      // Still queued while the follow-up runs
+      expect((await queue.peekAll()).some((queued) => queued.id === item.id)).toBe(true);
+      followUps.push([item.id, item.meta?.fiscalPayload, response]);
+    });
+    for (const id of ['ok', 'bad', 'dup']) {
+      await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: id, meta: { fiscalPayload: `fiscal-${id}` } });
+    }
+
+    await queue.replay({ concurrency: 1 });
+
+    expect(followUps).toEqual([
+      ['ok', 'fiscal-ok', { data: { id: 'ok' } }],
+      ['dup', 'fiscal-dup', undefined],
+    ]);
+  });
+
+  it('stops on a network error and retries with backoff', async () => {
+    vi.useFakeTimers();
+    let online = false;
+    const send = vi.fn(async () => {
+      if (!online) throw httpError();
+    });
+    const queue = new OfflineQueue(new MemoryQueueStore(), send);
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'a' });
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'b' });
+
+    await queue.replay({ concurrency: 1 });
+    expect(send).toHaveBeenCalledTimes(1);
+    expect(queue.getProgress().retryAt).not.toBeNull();
+    expect((await queue.peekAll())[0].attempts).toBe(1);
+
+    online = true;
+    await vi.runAllTimersAsync();
+    expect(await queue.peekAll()).toEqual([]);
+    expect(queue.getProgress().retryAt).toBeNull();
+  });
+
+  it('waits for a sign-in on 401 instead of rejecting', async () => {
+    vi.useFakeTimers();
+    let signedIn = false;
+    const send = vi.fn(async () => {
+      if (!signedIn) throw httpError(401);
+    });
+    const queue = new OfflineQueue(new MemoryQueueStore(), send);
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'a' });
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'b' });
+
+    await queue.replay({ concurrency: 1 });
+    expect(queue.getProgress()).toMatchObject({ pending: 2, rejected: 0, waitingForAuth: true, retryAt: null });
+    await vi.runAllTimersAsync();
+    expect(send).toHaveBeenCalledTimes(1);
+
+    signedIn = true;
+    await queue.replay();
+    expect(await queue.peekAll()).toEqual([]);
+    expect(queue.getProgress().waitingForAuth).toBe(false);
+  });
+
+  it('replays rejected items on request', async () => {
+    let fixed = false;
+    const send = vi.fn(async () => {
+      if (!fixed) throw httpError(400);
+    });
+    const queue = new OfflineQueue(new MemoryQueueStore(), send);
+    await queue.enqueue('/pos/make-sale/', {}, { idempotencyKey: 'a' });
+    await queue.replay();
+    expect(queue.getProgress()).toMatchObject({ pending: 0, rejected: 1 });
+
+    fixed = true;
+    await queue.retryRejected();
+    expect(await queue.peekAll()).toEqual([]);
+    expect(queue.getProgress()).toMatchObject({ pending: 0, rejected: 0, sent: 1 });
+  });
+});
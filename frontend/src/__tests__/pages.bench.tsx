@@ -0,0 +1,277 @@
+import { bench, describe } from 'vitest';
+import { render, fireEvent } from '@testing-library/react';
+import type { RenderResult } from '@testing-library/react';
+import { Provider } from 'react-redux';
+import { configureStore } from '@reduxjs/toolkit';
+import { DataTable } from '../components/DataTable';
+import POS from '../pages/POS';
+import Inventory from '../pages/Inventory';
+import PurchaseOrderManagement from '../pages/PurchaseOrderManagement';
+import Transactions from '../pages/Transactions';
+import transactionReducer from '../store/slices/transactionSlice';
+import { formatCurrency } from '../utils/formatters';
+import {
+  BENCH_SIZES,
+  KEYSTROKES,
+  benchOptions,
+  productRows,
+  purchaseOrderRows,
+  serveFixtures,
+  transactionRows,
+  until,
+  untilRendered,
+} from '../test/bench';
+
+// Render benchmarks for the heaviest screens at 1k/10k/100k rows. Pages load
+// through their real fetch code, answered from in-memory fixtures. Compare a
+// run with a recorded baseline using `python -m tools.benchcheck`.
+
+type Options = ReturnType<typeof benchOptions>;
+
+type Mounted = { view: RenderResult; step: (i: number) => unknown };
+
+/** Mount, wait for the rows, unmount: the full cost of opening the screen. */
+function benchMount(mount: () => Promise<RenderResult> | RenderResult, options: Options) {
+  bench(
+    'initial render',
+    async () => {
+      const view = await mount();
+      view.unmount();
+    },
+    options
+  );
+}
+
+/**
+ * Repeat one interaction against a screen mounted once in setup, so each
+ * sample times the interaction and the re-render it causes, not the mount.
+ */
+function benchStep(name: string, mount: () => Promise<Mounted>, options: Options) {
+  let mounted: Mounted | null = null;
+  let i = 0;
+  bench(
+    name,
+    async () => {
+      await mounted!.step(i++);
+    },
+    {
+      ...options,
+      setup: async () => {
+        mounted = await mount();
+        i = 0;
+      },
+      teardown: () => {
+        mounted?.view.unmount();
+        mounted = null;
+      },
+    }
+  );
+}
+
+const lastName = (rows: Array<{ name: string }>) => rows[rows.length - 1].name;
+
+for (const size of BENCH_SIZES) {
+  const options = benchOptions(size);
+  const products = productRows(size);
+  const orders = purchaseOrderRows(size);
+  const transactions = transactionRows(size);
+
+  describe(`DataTable (${size} rows)`, () => {
+    const mount = () =>
+      render(
+        <DataTable
+          data={products}
+          columns={[
+            { header: 'SKU', accessor: 'sku', sortable: true },
+            { header: 'Name', accessor: 'name', sortable: true },
+            { header: 'Category', accessor: 'category', sortable: true },
+            { header: 'Price', accessor: 'unit_price', sortable: true, render: (value) => formatCurrency(Number(value)) },
+            { header: 'Stock', accessor: 'quantity_in_stock', sortable: true },
+          ]}
+        />
+      );
+
+    benchMount(mount, options);
+
+    benchStep(
+      'search keystroke',
+      async () => {
+        const view = mount();
+        const input = view.getByPlaceholderText('Search...');
+        return { view, step: (i) => fireEvent.change(input, { target: { value: KEYSTROKES[i % KEYSTROKES.length] } }) };
+      },
+      options
+    );
+
+    // Alternates ascending and descending, a full sort each time
+    benchStep(
+      'sort by column',
+      async () => {
+        const view = mount();
+        const header = view.getByText('Name', { selector: 'th, th *' });
+        return { view, step: () => fireEvent.click(header) };
+      },
+      options
+    );
+  });
+
+  describe(`POS (${size} products)`, () => {
+    const fixtures = {
+      '/stores/': [{ id: 1, name: 'Main Store' }],
+      '/sale-sessions/': [{ id: 1, store: 1, is_active: true }],
+      '/products/': products,
+    };
+    const mount = async () => {
+      serveFixtures(fixtures);
+      const view = render(<POS />);
+      await untilRendered(view.container, lastName(products));
+      return view;
+    };
+
+    benchMount(mount, options);
+
+    benchStep(
+      'search keystroke',
+      async () => {
+        const view = await mount();
+        const input = view.getByPlaceholderText('Search products...');
+        return { view, step: (i) => fireEvent.change(input, { target: { value: KEYSTROKES[i % KEYSTROKES.length] } }) };
+      },
+      options
+    );
+
+    // The catalogue has no sort control; switching category re-filters and re-renders the grid
+    benchStep(
+      'category filter',
+      async () => {
+        const view = await mount();
+        const select = view.getByDisplayValue('All Categories');
+        const values = [products[0].category, 'all'];
+        return { view, step: (i) => fireEvent.change(select, { target: { value: values[i % values.length] } }) };
+      },
+      options
+    );
+  });
+
+  describe(`Inventory (${size} products)`, () => {
+    const fixtures = { '/stores/': [{ id: 1, name: 'Main Store' }], '/products/': products };
+    const mountWithTabs = async () => {
+      serveFixtures(fixtures);
+      const view = render(<Inventory />);
+      // Grabbed before the rows arrive, while the DOM is still small
+      const [productsTab, reportsTab] = ['Products', 'Reports'].map((label) =>
+        view.getByText(label, { selector: 'button' })
+      );
+      await untilRendered(view.container, lastName(products));
+      return { view, productsTab, reportsTab };
+    };
+
+    benchMount(async () => (await mountWithTabs()).view, options);
+
+    // No search or sort on this screen; the Reports tab runs the low-stock filter
+    // over every product, and switching back refetches and re-renders the list
+    benchStep(
+      'reports tab and back',
+      async () => {
+        const { view, productsTab, reportsTab } = await mountWithTabs();
+        return {
+          view,
+          step: async () => {
+            fireEvent.click(reportsTab);
+            await untilRendered(view.container, 'Low Stock Alerts');
+            fireEvent.click(productsTab);
+            await untilRendered(view.container, lastName(products));
+          },
+        };
+      },
+      options
+    );
+  });
+
+  describe(`PurchaseOrderManagement (${size} orders)`, () => {
+    const fixtures = {
+      '/purchase-orders/': orders,
+      '/vendors/': Array.from({ length: 50 }, (_, i) => ({ id: i + 1, name: `Vendor ${i + 1}` })),
+      '/products/': products,
+    };
+    const mount = async () => {
+      serveFixtures(fixtures);
+      const view = render(<PurchaseOrderManagement />);
+      await untilRendered(view.container, orders[orders.length - 1].po_number);
+      return view;
+    };
+
+    benchMount(mount, options);
+
+    benchStep(
+      'status filter',
+      async () => {
+        const view = await mount();
+        const buttons = ['DRAFT', 'ALL'].map((status) => view.getAllByText(status, { selector: 'button' })[0]);
+        return { view, step: (i) => fireEvent.click(buttons[i % buttons.length]) };
+      },
+      options
+    );
+
+    // The product picker in the create-PO form filters the whole catalogue per keystroke
+    benchStep(
+      'product search keystroke',
+      async () => {
+        const view = await mount();
+        fireEvent.click(view.getByText('Create PO', { selector: 'button' }));
+        const input = view.getByPlaceholderText('Enter product name (e.g., Car, Office Chair)');
+        return { view, step: (i) => fireEvent.change(input, { target: { value: KEYSTROKES[i % KEYSTROKES.length] } }) };
+      },
+      options
+    );
+  });
+
+  describe(`Transactions (${size} rows)`, () => {
+    // The page loads 100 rows and pages in more on scroll; serving every row in
+    // one page stands in for a user who has scrolled through `size` rows.
+    const fixtures = {
+      '/transactions/': (params: Record<string, any>) => {
+        const results = transactions.filter(
+          (row) =>
+            (!params.type || row.type === params.type) &&
+            (!params.account_type || row.account_type === params.account_type)
+        );
+        return { results, count: results.length, next: null };
+      },
+    };
+    const incomeRows = transactions.filter((row) => row.type === 'income').length;
+    const listLength = (container: HTMLElement) => container.querySelector('ul.divide-y')?.children.length ?? 0;
+
+    const mount = async () => {
+      serveFixtures(fixtures);
+      const store = configureStore({ reducer: { transaction: transactionReducer } });
+      const view = render(
+        <Provider store={store}>
+          <Transactions />
+        </Provider>
+      );
+      await until(() => listLength(view.container) === size, `${size} transactions`);
+      return view;
+    };
+
+    benchMount(mount, options);
+
+    // No search or sort here; the type filter refetches and re-renders the list
+    benchStep(
+      'type filter',
+      async () => {
+        const view = await mount();
+        const select = view.getByDisplayValue('All Types');
+        return {
+          view,
+          step: async (i) => {
+            const income = i % 2 === 0;
+            fireEvent.change(select, { target: { value: income ? 'income' : 'all' } });
+            await until(() => listLength(view.container) === (income ? incomeRows : size), 'filtered transactions');
+          },
+        };
+      },
+      options
+    );
+  });
+}
@@ -0,0 +1,81 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+vi.mock('../services/api', () => ({
+  default: { get: vi.fn() },
+}));
+
+import api from '../services/api';
+import { RatesService } from '../services/analyticsService';
+
+const get = api.get as unknown as ReturnType<typeof vi.fn>;
+
+describe('RatesService', () => {
+  beforeEach(() => {
+    RatesService.setUnitsPerUsd({ ZWL: 1000, ZAR: 18 });
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    get.mockReset();
+  });
+
+  it('converts every pair synchronously, including cross-rates via USD', () => {
+    expect(RatesService.convertSync(2, 'USD', 'ZWL')).toBe(2000);
+    expect(RatesService.convertSync(500, 'ZWL', 'USD')).toBe(0.5);
+    expect(RatesService.convertSync(18, 'ZAR', 'ZWL')).toBeCloseTo(1000);
+    expect(RatesService.convertSync(7, 'ZAR', 'ZAR')).toBe(7);
+  });
+
+  it('leaves amounts in unknown currencies unconverted', () => {
+    expect(RatesService.rate('USD', 'EUR')).toBeUndefined();
+    expect(RatesService.convertSync(5, 'USD', 'EUR')).toBe(5);
+  });
+
+  it('converts a column in one pass, reusing the output buffer', () => {
+    const out = new Float64Array(3);
+    const result = RatesService.convertMany(new Float64Array([1, 2.5, -4]), 'USD', 'ZWL', out);
+    expect(result).toBe(out);
+    expect(Array.from(out)).toEqual([1000, 2500, -4000]);
+  });
+
+  it('loads the table once per TTL and shares concurrent refreshes', async () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(Date.now() + 24 * 60 * 60 * 1000);
+    get.mockResolvedValue({
+      data: {
+        results: [
+          { code: 'USD', exchange_rate_to_usd: '1', is_active: true },
+          { code: 'zwg', exchange_rate_to_usd: '26.5', is_active: true },
+          { code: 'GBP', exchange_rate_to_usd: 0, is_active: true },
+          { code: 'ZWL', exchange_rate_to_usd: 1000, is_active: false },
+        ],
+      },
+    });
+    const listener = vi.fn();
+    const unsubscribe = RatesService.subscribe(listener);
+
+    const [first, second] = await Promise.all([RatesService.ensureFresh(), RatesService.ensureFresh()]);
+    expect(get).toHaveBeenCalledTimes(1);
+    expect(first).toBe(second);
+    expect([...first.codes].sort()).toEqual(['USD', 'ZWG']);
+    expect(RatesService.convertSync(2, 'USD', 'ZWG')).toBe(53);
+    expect(listener).toHaveBeenCalledWith(first);
+
+    await RatesService.ensureFresh();
+    expect(get).toHaveBeenCalledTimes(1);
+    vi.advanceTimersByTime(RatesService.TTL_MS);
+    await RatesService.ensureFresh();
+    expect(get).toHaveBeenCalledTimes(2);
+    unsubscribe();
+  });
+
+  it('keeps the previous table when a refresh fails', async () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(Date.now() + 48 * 60 * 60 * 1000);
+    vi.spyOn(console, 'error').mockImplementation(() => {});
+    get.mockRejectedValue(new Error('offline'));
+    const table = RatesService.getTable();
+    expect(await RatesService.ensureFresh()).toBe(table);
+    expect(await RatesService.convert(1, 'USD', 'ZWL')).toBe(1000);
+  });
+});
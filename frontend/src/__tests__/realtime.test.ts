@@ -0,0 +1,177 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+
+vi.mock('../services/api', () => ({
+  default: { get: vi.fn(), defaults: { baseURL: 'http://localhost:8000/api' } },
+}));
+
+import api from '../services/api';
+import { RealtimeClient, mergeById } from '../services/realtime';
+import type { RealtimeEvent, TransportHandlers } from '../services/realtime';
+
+const get = api.get as unknown as ReturnType<typeof vi.fn>;
+
+/** In-memory event server: records connections and pushes events to them. */
+class MockEventServer {
+  connections: Array<{ url: URL; handlers: TransportHandlers; closed: boolean }> = [];
+
+  transport = (url: string, handlers: TransportHandlers) => {
+    const connection = { url: new URL(url), handlers, closed: false };
+    this.connections.push(connection);
+    return { close: () => (connection.closed = true) };
+  };
+
+  get latest() {
+    return this.connections[this.connections.length - 1];
+  }
+
+  emit(events: RealtimeEvent[], id?: string) {
+    this.latest.handlers.onEvents(events, id);
+  }
+}
+
+const flush = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+const httpError = (status: number) => Object.assign(new Error(`HTTP ${status}`), { response: { status } });
+
+describe('mergeById', () => {
+  const list = [
+    { id: 1, status: 'PENDING', amount: 5 },
+    { id: 2, status: 'PENDING', amount: 7 },
+  ];
+
+  it('updates, prepends and deletes by id without touching other rows', () => {
+    const next = mergeById(list, [
+      { resource: 'p', op: 'upsert', id: 1, data: { status: 'COMPLETED' } },
+      { resource: 'p', op: 'upsert', id: 3, data: { status: 'PENDING', amount: 1 } },
+      { resource: 'p', op: 'delete', id: 2 },
+    ]);
+    expect(next).toEqual([
+      { id: 3, status: 'PENDING', amount: 1 },
+      { id: 1, status: 'COMPLETED', amount: 5 },
+    ]);
+    expect(list[0].status).toBe('PENDING');
+  });
+
+  it('returns the same list when there is nothing to apply', () => {
+    expect(mergeById(list, [{ resource: 'p', op: 'resync' }])).toBe(list);
+  });
+});
+
+describe('RealtimeClient', () => {
+  afterEach(() => {
+    vi.useRealTimers();
+    get.mockReset();
+  });
+
+  it('shares one connection across resources and routes events by resource', async () => {
+    const server = new MockEventServer();
+    const client = new RealtimeClient({ url: 'http://api.test/events/', transport: server.transport, ticket: async () => 'abc' });
+    const payments = vi.fn();
+    const tills = vi.fn();
+    client.subscribe('mobile-money-payments', payments);
+    client.subscribe('cash-tills', tills);
+    await flush();
+
+    expect(server.connections).toHaveLength(1);
+    expect(server.latest.url.searchParams.get('resources')).toBe('cash-tills,mobile-money-payments');
+    expect(server.latest.url.searchParams.get('ticket')).toBe('abc');
+    server.latest.handlers.onOpen();
+    expect(client.getStatus()).toBe('live');
+
+    server.emit([
+      { resource: 'cash-tills', op: 'upsert', id: 4, data: { current_balance: 10 } },
+      { resource: 'mobile-money-payments', op: 'delete', id: 9 },
+    ]);
+    expect(tills).toHaveBeenCalledWith([{ resource: 'cash-tills', op: 'upsert', id: 4, data: { current_balance: 10 } }]);
+    expect(payments).toHaveBeenCalledWith([{ resource: 'mobile-money-payments', op: 'delete', id: 9 }]);
+  });
+
+  it('asks subscribers to resync after the stream is interrupted', async () => {
+    const server = new MockEventServer();
+    const client = new RealtimeClient({ url: 'http://api.test/events/', transport: server.transport });
+    const listener = vi.fn();
+    client.subscribe('cash-tills', listener);
+    await flush();
+
+    server.latest.handlers.onOpen();
+    server.latest.handlers.onInterrupted();
+    expect(client.getStatus()).toBe('connecting');
+    server.latest.handlers.onOpen();
+    expect(listener).toHaveBeenCalledWith([{ resource: 'cash-tills', op: 'resync' }]);
+  });
+
+  it('reconnects with a fresh ticket and never puts the access token in the URL', async () => {
+    vi.useFakeTimers();
+    const server = new MockEventServer();
+    let issued = 0;
+    const ticket = vi.fn(async () => `ticket-${++issued}`);
+    const client = new RealtimeClient({ url: 'http://api.test/events/', transport: server.transport, ticket });
+    client.subscribe('cash-tills', vi.fn());
+    await vi.advanceTimersByTimeAsync(0);
+
+    expect(server.latest.url.searchParams.get('ticket')).toBe('ticket-1');
+    expect(server.latest.url.searchParams.has('token')).toBe(false);
+    server.latest.handlers.onOpen();
+    server.emit([{ resource: 'cash-tills', op: 'delete', id: 1 }], '7');
+    server.latest.handlers.onClosed(true);
+
+    // The first reconnect waits at most a second
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(server.connections).toHaveLength(2);
+    expect(server.latest.url.searchParams.get('ticket')).toBe('ticket-2');
+    expect(server.latest.url.searchParams.get('last_event_id')).toBe('7');
+    client.close();
+  });
+
+  it('polls when the backend does not issue stream tickets', async () => {
+    vi.useFakeTimers();
+    const server = new MockEventServer();
+    const ticket = vi.fn().mockRejectedValue(httpError(404));
+    const client = new RealtimeClient({ url: 'http://api.test/events/', transport: server.transport, ticket });
+    client.subscribe('cash-tills', vi.fn(), { pollUrl: '/cash-tills/' });
+    await vi.advanceTimersByTimeAsync(0);
+
+    expect(server.connections).toHaveLength(0);
+    expect(client.getStatus()).toBe('polling');
+    client.close();
+  });
+
+  it('falls back to conditional polling when push is unavailable', async () => {
+    vi.useFakeTimers();
+    const server = new MockEventServer();
+    const client = new RealtimeClient({ url: 'http://api.test/events/', transport: server.transport });
+    const listener = vi.fn();
+    client.subscribe('cash-tills', listener, { pollUrl: '/cash-tills/', pollIntervalMs: 1000 });
+    await vi.advanceTimersByTimeAsync(0);
+    server.latest.handlers.onClosed(false);
+    expect(client.getStatus()).toBe('polling');
+
+    get.mockResolvedValueOnce({
+      status: 200,
+      headers: { etag: '"v1"' },
+      data: { results: [{ id: 1, current_balance: 0 }, { id: 2, current_balance: 5 }] },
+    });
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(listener).toHaveBeenLastCalledWith([
+      { resource: 'cash-tills', op: 'upsert', id: 1, data: { id: 1, current_balance: 0 } },
+      { resource: 'cash-tills', op: 'upsert', id: 2, data: { id: 2, current_balance: 5 } },
+    ]);
+
+    get.mockResolvedValueOnce({ status: 304, headers: {}, data: '' });
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(get.mock.calls[1][1].headers).toEqual({ 'If-None-Match': '"v1"' });
+    expect(listener).toHaveBeenCalledTimes(1);
+
+    get.mockResolvedValueOnce({
+      status: 200,
+      headers: { etag: '"v2"' },
+      data: { results: [{ id: 1, current_balance: 12 }] },
+    });
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(listener).toHaveBeenLastCalledWith([
+      { resource: 'cash-tills', op: 'upsert', id: 1, data: { id: 1, current_balance: 12 } },
+      { resource: 'cash-tills', op: 'delete', id: 2 },
+    ]);
+    client.close();
+  });
+});
@@ -0,0 +1,157 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import type { AxiosResponse, InternalAxiosRequestConfig } from 'axios';
+import { RequestCache, resourceOf } from '../services/requestCache';
+
+const respond = (config: InternalAxiosRequestConfig, data: unknown): AxiosResponse => ({
+  data,
+  status: 200,
+  statusText: 'OK',
+  headers: {},
+  config,
+});
+
+const request = (url: string, extra: Partial<InternalAxiosRequestConfig> = {}) =>
+  ({ method: 'get', url, baseURL: 'http://localhost:8000/api', headers: {}, ...extra }) as InternalAxiosRequestConfig;
+
+describe('RequestCache', () => {
+  let cache: RequestCache;
+  let transport: ReturnType<typeof vi.fn>;
+  let adapter: (config: InternalAxiosRequestConfig) => Promise<AxiosResponse>;
+
+  beforeEach(() => {
+    vi.useRealTimers();
+    cache = new RequestCache({
+      policies: { '/stores/': { ttlMs: 1000, staleMs: 5000 } },
+      invalidates: { '/pos/': ['/stores/'] },
+      maxEntries: 2,
+    });
+    let calls = 0;
+    transport = vi.fn(async (config: InternalAxiosRequestConfig) => respond(config, { call: ++calls }));
+    adapter = cache.adapter(transport as any);
+  });
+
+  it('derives the resource from relative and absolute URLs', () => {
+    expect(resourceOf('/products/12/?page=2')).toBe('/products/');
+    expect(resourceOf('http://localhost:8000/api/stores/', 'http://localhost:8000/api')).toBe('/stores/');
+  });
+
+  it('merges identical concurrent GETs into one request', async () => {
+    const [a, b] = await Promise.all([adapter(request('/users/')), adapter(request('/users/'))]);
+    expect(transport).toHaveBeenCalledTimes(1);
+    expect(a.data).toEqual(b.data);
+  });
+
+  it('serves cached responses within the TTL', async () => {
+    await adapter(request('/stores/'));
+    const second = await adapter(request('/stores/'));
+    expect(transport).toHaveBeenCalledTimes(1);
+    expect(second.data).toEqual({ call: 1 });
+    expect(cache.hits).toBe(1);
+  });
+
+  it('does not cache resources without a policy', async () => {
+    await adapter(request('/users/'));
+    await adapter(request('/users/'));
+    expect(transport).toHaveBeenCalledTimes(2);
+  });
+
+  it('keys entries by query params', async () => {
+    await adapter(request('/stores/', { params: { page: 1 } }));
+    await adapter(request('/stores/', { params: { page: 2 } }));
+    expect(transport).toHaveBeenCalledTimes(2);
+  });
+
+  it('serves stale data while revalidating in the background', async () => {
+    vi.useFakeTimers();
+    await adapter(request('/stores/'));
+    vi.advanceTimersByTime(2000);
+
+    const stale = await adapter(request('/stores/'));
+    expect(stale.data).toEqual({ call: 1 });
+    expect(transport).toHaveBeenCalledTimes(2);
+
+    await vi.runAllTimersAsync();
+    const fresh = await adapter(request('/stores/'));
+    expect(fresh.data).toEqual({ call: 2 });
+    vi.useRealTimers();
+  });
+
+  it('invalidates cached entries on writes to the same or a dependent resource', async () => {
+    await adapter(request('/stores/'));
+    await adapter(request('/pos/make-sale/', { method: 'post' }));
+    await adapter(request('/stores/'));
+    expect(transport).toHaveBeenCalledTimes(3);
+  });
+
+  describe('cancelling a shared GET', () => {
+    // A transport that answers only when told to, and stops if its signal aborts
+    let answer: () => void;
+    let sent: InternalAxiosRequestConfig;
+
+    beforeEach(() => {
+      transport.mockImplementation(
+        (config: InternalAxiosRequestConfig) =>
+          new Promise((resolve, reject) => {
+            sent = config;
+            answer = () => resolve(respond(config, { call: 1 }));
+            (config.signal as AbortSignal | undefined)?.addEventListener?.('abort', () => reject(new Error('aborted')));
+          })
+      );
+    });
+
+    it('cancels only the caller who aborted', async () => {
+      const first = new AbortController();
+      const a = adapter(request('/users/', { signal: first.signal }));
+      const b = adapter(request('/users/', { signal: new AbortController().signal }));
+
+      first.abort();
+      await expect(a).rejects.toMatchObject({ code: 'ERR_CANCELED' });
+      expect((sent.signal as AbortSignal).aborted).toBe(false);
+      answer();
+      expect((await b).data).toEqual({ call: 1 });
+      expect(transport).toHaveBeenCalledTimes(1);
+    });
+
+    it('aborts the request once every caller has left', async () => {
+      const controllers = [new AbortController(), new AbortController()];
+      const calls = controllers.map((c) => adapter(request('/users/', { signal: c.signal })));
+
+      controllers[0].abort();
+      expect((sent.signal as AbortSignal).aborted).toBe(false);
+      controllers[1].abort();
+      await Promise.allSettled(calls);
+      expect((sent.signal as AbortSignal).aborted).toBe(true);
+
+      // The next caller starts afresh instead of joining the aborted request
+      const again = adapter(request('/users/'));
+      answer();
+      expect((await again).data).toEqual({ call: 1 });
+      expect(transport).toHaveBeenCalledTimes(2);
+    });
+
+    it('keeps revalidating after the caller who triggered it leaves', async () => {
+      vi.useFakeTimers();
+      const warm = adapter(request('/stores/'));
+      answer();
+      await warm;
+      vi.advanceTimersByTime(2000);
+
+      const caller = new AbortController();
+      await adapter(request('/stores/', { signal: caller.signal }));
+      caller.abort();
+      expect((sent.signal as AbortSignal).aborted).toBe(false);
+      vi.useRealTimers();
+    });
+  });
+
+  it('evicts the least recently used entry past maxEntries', async () => {
+    await adapter(request('/stores/', { params: { page: 1 } }));
+    await adapter(request('/stores/', { params: { page: 2 } }));
+    await adapter(request('/stores/', { params: { page: 1 } }));
+    await adapter(request('/stores/', { params: { page: 3 } }));
+    expect(cache.size).toBe(2);
+
+    await adapter(request('/stores/', { params: { page: 1 } }));
+    expect(transport).toHaveBeenCalledTimes(3);
+  });
+});
@@ -0,0 +1,55 @@
+import { describe, it, expect } from 'vitest';
+import { buildSearchIndex, searchRows, sortRows, toSortKey } from '../utils/tableData';
+
+describe('tableData', () => {
+  const rows = [
+    { id: 1, name: 'Sugar 2kg', amount: '120.50', date: '2024-03-01' },
+    { id: 2, name: 'bread', amount: '9.99', date: '2024-01-15' },
+    { id: 3, name: 'Cooking Oil', amount: null, date: '2023-12-31' },
+    { id: 4, name: 'Sugar 10kg', amount: '1000', date: '2024-02-10' },
+  ];
+
+  describe('searchRows', () => {
+    it('matches case-insensitively on any field', () => {
+      const index = buildSearchIndex(rows);
+      expect(searchRows(rows, index, 'SUGAR').map((r) => r.id)).toEqual([1, 4]);
+      expect(searchRows(rows, index, '9.99').map((r) => r.id)).toEqual([2]);
+    });
+
+    it('does not match across field boundaries', () => {
+      const index = buildSearchIndex(rows);
+      expect(searchRows(rows, index, 'bread9')).toEqual([]);
+    });
+
+    it('returns all rows for an empty term', () => {
+      expect(searchRows(rows, buildSearchIndex(rows), '  ')).toBe(rows);
+    });
+  });
+
+  describe('sortRows', () => {
+    it('sorts numeric strings numerically', () => {
+      expect(sortRows(rows, 'amount', 'asc').map((r) => r.id)).toEqual([2, 1, 4, 3]);
+      expect(sortRows(rows, 'amount', 'desc').map((r) => r.id)).toEqual([4, 1, 2, 3]);
+    });
+
+    it('sorts ISO dates chronologically', () => {
+      expect(sortRows(rows, 'date', 'asc').map((r) => r.id)).toEqual([3, 2, 4, 1]);
+    });
+
+    it('uses natural, case-insensitive ordering for text', () => {
+      expect(sortRows(rows, 'name', 'asc').map((r) => r.id)).toEqual([2, 3, 1, 4]);
+    });
+
+    it('does not mutate the input', () => {
+      const copy = [...rows];
+      sortRows(rows, 'name', 'desc');
+      expect(rows).toEqual(copy);
+    });
+  });
+
+  it('normalises empty values to null', () => {
+    expect(toSortKey('')).toBeNull();
+    expect(toSortKey(undefined)).toBeNull();
+    expect(toSortKey(Number.NaN)).toBeNull();
+  });
+});
@@ -0,0 +1,118 @@
+import { describe, it, expect, vi } from 'vitest';
+import axios from 'axios';
+import type { AxiosAdapter } from 'axios';
+import { RequestCache } from '../services/requestCache';
+import { RingBuffer, Telemetry, endpointName, responseBytes, summarize } from '../services/telemetry';
+import type { TelemetrySample } from '../services/telemetry';
+
+describe('RingBuffer', () => {
+  it('keeps the newest items and reads them oldest first', () => {
+    const buffer = new RingBuffer<number>(3);
+    [1, 2, 3, 4, 5].forEach((n) => buffer.push(n));
+    expect(buffer.toArray()).toEqual([3, 4, 5]);
+    expect(buffer.total).toBe(5);
+    expect(buffer.toArray(4)).toEqual([5]);
+    // Items 1 and 2 were overwritten, so reading from 1 starts at the oldest kept
+    expect(buffer.toArray(1)).toEqual([3, 4, 5]);
+  });
+});
+
+describe('endpointName', () => {
+  it('groups requests per endpoint rather than per record', () => {
+    expect(endpointName('get', '/products/12/?q=tea')).toBe('GET /products/:id/');
+    expect(endpointName('patch', 'http://localhost:8000/api/cash-tills/3/', 'http://localhost:8000/api')).toBe(
+      'PATCH /cash-tills/:id/'
+    );
+  });
+});
+
+describe('summarize', () => {
+  it('reports percentiles, cache hits, retries and errors per endpoint', () => {
+    const samples: TelemetrySample[] = [10, 20, 30, 40, 100].map((duration, i) => ({
+      kind: 'request',
+      name: 'GET /stores/',
+      duration,
+      at: i,
+      status: i === 4 ? 503 : 200,
+      cache: i < 2 ? 'hit' : 'miss',
+      retries: i === 4 ? 1 : 0,
+    }));
+    const [stats] = summarize(samples);
+    expect(stats).toMatchObject({ count: 5, p50: 30, p95: 100, max: 100, cacheHits: 2, retries: 1, errors: 1 });
+  });
+});
+
+describe('Telemetry', () => {
+  it('sends samples in batches and keeps them when a batch fails', async () => {
+    const send = vi.fn().mockResolvedValueOnce(false).mockResolvedValue(true);
+    const telemetry = new Telemetry({ endpoint: '/collect', batchSize: 2, send });
+    telemetry.record({ kind: 'route', name: '/pos', duration: 5 });
+    telemetry.record({ kind: 'route', name: '/pos', duration: 6 });
+    await telemetry.flush();
+
+    telemetry.record({ kind: 'route', name: '/inventory', duration: 7 });
+    await telemetry.flush();
+    await telemetry.flush();
+    const batches = send.mock.calls.map(([, body]) => JSON.parse(body).samples.map((s: TelemetrySample) => s.duration));
+    expect(batches).toEqual([[5, 6], [5, 6], [7]]);
+  });
+
+  it('times requests through the interceptors, with cache status', async () => {
+    const transport: AxiosAdapter = async (config) => ({
+      data: { results: [] },
+      status: 200,
+      statusText: 'OK',
+      headers: { 'content-length': '14' },
+      config,
+    });
+    const cache = new RequestCache({ policies: { '/stores/': { ttlMs: 60000 } } });
+    const instance = axios.create({ baseURL: 'http://api.test', adapter: cache.adapter(transport) });
+    const telemetry = new Telemetry();
+    telemetry.instrument(instance, cache);
+
+    await instance.get('/stores/');
+    await instance.get('/stores/');
+    await instance.get('/stores/4/');
+
+    const requests = telemetry.samples();
+    expect(requests.map((sample) => [sample.name, sample.cache, sample.status, sample.bytes])).toEqual([
+      ['GET /stores/', 'miss', 200, 14],
+      ['GET /stores/', 'hit', 200, 14],
+      ['GET /stores/:id/', 'miss', 200, 14],
+    ]);
+    expect(requests.every((sample) => sample.duration >= 0)).toBe(true);
+  });
+
+  it('measures a route from navigation to page mount', () => {
+    const telemetry = new Telemetry();
+    telemetry.startRoute();
+    telemetry.endRoute('/pos');
+    telemetry.endRoute('/pos');
+    expect(telemetry.samples()).toHaveLength(1);
+    expect(telemetry.samples()[0]).toMatchObject({ kind: 'route', name: '/pos' });
+  });
+});
+
+describe('responseBytes', () => {
+  // Like an XHR with responseType blob/arraybuffer, where responseText throws InvalidStateError
+  const binaryRequest = (responseType: string) => ({
+    responseType,
+    get responseText(): string {
+      throw new DOMException('responseText is only available for text responses', 'InvalidStateError');
+    },
+  });
+  const response = (data: unknown, request: unknown, headers = {}) =>
+    ({ data, request, headers, status: 200, statusText: 'OK', config: {} }) as any;
+
+  it('sizes binary bodies without touching responseText', () => {
+    expect(responseBytes(response(new Blob(['payslip']), binaryRequest('blob')))).toBe(7);
+    expect(responseBytes(response(new ArrayBuffer(5), binaryRequest('arraybuffer')))).toBe(5);
+    expect(responseBytes(response({}, binaryRequest('json')))).toBeUndefined();
+  });
+
+  it('prefers Content-Length and falls back to the response text', () => {
+    expect(responseBytes(response('abc', { responseType: '', responseText: 'abc' }, { 'content-length': '10' }))).toBe(10);
+    expect(responseBytes(response({ a: 1 }, { responseType: '', responseText: '{"a":1}' }))).toBe(7);
+    expect(responseBytes(undefined)).toBeUndefined();
+  });
+});
@@ -1,139 +1,125 @@
-import { describe, it, expect } from 'vitest';
-import transactionReducer, {
-  setTransactions,
-  addTransaction,
-  updateTransaction,
-  deleteTransaction,
-  setLoading,
-  setError,
-  setFilters,
-  clearFilters,
-  type Transaction,
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { configureStore } from '@reduxjs/toolkit';
+import api from '../services/api';
+import reducer, {
+  fetchTransactions,
+  fetchMoreTransactions,
+  syncTransactions,
+  selectAllTransactions,
+  selectTotalsByType,
+  selectTotalsByCategory,
 } from '../store/slices/transactionSlice';
+import type { Transaction } from '../services/transactionService';
 
-describe('Transaction Slice', () => {
-  const initialState = {
-    transactions: [],
-    loading: false,
-    error: null,
-    filters: {
-      type: 'all' as const,
-      dateRange: {
-        start: null,
-        end: null,
+const tx = (id: string, overrides: Partial<Transaction> = {}): Transaction => ({
+  id,
+  description: `Transaction ${id}`,
+  amount: 100,
+  type: 'expense',
+  category: 'Rent',
+  date: '2024-03-01',
+  updated_at: '2024-03-01T10:00:00Z',
+  ...overrides,
+});
+
+const firstPage = () =>
+  reducer(
+    undefined,
+    fetchTransactions.fulfilled(
+      {
+        query: { type: 'all' },
+        page: {
+          results: [tx('bank_1', { date: '2024-03-02' }), tx('bank_2', { type: 'income', category: 'Sales', amount: 500 })],
+          count: 3,
+          next: 'http://localhost:8000/api/transactions/?page=2',
+        },
+        serverTime: null,
       },
-      category: null,
-    },
-  };
+      'req-1',
+      { type: 'all' }
+    )
+  );
 
-  const mockTransactions: Transaction[] = [
-    {
-      id: '1',
-      type: 'income',
-      amount: 1000,
-      category: 'Salary',
-      description: 'Monthly salary',
-      date: '2024-03-01',
-      status: 'completed',
-    },
-    {
-      id: '2',
-      type: 'expense',
-      amount: 500,
-      category: 'Rent',
-      description: 'Monthly rent',
-      date: '2024-03-02',
-      status: 'completed',
-    },
-  ];
+const root = (state: ReturnType<typeof reducer>) => ({ transaction: state }) as any;
 
-  it('should handle initial state', () => {
-    expect(transactionReducer(undefined, { type: 'unknown' })).toEqual(initialState);
+describe('transactionSlice', () => {
+  it('normalizes the first page by id and keeps the next cursor', () => {
+    const state = firstPage();
+    expect(state.ids).toEqual(['bank_1', 'bank_2']);
+    expect(state.next).toContain('page=2');
+    expect(state.count).toBe(3);
+    expect(state.syncedAt).toBe('2024-03-01T10:00:00Z');
   });
 
-  it('should handle setTransactions', () => {
-    const actual = transactionReducer(initialState, setTransactions(mockTransactions));
-    expect(actual.transactions).toEqual(mockTransactions);
+  it('appends further pages without duplicating rows', () => {
+    const state = reducer(
+      firstPage(),
+      fetchMoreTransactions.fulfilled({ results: [tx('bank_2'), tx('bank_3', { date: '2024-02-01' })], next: null }, 'req-2')
+    );
+    expect(state.ids).toEqual(['bank_1', 'bank_2', 'bank_3']);
+    expect(state.next).toBeNull();
   });
 
-  it('should handle addTransaction', () => {
-    const newTransaction: Transaction = {
-      id: '3',
-      type: 'expense',
-      amount: 200,
-      category: 'Groceries',
-      description: 'Weekly groceries',
-      date: '2024-03-03',
-      status: 'completed',
-    };
-    const actual = transactionReducer(
-      { ...initialState, transactions: mockTransactions },
-      addTransaction(newTransaction)
+  it('merges deltas and removes deleted ids', () => {
+    const state = reducer(
+      firstPage(),
+      syncTransactions.fulfilled(
+        {
+          changed: [tx('bank_1', { amount: 250, updated_at: '2024-03-05T00:00:00Z' }), tx('bank_9', { date: '2024-03-06' })],
+          deleted: ['bank_2'],
+          serverTime: null,
+        },
+        'req-3'
+      )
     );
-    expect(actual.transactions).toHaveLength(3);
-    expect(actual.transactions).toContain(newTransaction);
+    expect(state.ids).toEqual(['bank_9', 'bank_1']);
+    expect(state.entities.bank_1?.amount).toBe(250);
+    expect(state.count).toBe(3);
+    expect(state.syncedAt).toBe('2024-03-05T00:00:00Z');
   });
 
-  it('should handle updateTransaction', () => {
-    const updatedTransaction: Transaction = {
-      ...mockTransactions[0],
-      amount: 1500,
-      description: 'Updated salary',
-    };
-    const actual = transactionReducer(
-      { ...initialState, transactions: mockTransactions },
-      updateTransaction(updatedTransaction)
-    );
-    expect(actual.transactions[0]).toEqual(updatedTransaction);
-    expect(actual.transactions[1]).toEqual(mockTransactions[1]);
+  it('memoizes totals until the rows change', () => {
+    const state = root(firstPage());
+    const totals = selectTotalsByType(state);
+    expect(totals).toEqual({ income: 500, expense: 100, net: 400 });
+    expect(selectTotalsByType(state)).toBe(totals);
+    expect(selectTotalsByCategory(state).Sales).toEqual({ income: 500, expense: 0, net: 500, count: 1 });
+    expect(selectAllTransactions(state)).toHaveLength(2);
   });
 
-  it('should handle deleteTransaction', () => {
-    const actual = transactionReducer(
-      { ...initialState, transactions: mockTransactions },
-      deleteTransaction('1')
+  it('uses the server clock for the sync cursor', () => {
+    const state = reducer(
+      undefined,
+      fetchTransactions.fulfilled(
+        { query: {}, page: { results: [tx('bank_1')], next: null }, serverTime: '2024-03-09T08:00:00Z' },
+        'req-4',
+        {}
+      )
     );
-    expect(actual.transactions).toHaveLength(1);
-    expect(actual.transactions[0]).toEqual(mockTransactions[1]);
+    expect(state.syncedAt).toBe('2024-03-09T08:00:00Z');
   });
+});
 
-  it('should handle setLoading', () => {
-    const actual = transactionReducer(initialState, setLoading(true));
-    expect(actual.loading).toBe(true);
+describe('syncTransactions', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
   });
 
-  it('should handle setError', () => {
-    const errorMessage = 'Failed to fetch transactions';
-    const actual = transactionReducer(initialState, setError(errorMessage));
-    expect(actual.error).toBe(errorMessage);
-  });
+  it('stops paging when the server ignores updated_since', async () => {
+    const store = configureStore({ reducer: { transaction: reducer } });
+    store.dispatch(
+      fetchTransactions.fulfilled({ query: {}, page: { results: [tx('bank_1'), tx('bank_2')], next: null }, serverTime: null }, 'req-1', {})
+    );
+    // Every call returns the same unchanged first page with a next cursor
+    const get = vi.spyOn(api, 'get').mockResolvedValue({
+      data: { results: [tx('bank_1'), tx('bank_2')], next: '/transactions/?page=2', server_time: '2024-03-09T08:00:00Z' },
+      headers: {},
+    });
 
-  it('should handle setFilters', () => {
-    const newFilters = {
-      type: 'income' as const,
-      dateRange: {
-        start: '2024-03-01',
-        end: '2024-03-31',
-      },
-      category: 'Salary',
-    };
-    const actual = transactionReducer(initialState, setFilters(newFilters));
-    expect(actual.filters).toEqual(newFilters);
-  });
+    await store.dispatch(syncTransactions());
 
-  it('should handle clearFilters', () => {
-    const stateWithFilters = {
-      ...initialState,
-      filters: {
-        type: 'income' as const,
-        dateRange: {
-          start: '2024-03-01',
-          end: '2024-03-31',
-        },
-        category: 'Salary',
-      },
-    };
-    const actual = transactionReducer(stateWithFilters, clearFilters());
-    expect(actual.filters).toEqual(initialState.filters);
+    expect(get).toHaveBeenCalledTimes(1);
+    expect(store.getState().transaction.ids).toEqual(['bank_2', 'bank_1']);
+    expect(store.getState().transaction.syncedAt).toBe('2024-03-09T08:00:00Z');
   });
-}); 
\ No newline at end of file
+});
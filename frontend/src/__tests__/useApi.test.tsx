@@ -4,10 +4,15 @@ import { useApi } from '../hooks/useApi';
 import { Provider } from 'react-redux';
 import { configureStore } from '@reduxjs/toolkit';
 import authReducer from '../store/slices/authSlice';
-import axios from 'axios';
+import api from '../services/api';
 import type { ReactNode } from 'react';
 
-vi.mock('axios');
+vi.mock('../services/api', () => ({
+  default: {
+    request: vi.fn(),
+  },
+  requestCache: { clear: vi.fn() },
+}));
 
 const mockStore = configureStore({
   reducer: {
@@ -15,7 +20,8 @@ const mockStore = configureStore({
   },
   preloadedState: {
     auth: {
-      token: 'mock-token',
+      access: 'mock-token',
+      refresh: null,
       user: null,
       isAuthenticated: true,
       loading: false,
@@ -33,84 +39,72 @@ describe('useApi', () => {
     vi.clearAllMocks();
   });
 
-  it('creates axios instance with correct base URL', () => {
-    const { result } = renderHook(() => useApi(), { wrapper: Wrapper });
-    expect(axios.create).toHaveBeenCalledWith({
-      baseURL: expect.any(String),
-      headers: {
-        'Content-Type': 'application/json',
-      },
-    });
-  });
+  it('sends requests through the shared api client', async () => {
+    const mockResponse = { data: { test: 'data' } };
+    (api.request as any).mockResolvedValue(mockResponse);
 
-  it('adds authorization header when token is present', () => {
     const { result } = renderHook(() => useApi(), { wrapper: Wrapper });
-    expect(axios.create).toHaveBeenCalledWith(
-      expect.objectContaining({
-        headers: expect.objectContaining({
-          'Content-Type': 'application/json',
-        }),
-      })
+    const response = await result.current.get('/test');
+
+    expect(response).toBe(mockResponse);
+    expect(api.request).toHaveBeenCalledWith(
+      expect.objectContaining({ method: 'get', url: '/test' })
     );
   });
 
-  it('makes GET request correctly', async () => {
-    const mockResponse = { data: { test: 'data' } };
-    (axios.create as any).mockReturnValue({
-      get: vi.fn().mockResolvedValue(mockResponse),
-    });
+  it('adds the authorization header from the auth slice', async () => {
+    (api.request as any).mockResolvedValue({ data: {} });
 
     const { result } = renderHook(() => useApi(), { wrapper: Wrapper });
-    const response = await result.current.get('/test');
+    await result.current.post('/test', { test: 'input' });
 
-    expect(response).toBe(mockResponse);
+    expect(api.request).toHaveBeenCalledWith(
+      expect.objectContaining({
+        method: 'post',
+        data: { test: 'input' },
+        headers: expect.objectContaining({ Authorization: 'Bearer mock-token' }),
+      })
+    );
   });
 
-  it('makes POST request correctly', async () => {
-    const mockResponse = { data: { test: 'data' } };
-    const mockData = { test: 'input' };
-    (axios.create as any).mockReturnValue({
-      post: vi.fn().mockResolvedValue(mockResponse),
-    });
+  it('makes PUT and DELETE requests correctly', async () => {
+    (api.request as any).mockResolvedValue({ data: {} });
 
     const { result } = renderHook(() => useApi(), { wrapper: Wrapper });
-    const response = await result.current.post('/test', mockData);
+    await result.current.put('/test/1', { name: 'x' });
+    await result.current.delete('/test/1');
 
-    expect(response).toBe(mockResponse);
+    expect(api.request).toHaveBeenNthCalledWith(1, expect.objectContaining({ method: 'put', url: '/test/1' }));
+    expect(api.request).toHaveBeenNthCalledWith(2, expect.objectContaining({ method: 'delete', url: '/test/1' }));
   });
 
-  it('makes PUT request correctly', async () => {
-    const mockResponse = { data: { test: 'data' } };
-    const mockData = { test: 'input' };
-    (axios.create as any).mockReturnValue({
-      put: vi.fn().mockResolvedValue(mockResponse),
-    });
+  it('passes cache options through to the client', async () => {
+    (api.request as any).mockResolvedValue({ data: {} });
 
     const { result } = renderHook(() => useApi(), { wrapper: Wrapper });
-    const response = await result.current.put('/test', mockData);
+    await result.current.get('/stores/', { cache: false, dedupe: false });
 
-    expect(response).toBe(mockResponse);
+    expect(api.request).toHaveBeenCalledWith(expect.objectContaining({ cache: false, dedupe: false }));
   });
 
-  it('makes DELETE request correctly', async () => {
-    const mockResponse = { data: { test: 'data' } };
-    (axios.create as any).mockReturnValue({
-      delete: vi.fn().mockResolvedValue(mockResponse),
+  it('aborts pending requests when the component unmounts', async () => {
+    let signal: AbortSignal | undefined;
+    (api.request as any).mockImplementation((config: any) => {
+      signal = config.signal;
+      return new Promise(() => undefined);
     });
 
-    const { result } = renderHook(() => useApi(), { wrapper: Wrapper });
-    const response = await result.current.delete('/test');
+    const { result, unmount } = renderHook(() => useApi(), { wrapper: Wrapper });
+    result.current.get('/slow');
+    unmount();
 
-    expect(response).toBe(mockResponse);
+    expect(signal?.aborted).toBe(true);
   });
 
   it('handles request errors correctly', async () => {
-    const mockError = new Error('Network error');
-    (axios.create as any).mockReturnValue({
-      get: vi.fn().mockRejectedValue(mockError),
-    });
+    (api.request as any).mockRejectedValue(new Error('Network error'));
 
     const { result } = renderHook(() => useApi(), { wrapper: Wrapper });
     await expect(result.current.get('/test')).rejects.toThrow('Network error');
   });
-}); 
\ No newline at end of file
+});
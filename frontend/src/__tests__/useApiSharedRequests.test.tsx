@@ -0,0 +1,52 @@
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { renderHook } from '@testing-library/react';
+import { Provider } from 'react-redux';
+import { configureStore } from '@reduxjs/toolkit';
+import type { ReactNode } from 'react';
+import type { AxiosAdapter, InternalAxiosRequestConfig } from 'axios';
+import { useApi } from '../hooks/useApi';
+import authReducer from '../store/slices/authSlice';
+import api, { requestCache } from '../services/api';
+
+// The real client and request cache, with only the network underneath stubbed
+const store = configureStore({ reducer: { auth: authReducer } });
+const Wrapper = ({ children }: { children: ReactNode }) => <Provider store={store}>{children}</Provider>;
+
+describe('useApi with shared requests', () => {
+  const original = api.defaults.adapter;
+  let sent: InternalAxiosRequestConfig[];
+  let answer: () => void;
+
+  beforeEach(() => {
+    sent = [];
+    const transport: AxiosAdapter = (config) =>
+      new Promise((resolve, reject) => {
+        sent.push(config);
+        answer = () => resolve({ data: { id: 1 }, status: 200, statusText: 'OK', headers: {}, config });
+        (config.signal as AbortSignal | undefined)?.addEventListener?.('abort', () => reject(new Error('aborted')));
+      });
+    requestCache.clear();
+    api.defaults.adapter = requestCache.adapter(transport);
+  });
+
+  afterEach(() => {
+    api.defaults.adapter = original;
+  });
+
+  it('keeps answering one component after another requesting the same URL unmounts', async () => {
+    const first = renderHook(() => useApi(), { wrapper: Wrapper });
+    const second = renderHook(() => useApi(), { wrapper: Wrapper });
+
+    const leaving = first.result.current.get('/users/1/');
+    const staying = second.result.current.get('/users/1/');
+    // Let both pass the interceptors and join the one request before leaving
+    await new Promise((resolve) => setTimeout(resolve, 0));
+    expect(sent).toHaveLength(1);
+    first.unmount();
+
+    await expect(leaving).rejects.toMatchObject({ code: 'ERR_CANCELED' });
+    answer();
+    expect((await staying).data).toEqual({ id: 1 });
+    expect(sent).toHaveLength(1);
+  });
+});
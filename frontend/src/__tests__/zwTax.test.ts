@@ -0,0 +1,61 @@
+import { describe, it, expect } from 'vitest';
+import {
+  compileZwTaxTable,
+  computeZwPayrollBatch,
+  computeZwPayrollDeductions,
+  defaultZwTaxConfig,
+  runZwPayrollBatch,
+  ZwTaxConfig,
+} from '../utils/zwTax';
+
+const grossSamples = [0, 150, 300, 299.99, 1000, 1000.01, 2000, 2999, 4000, 5000, 12500, 80000];
+
+describe('computeZwPayrollBatch', () => {
+  const configs: Array<[string, ZwTaxConfig]> = [
+    ['default bands', defaultZwTaxConfig],
+    ['with a tax credit', { ...defaultZwTaxConfig, annualTaxCredit: 1200 }],
+    [
+      'without an open top band',
+      {
+        annualBands: [
+          { upTo: 1000, rate: 0.1 },
+          { upTo: 5000, rate: 0.2 },
+        ],
+        annualTaxCredit: 50,
+        aidsLevyRate: 0.03,
+        nssaRate: 0.04,
+        nssaMonthlyCap: 100,
+      },
+    ],
+  ];
+
+  it.each(configs)('matches computeZwPayrollDeductions (%s)', (_, config) => {
+    const batch = computeZwPayrollBatch(Float64Array.from(grossSamples), config);
+    grossSamples.forEach((gross, i) => {
+      const single = computeZwPayrollDeductions(gross, config);
+      expect(batch.paye[i]).toBeCloseTo(single.paye, 9);
+      expect(batch.aidsLevy[i]).toBeCloseTo(single.aidsLevy, 9);
+      expect(batch.nssa[i]).toBeCloseTo(single.nssa, 9);
+      expect(batch.totalDeductions[i]).toBeCloseTo(single.totalDeductions, 9);
+    });
+  });
+
+  it('sums each column in the same pass', () => {
+    const batch = computeZwPayrollBatch([1000, 2000, 3000]);
+    const paye = [1000, 2000, 3000].reduce((sum, g) => sum + computeZwPayrollDeductions(g).paye, 0);
+    expect(batch.totals.gross).toBe(6000);
+    expect(batch.totals.paye).toBeCloseTo(paye, 9);
+  });
+
+  it('compiles each config once into cumulative thresholds', () => {
+    const table = compileZwTaxTable(defaultZwTaxConfig);
+    expect(compileZwTaxTable(defaultZwTaxConfig)).toBe(table);
+    expect(Array.from(table.lower)).toEqual([0, 3600, 12000, 24000, 36000, 48000]);
+    expect(table.base[2]).toBeCloseTo(8400 * 0.2, 9);
+  });
+
+  it('runs inline below the worker threshold', async () => {
+    const result = await runZwPayrollBatch(Float64Array.from([1000]), { useWorker: false });
+    expect(result.paye[0]).toBeCloseTo(computeZwPayrollDeductions(1000).paye, 9);
+  });
+});
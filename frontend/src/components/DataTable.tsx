@@ -1,5 +1,9 @@
-import { useState, useMemo } from 'react';
+import { useState, useMemo, useEffect, useRef } from 'react';
 import { FiChevronDown, FiChevronUp, FiSearch } from 'react-icons/fi';
+import { buildSearchIndex, searchRows, sortRows } from '../utils/tableData';
+import type { SortDirection } from '../utils/tableData';
+import { EXPORT_MIME_TYPES, exportRows, isAbortError, openExportSink } from '../utils/exportStream';
+import type { ExportFormat, ExportRow, ExportSink } from '../utils/exportStream';
 
 interface Column<T> {
   header: string;
@@ -10,6 +14,13 @@ interface Column<T> {
 
 type RowId = string | number;
 
+export interface DataTableQuery<T> {
+  page: number;
+  pageSize: number;
+  sort: { key: keyof T; direction: SortDirection } | null;
+  search: string;
+}
+
 interface DataTableProps<T> {
   columns: Column<T>[];
   data: T[];
@@ -20,8 +31,30 @@ interface DataTableProps<T> {
   onSelectionChange?: (selected: RowId[]) => void;
   enableExport?: boolean;
   exportFileName?: string;
+  exportFormats?: ExportFormat[];
+  /** Render only the rows in view inside a fixed-height scroll area instead of paginating */
+  virtualized?: boolean;
+  rowHeight?: number;
+  height?: number;
+  /**
+   * Server-driven mode: `data` is the current page only and paging, sorting
+   * and searching are delegated to this callback (search is debounced).
+   */
+  onQueryChange?: (query: DataTableQuery<T>) => void;
+  /**
+   * Server-driven mode: fetch every row matching the current search and sort
+   * for export. Without it, export is not offered, since `data` is one page.
+   */
+  onExportAll?: (query: Pick<DataTableQuery<T>, 'sort' | 'search'>, signal: AbortSignal) => Promise<T[]>;
+  totalCount?: number;
+  loading?: boolean;
 }
 
+const OVERSCAN_ROWS = 8;
+const SEARCH_DEBOUNCE_MS = 300;
+// Larger exports are encoded in a Web Worker
+const WORKER_EXPORT_ROWS = 20000;
+
 export function DataTable<T extends { id: RowId }>({
   columns,
   data,
@@ -32,101 +65,173 @@ export function DataTable<T extends { id: RowId }>({
   onSelectionChange,
   enableExport = false,
   exportFileName = 'export.csv',
+  exportFormats = ['csv'],
+  virtualized = false,
+  rowHeight = 48,
+  height = 480,
+  onQueryChange,
+  onExportAll,
+  totalCount,
+  loading = false,
 }: DataTableProps<T>) {
+  const serverSide = !!onQueryChange;
   const [currentPage, setCurrentPage] = useState(1);
-  const [sortConfig, setSortConfig] = useState<{ key: keyof T; direction: 'asc' | 'desc' } | null>(null);
+  const [sortConfig, setSortConfig] = useState<{ key: keyof T; direction: SortDirection } | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
-  const [selectedIds, setSelectedIds] = useState<RowId[]>([]);
+  const [selectedIds, setSelectedIds] = useState<Set<RowId>>(() => new Set());
+  const [scrollTop, setScrollTop] = useState(0);
+  const [exportProgress, setExportProgress] = useState<number | null>(null);
+  const [exportError, setExportError] = useState<string | null>(null);
+  const scrollFrame = useRef<number>();
+  const exportController = useRef<AbortController | null>(null);
+  // Held in a ref so an inline callback does not re-trigger the query effect
+  const queryHandler = useRef(onQueryChange);
+  queryHandler.current = onQueryChange;
 
-  const filteredData = useMemo(() => {
-    let result = [...data];
+  // Rebuilt only when the rows change, not on every keystroke
+  const searchIndex = useMemo(() => (serverSide ? [] : buildSearchIndex(data)), [data, serverSide]);
 
-    if (searchTerm) {
-      const searchLower = searchTerm.toLowerCase();
-      result = result.filter((item) =>
-        Object.values(item).some((value) => String(value).toLowerCase().includes(searchLower))
-      );
-    }
-
-    if (sortConfig) {
-      result.sort((a, b) => {
-        const aValue = a[sortConfig.key];
-        const bValue = b[sortConfig.key];
-        if (aValue === bValue) return 0;
-        if (aValue === null) return 1;
-        if (bValue === null) return -1;
-        const comparison = String(aValue).localeCompare(String(bValue));
-        return sortConfig.direction === 'asc' ? comparison : -comparison;
-      });
-    }
+  const filteredData = useMemo(() => {
+    if (serverSide) return data;
+    const matches = searchTerm ? searchRows(data, searchIndex, searchTerm) : data;
+    return sortConfig ? sortRows(matches, sortConfig.key, sortConfig.direction) : matches;
+  }, [data, searchIndex, sortConfig, searchTerm, serverSide]);
 
-    return result;
-  }, [data, sortConfig, searchTerm]);
+  const totalRows = serverSide ? totalCount ?? data.length : filteredData.length;
+  const paginated = !virtualized || serverSide;
+  const canExport = enableExport && (!serverSide || !!onExportAll);
 
   const paginatedData = useMemo(() => {
+    if (serverSide || !paginated) return filteredData;
     const startIndex = (currentPage - 1) * pageSize;
     return filteredData.slice(startIndex, startIndex + pageSize);
-  }, [filteredData, currentPage, pageSize]);
+  }, [filteredData, currentPage, pageSize, paginated, serverSide]);
 
-  const totalPages = Math.ceil(filteredData.length / pageSize);
+  const totalPages = Math.max(1, Math.ceil(totalRows / pageSize));
+
+  useEffect(() => {
+    if (!serverSide) return;
+    const timer = window.setTimeout(
+      () => queryHandler.current?.({ page: currentPage, pageSize, sort: sortConfig, search: searchTerm }),
+      searchTerm ? SEARCH_DEBOUNCE_MS : 0
+    );
+    return () => window.clearTimeout(timer);
+  }, [serverSide, currentPage, pageSize, sortConfig, searchTerm]);
+
+  useEffect(() => () => {
+    if (scrollFrame.current) cancelAnimationFrame(scrollFrame.current);
+    exportController.current?.abort();
+  }, []);
+
+  // Only the rows inside the scroll viewport (plus overscan) are mounted
+  const windowStart = virtualized ? Math.max(0, Math.floor(scrollTop / rowHeight) - OVERSCAN_ROWS) : 0;
+  const windowEnd = virtualized
+    ? Math.min(paginatedData.length, Math.ceil((scrollTop + height) / rowHeight) + OVERSCAN_ROWS)
+    : paginatedData.length;
+  const visibleRows = virtualized ? paginatedData.slice(windowStart, windowEnd) : paginatedData;
+
+  const handleScroll = (e: React.UIEvent<HTMLDivElement>) => {
+    const top = e.currentTarget.scrollTop;
+    if (scrollFrame.current) cancelAnimationFrame(scrollFrame.current);
+    scrollFrame.current = requestAnimationFrame(() => setScrollTop(top));
+  };
+
+  const handleSearch = (value: string) => {
+    setSearchTerm(value);
+    setCurrentPage(1);
+  };
 
   const handleSort = (key: keyof T) => {
     setSortConfig((current) => ({
       key,
       direction: current?.key === key && current.direction === 'asc' ? 'desc' : 'asc',
     }));
+    setCurrentPage(1);
   };
 
-  const allVisibleSelected = selectableRows && paginatedData.every((row) => selectedIds.includes(row.id));
+  const updateSelection = (next: Set<RowId>) => {
+    setSelectedIds(next);
+    onSelectionChange?.(Array.from(next));
+  };
+
+  // Select-all covers the rows on hand: the current page, or every matching
+  // row when virtualized client-side. Server-driven tables only hold one page.
+  const selectionScope = paginatedData;
+  const selectAllLabel = paginated ? 'Select all rows on this page' : 'Select all matching rows';
+  const allVisibleSelected =
+    selectableRows && selectionScope.length > 0 && selectionScope.every((row) => selectedIds.has(row.id));
 
   const toggleSelectAllVisible = () => {
     if (!selectableRows) return;
-    let next: RowId[] = [];
+    const next = new Set(selectedIds);
     if (allVisibleSelected) {
-      const visibleIds = new Set(paginatedData.map((r) => r.id));
-      next = selectedIds.filter((id) => !visibleIds.has(id));
+      selectionScope.forEach((row) => next.delete(row.id));
     } else {
-      const idsToAdd = paginatedData.map((r) => r.id).filter((id) => !selectedIds.includes(id));
-      next = [...selectedIds, ...idsToAdd];
+      selectionScope.forEach((row) => next.add(row.id));
     }
-    setSelectedIds(next);
-    onSelectionChange?.(next);
+    updateSelection(next);
   };
 
   const toggleSelectOne = (id: RowId) => {
     if (!selectableRows) return;
-    const next = selectedIds.includes(id) ? selectedIds.filter((x) => x !== id) : [...selectedIds, id];
-    setSelectedIds(next);
-    onSelectionChange?.(next);
+    const next = new Set(selectedIds);
+    if (next.has(id)) {
+      next.delete(id);
+    } else {
+      next.add(id);
+    }
+    updateSelection(next);
   };
 
-  const handleExport = () => {
-    const rows = filteredData;
-    const headers = columns.map((c) => String(c.header));
-    const csv = [headers.join(',')]
-      .concat(
-        rows.map((row) =>
-          columns
-            .map((c) => {
-              const v = row[c.accessor];
-              const s = typeof v === 'string' ? v : String(v ?? '');
-              return '"' + s.replace(/"/g, '""') + '"';
-            })
-            .join(',')
-        )
-      )
-      .join('\n');
-    const blob = new Blob([csv], { type: 'text/csv;charset=utf-8;' });
-    const url = URL.createObjectURL(blob);
-    const link = document.createElement('a');
-    link.href = url;
-    link.setAttribute('download', exportFileName);
-    document.body.appendChild(link);
-    link.click();
-    link.remove();
-    URL.revokeObjectURL(url);
+  const handleExport = async (format: ExportFormat) => {
+    if (exportController.current) return;
+    const controller = new AbortController();
+    exportController.current = controller;
+    const fileName = exportFileName.replace(/\.[^.]+$/, '') + `.${format}`;
+    // Opened before anything else is awaited: the save dialog needs the click's user activation
+    const opening = openExportSink(fileName, EXPORT_MIME_TYPES[format]);
+    setExportError(null);
+    setExportProgress(0);
+    let sink: ExportSink | undefined;
+    try {
+      sink = await opening;
+      const rows = (
+        serverSide ? await onExportAll!({ sort: sortConfig, search: searchTerm }, controller.signal) : filteredData
+      ) as unknown as ExportRow[];
+      if (controller.signal.aborted) throw new DOMException('Export cancelled', 'AbortError');
+      const opened = sink;
+      sink = undefined;
+      await exportRows(
+        rows,
+        columns.map((c) => ({ header: String(c.header), key: String(c.accessor) })),
+        {
+          format,
+          fileName,
+          sink: opened,
+          signal: controller.signal,
+          useWorker: rows.length >= WORKER_EXPORT_ROWS,
+          onProgress: ({ rows: written, totalRows }) =>
+            setExportProgress(totalRows ? Math.round((written / totalRows) * 100) : 100),
+        }
+      );
+    } catch (error) {
+      // Still ours only if the rows never arrived; exportRows discards its own
+      await sink?.abort().catch(() => undefined);
+      // Thrown from a click handler nothing would catch it, so show it instead
+      if (!isAbortError(error) && !controller.signal.aborted) {
+        console.error('Export failed:', error);
+        setExportError(error instanceof Error && error.message ? error.message : 'Export failed');
+      }
+    } finally {
+      exportController.current = null;
+      setExportProgress(null);
+    }
   };
 
+  const columnCount = columns.length + (selectableRows ? 1 : 0);
+  const firstShown = totalRows === 0 ? 0 : paginated ? (currentPage - 1) * pageSize + 1 : 1;
+  const lastShown = paginated ? Math.min(currentPage * pageSize, totalRows) : totalRows;
+
   return (
     <div className="bg-white shadow-md rounded-lg overflow-hidden">
       {searchable && (
@@ -136,26 +241,51 @@ export function DataTable<T extends { id: RowId }>({
               type="text"
               placeholder="Search..."
               value={searchTerm}
-              onChange={(e) => setSearchTerm(e.target.value)}
+              onChange={(e) => handleSearch(e.target.value)}
               className="w-full pl-10 pr-4 py-2 border rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
             />
             <FiSearch className="absolute left-3 top-3 text-gray-400" />
           </div>
-          {enableExport && (
-            <button onClick={handleExport} className="px-3 py-2 border rounded-md text-sm">
-              Export CSV
-            </button>
+          {canExport && exportError && (
+            <span role="alert" className="text-sm text-red-600">
+              {exportError}
+            </span>
           )}
+          {canExport &&
+            (exportProgress === null ? (
+              exportFormats.map((format) => (
+                <button key={format} onClick={() => handleExport(format)} className="px-3 py-2 border rounded-md text-sm">
+                  Export {format.toUpperCase()}
+                </button>
+              ))
+            ) : (
+              <>
+                <span className="text-sm text-gray-600">Exporting {exportProgress}%</span>
+                <button onClick={() => exportController.current?.abort()} className="px-3 py-2 border rounded-md text-sm">
+                  Cancel
+                </button>
+              </>
+            ))}
         </div>
       )}
 
-      <div className="overflow-x-auto">
+      <div
+        className={virtualized ? 'overflow-auto' : 'overflow-x-auto'}
+        style={virtualized ? { height } : undefined}
+        onScroll={virtualized ? handleScroll : undefined}
+      >
         <table className="min-w-full divide-y divide-gray-200">
-          <thead className="bg-gray-50">
+          <thead className={virtualized ? 'bg-gray-50 sticky top-0 z-10' : 'bg-gray-50'}>
             <tr>
               {selectableRows && (
                 <th className="px-6 py-3">
-                  <input type="checkbox" checked={!!allVisibleSelected} onChange={toggleSelectAllVisible} />
+                  <input
+                    type="checkbox"
+                    aria-label={selectAllLabel}
+                    title={selectAllLabel}
+                    checked={!!allVisibleSelected}
+                    onChange={toggleSelectAllVisible}
+                  />
                 </th>
               )}
               {columns.map((column) => (
@@ -180,22 +310,26 @@ export function DataTable<T extends { id: RowId }>({
               ))}
             </tr>
           </thead>
-          <tbody className="bg-white divide-y divide-gray-200">
-            {paginatedData.map((row) => (
+          <tbody className={loading ? 'bg-white divide-y divide-gray-200 opacity-50' : 'bg-white divide-y divide-gray-200'}>
+            {virtualized && windowStart > 0 && (
+              <tr aria-hidden="true" style={{ height: windowStart * rowHeight }}>
+                <td colSpan={columnCount} />
+              </tr>
+            )}
+            {visibleRows.map((row) => (
               <tr
                 key={row.id}
                 onClick={() => onRowClick?.(row)}
                 className={onRowClick ? 'cursor-pointer hover:bg-gray-50' : ''}
+                style={virtualized ? { height: rowHeight } : undefined}
               >
                 {selectableRows && (
                   <td className="px-6 py-4 whitespace-nowrap">
                     <input
                       type="checkbox"
-                      checked={selectedIds.includes(row.id)}
-                      onChange={(e) => {
-                        e.stopPropagation();
-                        toggleSelectOne(row.id);
-                      }}
+                      checked={selectedIds.has(row.id)}
+                      onClick={(e) => e.stopPropagation()}
+                      onChange={() => toggleSelectOne(row.id)}
                     />
                   </td>
                 )}
@@ -206,23 +340,30 @@ export function DataTable<T extends { id: RowId }>({
                 ))}
               </tr>
             ))}
+            {virtualized && windowEnd < paginatedData.length && (
+              <tr aria-hidden="true" style={{ height: (paginatedData.length - windowEnd) * rowHeight }}>
+                <td colSpan={columnCount} />
+              </tr>
+            )}
           </tbody>
         </table>
       </div>
 
       <div className="px-6 py-4 border-t flex items-center justify-between">
         <div className="text-sm text-gray-700">
-          Showing {(currentPage - 1) * pageSize + 1} to {Math.min(currentPage * pageSize, filteredData.length)} of {filteredData.length} results
-        </div>
-        <div className="flex space-x-2">
-          <button onClick={() => setCurrentPage((prev) => Math.max(prev - 1, 1))} disabled={currentPage === 1} className="px-3 py-1 border rounded-md disabled:opacity-50">
-            Previous
-          </button>
-          <button onClick={() => setCurrentPage((prev) => Math.min(prev + 1, totalPages))} disabled={currentPage === totalPages} className="px-3 py-1 border rounded-md disabled:opacity-50">
-            Next
-          </button>
+          Showing {firstShown} to {lastShown} of {totalRows} results
         </div>
+        {paginated && (
+          <div className="flex space-x-2">
+            <button onClick={() => setCurrentPage((prev) => Math.max(prev - 1, 1))} disabled={currentPage === 1 || loading} className="px-3 py-1 border rounded-md disabled:opacity-50">
+              Previous
+            </button>
+            <button onClick={() => setCurrentPage((prev) => Math.min(prev + 1, totalPages))} disabled={currentPage === totalPages || loading} className="px-3 py-1 border rounded-md disabled:opacity-50">
+              Next
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
-} 
\ No newline at end of file
+}
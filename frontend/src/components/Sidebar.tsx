@@ -1,8 +1,9 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback } from 'react';
 import { Link, useLocation } from 'react-router-dom';
 import { useAuth } from '../hooks/useAuth';
 import { cn } from '../utils/cn';
 import { primaryNav, NavItem } from '../config/navigation';
+import { prefetchRoute, prefetchRoutesWhenIdle } from '../config/routes';
 
 const Sidebar: React.FC = () => {
   const location = useLocation();
@@ -36,7 +37,7 @@ const Sidebar: React.FC = () => {
     });
   }, [location.pathname]);
 
-  const allowed = (roles?: Array<'superadmin' | 'employer' | 'employee'>) => {
+  const allowed = useCallback((roles?: Array<'superadmin' | 'employer' | 'employee'>) => {
     if (!roles || roles.length === 0) return true;
     const isStaff = (user as any)?.is_staff === true;
     // Map legacy/alternate roles to app roles
@@ -45,7 +46,21 @@ const Sidebar: React.FC = () => {
     // Staff should have access to all gated items
     if (isStaff) return true;
     return normalizedRole ? roles.includes(normalizedRole) : false;
-  };
+  }, [user]);
+
+  // Warm the page chunks the user is allowed to open once the browser is idle
+  useEffect(() => {
+    const paths: string[] = [];
+    const collect = (items: NavItem[]) => {
+      items.forEach(item => {
+        if (!allowed(item.roles)) return;
+        if (item.path) paths.push(item.path);
+        if (item.children) collect(item.children);
+      });
+    };
+    collect(primaryNav);
+    return prefetchRoutesWhenIdle(paths);
+  }, [allowed]);
 
   const toggleMenu = (key: string) => {
     setExpandedMenus(prev => {
@@ -149,6 +164,8 @@ const Sidebar: React.FC = () => {
                         <Link
                           key={child.key}
                           to={child.path || '#'}
+                          onMouseEnter={() => prefetchRoute(child.path)}
+                          onFocus={() => prefetchRoute(child.path)}
                           className={cn(
                             'flex items-center px-3 py-2 text-sm font-medium rounded-md transition-colors',
                             isChildActive ? 'bg-blue-600 text-white' : 'text-gray-400 hover:bg-gray-800 hover:text-white'
@@ -171,6 +188,8 @@ const Sidebar: React.FC = () => {
             <Link
               key={item.key}
               to={item.path || '#'}
+              onMouseEnter={() => prefetchRoute(item.path)}
+              onFocus={() => prefetchRoute(item.path)}
               className={cn(
                 'flex items-center px-3 py-2 text-sm font-medium rounded-md transition-colors',
                 isActive ? 'bg-blue-600 text-white' : 'text-gray-300 hover:bg-gray-800 hover:text-white'
@@ -1,20 +1,18 @@
 import React, { useEffect } from 'react';
 import { useDispatch } from 'react-redux';
 import { initializeAuth } from '../../store/slices/authSlice';
-import api from '../../services/api';
+import api, { authTokens } from '../../services/api';
 
 const AuthInitializer: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const dispatch = useDispatch();
 
   useEffect(() => {
     const initializeAuthState = async () => {
-      const accessToken = localStorage.getItem('access');
+      const accessToken = authTokens.getAccess();
       
       if (accessToken) {
         try {
-          // Set the token in the API headers
-          api.defaults.headers.common['Authorization'] = `Bearer ${accessToken}`;
-          
+          // The request interceptor adds the (renewed) token
           // Fetch user data
           const response = await api.get('/users/me/');
           const userData = {
@@ -29,9 +27,7 @@ const AuthInitializer: React.FC<{ children: React.ReactNode }> = ({ children })
         } catch (error) {
           console.error('Failed to initialize auth:', error);
           // Clear invalid tokens
-          localStorage.removeItem('access');
-          localStorage.removeItem('refresh');
-          delete api.defaults.headers.common['Authorization'];
+          authTokens.clear();
         }
       }
     };
@@ -0,0 +1,22 @@
+import React from 'react';
+import { useRealtimeStatus } from '../../hooks/useRealtime';
+
+const LABELS = {
+  idle: { text: 'Offline', dot: 'bg-gray-400' },
+  connecting: { text: 'Connecting…', dot: 'bg-yellow-400' },
+  live: { text: 'Live', dot: 'bg-green-500' },
+  polling: { text: 'Auto-refresh', dot: 'bg-blue-400' },
+} as const;
+
+/** Shows whether the page is receiving pushed updates or polling for them. */
+const LiveStatus: React.FC = () => {
+  const status = LABELS[useRealtimeStatus()];
+  return (
+    <span className="inline-flex items-center gap-1.5 text-xs text-gray-500">
+      <span className={`h-2 w-2 rounded-full ${status.dot}`} />
+      {status.text}
+    </span>
+  );
+};
+
+export default LiveStatus;
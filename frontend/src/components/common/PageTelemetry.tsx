@@ -0,0 +1,17 @@
+import React, { Profiler, useEffect } from 'react';
+import { telemetry } from '../../services/telemetry';
+
+/** Times renders of a page and ends the route timing once it has mounted. */
+const PageTelemetry: React.FC<{ id: string; children: React.ReactNode }> = ({ id, children }) => {
+  useEffect(() => {
+    telemetry.endRoute(id);
+  }, [id]);
+
+  return (
+    <Profiler id={id} onRender={telemetry.onRender}>
+      {children}
+    </Profiler>
+  );
+};
+
+export default PageTelemetry;
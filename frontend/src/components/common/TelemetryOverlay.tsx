@@ -0,0 +1,117 @@
+import React, { useEffect, useMemo, useState } from 'react';
+import { summarize, telemetry } from '../../services/telemetry';
+import type { SampleStats, TelemetrySample } from '../../services/telemetry';
+
+const KINDS: TelemetrySample['kind'][] = ['request', 'route', 'render', 'longtask'];
+const REFRESH_MS = 1000;
+
+const ms = (value: number) => `${value < 10 ? value.toFixed(1) : Math.round(value)} ms`;
+
+const kb = (bytes: number) => (bytes ? `${(bytes / 1024).toFixed(1)} kB` : '—');
+
+/** Development-only panel listing the slowest requests, routes, renders and long tasks. */
+const TelemetryOverlay: React.FC = () => {
+  const [open, setOpen] = useState(false);
+  const [kind, setKind] = useState<TelemetrySample['kind']>('request');
+  const [samples, setSamples] = useState<TelemetrySample[]>([]);
+
+  useEffect(() => {
+    if (!open) return;
+    // Samples arrive in bursts; re-render at most once a second
+    let timer: ReturnType<typeof setTimeout> | null = null;
+    const refresh = () => {
+      timer = null;
+      setSamples(telemetry.samples());
+    };
+    refresh();
+    const unsubscribe = telemetry.subscribe(() => {
+      if (!timer) timer = setTimeout(refresh, REFRESH_MS);
+    });
+    return () => {
+      unsubscribe();
+      if (timer) clearTimeout(timer);
+    };
+  }, [open]);
+
+  const rows = useMemo<SampleStats[]>(
+    () => summarize(samples.filter((sample) => sample.kind === kind)).sort((a, b) => b.p95 - a.p95),
+    [samples, kind]
+  );
+
+  if (!open) {
+    return (
+      <button
+        onClick={() => setOpen(true)}
+        className="fixed bottom-4 left-4 z-50 rounded-full bg-gray-800 px-3 py-1 text-xs text-white opacity-60 hover:opacity-100"
+        title="Performance telemetry"
+      >
+        ⏱ perf
+      </button>
+    );
+  }
+
+  return (
+    <div className="fixed bottom-4 left-4 z-50 w-[36rem] max-h-[60vh] overflow-auto rounded-lg bg-gray-900 p-3 text-xs text-gray-100 shadow-xl">
+      <div className="mb-2 flex items-center justify-between">
+        <div className="flex gap-1">
+          {KINDS.map((option) => (
+            <button
+              key={option}
+              onClick={() => setKind(option)}
+              className={`rounded px-2 py-0.5 ${option === kind ? 'bg-blue-600' : 'bg-gray-700 hover:bg-gray-600'}`}
+            >
+              {option}
+            </button>
+          ))}
+        </div>
+        <button onClick={() => setOpen(false)} className="px-2 text-gray-400 hover:text-white">
+          ✕
+        </button>
+      </div>
+      {rows.length === 0 ? (
+        <p className="py-4 text-center text-gray-400">No {kind} samples yet</p>
+      ) : (
+        <table className="w-full">
+          <thead>
+            <tr className="text-left text-gray-400">
+              <th className="py-1 pr-2">Name</th>
+              <th className="py-1 pr-2 text-right">n</th>
+              <th className="py-1 pr-2 text-right">p50</th>
+              <th className="py-1 pr-2 text-right">p95</th>
+              <th className="py-1 pr-2 text-right">max</th>
+              {kind === 'request' && (
+                <>
+                  <th className="py-1 pr-2 text-right">cache</th>
+                  <th className="py-1 pr-2 text-right">retries</th>
+                  <th className="py-1 pr-2 text-right">errors</th>
+                  <th className="py-1 text-right">size</th>
+                </>
+              )}
+            </tr>
+          </thead>
+          <tbody>
+            {rows.map((row) => (
+              <tr key={row.name} className="border-t border-gray-800">
+                <td className="py-1 pr-2 font-mono break-all">{row.name}</td>
+                <td className="py-1 pr-2 text-right">{row.count}</td>
+                <td className="py-1 pr-2 text-right">{ms(row.p50)}</td>
+                <td className="py-1 pr-2 text-right">{ms(row.p95)}</td>
+                <td className="py-1 pr-2 text-right">{ms(row.max)}</td>
+                {kind === 'request' && (
+                  <>
+                    <td className="py-1 pr-2 text-right">{Math.round((row.cacheHits / row.count) * 100)}%</td>
+                    <td className="py-1 pr-2 text-right">{row.retries}</td>
+                    <td className={`py-1 pr-2 text-right ${row.errors ? 'text-red-400' : ''}`}>{row.errors}</td>
+                    <td className="py-1 text-right">{kb(row.bytes / row.count)}</td>
+                  </>
+                )}
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      )}
+    </div>
+  );
+};
+
+export default TelemetryOverlay;
@@ -0,0 +1,153 @@
+import { lazyPage } from '../utils/lazyPage';
+import type { LazyPage } from '../utils/lazyPage';
+
+// Every page behind the sidebar is split into its own chunk and only fetched
+// when its route is first rendered (or prefetched from the sidebar).
+const Dashboard = lazyPage(() => import('../pages/Dashboard'));
+const Users = lazyPage(() => import('../pages/Users'));
+const Settings = lazyPage(() => import('../pages/Settings'));
+const CurrencySettings = lazyPage(() => import('../pages/CurrencySettings'));
+const Transactions = lazyPage(() => import('../pages/Transactions'));
+const Budgets = lazyPage(() => import('../pages/Budgets'));
+const GeneralLedger = lazyPage(() => import('../pages/GeneralLedger'));
+const HRM = lazyPage(() => import('../pages/HRM'));
+const Payroll = lazyPage(() => import('../pages/Payroll'));
+const Inventory = lazyPage(() => import('../pages/Inventory'));
+const Services = lazyPage(() => import('../pages/Services'));
+const POS = lazyPage(() => import('../pages/POS'));
+const Projects = lazyPage(() => import('../pages/Projects'));
+const CRM = lazyPage(() => import('../pages/CRM'));
+const Analytics = lazyPage(() => import('../pages/Analytics'));
+const DocumentTemplates = lazyPage(() => import('../pages/DocumentTemplates'));
+const Letters = lazyPage(() => import('../pages/Letters'));
+const GeneratedDocuments = lazyPage(() => import('../pages/GeneratedDocuments'));
+const AuditLogs = lazyPage(() => import('../pages/AuditLogs'));
+const Reports = lazyPage(() => import('../pages/Reports'));
+const MobileMoney = lazyPage(() => import('../pages/MobileMoney'));
+const ZIMRACompliance = lazyPage(() => import('../pages/ZIMRACompliance'));
+const FiscalisationInvoices = lazyPage(() => import('../pages/FiscalisationInvoices'));
+const AccountsReceivable = lazyPage(() => import('../pages/AccountsReceivable'));
+const AccountsPayable = lazyPage(() => import('../pages/AccountsPayable'));
+const Banking = lazyPage(() => import('../pages/Banking'));
+const Procurement = lazyPage(() => import('../pages/Procurement'));
+const Manufacturing = lazyPage(() => import('../pages/Manufacturing'));
+const StoresManagement = lazyPage(() => import('../components/StoresManagement'));
+const VendorManagement = lazyPage(() => import('../pages/VendorManagement'));
+const PurchaseOrderManagement = lazyPage(() => import('../pages/PurchaseOrderManagement'));
+const LeadManagement = lazyPage(() => import('../pages/LeadManagement'));
+const OpportunityPipeline = lazyPage(() => import('../pages/OpportunityPipeline'));
+const QuotationManagement = lazyPage(() => import('../pages/QuotationManagement'));
+const FixedAssetRegister = lazyPage(() => import('../pages/FixedAssetRegister'));
+const BudgetManagement = lazyPage(() => import('../pages/BudgetManagement'));
+const MobileMoneyPayments = lazyPage(() => import('../pages/MobileMoneyPayments'));
+const CashTill = lazyPage(() => import('../pages/CashTill'));
+const LeaveManagement = lazyPage(() => import('../pages/LeaveManagement'));
+const AttendanceTracking = lazyPage(() => import('../pages/AttendanceTracking'));
+const DocumentManagement = lazyPage(() => import('../pages/DocumentManagement'));
+
+export const EmployerSignup = lazyPage(() => import('../pages/EmployerSignup'));
+
+export type AppRoute = {
+  path: string;
+  page: LazyPage;
+};
+
+// Routes rendered inside PrivateRoute + MainLayout
+export const protectedRoutes: AppRoute[] = [
+  { path: '/dashboard', page: Dashboard },
+  { path: '/users', page: Users },
+  { path: '/settings', page: Settings },
+  { path: '/settings/currencies', page: CurrencySettings },
+  { path: '/transactions', page: Transactions },
+  { path: '/budgets', page: Budgets },
+  { path: '/general-ledger', page: GeneralLedger },
+  { path: '/hrm', page: HRM },
+  { path: '/payroll', page: Payroll },
+  { path: '/inventory', page: Inventory },
+  { path: '/services', page: Services },
+  { path: '/pos', page: POS },
+  { path: '/projects', page: Projects },
+  { path: '/crm', page: CRM },
+  { path: '/analytics', page: Analytics },
+  { path: '/document-templates', page: DocumentTemplates },
+  { path: '/letters', page: Letters },
+  { path: '/generated-documents', page: GeneratedDocuments },
+  { path: '/audit-logs', page: AuditLogs },
+  { path: '/reports', page: Reports },
+  { path: '/finance/mobile-money', page: MobileMoney },
+  { path: '/compliance/zimra', page: ZIMRACompliance },
+  { path: '/sales/fiscalisation-invoices', page: FiscalisationInvoices },
+  { path: '/ar', page: AccountsReceivable },
+  { path: '/ap', page: AccountsPayable },
+  { path: '/banking', page: Banking },
+  { path: '/procurement', page: Procurement },
+  { path: '/manufacturing', page: Manufacturing },
+  { path: '/stores', page: StoresManagement },
+  { path: '/supply-chain/vendors', page: VendorManagement },
+  { path: '/supply-chain/purchase-orders', page: PurchaseOrderManagement },
+  { path: '/crm/leads', page: LeadManagement },
+  { path: '/crm/opportunities', page: OpportunityPipeline },
+  { path: '/sales/quotations', page: QuotationManagement },
+  { path: '/finance/fixed-assets', page: FixedAssetRegister },
+  { path: '/finance/budget-management', page: BudgetManagement },
+  { path: '/finance/mobile-money-payments', page: MobileMoneyPayments },
+  { path: '/finance/cash-till', page: CashTill },
+  { path: '/hr/leave-management', page: LeaveManagement },
+  { path: '/hr/attendance', page: AttendanceTracking },
+  { path: '/documents', page: DocumentManagement },
+];
+
+const pagesByPath = new Map(protectedRoutes.map((route) => [route.path, route.page]));
+
+// Skip speculative downloads on metered or very slow connections.
+const shouldPrefetch = () => {
+  const connection = (navigator as any).connection;
+  return !connection || (!connection.saveData && !/2g/.test(connection.effectiveType || ''));
+};
+
+/** Start downloading the chunk for `path`; safe to call repeatedly. */
+export const prefetchRoute = (path?: string) => {
+  const page = path ? pagesByPath.get(path) : undefined;
+  if (page) {
+    page.preload().catch(() => undefined);
+  }
+};
+
+/**
+ * Prefetch the given routes one at a time while the browser is idle.
+ * Returns a cleanup function that stops any remaining prefetches.
+ */
+export const prefetchRoutesWhenIdle = (paths: string[]) => {
+  const queue = paths.filter((path) => pagesByPath.has(path));
+  let handle: number | undefined;
+  let cancelled = false;
+
+  const schedule = (callback: () => void) =>
+    typeof window.requestIdleCallback === 'function'
+      ? window.requestIdleCallback(callback, { timeout: 5000 })
+      : window.setTimeout(callback, 1000);
+
+  const next = () => {
+    const path = queue.shift();
+    if (cancelled || !path) return;
+    pagesByPath.get(path)!.preload()
+      .catch(() => undefined)
+      .finally(() => {
+        if (!cancelled) handle = schedule(next);
+      });
+  };
+
+  if (shouldPrefetch() && queue.length > 0) {
+    handle = schedule(next);
+  }
+
+  return () => {
+    cancelled = true;
+    if (handle === undefined) return;
+    if (typeof window.cancelIdleCallback === 'function') {
+      window.cancelIdleCallback(handle);
+    } else {
+      window.clearTimeout(handle);
+    }
+  };
+};
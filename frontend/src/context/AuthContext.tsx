@@ -1,7 +1,7 @@
 import React, { createContext, useContext, useState, useEffect, ReactNode } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { toast } from 'react-hot-toast';
-import api from '../services/api';
+import api, { authTokens } from '../services/api';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 
 interface User {
@@ -37,16 +37,15 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
   const [error, setError] = useState<string | null>(null);
   const navigate = useNavigate();
 
-  // Helper: Set access and refresh tokens everywhere
+  // Helper: Set access and refresh tokens everywhere. The api client adds the
+  // header from authTokens per request; a default header would outlive a refresh.
   const setTokens = (access: string | null, refresh: string | null) => {
     if (access) {
       localStorage.setItem('token', access);
-      api.defaults.headers.common['Authorization'] = `Bearer ${access}`;
-      console.log('Access token set:', access);
+      authTokens.set(access, refresh);
     } else {
       localStorage.removeItem('token');
-      delete api.defaults.headers.common['Authorization'];
-      console.log('Access token cleared');
+      authTokens.clear();
     }
     if (refresh) {
       localStorage.setItem('refreshToken', refresh);
@@ -57,7 +56,7 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
 
   // On mount, check for token and fetch user
   useEffect(() => {
-    const access = localStorage.getItem('token');
+    const access = authTokens.getAccess() ?? localStorage.getItem('token');
     const refresh = localStorage.getItem('refreshToken');
     if (access) {
       setTokens(access, refresh);
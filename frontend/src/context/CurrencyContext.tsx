@@ -1,24 +1,61 @@
-import React, { createContext, useContext, useMemo, useState } from 'react';
-import { RatesService, Currency } from '../services/analyticsService';
+import React, { createContext, useCallback, useContext, useEffect, useMemo, useState } from 'react';
+import { useSelector } from 'react-redux';
+import { RatesService, Currency, RateTable } from '../services/analyticsService';
+import { RootState } from '../store';
+import { formatCurrency, formatCurrencyMany } from '../utils/formatters';
 
 interface CurrencyContextType {
   currency: Currency;
   setCurrency: (c: Currency) => void;
-  convert: (amount: number, to: Currency) => Promise<number>;
+  /** Current rate table; changes identity on every refresh */
+  rates: RateTable;
+  /** Convert from `from` (default: the selected currency) to `to` using the cached rates */
+  convert: (amount: number, to: Currency, from?: Currency) => number;
+  convertMany: (amounts: ArrayLike<number>, to: Currency, from?: Currency, out?: Float64Array) => Float64Array;
+  /** Convert to `to` (default: the selected currency) and format in that currency */
+  format: (amount: number, to?: Currency, from?: Currency) => string;
+  formatMany: (amounts: ArrayLike<number>, to?: Currency, from?: Currency) => string[];
+  /** Marks a mounted `useCurrency` caller; returns the release function */
+  retain: () => () => void;
 }
 
 const CurrencyContext = createContext<CurrencyContextType | undefined>(undefined);
 
 export const CurrencyProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const [currency, setCurrency] = useState<Currency>('USD');
+  const [rates, setRates] = useState<RateTable>(() => RatesService.getTable());
+  const [users, setUsers] = useState(0);
+  const isAuthenticated = useSelector((state: RootState) => state.auth.isAuthenticated);
+  const inUse = users > 0;
+
+  useEffect(() => RatesService.subscribe(setRates), []);
+
+  const retain = useCallback(() => {
+    setUsers((count) => count + 1);
+    return () => setUsers((count) => count - 1);
+  }, []);
+
+  // Rates are only loaded while something on screen converts with them.
+  // /currencies/ needs a session; reload once signed in and again whenever the table expires
+  useEffect(() => {
+    if (!isAuthenticated || !inUse) return;
+    RatesService.ensureFresh();
+    const timer = setInterval(() => RatesService.ensureFresh(), RatesService.TTL_MS);
+    return () => clearInterval(timer);
+  }, [isAuthenticated, inUse]);
 
   const value = useMemo<CurrencyContextType>(() => ({
     currency,
     setCurrency,
-    convert: async (amount: number, to: Currency) => {
-      return RatesService.convert(amount, currency, to);
-    },
-  }), [currency]);
+    rates,
+    convert: (amount, to, from = currency) => RatesService.convertSync(amount, from, to, rates),
+    convertMany: (amounts, to, from = currency, out) => RatesService.convertMany(amounts, from, to, out, rates),
+    format: (amount, to = currency, from = currency) =>
+      formatCurrency(RatesService.convertSync(amount, from, to, rates), to),
+    formatMany: (amounts, to = currency, from = currency) =>
+      formatCurrencyMany(from === to ? amounts : RatesService.convertMany(amounts, from, to, undefined, rates), to),
+    retain,
+  }), [currency, rates, retain]);
 
   return (
     <CurrencyContext.Provider value={value}>{children}</CurrencyContext.Provider>
@@ -27,6 +64,8 @@ export const CurrencyProvider: React.FC<{ children: React.ReactNode }> = ({ chil
 
 export const useCurrency = () => {
   const ctx = useContext(CurrencyContext);
+  const retain = ctx?.retain;
+  useEffect(() => retain?.(), [retain]);
   if (!ctx) throw new Error('useCurrency must be used within CurrencyProvider');
   return ctx;
-}; 
\ No newline at end of file
+};
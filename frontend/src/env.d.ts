@@ -2,6 +2,14 @@
 
 interface ImportMetaEnv {
   readonly VITE_API_URL: string;
+  /** Comma-separated debug namespaces, see utils/debug.ts */
+  readonly VITE_DEBUG?: string;
+  /** Push transport for services/realtime.ts: 'sse' (default), 'ws' or 'poll' */
+  readonly VITE_REALTIME_TRANSPORT?: string;
+  /** Event stream URL; defaults to `${VITE_API_BASE_URL}/events/` */
+  readonly VITE_REALTIME_URL?: string;
+  /** Collector that receives batched samples from services/telemetry.ts; unset keeps them in memory */
+  readonly VITE_TELEMETRY_URL?: string;
 }
 
 interface ImportMeta {
@@ -0,0 +1,45 @@
+import { useEffect, useMemo, useState } from 'react';
+import { createAggregationChannel } from '../services/computePool';
+import { copyColumns } from '../utils/aggregate';
+import type { AggregateColumns, AggregateRequest, AggregateResult } from '../utils/aggregate';
+import { isAbortError } from '../utils/exportStream';
+
+type AggregationState = {
+  result: AggregateResult | null;
+  /** Group names, indexed like result.groupSums */
+  keys: string[];
+  pending: boolean;
+};
+
+export type ColumnSource = {
+  columns: AggregateColumns;
+  keys: string[];
+};
+
+/**
+ * Aggregate `source` in the compute pool whenever it (or the request) changes.
+ * A new run cancels the one still in flight, so rapid changes only pay for
+ * the last. Jobs take ownership of their columns, so each run gets a copy.
+ */
+export const useAggregation = (source: ColumnSource | null, request: AggregateRequest) => {
+  const [state, setState] = useState<AggregationState>({ result: null, keys: [], pending: false });
+  const channel = useMemo(() => createAggregationChannel(), []);
+
+  useEffect(() => () => channel.cancel(), [channel]);
+
+  useEffect(() => {
+    if (!source) return;
+    setState((previous) => ({ ...previous, pending: true }));
+    channel
+      .run(copyColumns(source.columns), request)
+      .then((result) => setState({ result, keys: source.keys, pending: false }))
+      .catch((error) => {
+        if (isAbortError(error)) return;
+        console.error('Aggregation failed:', error);
+        setState((previous) => ({ ...previous, pending: false }));
+      });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [channel, source, request.groupSums, request.runningBalance, request.period]);
+
+  return state;
+};
@@ -1,63 +1,75 @@
-import { useCallback } from 'react';
-import axios from 'axios';
+import { useCallback, useEffect, useRef } from 'react';
 import type { AxiosRequestConfig } from 'axios';
 import { useSelector } from 'react-redux';
+import api from '../services/api';
 import type { RootState } from '../store';
 
-const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:3000/api';
-
+/**
+ * Thin hook over the shared `api` client so hook-based fetches get the same
+ * refresh, retry, caching and toast behaviour as the services. Requests made
+ * through the hook are aborted when the component unmounts; pass `cache` /
+ * `dedupe` in the config to tune the response cache per call.
+ */
 export const useApi = () => {
-  const token = useSelector((state: RootState) => state.auth.token);
+  const token = useSelector((state: RootState) => state.auth.access);
+  const controllers = useRef(new Set<AbortController>());
 
-  const createAxiosInstance = useCallback(() => {
-    const instance = axios.create({
-      baseURL: API_BASE_URL,
-      headers: {
-        'Content-Type': 'application/json',
-      },
-    });
+  useEffect(() => {
+    const active = controllers.current;
+    return () => {
+      active.forEach((controller) => controller.abort());
+      active.clear();
+    };
+  }, []);
 
-    if (token) {
-      instance.defaults.headers.common['Authorization'] = `Bearer ${token}`;
-    }
+  const request = useCallback(
+    async <T>(config: AxiosRequestConfig) => {
+      // Respect a caller-provided signal; otherwise tie the request to this component
+      const controller = config.signal ? undefined : new AbortController();
+      if (controller) {
+        controllers.current.add(controller);
+      }
 
-    return instance;
-  }, [token]);
+      const headers: Record<string, any> = { ...(config.headers as Record<string, any>) };
+      if (token && !headers.Authorization) {
+        headers.Authorization = `Bearer ${token}`;
+      }
 
-  const get = useCallback(
-    async <T>(url: string, config?: AxiosRequestConfig) => {
-      const instance = createAxiosInstance();
-      const response = await instance.get<T>(url, config);
-      return response;
+      try {
+        return await api.request<T>({
+          ...config,
+          headers,
+          signal: config.signal ?? controller?.signal,
+        });
+      } finally {
+        if (controller) {
+          controllers.current.delete(controller);
+        }
+      }
     },
-    [createAxiosInstance]
+    [token]
+  );
+
+  const get = useCallback(
+    <T>(url: string, config?: AxiosRequestConfig) => request<T>({ ...config, method: 'get', url }),
+    [request]
   );
 
   const post = useCallback(
-    async <T>(url: string, data?: any, config?: AxiosRequestConfig) => {
-      const instance = createAxiosInstance();
-      const response = await instance.post<T>(url, data, config);
-      return response;
-    },
-    [createAxiosInstance]
+    <T>(url: string, data?: any, config?: AxiosRequestConfig) =>
+      request<T>({ ...config, method: 'post', url, data }),
+    [request]
   );
 
   const put = useCallback(
-    async <T>(url: string, data?: any, config?: AxiosRequestConfig) => {
-      const instance = createAxiosInstance();
-      const response = await instance.put<T>(url, data, config);
-      return response;
-    },
-    [createAxiosInstance]
+    <T>(url: string, data?: any, config?: AxiosRequestConfig) =>
+      request<T>({ ...config, method: 'put', url, data }),
+    [request]
   );
 
   const del = useCallback(
-    async <T>(url: string, config?: AxiosRequestConfig) => {
-      const instance = createAxiosInstance();
-      const response = await instance.delete<T>(url, config);
-      return response;
-    },
-    [createAxiosInstance]
+    <T>(url: string, config?: AxiosRequestConfig) => request<T>({ ...config, method: 'delete', url }),
+    [request]
   );
 
   return {
@@ -66,4 +78,4 @@ export const useApi = () => {
     put,
     delete: del,
   };
-}; 
\ No newline at end of file
+};
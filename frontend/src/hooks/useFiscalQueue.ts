@@ -0,0 +1,10 @@
+import { useEffect, useState } from 'react';
+import { fiscalPipeline } from '../utils/invoice';
+import type { FiscalProgress } from '../utils/invoice';
+
+/** Live progress of the background fiscalisation queue (pending, rejected, backlog). */
+export const useFiscalQueue = (): FiscalProgress => {
+  const [progress, setProgress] = useState<FiscalProgress>(() => fiscalPipeline.getProgress());
+  useEffect(() => fiscalPipeline.subscribe(setProgress), []);
+  return progress;
+};
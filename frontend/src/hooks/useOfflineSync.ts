@@ -0,0 +1,10 @@
+import { useEffect, useState } from 'react';
+import { offlineQueue } from '../services/offlineQueue';
+import type { SyncProgress } from '../services/offlineQueue';
+
+/** Live progress of the offline write queue (pending count, throughput, next retry). */
+export const useOfflineSync = (): SyncProgress => {
+  const [progress, setProgress] = useState<SyncProgress>(() => offlineQueue.getProgress());
+  useEffect(() => offlineQueue.subscribe(setProgress), []);
+  return progress;
+};
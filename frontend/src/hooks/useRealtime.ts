@@ -0,0 +1,25 @@
+import { useEffect, useRef, useState } from 'react';
+import { realtime } from '../services/realtime';
+import type { RealtimeListener, RealtimeStatus, SubscribeOptions } from '../services/realtime';
+
+/**
+ * Receive delta events for `resource` while the component is mounted. The
+ * latest `onEvents` is always called, so it need not be memoized.
+ */
+export const useRealtime = (resource: string | null, onEvents: RealtimeListener, options: SubscribeOptions = {}) => {
+  const handler = useRef(onEvents);
+  handler.current = onEvents;
+
+  useEffect(() => {
+    if (!resource) return;
+    return realtime.subscribe(resource, (events) => handler.current(events), options);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [resource, options.pollUrl, options.pollIntervalMs]);
+};
+
+/** Whether updates are currently pushed ('live') or polled. */
+export const useRealtimeStatus = (): RealtimeStatus => {
+  const [status, setStatus] = useState<RealtimeStatus>(() => realtime.getStatus());
+  useEffect(() => realtime.onStatus(setStatus), []);
+  return status;
+};
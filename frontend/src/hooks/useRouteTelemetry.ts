@@ -0,0 +1,14 @@
+import { useRef } from 'react';
+import { useLocation } from 'react-router-dom';
+import { telemetry } from '../services/telemetry';
+
+/** Starts a route timing on every navigation; call once above the routes. */
+export const useRouteTelemetry = () => {
+  const location = useLocation();
+  const lastKey = useRef<string | null>(null);
+  // Started while rendering (not in an effect) so the new page's render time is included
+  if (lastKey.current !== location.key) {
+    lastKey.current = location.key;
+    telemetry.startRoute();
+  }
+};
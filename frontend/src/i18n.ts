@@ -1,5 +1,6 @@
 import i18n from 'i18next';
 import { initReactI18next } from 'react-i18next';
+import { setFormatLocale } from './utils/formatters';
 
 const resources = {
   en: {
@@ -47,4 +48,8 @@ i18n.use(initReactI18next).init({
   interpolation: { escapeValue: false },
 });
 
+// Numbers and dates follow the UI language
+setFormatLocale(i18n.language);
+i18n.on('languageChanged', setFormatLocale);
+
 export default i18n; 
\ No newline at end of file
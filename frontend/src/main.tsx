@@ -3,9 +3,20 @@ import ReactDOM from 'react-dom/client';
 import { Provider } from 'react-redux';
 import { store } from './store';
 import App from './App';
+import { startOfflineSync } from './services/offlineQueue';
+import { startTelemetry } from './services/telemetry';
+import { startFiscalSync } from './utils/invoice';
 import './index.css';
 import './i18n';
 
+// Fiscalise invoices still queued from the last session; started first so
+// offline sales replayed below are handed to the fiscal queue
+startFiscalSync();
+// Replay sales and other writes queued while offline
+startOfflineSync();
+// Long tasks and batched upload of timing samples (see services/telemetry.ts)
+startTelemetry();
+
 ReactDOM.createRoot(document.getElementById('root')!).render(
   <React.StrictMode>
     <Provider store={store}>
@@ -1,4 +1,8 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
+import { transactionService } from '../services/transactionService';
+import { useAggregation } from '../hooks/useAggregation';
+import type { ColumnSource } from '../hooks/useAggregation';
+import type { ColumnFields } from '../utils/aggregate';
 
 const tabs = [
   { key: 'financial', label: 'Financial' },
@@ -6,8 +10,69 @@ const tabs = [
   { key: 'sales', label: 'Sales' },
 ];
 
+const MONTHS_SHOWN = 12;
+// Large pages: every row in the range is loaded, so round trips matter more than page size
+const LEDGER_PAGE_SIZE = 1000;
+
+// Amounts as magnitudes, grouped by type and bucketed by month
+const ledgerFields: ColumnFields = { amount: 'amount', key: 'type', date: 'date', absolute: true };
+const monthlyByType = { groupSums: true, period: 'month' } as const;
+
+/** First day of the oldest month on the chart, as the API's `start_date` */
+const rangeStart = (now = new Date()) =>
+  new Date(Date.UTC(now.getUTCFullYear(), now.getUTCMonth() - (MONTHS_SHOWN - 1), 1)).toISOString().slice(0, 10);
+
+const formatAmount = (value: number) =>
+  `$${value.toLocaleString(undefined, { minimumFractionDigits: 2, maximumFractionDigits: 2 })}`;
+
 const Analytics: React.FC = () => {
   const [activeTab, setActiveTab] = useState('financial');
+  const financial = activeTab === 'financial';
+  // Every transaction in the months shown, unfiltered, as columns: the
+  // transaction slice holds only what the Transactions page last loaded
+  const [ledger, setLedger] = useState<ColumnSource | null>(null);
+  const { result, keys, pending } = useAggregation(ledger, monthlyByType);
+
+  // Loaded once the financial tab is first opened, and kept after that
+  useEffect(() => {
+    if (!financial || ledger) return;
+    const controller = new AbortController();
+    transactionService
+      .getTransactionColumns({ start_date: rangeStart() }, ledgerFields, {
+        signal: controller.signal,
+        pageSize: LEDGER_PAGE_SIZE,
+      })
+      .then(setLedger)
+      .catch((error) => {
+        if (!controller.signal.aborted) console.error('Failed to load transactions:', error);
+      });
+    return () => controller.abort();
+  }, [financial, ledger]);
+
+  const groupTotal = (type: string) => {
+    const index = keys.indexOf(type);
+    return index >= 0 && result?.groupSums ? result.groupSums[index] : 0;
+  };
+  const totalsReady = !!ledger && !!result && !pending;
+  const revenue = groupTotal('income');
+  const expenses = groupTotal('expense');
+
+  const months = (() => {
+    const periods = result?.periods;
+    if (!periods?.groupSums) return [];
+    const income = keys.indexOf('income');
+    const expense = keys.indexOf('expense');
+    const first = Math.max(0, periods.starts.length - MONTHS_SHOWN);
+    return Array.from({ length: periods.starts.length - first }, (_, n) => {
+      const bucket = (first + n) * keys.length;
+      return {
+        label: new Date(periods.starts[first + n]).toLocaleDateString(undefined, { month: 'short', year: '2-digit', timeZone: 'UTC' }),
+        income: income >= 0 ? periods.groupSums![bucket + income] : 0,
+        expense: expense >= 0 ? periods.groupSums![bucket + expense] : 0,
+      };
+    });
+  })();
+  const monthScale = Math.max(1, ...months.map(m => Math.max(m.income, m.expense)));
 
   return (
     <div className="bg-white rounded-xl shadow p-8 min-h-[60vh]">
@@ -24,25 +89,51 @@ const Analytics: React.FC = () => {
         ))}
       </div>
       {/* Financial Tab */}
-      {activeTab === 'financial' && (
+      {financial && (
         <div>
           <div className="mb-6">
-            <div className="bg-pink-50 rounded-lg p-6 shadow flex flex-col items-center mb-4">
-              <span className="text-5xl mb-2">📈</span>
-              <h3 className="font-semibold text-lg mb-1">Financial Chart</h3>
-              <p className="text-gray-500 text-sm">No data yet. Connect your financial data source.</p>
-            </div>
+            {months.length ? (
+              <div className="bg-pink-50 rounded-lg p-6 shadow mb-4">
+                <h3 className="font-semibold text-lg mb-4">Income vs Expenses by Month</h3>
+                <div className="flex items-end gap-3 h-48">
+                  {months.map(month => (
+                    <div key={month.label} className="flex-1 flex flex-col items-center justify-end h-full">
+                      <div className="flex items-end gap-1 w-full justify-center h-full">
+                        <div
+                          className="w-3 bg-green-500 rounded-t"
+                          style={{ height: `${(month.income / monthScale) * 100}%` }}
+                          title={`Income ${formatAmount(month.income)}`}
+                        />
+                        <div
+                          className="w-3 bg-pink-500 rounded-t"
+                          style={{ height: `${(month.expense / monthScale) * 100}%` }}
+                          title={`Expenses ${formatAmount(month.expense)}`}
+                        />
+                      </div>
+                      <span className="text-xs text-gray-500 mt-1">{month.label}</span>
+                    </div>
+                  ))}
+                </div>
+              </div>
+            ) : (
+              <div className="bg-pink-50 rounded-lg p-6 shadow flex flex-col items-center mb-4">
+                <span className="text-5xl mb-2">📈</span>
+                <h3 className="font-semibold text-lg mb-1">Financial Chart</h3>
+                <p className="text-gray-500 text-sm">No data yet. Connect your financial data source.</p>
+              </div>
+            )}
+            <p className="text-gray-500 text-sm mb-2">Last {MONTHS_SHOWN} months</p>
             <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
               <div className="bg-white rounded shadow p-4 flex flex-col items-center">
-                <span className="text-2xl font-bold text-pink-700">—</span>
+                <span className="text-2xl font-bold text-pink-700">{totalsReady ? formatAmount(revenue) : '—'}</span>
                 <span className="text-gray-500 text-sm">Total Revenue</span>
               </div>
               <div className="bg-white rounded shadow p-4 flex flex-col items-center">
-                <span className="text-2xl font-bold text-pink-700">—</span>
+                <span className="text-2xl font-bold text-pink-700">{totalsReady ? formatAmount(expenses) : '—'}</span>
                 <span className="text-gray-500 text-sm">Total Expenses</span>
               </div>
               <div className="bg-white rounded shadow p-4 flex flex-col items-center">
-                <span className="text-2xl font-bold text-pink-700">—</span>
+                <span className="text-2xl font-bold text-pink-700">{totalsReady ? formatAmount(revenue - expenses) : '—'}</span>
                 <span className="text-gray-500 text-sm">Net Profit</span>
               </div>
             </div>
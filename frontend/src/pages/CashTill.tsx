@@ -4,6 +4,9 @@ import Skeleton from '../components/common/Skeleton';
 import EmptyState from '../components/common/EmptyState';
 import { useAuth } from '../context/AuthContext';
 import { toast } from 'react-hot-toast';
+import { mergeById } from '../services/realtime';
+import { useRealtime } from '../hooks/useRealtime';
+import LiveStatus from '../components/common/LiveStatus';
 
 interface CashTillAccount {
   id: number;
@@ -20,6 +23,16 @@ interface StoreOption {
   name: string;
 }
 
+const normalizeAccount = (r: any): CashTillAccount => ({
+  id: r.id,
+  account_name: r.account_name || r.name || `Cash Till ${r.id}`,
+  currency_code: (r.currency_code || (typeof r.currency === 'string' ? r.currency : (r.currency?.code || r.currency?.currency_code)) || '').trim() || undefined,
+  is_active: Boolean(r.is_active),
+  store: r.store || r.store_id,
+  opening_balance: typeof r.opening_balance === 'number' ? r.opening_balance : (r.opening_balance ? Number(r.opening_balance) : undefined),
+  current_balance: typeof r.current_balance === 'number' ? r.current_balance : (r.current_balance ? Number(r.current_balance) : undefined),
+});
+
 const CashTill: React.FC = () => {
   const [accounts, setAccounts] = useState<CashTillAccount[]>([]);
   const [loading, setLoading] = useState(false);
@@ -59,15 +72,7 @@ const CashTill: React.FC = () => {
       const a = await api.get('/cash-tills/');
       const accRaw = a.data?.results || a.data || [];
       const accNorm: CashTillAccount[] = Array.isArray(accRaw)
-        ? accRaw.map((r: any) => ({
-            id: r.id,
-            account_name: r.account_name || r.name || `Cash Till ${r.id}`,
-            currency_code: (r.currency_code || (typeof r.currency === 'string' ? r.currency : (r.currency?.code || r.currency?.currency_code)) || '').trim() || undefined,
-            is_active: Boolean(r.is_active),
-            store: r.store || r.store_id,
-            opening_balance: typeof r.opening_balance === 'number' ? r.opening_balance : (r.opening_balance ? Number(r.opening_balance) : undefined),
-            current_balance: typeof r.current_balance === 'number' ? r.current_balance : (r.current_balance ? Number(r.current_balance) : undefined),
-          }))
+        ? accRaw.map(normalizeAccount)
         : [];
       setAccounts(accNorm);
     } catch (e: any) {
@@ -82,6 +87,12 @@ const CashTill: React.FC = () => {
     load();
   }, []);
 
+  // Till balances move with every sale; take the server's pushed updates
+  useRealtime('cash-tills', (events) => {
+    if (events.some(e => e.op === 'resync')) load();
+    else setAccounts(prev => mergeById(prev, events, normalizeAccount));
+  }, { pollUrl: '/cash-tills/' });
+
   const toggleAccount = async (id: number, on: boolean) => {
     const prev = [...accounts];
     setAccounts((cur) => cur.map((acc) => (acc.id === id ? { ...acc, is_active: on } : acc)));
@@ -179,6 +190,7 @@ const CashTill: React.FC = () => {
     <div className="bg-white rounded-xl shadow p-8 min-h-[60vh]">
       <div className="flex items-center justify-between mb-6">
         <h2 className="text-xl font-bold">Cash Till</h2>
+        <LiveStatus />
       </div>
 
       <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
@@ -3,6 +3,7 @@ import { toast } from 'react-hot-toast';
 import api from '../services/api';
 import Skeleton from '../components/common/Skeleton';
 import EmptyState from '../components/common/EmptyState';
+import { formatNumber } from '../utils/formatters';
 import { FiDollarSign, FiRefreshCw, FiTrendingUp, FiTrendingDown, FiGlobe } from 'react-icons/fi';
 
 interface Currency {
@@ -96,10 +97,7 @@ const CurrencyManagement: React.FC = () => {
   };
 
   const formatRate = (rate: number) => {
-    return new Intl.NumberFormat('en-ZW', {
-      minimumFractionDigits: 2,
-      maximumFractionDigits: 6,
-    }).format(rate);
+    return formatNumber(rate, { minimumFractionDigits: 2, maximumFractionDigits: 6 }, 'en-ZW');
   };
 
   const getRateChange = (currency: Currency) => {
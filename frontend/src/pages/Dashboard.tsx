@@ -5,6 +5,7 @@ import Skeleton from '../components/common/Skeleton';
 import EmptyState from '../components/common/EmptyState';
 import api from '../services/api';
 import { toast } from 'react-hot-toast';
+import { formatCurrency, formatNumber } from '../utils/formatters';
 
 interface DashboardData {
   kpis: {
@@ -74,17 +75,12 @@ const Dashboard: React.FC = () => {
 
   const fmt = (n?: number | null) => {
     if (n === null || n === undefined) return '—';
-    return new Intl.NumberFormat('en-US', {
-      style: 'currency',
-      currency: 'USD',
-      minimumFractionDigits: 2,
-      maximumFractionDigits: 2,
-    }).format(Number(n));
+    return formatCurrency(Number(n));
   };
 
   const fmtNumber = (n?: number | null) => {
     if (n === null || n === undefined) return '—';
-    return new Intl.NumberFormat('en-US').format(Number(n));
+    return formatNumber(Number(n));
   };
 
   const kpis = data?.kpis || {};
@@ -4,6 +4,9 @@ import Skeleton from '../components/common/Skeleton';
 import EmptyState from '../components/common/EmptyState';
 import { Guard } from '../components/auth/FeatureGuard';
 import { toast } from 'react-hot-toast';
+import { fiscalPipeline } from '../utils/invoice';
+import type { QueueItem } from '../services/offlineQueue';
+import { useFiscalQueue } from '../hooks/useFiscalQueue';
 
 interface Invoice {
   id: number;
@@ -21,6 +24,16 @@ const FiscalisationInvoices: React.FC = () => {
   const [invoices, setInvoices] = useState<Invoice[]>([]);
   const [loading, setLoading] = useState(false);
   const [query, setQuery] = useState('');
+  const fiscalQueue = useFiscalQueue();
+  // Invoices still in the background fiscalisation queue, by invoice number
+  const [queued, setQueued] = useState<Map<string, QueueItem>>(new Map());
+
+  useEffect(() => {
+    fiscalPipeline
+      .peekAll()
+      .then((items) => setQueued(new Map(items.map((item) => [item.id, item]))))
+      .catch(() => undefined);
+  }, [fiscalQueue.pending, fiscalQueue.rejected, fiscalQueue.fiscalized]);
 
   const load = async () => {
     setLoading(true);
@@ -50,16 +63,34 @@ const FiscalisationInvoices: React.FC = () => {
 
   useEffect(() => { load(); }, []);
 
-  const fiscalize = async (id: number) => {
+  const fiscalize = async (inv: Invoice) => {
     try {
-      // Fiscalization for POS sales is logged during POSMakeSale; here we no-op
-      toast.success('Fiscalization triggered (ensure POS sale flow handles this).');
-      load();
+      const { data: sale } = await api.get(`/pos-sales/${inv.id}/`);
+      await fiscalPipeline.enqueue({
+        invoiceNumber: inv.invoice_number,
+        amount: inv.total,
+        taxAmount: inv.vat_amount,
+        currency: inv.currency_code || 'USD',
+        items: (sale?.items || []).map((item: any) => ({
+          description: item.item_name || '',
+          qty: Number(item.quantity || 0),
+          unitPrice: parseFloat(item.unit_price || 0),
+          taxRate: Number(item.tax_rate ?? item.vat_rate ?? 0),
+        })),
+      });
+      toast.success(`${inv.invoice_number} queued for fiscalisation`);
     } catch (e) {
       toast.error('Failed to fiscalize invoice');
     }
   };
 
+  const statusOf = (inv: Invoice) => {
+    const item = queued.get(inv.invoice_number);
+    if (item?.failedAt) return 'REJECTED';
+    if (item) return 'QUEUED';
+    return inv.status || '—';
+  };
+
   const filtered = invoices.filter((inv) => {
     const q = query.toLowerCase();
     if (!q) return true;
@@ -73,6 +104,20 @@ const FiscalisationInvoices: React.FC = () => {
     <div className="bg-white rounded-xl shadow p-8 min-h-[60vh]">
       <div className="flex items-center justify-between mb-6">
         <h2 className="text-xl font-bold">ZIMRA Fiscalisation Invoices</h2>
+        {(fiscalQueue.pending > 0 || fiscalQueue.rejected > 0) && (
+          <div className="text-sm text-gray-600">
+            {fiscalQueue.pending} queued
+            {fiscalQueue.running && ` (${fiscalQueue.throughput.toFixed(1)}/s)`}
+            {fiscalQueue.rejected > 0 && (
+              <>
+                , <span className="text-red-600">{fiscalQueue.rejected} rejected</span>
+                <Guard allowedRoles={['admin','manager']}>
+                  <button className="ml-2 text-blue-600 hover:text-blue-800" onClick={() => fiscalPipeline.retryRejected().catch(() => toast.error('Retry failed'))}>Retry</button>
+                </Guard>
+              </>
+            )}
+          </div>
+        )}
         <input className="border rounded px-3 py-2" placeholder="Search by # or customer" value={query} onChange={(e) => setQuery(e.target.value)} />
       </div>
       {loading ? (
@@ -102,11 +147,13 @@ const FiscalisationInvoices: React.FC = () => {
                   <td className="py-2 px-4">{new Date(inv.date).toLocaleDateString()}</td>
                   <td className="py-2 px-4">{inv.total}</td>
                   <td className="py-2 px-4">{inv.vat_amount}</td>
-                  <td className="py-2 px-4">{inv.status || '—'}</td>
-                  <td className="py-2 px-4">{inv.fiscal_receipt_number || '—'}</td>
+                  <td className="py-2 px-4" title={queued.get(inv.invoice_number)?.lastError}>{statusOf(inv)}</td>
+                  <td className="py-2 px-4">
+                    {inv.fiscal_receipt_number || fiscalPipeline.resultFor(inv.invoice_number)?.fiscalCode || '—'}
+                  </td>
                   <td className="py-2 px-4">
                     <Guard allowedRoles={['admin','manager']}>
-                      <button className="text-blue-600 hover:text-blue-800 mr-3" onClick={() => fiscalize(inv.id)}>Fiscalize</button>
+                      <button className="text-blue-600 hover:text-blue-800 mr-3" onClick={() => fiscalize(inv)}>Fiscalize</button>
                     </Guard>
                     <button className="text-gray-600 hover:text-gray-800">View</button>
                   </td>
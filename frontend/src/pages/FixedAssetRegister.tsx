@@ -5,6 +5,7 @@ import {
   FiCalendar, FiDollarSign, FiMapPin
 } from 'react-icons/fi';
 import { fixedAssetService, assetCategoryService } from '../services/extendedApi';
+import { formatCurrency as formatMoney } from '../utils/formatters';
 
 interface FixedAsset {
   id: number;
@@ -147,10 +148,7 @@ const FixedAssetRegister: React.FC = () => {
   );
 
   const formatCurrency = (value: string) => {
-    return new Intl.NumberFormat('en-US', {
-      style: 'currency',
-      currency: 'USD'
-    }).format(parseFloat(value));
+    return formatMoney(parseFloat(value));
   };
 
   if (loading) {
@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import api from '../services/api';
 import { toast } from 'react-hot-toast';
+import { formatNumber } from '../utils/formatters';
 
 interface GeneralLedgerEntry {
   id: number;
@@ -117,10 +118,7 @@ const GeneralLedger: React.FC = () => {
   };
 
   const formatCurrency = (amount: number) => {
-    return new Intl.NumberFormat('en-US', {
-      minimumFractionDigits: 2,
-      maximumFractionDigits: 2
-    }).format(amount);
+    return formatNumber(amount, { minimumFractionDigits: 2, maximumFractionDigits: 2 });
   };
 
   return (
@@ -1,5 +1,7 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import api from '../services/api';
+import { bulkWrite, BulkProgress } from '../services/bulkWrite';
+import { csvRecords } from '../utils/csvImport';
 
 interface Product {
   id: number;
@@ -77,6 +79,8 @@ const Inventory: React.FC = () => {
   const [formData, setFormData] = useState<any>({});
   const [editingProduct, setEditingProduct] = useState<Product | null>(null);
   const [viewingProduct, setViewingProduct] = useState<Product | null>(null);
+  const [importProgress, setImportProgress] = useState<BulkProgress | null>(null);
+  const importInputRef = useRef<HTMLInputElement>(null);
 
   const tabs = [
     { key: 'products', label: 'Products' },
@@ -358,6 +362,54 @@ const Inventory: React.FC = () => {
     }
   };
 
+  // CSV columns may use either the backend names (sku, quantity_in_stock) or the ones shown here
+  const toProductPayload = (row: Record<string, string>) => ({
+    sku: row.sku || row.product_code || '',
+    name: row.name || row.product_name || '',
+    description: row.description || '',
+    category: row.category || '',
+    unit_price: Number(row.unit_price || 0),
+    cost_price: Number(row.cost_price || 0),
+    quantity_in_stock: Number(row.quantity_in_stock || row.current_stock || 0),
+    minimum_stock_level: Number(row.minimum_stock_level || row.reorder_level || 0),
+    store: row.store ? Number(row.store) : stores[0]?.id,
+    is_active: row.is_active ? !/^(false|0|no)$/i.test(row.is_active) : true,
+  });
+
+  const handleImport = async (event: React.ChangeEvent<HTMLInputElement>) => {
+    const file = event.target.files?.[0];
+    event.target.value = '';
+    if (!file) return;
+    const rows = csvRecords(await file.text()).map(toProductPayload);
+    if (!rows.length) {
+      alert('The file has no product rows');
+      return;
+    }
+    try {
+      // Keyed by the file so re-importing it after a failure resumes instead of duplicating
+      const result = await bulkWrite('/products/', rows, {
+        jobId: `products:${file.name}:${file.size}:${file.lastModified}`,
+        onProgress: setImportProgress,
+      });
+      const lines = [`Imported ${result.succeeded} of ${rows.length} products.`];
+      if (result.failed.length) {
+        lines.push(
+          `${result.failed.length} rows were rejected:`,
+          ...result.failed.slice(0, 10).map((f) => `  Row ${f.index + 2}: ${f.error}`)
+        );
+      }
+      if (result.interrupted) {
+        lines.push('The import was interrupted. Select the same file again to resume.');
+      }
+      alert(lines.join('\n'));
+    } catch (error: any) {
+      alert(error?.message || 'Import failed');
+    } finally {
+      setImportProgress(null);
+      fetchData();
+    }
+  };
+
   const handleView = (product: Product) => {
     setViewingProduct(product);
   };
@@ -366,12 +418,28 @@ const Inventory: React.FC = () => {
     <div>
       <div className="flex justify-between items-center mb-4">
         <h3 className="text-lg font-bold">Products</h3>
-        <button
-          onClick={() => openModal('product')}
-          className="bg-blue-600 text-white px-4 py-2 rounded shadow hover:bg-blue-700 transition"
-        >
-          + Add Product
-        </button>
+        <div className="flex items-center gap-2">
+          {importProgress && (
+            <span className="text-sm text-gray-600">
+              Importing {importProgress.done}/{importProgress.total}
+              {importProgress.rowsPerSecond > 0 && ` (${Math.round(importProgress.rowsPerSecond)} rows/s)`}
+            </span>
+          )}
+          <input ref={importInputRef} type="file" accept=".csv,text/csv" className="hidden" onChange={handleImport} />
+          <button
+            onClick={() => importInputRef.current?.click()}
+            disabled={!!importProgress}
+            className="bg-white border border-blue-600 text-blue-600 px-4 py-2 rounded shadow hover:bg-blue-50 transition disabled:opacity-50"
+          >
+            Import CSV
+          </button>
+          <button
+            onClick={() => openModal('product')}
+            className="bg-blue-600 text-white px-4 py-2 rounded shadow hover:bg-blue-700 transition"
+          >
+            + Add Product
+          </button>
+        </div>
       </div>
       <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
         {products.map(product => (
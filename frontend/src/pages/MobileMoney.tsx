@@ -5,6 +5,10 @@ import Skeleton from '../components/common/Skeleton';
 import EmptyState from '../components/common/EmptyState';
 import { useAuth } from '../context/AuthContext';
 import { toast } from 'react-hot-toast';
+import { mergeById } from '../services/realtime';
+import type { RealtimeEvent } from '../services/realtime';
+import { useRealtime } from '../hooks/useRealtime';
+import LiveStatus from '../components/common/LiveStatus';
 
 interface MobileMoneyAccount {
   id: number;
@@ -34,6 +38,35 @@ interface MobileMoneyPayment {
   created_at?: string;
 }
 
+const normalizeAccount = (r: any): MobileMoneyAccount => {
+  // Support both single store and stores array
+  const primaryStore = r.store || r.store_id;
+  const storesArray = r.stores || (primaryStore ? [primaryStore] : []);
+  return {
+    id: r.id,
+    account_name: r.account_name || r.name || `${r.provider} - ${r.phone_number}`,
+    provider: r.provider,
+    phone_number: r.phone_number,
+    currency_code: (r.currency_code || (typeof r.currency === 'string' ? r.currency : (r.currency?.code || r.currency?.currency_code)) || '').trim() || undefined,
+    is_active: Boolean(r.is_active),
+    store: primaryStore, // Keep for backward compatibility
+    stores: storesArray, // All stores linked to this account
+    opening_balance: typeof r.opening_balance === 'number' ? r.opening_balance : (r.opening_balance ? Number(r.opening_balance) : undefined),
+    current_balance: typeof r.current_balance === 'number' ? r.current_balance : (r.current_balance ? Number(r.current_balance) : undefined),
+  };
+};
+
+// Rows from the legacy /mobile-money-transactions/ endpoint
+const normalizeLegacyPayment = (r: any): MobileMoneyPayment => ({
+  id: r.id,
+  account: r.account || r.mobile_money_account || r.account_id,
+  amount: r.amount,
+  currency_code: r.currency_code || r.currency,
+  reference: r.reference || r.tx_ref || r.description,
+  status: r.status,
+  created_at: r.created_at || r.timestamp,
+});
+
 const MobileMoney: React.FC = () => {
   const [accounts, setAccounts] = useState<MobileMoneyAccount[]>([]);
   const [payments, setPayments] = useState<MobileMoneyPayment[]>([]);
@@ -134,23 +167,7 @@ const MobileMoney: React.FC = () => {
       const a = await api.get('/mobile-money-accounts/');
       const accRaw = a.data?.results || a.data || [];
       const accNorm: MobileMoneyAccount[] = Array.isArray(accRaw)
-        ? accRaw.map((r: any) => {
-            // Support both single store and stores array
-            const primaryStore = r.store || r.store_id;
-            const storesArray = r.stores || (primaryStore ? [primaryStore] : []);
-            return {
-              id: r.id,
-              account_name: r.account_name || r.name || `${r.provider} - ${r.phone_number}`,
-              provider: r.provider,
-              phone_number: r.phone_number,
-              currency_code: (r.currency_code || (typeof r.currency === 'string' ? r.currency : (r.currency?.code || r.currency?.currency_code)) || '').trim() || undefined,
-              is_active: Boolean(r.is_active),
-              store: primaryStore, // Keep for backward compatibility
-              stores: storesArray, // All stores linked to this account
-              opening_balance: typeof r.opening_balance === 'number' ? r.opening_balance : (r.opening_balance ? Number(r.opening_balance) : undefined),
-              current_balance: typeof r.current_balance === 'number' ? r.current_balance : (r.current_balance ? Number(r.current_balance) : undefined),
-            };
-          })
+        ? accRaw.map(normalizeAccount)
         : [];
       setAccounts(accNorm);
 
@@ -159,17 +176,7 @@ const MobileMoney: React.FC = () => {
         const p2 = await api.get('/mobile-money-transactions/');
         setPaymentEndpoint('/mobile-money-transactions/');
         const raw = p2.data?.results || p2.data || [];
-        const normalized: MobileMoneyPayment[] = Array.isArray(raw)
-          ? raw.map((r: any) => ({
-              id: r.id,
-              account: r.account || r.mobile_money_account || r.account_id,
-              amount: r.amount,
-              currency_code: r.currency_code || r.currency,
-              reference: r.reference || r.tx_ref || r.description,
-              status: r.status,
-              created_at: r.created_at || r.timestamp,
-            }))
-          : [];
+        const normalized: MobileMoneyPayment[] = Array.isArray(raw) ? raw.map(normalizeLegacyPayment) : [];
         setPayments(normalized);
       } catch (legacyErr: any) {
         if (legacyErr?.response?.status !== 404) throw legacyErr;
@@ -183,6 +190,16 @@ const MobileMoney: React.FC = () => {
   };
   useEffect(() => { load(); }, []);
 
+  // Balances and payment statuses are pushed by the server instead of reloaded
+  useRealtime('mobile-money-accounts', (events: RealtimeEvent[]) => {
+    if (events.some(e => e.op === 'resync')) load();
+    else setAccounts(prev => mergeById(prev, events, normalizeAccount));
+  }, { pollUrl: '/mobile-money-accounts/' });
+  useRealtime(paymentEndpoint.replace(/\//g, ''), (events: RealtimeEvent[]) => {
+    if (events.some(e => e.op === 'resync')) load();
+    else setPayments(prev => mergeById(prev, events, paymentEndpoint === '/mobile-money-transactions/' ? normalizeLegacyPayment : undefined));
+  }, { pollUrl: paymentEndpoint });
+
   const toggleAccount = async (id: number, on: boolean) => {
     const prev = [...accounts];
     setAccounts((cur) => cur.map((acc) => (acc.id === id ? { ...acc, is_active: on } : acc)));
@@ -414,6 +431,7 @@ const MobileMoney: React.FC = () => {
     <div className="bg-white rounded-xl shadow p-8 min-h-[60vh]">
       <div className="flex items-center justify-between mb-6">
         <h2 className="text-xl font-bold">Mobile Money</h2>
+        <LiveStatus />
       </div>
 
       <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
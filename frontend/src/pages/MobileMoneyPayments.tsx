@@ -7,6 +7,10 @@ import {
 import { mobileMoneyPaymentService } from '../services/extendedApi';
 import api from '../services/api';
 import { useAuth } from '../context/AuthContext';
+import { mergeById } from '../services/realtime';
+import type { RealtimeEvent } from '../services/realtime';
+import { useRealtime } from '../hooks/useRealtime';
+import LiveStatus from '../components/common/LiveStatus';
 
 interface MobileMoneyPayment {
   id: number;
@@ -22,6 +26,21 @@ interface MobileMoneyPayment {
   invoice_number?: string;
 }
 
+// Rows from the legacy /mobile-money-transactions/ endpoint use different field names
+const normalizeLegacyPayment = (r: any): MobileMoneyPayment => ({
+  id: r.id,
+  transaction_ref: r.transaction_ref || r.reference || `TX-${r.id}`,
+  payment_method: r.payment_method || r.provider || 'MOBILE_MONEY',
+  phone_number: r.phone_number || r.msisdn || '',
+  amount: String(r.amount),
+  currency: r.currency || r.currency_code || 'USD',
+  status: r.status || 'PENDING',
+  created_at: r.created_at || r.timestamp,
+  completed_at: r.completed_at,
+  customer_name: r.customer_name,
+  invoice_number: r.invoice_number,
+});
+
 const MobileMoneyPayments: React.FC = () => {
   const { user } = useAuth();
   const rawRole = (user as any)?.role ?? (user as any)?.user_role ?? (user as any)?.user?.role;
@@ -53,11 +72,28 @@ const MobileMoneyPayments: React.FC = () => {
   useEffect(() => {
     fetchPayments();
     fetchAccounts();
-    // Poll for payment updates every 30 seconds
-    const interval = setInterval(fetchPayments, 30000);
-    return () => clearInterval(interval);
   }, []);
 
+  // Status changes are pushed as they happen; polled (with ETags) if push is unavailable
+  const applyPaymentEvents = (events: RealtimeEvent[]) => {
+    if (events.some(e => e.op === 'resync')) {
+      fetchPayments();
+      return;
+    }
+    const legacy = paymentEndpoint === '/mobile-money-transactions/';
+    events.forEach(e => {
+      if (e.op !== 'upsert' || e.data?.status !== 'COMPLETED') return;
+      const current = payments.find(p => String(p.id) === String(e.id));
+      if (current && current.status !== 'COMPLETED') {
+        toast.success(`Payment ${current.transaction_ref} completed`);
+      }
+    });
+    setPayments(prev =>
+      mergeById(prev, events, (raw, existing) => (legacy ? normalizeLegacyPayment(raw) : { ...existing, ...raw }))
+    );
+  };
+  useRealtime(paymentEndpoint.replace(/\//g, ''), applyPaymentEvents, { pollUrl: paymentEndpoint });
+
   const fetchPayments = async () => {
     try {
       // Try primary endpoint
@@ -71,21 +107,7 @@ const MobileMoneyPayments: React.FC = () => {
           const res = await api.get('/mobile-money-transactions/');
           setPaymentEndpoint('/mobile-money-transactions/');
           const raw = res.data?.results || res.data || [];
-          const normalized: MobileMoneyPayment[] = Array.isArray(raw)
-            ? raw.map((r: any) => ({
-                id: r.id,
-                transaction_ref: r.transaction_ref || r.reference || `TX-${r.id}`,
-                payment_method: r.payment_method || r.provider || 'MOBILE_MONEY',
-                phone_number: r.phone_number || r.msisdn || '',
-                amount: String(r.amount),
-                currency: r.currency || r.currency_code || 'USD',
-                status: r.status || 'PENDING',
-                created_at: r.created_at || r.timestamp,
-                completed_at: r.completed_at,
-                customer_name: r.customer_name,
-                invoice_number: r.invoice_number,
-              }))
-            : [];
+          const normalized: MobileMoneyPayment[] = Array.isArray(raw) ? raw.map(normalizeLegacyPayment) : [];
           setPayments(normalized);
         } catch (e) {
           toast.error('Failed to load payments');
@@ -332,7 +354,10 @@ const MobileMoneyPayments: React.FC = () => {
     <div className="p-6 max-w-7xl mx-auto">
       {/* Header */}
       <div className="mb-8">
-        <h1 className="text-3xl font-bold text-gray-900 mb-2">Mobile Money Payments</h1>
+        <div className="flex items-center justify-between mb-2">
+          <h1 className="text-3xl font-bold text-gray-900">Mobile Money Payments</h1>
+          <LiveStatus />
+        </div>
         <p className="text-gray-600">Accept payments via EcoCash, OneMoney, and Innbucks</p>
       </div>
 
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect, useRef, useMemo } from 'react';
 import { toast } from 'react-hot-toast';
 import {
   FiShoppingCart, FiPlus, FiMinus, FiTrash2, FiPrinter,
@@ -6,6 +6,16 @@ import {
   FiCheckCircle, FiX, FiRefreshCw, FiSearch
 } from 'react-icons/fi';
 import api from '../services/api';
+import { CatalogIndex } from '../utils/catalogIndex';
+import { createDebugLogger } from '../utils/debug';
+import { offlineQueue } from '../services/offlineQueue';
+import { useOfflineSync } from '../hooks/useOfflineSync';
+import { fiscalPipeline, saleNumbers } from '../utils/invoice';
+import type { FiscalPayload } from '../utils/invoice';
+import { useFiscalQueue } from '../hooks/useFiscalQueue';
+
+// Verbose catalogue/sale tracing; enable with localStorage.setItem('debug', 'pos')
+const debug = createDebugLogger('pos');
 
 interface Product {
   id: number;
@@ -16,6 +26,7 @@ interface Product {
   current_stock: number;
   image?: string;
   barcode?: string;
+  sku?: string;
   category?: string;
 }
 
@@ -68,6 +79,8 @@ interface StoreOption {
 const POS: React.FC = () => {
   // State Management
   const [products, setProducts] = useState<Product[]>([]);
+  const offlineSync = useOfflineSync();
+  const fiscalQueue = useFiscalQueue();
   const [services, setServices] = useState<Service[]>([]);
   const [cart, setCart] = useState<CartItem[]>([]);
   const [customers, setCustomers] = useState<Customer[]>([]);
@@ -104,6 +117,8 @@ const POS: React.FC = () => {
     fetchStores();
     fetchCustomers();
     fetchActiveSession();
+    // Reserve sale numbers before the first checkout needs them
+    saleNumbers.reserveAhead();
     // Also fetch products and services on initial load
     fetchProducts();
     fetchServices();
@@ -117,9 +132,10 @@ const POS: React.FC = () => {
 
   // Debug: Log when products change
   useEffect(() => {
-    console.log('🔄 Products state updated:', products.length, 'products');
+    if (!debug.enabled) return;
+    debug('🔄 Products state updated:', products.length, 'products');
     if (products.length > 0) {
-      console.log('📦 Products in state:', products.map(p => ({ id: p.id, name: p.name, price: p.price })));
+      debug('📦 Products in state:', products.map(p => ({ id: p.id, name: p.name, price: p.price })));
     }
   }, [products]);
 
@@ -174,31 +190,34 @@ const POS: React.FC = () => {
       // We can filter by is_active later if needed
       // params.is_active = 'true';
       
-      console.log('🔍 Fetching products with params:', params);
-      console.log('🔍 Selected store:', storeId);
-      console.log('🔍 POS Session store:', posSession?.store);
+      debug('🔍 Fetching products with params:', params);
+      debug('🔍 Selected store:', storeId);
+      debug('🔍 POS Session store:', posSession?.store);
       
       let productsData: any[] = [];
       let apiError: any = null;
       
       // Try products endpoint first (primary endpoint)
       try {
-        console.log('📡 Making API call to /products/ with params:', params);
+        debug('📡 Making API call to /products/ with params:', params);
         const response = await api.get('/products/', { params });
-        console.log('📡 API Response status:', response.status);
-        console.log('📡 API Response data type:', typeof response.data);
-        console.log('📡 API Response data keys:', Object.keys(response.data || {}));
+        debug('📡 API Response status:', response.status);
+        debug('📡 API Response data type:', typeof response.data);
+        debug('📡 API Response data keys:', Object.keys(response.data || {}));
         
-        // Safely stringify response data (handle circular references and large objects)
-        try {
-          const responseDataStr = JSON.stringify(response.data, (key, value) => {
-            // Skip circular references and limit depth
-            if (key === 'headers' || key === 'config') return '[Object]';
-            return value;
-          }, 2);
-          console.log('📡 Full response data:', responseDataStr.substring(0, 1000) + (responseDataStr.length > 1000 ? '... (truncated)' : ''));
-        } catch (e) {
-          console.log('📡 Response data (could not stringify):', response.data);
+        // Safely stringify response data (handle circular references and large objects).
+        // Debug only: this is expensive on a large catalogue.
+        if (debug.enabled) {
+          try {
+            const responseDataStr = JSON.stringify(response.data, (key, value) => {
+              // Skip circular references and limit depth
+              if (key === 'headers' || key === 'config') return '[Object]';
+              return value;
+            }, 2);
+            debug('📡 Full response data:', responseDataStr.substring(0, 1000) + (responseDataStr.length > 1000 ? '... (truncated)' : ''));
+          } catch (e) {
+            debug('📡 Response data (could not stringify):', response.data);
+          }
         }
         
         productsData = response.data?.results || response.data || [];
@@ -208,7 +227,7 @@ const POS: React.FC = () => {
           if (typeof productsData === 'object' && productsData !== null) {
             const possibleArray = Object.values(productsData).find(v => Array.isArray(v));
             if (possibleArray) {
-              console.log('🔄 Found array in response object, using it');
+              debug('🔄 Found array in response object, using it');
               productsData = possibleArray;
             } else {
               productsData = [];
@@ -217,12 +236,14 @@ const POS: React.FC = () => {
             productsData = [];
           }
         }
-        console.log('✅ Loaded products from /products/ endpoint:', productsData.length);
+        debug('✅ Loaded products from /products/ endpoint:', productsData.length);
         if (productsData.length > 0) {
-          try {
-            console.log('📦 First product sample:', JSON.stringify(productsData[0], null, 2));
-          } catch (e) {
-            console.log('📦 First product sample (raw):', productsData[0]);
+          if (debug.enabled) {
+            try {
+              debug('📦 First product sample:', JSON.stringify(productsData[0], null, 2));
+            } catch (e) {
+              debug('📦 First product sample (raw):', productsData[0]);
+            }
           }
         } else {
           console.warn('⚠️ No products in response array');
@@ -249,13 +270,13 @@ const POS: React.FC = () => {
         } else {
           // Fallback to inventory-items if products endpoint fails
           try {
-            console.log('🔄 Trying inventory-items endpoint as fallback...');
+            debug('🔄 Trying inventory-items endpoint as fallback...');
             const response = await api.get('/inventory-items/', { params });
             productsData = response.data?.results || response.data || [];
             if (!Array.isArray(productsData)) {
               productsData = [];
             }
-            console.log('✅ Loaded products from /inventory-items/ endpoint:', productsData.length);
+            debug('✅ Loaded products from /inventory-items/ endpoint:', productsData.length);
           } catch (inventoryErr: any) {
             console.error('❌ Both endpoints failed. Inventory error:', {
               status: inventoryErr?.response?.status,
@@ -268,8 +289,8 @@ const POS: React.FC = () => {
       }
       
       // Normalize products to Product interface
-      console.log('🔄 Normalizing products. Raw data length:', productsData.length);
-      console.log('🔄 Raw products data:', productsData);
+      debug('🔄 Normalizing products. Raw data length:', productsData.length);
+      debug('🔄 Raw products data:', productsData);
       
       const normalized: Product[] = productsData
         .map((item: any) => {
@@ -302,10 +323,11 @@ const POS: React.FC = () => {
             current_stock: isNaN(stock) ? 0 : stock,
             image: item.image || item.image_url || undefined,
             barcode: (item.barcode || item.sku || '').toString(),
+            sku: item.sku ? String(item.sku) : undefined,
             category: category,
           };
           
-          console.log('🔄 Normalized product:', normalizedProduct);
+          debug('🔄 Normalized product:', normalizedProduct);
           return normalizedProduct;
         })
         .filter((p: Product) => {
@@ -315,13 +337,13 @@ const POS: React.FC = () => {
             return false;
           }
           // Don't filter by is_active or price - show all valid products
-          console.log('✅ Product passed filter:', p.name, p.id);
+          debug('✅ Product passed filter:', p.name, p.id);
           return true;
         });
       
-      console.log('📦 Final normalized products count:', normalized.length);
+      debug('📦 Final normalized products count:', normalized.length);
       if (normalized.length > 0) {
-        console.log('📦 Sample normalized products:', normalized.slice(0, 3).map(p => ({ 
+        debug('📦 Sample normalized products:', normalized.slice(0, 3).map(p => ({ 
           id: p.id, 
           name: p.name, 
           price: p.price,
@@ -387,7 +409,7 @@ const POS: React.FC = () => {
         duration_hours: s.duration_hours ? Number(s.duration_hours) : undefined,
       })).filter((s: Service) => s.name && s.service_price > 0); // Only include active services with valid data
       
-      console.log('Loaded services:', normalized.length);
+      debug('Loaded services:', normalized.length);
       setServices(normalized);
       const categoryList = Array.from(new Set(normalized
         .map(s => s.category)
@@ -413,7 +435,7 @@ const POS: React.FC = () => {
             barcode: item.sku || item.barcode,
             category: item.category || item.category_name || '',
           }));
-          console.log('Loaded products (fallback from 404):', normalized.length, normalized);
+          debug('Loaded products (fallback from 404):', normalized.length, normalized);
           setProducts(normalized);
           const categoryList = Array.from(new Set(normalized
             .map(p => p.category)
@@ -722,9 +744,44 @@ const POS: React.FC = () => {
     }
   };
 
+  // Apply sold quantities locally instead of reloading the catalogue;
+  // only the changed products are re-indexed
+  const applySoldStock = () => {
+    const sold = new Map<number, number>();
+    cart.forEach(item => {
+      if (item.item_type === 'product' && item.product) {
+        sold.set(item.product.id, (sold.get(item.product.id) || 0) + item.quantity);
+      }
+    });
+    setProducts(prev => prev.map(p => (sold.has(p.id) ? { ...p, current_stock: Math.max(0, p.current_stock - (sold.get(p.id) || 0)) } : p)));
+  };
+
+  // Fiscal codes arrive from the background queue after the receipt is shown
+  useEffect(
+    () =>
+      fiscalPipeline.onResult((invoiceNumber, result) => {
+        setLastSale((prev: any) =>
+          prev && prev.sale_number === invoiceNumber ? { ...prev, fiscal_receipt_number: result.fiscalCode } : prev
+        );
+      }),
+    []
+  );
+
+  // The fiscal device is off the checkout path; the queue submits in the background
+  const queueFiscalisation = (payload: FiscalPayload) => {
+    fiscalPipeline
+      .enqueue(payload)
+      .then((progress) => {
+        if (progress.backlogged) {
+          toast.error(`${progress.pending} sales are waiting for the fiscal device`, { id: 'fiscal-backlog' });
+        }
+      })
+      .catch((error) => console.error('Could not queue fiscalisation:', error));
+  };
+
   // Sale Processing
   const processSale = async () => {
-    console.log('processSale called', { cartLength: cart.length, posSession, selectedCustomer, selectedPaymentMethod });
+    debug('processSale called', { cartLength: cart.length, posSession, selectedCustomer, selectedPaymentMethod });
     
     if (cart.length === 0) {
       toast.error('Cart is empty');
@@ -737,14 +794,19 @@ const POS: React.FC = () => {
     }
 
     setLoading(true);
+    // Kept outside the try so a sale that cannot reach the server can be queued
+    let queuedSale: { saleNumber: string; payload: any; fiscalPayload: FiscalPayload } | null = null;
     try {
-      console.log('Starting sale processing...');
+      debug('Starting sale processing...');
       const summary = getSaleSummary();
       const customer = selectedCustomer ? customers.find(c => c.id === selectedCustomer) : null;
       
-      const timestamp = Date.now().toString().slice(-10);
-      const random = Math.floor(Math.random() * 1000).toString().padStart(3, '0');
-      const saleNumber = `SALE-${timestamp}${random}`.slice(0, 20);
+      // Taken from a block of numbers reserved for this till; the timestamp form covers offline tills
+      const saleNumber = saleNumbers.next() ?? (() => {
+        const timestamp = Date.now().toString().slice(-10);
+        const random = Math.floor(Math.random() * 1000).toString().padStart(3, '0');
+        return `SALE-${timestamp}${random}`.slice(0, 20);
+      })();
       
       const paymentMethodMap: { [key: string]: string } = {
         'cash': 'CASH',
@@ -765,6 +827,7 @@ const POS: React.FC = () => {
         total_amount: Number(summary.total.toFixed(2)),
         payment_method: backendPaymentMethod,
         status: 'COMPLETED',
+        defer_fiscalization: true,
         items: cart.map(item => ({
           product: item.item_type === 'product' ? item.product?.id : null,
           service: item.item_type === 'service' ? item.service?.id : null,
@@ -775,22 +838,50 @@ const POS: React.FC = () => {
         })),
       };
 
-      console.log('Submitting POS sale payload:', payload);
-      const response = await api.post('/pos/make-sale/', payload);
+      const fiscalPayload: FiscalPayload = {
+        invoiceNumber: saleNumber,
+        amount: payload.total_amount,
+        taxAmount: payload.tax_amount,
+        currency: 'USD',
+        items: cart.map(item => ({
+          description: (item.item_type === 'product' ? item.product?.name : item.service?.name) || '',
+          qty: item.quantity,
+          unitPrice: Number(item.unit_price.toFixed(2)),
+          taxRate: item.total_price ? Number(((item.vat_amount / item.total_price) * 100).toFixed(2)) : 0,
+        })),
+      };
+
+      debug('Submitting POS sale payload:', payload);
+      queuedSale = { saleNumber, payload, fiscalPayload };
+      // The sale number doubles as the idempotency key, so a replay of a sale
+      // whose response was lost is not recorded twice
+      const response = await api.post('/pos/make-sale/', payload, { headers: { 'Idempotency-Key': saleNumber } });
       const saleResponse = response.data;
-      console.log('Sale completed:', saleResponse);
+      debug('Sale completed:', saleResponse);
 
       setLastSale(saleResponse);
       setShowReceipt(true);
+      // A backend that still fiscalises inline returns the receipt number already
+      if (!saleResponse?.fiscal_receipt_number) queueFiscalisation(fiscalPayload);
       clearCart();
       setSelectedCustomer(null);
       toast.success('Sale completed successfully!');
 
-      // Refresh products, services and session to reflect new balances
-      await fetchProducts();
-      await fetchServices();
+      applySoldStock();
       await fetchActiveSession();
     } catch (error: any) {
+      if (queuedSale && !error?.response && error?.code !== 'ERR_CANCELED') {
+        // Fiscalised from the replay once the server has accepted the sale
+        await offlineQueue.enqueue('/pos/make-sale/', queuedSale.payload, {
+          idempotencyKey: queuedSale.saleNumber,
+          meta: { fiscalPayload: queuedSale.fiscalPayload },
+        });
+        applySoldStock();
+        clearCart();
+        setSelectedCustomer(null);
+        toast.success('Offline: sale saved and will sync when the connection returns');
+        return;
+      }
       console.error('Sale failed:', error);
       console.error('Error response:', error?.response?.data);
       const errorData = error?.response?.data;
@@ -823,69 +914,67 @@ const POS: React.FC = () => {
   };
 
   // Filter Functions
-  const filteredProducts = products.filter(product => {
-    // Basic validation
-    if (!product || !product.id || !product.name || product.name.trim() === '') {
-      console.log('🔍 Filter: Product filtered out (missing id/name):', product);
-      return false;
-    }
-    
-    // Search filter
-    const searchLower = searchTerm.toLowerCase().trim();
-    const matchesSearch = !searchLower || 
-                         (product.name && product.name.toLowerCase().includes(searchLower)) ||
-                         (product.description && product.description && product.description.toLowerCase().includes(searchLower)) ||
-                         (product.barcode && product.barcode && product.barcode.toString().toLowerCase().includes(searchLower));
-    
-    if (!matchesSearch && searchLower) {
-      console.log('🔍 Filter: Product filtered out (search):', product.name, 'searchTerm:', searchLower);
-      return false;
-    }
-    
-    // Category filter
-    const matchesCategory = selectedCategory === 'all' || 
-                           !selectedCategory ||
-                           !product.category || 
-                           product.category === selectedCategory ||
-                           product.category.toLowerCase() === selectedCategory.toLowerCase();
-    
-    if (!matchesCategory) {
-      console.log('🔍 Filter: Product filtered out (category):', product.name, 'category:', product.category, 'selected:', selectedCategory);
-      return false;
-    }
-    
-    console.log('✅ Filter: Product passed all filters:', product.name);
-    return true;
-  });
-  
-  console.log('🔍 Filtered products count:', filteredProducts.length, 'out of', products.length);
+  // Indexes are built when the catalogue loads and re-index only items whose
+  // object changed, so a keystroke or scan never walks the whole catalogue.
+  const productIndex = useMemo(
+    () =>
+      new CatalogIndex<Product>({
+        getId: (product) => product.id,
+        getCodes: (product) => [product.barcode, product.sku],
+        getText: (product) => [product.name, product.description],
+        getCategory: (product) => product.category,
+      }),
+    []
+  );
+  const serviceIndex = useMemo(
+    () =>
+      new CatalogIndex<Service>({
+        getId: (service) => service.id,
+        getCodes: (service) => [service.service_code],
+        getText: (service) => [service.name, service.description],
+        getCategory: (service) => service.category,
+      }),
+    []
+  );
+
+  // A new snapshot per sync, so searches depend on the catalogue they read
+  const productCatalog = useMemo(() => {
+    productIndex.sync(products.filter(product => product && product.id && product.name && product.name.trim() !== ''));
+    return { index: productIndex, version: productIndex.version };
+  }, [productIndex, products]);
+  const serviceCatalog = useMemo(() => {
+    serviceIndex.sync(services.filter(service => service && service.id && service.name));
+    return { index: serviceIndex, version: serviceIndex.version };
+  }, [serviceIndex, services]);
+
+  const filteredProducts = useMemo(
+    () => productCatalog.index.search(searchTerm, selectedCategory),
+    [productCatalog, searchTerm, selectedCategory]
+  );
+  const filteredServices = useMemo(
+    () => serviceCatalog.index.search(searchTerm, selectedCategory),
+    [serviceCatalog, searchTerm, selectedCategory]
+  );
 
-  // Debug: Log when filtered products or filters change
   useEffect(() => {
-    console.log('🔍 Filtered products updated:', filteredProducts.length, 'filtered products');
-    console.log('🔍 Search term:', searchTerm, 'Category:', selectedCategory);
-    console.log('🔍 Total products:', products.length);
+    debug('🔍 Filtered products:', filteredProducts.length, 'of', products.length, 'search:', searchTerm, 'category:', selectedCategory);
   }, [filteredProducts.length, searchTerm, selectedCategory, products.length]);
 
-  const filteredServices = services.filter(service => {
-    if (!service || !service.id || !service.name) {
-      return false;
+  // Barcode scanners type the code followed by Enter
+  const handleScan = () => {
+    const code = searchTerm.trim();
+    if (!code) return;
+    const product = itemType === 'products' ? productCatalog.index.lookupCode(code) : undefined;
+    const service = itemType === 'services' ? serviceCatalog.index.lookupCode(code) : undefined;
+    if (product) {
+      addToCart(product, 'product');
+    } else if (service) {
+      addToCart(service, 'service');
+    } else {
+      return;
     }
-    
-    const searchLower = searchTerm.toLowerCase().trim();
-    const matchesSearch = !searchLower || 
-                         (service.name && service.name.toLowerCase().includes(searchLower)) ||
-                         (service.description && service.description.toLowerCase().includes(searchLower)) ||
-                         (service.service_code && service.service_code && service.service_code.toString().toLowerCase().includes(searchLower));
-    
-    const matchesCategory = selectedCategory === 'all' || 
-                           !service.category || 
-                           service.category === selectedCategory;
-    
-    // Don't filter by service_price > 0 - allow all services to be displayed
-    // Price validation will happen when adding to cart
-    return matchesSearch && matchesCategory;
-  });
+    setSearchTerm('');
+  };
 
   // Print Functions
   const printReceipt = () => {
@@ -915,6 +1004,33 @@ const POS: React.FC = () => {
                 <h1 className="text-2xl font-bold text-gray-900">Point of Sale</h1>
                 <p className="text-gray-600">
                   {posSession ? 'Session Active' : 'No Active Session'}
+                  {(offlineSync.pending > 0 || offlineSync.running) && (
+                    <span className="ml-2 text-orange-600 font-medium">
+                      • {offlineSync.running
+                        ? `Syncing offline sales (${offlineSync.sent} sent, ${offlineSync.throughput.toFixed(1)}/s)`
+                        : `${offlineSync.pending} offline sale${offlineSync.pending === 1 ? '' : 's'} pending`}
+                      {offlineSync.waitingForAuth && ' (sign in to sync)'}
+                    </span>
+                  )}
+                  {offlineSync.rejected > 0 && !offlineSync.running && (
+                    <span className="ml-2 text-red-600 font-medium">
+                      • {offlineSync.rejected} offline sale{offlineSync.rejected === 1 ? '' : 's'} rejected
+                      <button
+                        onClick={() => {
+                          offlineQueue.retryRejected().catch((error) => console.error('Offline sync failed:', error));
+                        }}
+                        className="ml-1 underline hover:text-red-800"
+                      >
+                        Retry
+                      </button>
+                    </span>
+                  )}
+                  {(fiscalQueue.pending > 0 || fiscalQueue.rejected > 0) && (
+                    <span className={`ml-2 font-medium ${fiscalQueue.backlogged || fiscalQueue.rejected ? 'text-red-600' : 'text-gray-500'}`}>
+                      • {fiscalQueue.pending} awaiting fiscalisation
+                      {fiscalQueue.rejected > 0 && `, ${fiscalQueue.rejected} rejected`}
+                    </span>
+                  )}
                   {selectedStore && stores.length > 0 && (
                     <span className="ml-2 text-blue-600 font-medium">
                       • {stores.find(s => s.id === selectedStore)?.name || `Store ${selectedStore}`}
@@ -1052,6 +1168,9 @@ const POS: React.FC = () => {
                       placeholder={itemType === 'products' ? 'Search products...' : 'Search services...'}
                       value={searchTerm}
                       onChange={(e) => setSearchTerm(e.target.value)}
+                      onKeyDown={(e) => {
+                        if (e.key === 'Enter') handleScan();
+                      }}
                       className="w-full pl-10 pr-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
                     />
                   </div>
@@ -1110,10 +1229,10 @@ const POS: React.FC = () => {
                     <button
                       onClick={() => {
                         if (itemType === 'products') {
-                          console.log('🔄 Manually refreshing products...');
+                          debug('🔄 Manually refreshing products...');
                           fetchProducts();
                         } else {
-                          console.log('🔄 Manually refreshing services...');
+                          debug('🔄 Manually refreshing services...');
                           fetchServices();
                         }
                       }}
@@ -1364,7 +1483,7 @@ const POS: React.FC = () => {
                 <button
                   onClick={(e) => {
                     e.preventDefault();
-                    console.log('Complete Sale button clicked', { loading, posSession, cartLength: cart.length });
+                    debug('Complete Sale button clicked', { loading, posSession, cartLength: cart.length });
                     processSale();
                   }}
                   disabled={loading || !posSession || cart.length === 0}
@@ -1527,7 +1646,7 @@ const POS: React.FC = () => {
               <div className="border-t pt-4">
                 <div className="flex justify-between text-sm mb-2">
                   <span>Receipt #:</span>
-                  <span>{lastSale.fiscal_receipt_number}</span>
+                  <span>{lastSale.fiscal_receipt_number || 'Pending fiscalisation'}</span>
                 </div>
                 <div className="flex justify-between text-sm mb-2">
                   <span>Date:</span>
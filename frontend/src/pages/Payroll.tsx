@@ -1,6 +1,8 @@
 import React, { useState, useEffect } from 'react';
 import api from '../services/api';
 import { toast } from 'react-hot-toast';
+import { runZwPayrollBatch, ZwPayrollBatch } from '../utils/zwTax';
+import { formatNumber, getDateTimeFormat } from '../utils/formatters';
 
 interface Employee {
   id: number;
@@ -69,6 +71,7 @@ const Payroll: React.FC = () => {
   const [formData, setFormData] = useState<any>({});
   const [payrollEndpoint, setPayrollEndpoint] = useState<'/payrolls/' | '/payroll/'>('/payrolls/');
   const [payslipEndpoint, setPayslipEndpoint] = useState<'/payslips/' | '/payslip/'>('/payslips/');
+  const [deductionTotals, setDeductionTotals] = useState<ZwPayrollBatch['totals'] | null>(null);
 
   const tabs = [
     { key: 'employees', label: 'Employees' },
@@ -81,11 +84,27 @@ const Payroll: React.FC = () => {
     fetchData();
   }, [activeTab]);
 
+  // Estimated statutory deductions for the whole active workforce, computed
+  // in one batch (on a worker for large headcounts)
+  useEffect(() => {
+    if (activeTab !== 'processing') return;
+    const active = employees.filter(e => e.is_active);
+    const gross = Float64Array.from(active, e => Number(e.basic_salary || 0) + Number(e.allowances || 0));
+    const controller = new AbortController();
+    runZwPayrollBatch(gross, { signal: controller.signal })
+      .then(result => setDeductionTotals(result.totals))
+      .catch(error => {
+        if (error?.name !== 'AbortError') console.error('Error estimating deductions:', error);
+      });
+    return () => controller.abort();
+  }, [activeTab, employees]);
+
   const fetchData = async () => {
     setLoading(true);
     try {
       switch (activeTab) {
         case 'employees':
+        case 'processing':
           const employeesResponse = await api.get('/employees/');
           {
             const data = employeesResponse.data?.results ?? employeesResponse.data ?? [];
@@ -325,7 +344,7 @@ const Payroll: React.FC = () => {
                 <td className="py-2 px-4">{`${employee.first_name} ${employee.last_name}`}</td>
                 <td className="py-2 px-4">{employee.department}</td>
                 <td className="py-2 px-4">{employee.position}</td>
-                <td className="py-2 px-4">${employee.basic_salary.toLocaleString()}</td>
+                <td className="py-2 px-4">${formatNumber(employee.basic_salary)}</td>
                 <td className="py-2 px-4">
                   <span className={`px-2 py-1 rounded text-xs ${employee.is_active ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}`}>
                     {employee.is_active ? 'Active' : 'Inactive'}
@@ -374,10 +393,10 @@ const Payroll: React.FC = () => {
               <tr key={record.id} className="border-b hover:bg-gray-50">
                 <td className="py-2 px-4">{record.employee_name}</td>
                 <td className="py-2 px-4">{record.period}</td>
-                <td className="py-2 px-4">${record.basic_salary.toLocaleString()}</td>
-                <td className="py-2 px-4">${record.allowances.toLocaleString()}</td>
-                <td className="py-2 px-4 font-semibold">${record.gross_pay.toLocaleString()}</td>
-                <td className="py-2 px-4 font-semibold text-green-600">${record.net_pay.toLocaleString()}</td>
+                <td className="py-2 px-4">${formatNumber(record.basic_salary)}</td>
+                <td className="py-2 px-4">${formatNumber(record.allowances)}</td>
+                <td className="py-2 px-4 font-semibold">${formatNumber(record.gross_pay)}</td>
+                <td className="py-2 px-4 font-semibold text-green-600">${formatNumber(record.net_pay)}</td>
                 <td className="py-2 px-4">
                   <span className={`px-2 py-1 rounded text-xs ${
                     record.status === 'PROCESSED' ? 'bg-green-100 text-green-800' :
@@ -387,7 +406,7 @@ const Payroll: React.FC = () => {
                     {record.status_display}
                   </span>
                 </td>
-                <td className="py-2 px-4">{new Date(record.processed_date).toLocaleDateString()}</td>
+                <td className="py-2 px-4">{getDateTimeFormat().format(new Date(record.processed_date))}</td>
                 <td className="py-2 px-4">
                   <button onClick={() => handlePayrollEdit(record)} className="text-blue-600 hover:underline mr-2">Edit</button>
                   <button onClick={() => handlePayrollDelete(record.id)} className="text-red-600 hover:underline">Delete</button>
@@ -426,13 +445,13 @@ const Payroll: React.FC = () => {
             <p className="text-sm text-gray-600 mb-2">Employee #: {payslip.employee_number}</p>
             <p className="text-sm text-gray-600 mb-3">Period: {payslip.period}</p>
             <div className="space-y-1 mb-3">
-              <p className="text-sm">Basic: <span className="font-semibold">${payslip.basic_salary.toLocaleString()}</span></p>
-              <p className="text-sm">Allowances: <span className="font-semibold">${payslip.allowances.toLocaleString()}</span></p>
-              <p className="text-sm">Gross: <span className="font-semibold text-blue-600">${payslip.gross_pay.toLocaleString()}</span></p>
-              <p className="text-sm">Net: <span className="font-semibold text-green-600">${payslip.net_pay.toLocaleString()}</span></p>
+              <p className="text-sm">Basic: <span className="font-semibold">${formatNumber(payslip.basic_salary)}</span></p>
+              <p className="text-sm">Allowances: <span className="font-semibold">${formatNumber(payslip.allowances)}</span></p>
+              <p className="text-sm">Gross: <span className="font-semibold text-blue-600">${formatNumber(payslip.gross_pay)}</span></p>
+              <p className="text-sm">Net: <span className="font-semibold text-green-600">${formatNumber(payslip.net_pay)}</span></p>
             </div>
             <div className="flex justify-between items-center">
-              <span className="text-xs text-gray-500">{new Date(payslip.generated_date).toLocaleDateString()}</span>
+              <span className="text-xs text-gray-500">{getDateTimeFormat().format(new Date(payslip.generated_date))}</span>
               {payslip.status === 'GENERATED' && (
                 <button 
                   onClick={() => downloadPayslip(payslip.id)}
@@ -470,10 +489,27 @@ const Payroll: React.FC = () => {
           <div className="bg-white p-4 rounded shadow">
             <h5 className="font-semibold mb-2">Total Basic Salary</h5>
             <p className="text-2xl font-bold text-green-600">
-              ${employees.filter(e => e.is_active).reduce((sum, e) => sum + e.basic_salary, 0).toLocaleString()}
+              ${formatNumber(employees.filter(e => e.is_active).reduce((sum, e) => sum + e.basic_salary, 0))}
             </p>
           </div>
         </div>
+        {deductionTotals && (
+          <div className="grid grid-cols-2 md:grid-cols-4 gap-4 mt-4">
+            {[
+              { label: 'Estimated PAYE', value: deductionTotals.paye },
+              { label: 'AIDS Levy', value: deductionTotals.aidsLevy },
+              { label: 'NSSA (employee)', value: deductionTotals.nssa },
+              { label: 'Estimated Net Pay', value: deductionTotals.gross - deductionTotals.totalDeductions },
+            ].map(card => (
+              <div key={card.label} className="bg-white p-4 rounded shadow">
+                <h5 className="font-semibold mb-2 text-sm">{card.label}</h5>
+                <p className="text-xl font-bold text-gray-800">
+                  ${formatNumber(card.value, { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
+                </p>
+              </div>
+            ))}
+          </div>
+        )}
         <div className="mt-6">
           <h5 className="font-semibold mb-2">Processing Instructions</h5>
           <ul className="list-disc list-inside space-y-1 text-sm text-gray-600">
@@ -1,5 +1,8 @@
 import React, { useState, useEffect } from 'react';
+import { toast } from 'react-hot-toast';
 import api from '../services/api';
+import { downloadReportFile } from '../services/reportService';
+import { isAbortError } from '../utils/exportStream';
 import Skeleton from '../components/common/Skeleton';
 import EmptyState from '../components/common/EmptyState';
 
@@ -75,6 +78,8 @@ const Reports: React.FC = () => {
   const [loading, setLoading] = useState(false);
   const [generating, setGenerating] = useState(false);
   const [formData, setFormData] = useState<any>({});
+  // Percent complete per in-progress download, keyed by `${type}-${id}`
+  const [downloads, setDownloads] = useState<Record<string, number>>({});
 
   const tabs = [
     { key: 'payroll', label: 'Payroll Reports' },
@@ -138,14 +143,23 @@ const Reports: React.FC = () => {
     if (reportType === 'payroll') endpoint = `/payroll-reports/${reportId}/download/`;
     if (reportType === 'tax') endpoint = `/tax-reports/${reportId}/download/`;
     if (reportType === 'financial') endpoint = `/financial-reports/${reportId}/download/`;
-    const response = await api.get(endpoint, { responseType: 'blob' });
-    const url = window.URL.createObjectURL(new Blob([response.data]));
-    const link = document.createElement('a');
-    link.href = url;
-    link.setAttribute('download', `${reportType}-report-${reportId}.pdf`);
-    document.body.appendChild(link);
-    link.click();
-    link.remove();
+    const key = `${reportType}-${reportId}`;
+    setDownloads((prev) => ({ ...prev, [key]: 0 }));
+    try {
+      await downloadReportFile(endpoint, `${reportType}-report-${reportId}.pdf`, {
+        onProgress: ({ bytes, totalBytes }) =>
+          setDownloads((prev) => ({ ...prev, [key]: totalBytes ? Math.round((bytes / totalBytes) * 100) : 0 })),
+      });
+    } catch (error) {
+      // Closing the save dialog is not an error
+      if (!isAbortError(error)) toast.error('Failed to download report');
+    } finally {
+      setDownloads((prev) => {
+        const next = { ...prev };
+        delete next[key];
+        return next;
+      });
+    }
   };
 
   const handleSubmit = async (e: React.FormEvent) => {
@@ -202,9 +216,12 @@ const Reports: React.FC = () => {
                 {report.status === 'COMPLETED' && (
                   <button 
                     onClick={() => downloadReport(report.id, 'payroll')}
-                    className="text-blue-600 hover:text-blue-800 text-sm font-medium"
+                    disabled={`payroll-${report.id}` in downloads}
+                    className="text-blue-600 hover:text-blue-800 text-sm font-medium disabled:opacity-50"
                   >
-                    Download
+                    {`payroll-${report.id}` in downloads
+                      ? `Downloading${downloads[`payroll-${report.id}`] ? ` ${downloads[`payroll-${report.id}`]}%` : '...'}`
+                      : 'Download'}
                   </button>
                 )}
               </div>
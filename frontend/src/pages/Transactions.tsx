@@ -1,7 +1,15 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { useDispatch, useSelector } from 'react-redux';
-import type { RootState } from '../store';
-import { setTransactions } from '../store/slices/transactionSlice';
+import type { AppDispatch, RootState } from '../store';
+import {
+  fetchTransactions,
+  fetchMoreTransactions,
+  syncTransactions,
+  transactionRemoved,
+  selectAllTransactions,
+  selectHasMoreTransactions,
+  selectTotalsByType,
+} from '../store/slices/transactionSlice';
 import { formatCurrency, formatDate } from '../utils/formatters';
 import TransactionModal from '../components/TransactionModal';
 import TransactionDetailModal from '../components/TransactionDetailModal';
@@ -9,40 +17,42 @@ import { transactionService, Transaction } from '../services/transactionService'
 import { toast } from 'react-hot-toast';
 
 const Transactions = () => {
-  const dispatch = useDispatch();
-  const { transactions, loading } = useSelector((state: RootState) => (state as any).transaction || { transactions: [], loading: false });
-  const [filteredTransactions, setFilteredTransactions] = useState<Transaction[]>([]);
+  const dispatch = useDispatch<AppDispatch>();
+  const filteredTransactions = useSelector(selectAllTransactions);
+  const totals = useSelector(selectTotalsByType);
+  const hasMore = useSelector(selectHasMoreTransactions);
+  const { loading: isLoading, loadingMore, count } = useSelector((state: RootState) => state.transaction);
   const [filter, setFilter] = useState<'all' | 'income' | 'expense'>('all');
   const [accountFilter, setAccountFilter] = useState<'all' | 'bank' | 'mobile' | 'cash' | 'pos' | 'purchase'>('all');
   const [showModal, setShowModal] = useState(false);
   const [showDetailModal, setShowDetailModal] = useState(false);
   const [selectedTransaction, setSelectedTransaction] = useState<Transaction | null>(null);
-  const [isLoading, setIsLoading] = useState(false);
   const [isDeleting, setIsDeleting] = useState(false);
+  const loadMoreRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
-    const fetchTransactions = async () => {
-      setIsLoading(true);
-      try {
-        const res = await transactionService.getTransactions({
-          type: filter,
-          account_type: accountFilter,
-        });
-        const list = Array.isArray(res) ? res : [];
-        dispatch(setTransactions(list as unknown as Transaction[]));
-        setFilteredTransactions(list);
-      } catch (error: any) {
+    dispatch(fetchTransactions({ type: filter, account_type: accountFilter }))
+      .unwrap()
+      .catch((error) => {
         console.error('Error fetching transactions:', error);
         toast.error('Failed to load transactions');
-        setFilteredTransactions([]);
-      } finally {
-        setIsLoading(false);
-      }
-    };
-
-    fetchTransactions();
+      });
   }, [dispatch, filter, accountFilter]);
 
+  // Load the next page when the end of the list scrolls into view
+  useEffect(() => {
+    const sentinel = loadMoreRef.current;
+    if (!sentinel || !hasMore) return;
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) dispatch(fetchMoreTransactions());
+      },
+      { rootMargin: '400px' }
+    );
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [dispatch, hasMore, isLoading, filteredTransactions.length]);
+
   const handleDeleteTransaction = async (transaction: Transaction) => {
     if (!window.confirm(`Are you sure you want to delete this transaction?\n\n${transaction.description}\nAmount: ${formatCurrency(transaction.amount)}`)) {
       return;
@@ -52,14 +62,7 @@ const Transactions = () => {
     try {
       await transactionService.deleteTransaction(transaction.id, transaction.account_type);
       toast.success('Transaction deleted successfully');
-      // Refresh transactions
-      const res = await transactionService.getTransactions({
-        type: filter,
-        account_type: accountFilter,
-      });
-      const list = Array.isArray(res) ? res : [];
-      dispatch(setTransactions(list as unknown as Transaction[]));
-      setFilteredTransactions(list);
+      dispatch(transactionRemoved(transaction.id));
       if (selectedTransaction?.id === transaction.id) {
         setShowDetailModal(false);
         setSelectedTransaction(null);
@@ -79,21 +82,13 @@ const Transactions = () => {
     setShowModal(true);
   };
 
+  // Pull only what changed since the last load
   const refreshTransactions = async () => {
-    setIsLoading(true);
     try {
-      const res = await transactionService.getTransactions({
-        type: filter,
-        account_type: accountFilter,
-      });
-      const list = Array.isArray(res) ? res : [];
-      dispatch(setTransactions(list as unknown as Transaction[]));
-      setFilteredTransactions(list);
+      await dispatch(syncTransactions()).unwrap();
     } catch (error: any) {
       console.error('Error fetching transactions:', error);
       toast.error('Failed to load transactions');
-    } finally {
-      setIsLoading(false);
     }
   };
 
@@ -132,6 +127,17 @@ const Transactions = () => {
           </div>
         </div>
 
+        {!isLoading && filteredTransactions.length > 0 && (
+          <div className="flex flex-wrap gap-6 text-sm text-gray-600">
+            <span>Income: <span className="font-medium text-green-600">{formatCurrency(totals.income)}</span></span>
+            <span>Expenses: <span className="font-medium text-red-600">{formatCurrency(totals.expense)}</span></span>
+            <span>Net: <span className="font-medium text-gray-900">{formatCurrency(totals.net)}</span></span>
+            <span className="text-gray-400">
+              {hasMore ? `${filteredTransactions.length} of ${count} loaded` : `${filteredTransactions.length} transactions`}
+            </span>
+          </div>
+        )}
+
         {isLoading ? (
           <div className="text-center py-12">
             <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-500 mx-auto"></div>
@@ -288,6 +294,10 @@ const Transactions = () => {
                 })}
               </ul>
             )}
+            <div ref={loadMoreRef} />
+            {loadingMore && (
+              <div className="text-center py-4 text-sm text-gray-500">Loading more...</div>
+            )}
           </div>
         )}
 
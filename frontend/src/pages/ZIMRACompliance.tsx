@@ -3,6 +3,7 @@ import { toast } from 'react-hot-toast';
 import api from '../services/api';
 import Skeleton from '../components/common/Skeleton';
 import EmptyState from '../components/common/EmptyState';
+import { formatCurrency } from '../utils/formatters';
 import { FiFileText, FiCheckCircle, FiAlertCircle, FiCalendar, FiDollarSign, FiDownload, FiUpload } from 'react-icons/fi';
 
 interface ZIMRAConfig {
@@ -144,10 +145,7 @@ const ZIMRACompliance: React.FC = () => {
   };
 
   const formatAmount = (amount: number) => {
-    return new Intl.NumberFormat('en-ZW', {
-      style: 'currency',
-      currency: 'USD',
-    }).format(amount);
+    return formatCurrency(amount, 'USD', 'en-ZW');
   };
 
   const formatDate = (date: string) => {
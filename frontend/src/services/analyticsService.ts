@@ -1,6 +1,7 @@
 import api from './api';
 
-export type Currency = 'ZWL' | 'USD';
+/** ISO currency code, e.g. 'USD' or 'ZWL' */
+export type Currency = string;
 
 export interface ExchangeRate {
   base: Currency;
@@ -9,30 +10,140 @@ export interface ExchangeRate {
   asOf: string; // ISO date
 }
 
-// Placeholder in-memory service. In production, fetch from backend which integrates RBZ source.
+/**
+ * Every pair's rate, derived once per refresh: `matrix[index[from] * codes.length + index[to]]`
+ * is what one unit of `from` is worth in `to`.
+ */
+export interface RateTable {
+  codes: Currency[];
+  index: Map<Currency, number>;
+  matrix: Float64Array;
+  asOf: string;
+  /** Bumped on every refresh, handy as a memo dependency */
+  version: number;
+}
+
+// Used until the first successful load from /currencies/
+const FALLBACK_UNITS_PER_USD: Record<Currency, number> = { USD: 1, ZWL: 1000 };
+
+const buildRateTable = (unitsPerUsd: Record<Currency, number>, asOf: string, version: number): RateTable => {
+  const codes = Object.keys(unitsPerUsd);
+  const n = codes.length;
+  const index = new Map(codes.map((code, i) => [code, i] as [Currency, number]));
+  const matrix = new Float64Array(n * n);
+  for (let i = 0; i < n; i++) {
+    const from = unitsPerUsd[codes[i]];
+    for (let j = 0; j < n; j++) {
+      matrix[i * n + j] = i === j ? 1 : unitsPerUsd[codes[j]] / from;
+    }
+  }
+  return { codes, index, matrix, asOf, version };
+};
+
+/**
+ * In-memory rate table loaded from /currencies/ (`exchange_rate_to_usd` is
+ * units of the currency per USD) and refreshed after `TTL_MS`. Conversions
+ * are synchronous against the current table; cross-rates go through USD and
+ * are computed once per load. Unknown currencies convert as-is.
+ */
 export class RatesService {
-  private static latest: ExchangeRate = {
-    base: 'USD',
-    quote: 'ZWL',
-    rate: 1000, // example rate
-    asOf: new Date().toISOString(),
-  };
+  static TTL_MS = 10 * 60 * 1000;
+
+  private static table: RateTable = buildRateTable(FALLBACK_UNITS_PER_USD, new Date().toISOString(), 0);
+  private static loadedAt = 0;
+  private static loading: Promise<RateTable> | null = null;
+  private static listeners = new Set<(table: RateTable) => void>();
+
+  static getTable(): RateTable {
+    return this.table;
+  }
+
+  static isStale(now = Date.now()): boolean {
+    return now - this.loadedAt >= this.TTL_MS;
+  }
+
+  /** Reload the table; concurrent callers share one request. Keeps the last table on failure. */
+  static refresh(): Promise<RateTable> {
+    if (this.loading) return this.loading;
+    this.loading = api
+      .get('/currencies/')
+      .then((response) => {
+        const rows: Array<{ code: string; exchange_rate_to_usd: number | string; is_active?: boolean }> =
+          response.data?.results || response.data || [];
+        const unitsPerUsd: Record<Currency, number> = { USD: 1 };
+        for (const row of rows) {
+          const rate = Number(row.exchange_rate_to_usd);
+          if (row.is_active === false || !row.code || !(rate > 0)) continue;
+          unitsPerUsd[row.code.toUpperCase()] = rate;
+        }
+        this.loadedAt = Date.now();
+        return this.setUnitsPerUsd(unitsPerUsd);
+      })
+      .finally(() => {
+        this.loading = null;
+      });
+    return this.loading;
+  }
+
+  /** Refresh only when the table is older than the TTL; errors are swallowed. */
+  static async ensureFresh(): Promise<RateTable> {
+    if (!this.isStale()) return this.table;
+    try {
+      return await this.refresh();
+    } catch (e) {
+      console.error('Failed to refresh exchange rates:', e);
+      return this.table;
+    }
+  }
+
+  /** Replace the table, e.g. from a pushed update. Rates are units per USD. */
+  static setUnitsPerUsd(unitsPerUsd: Record<Currency, number>, asOf = new Date().toISOString()): RateTable {
+    this.table = buildRateTable({ USD: 1, ...unitsPerUsd }, asOf, this.table.version + 1);
+    this.listeners.forEach((listener) => listener(this.table));
+    return this.table;
+  }
+
+  /** Called with the new table after every refresh; returns an unsubscribe function. */
+  static subscribe(listener: (table: RateTable) => void): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /** Units of `to` per unit of `from`, or undefined if either currency is unknown. */
+  static rate(from: Currency, to: Currency, table: RateTable = this.table): number | undefined {
+    if (from === to) return 1;
+    const i = table.index.get(from);
+    const j = table.index.get(to);
+    if (i === undefined || j === undefined) return undefined;
+    return table.matrix[i * table.codes.length + j];
+  }
+
+  static convertSync(amount: number, from: Currency, to: Currency, table: RateTable = this.table): number {
+    return amount * (this.rate(from, to, table) ?? 1);
+  }
+
+  /** Convert a whole column with one rate lookup; writes into `out` when given. */
+  static convertMany(
+    amounts: ArrayLike<number>,
+    from: Currency,
+    to: Currency,
+    out: Float64Array = new Float64Array(amounts.length),
+    table: RateTable = this.table
+  ): Float64Array {
+    const rate = this.rate(from, to, table) ?? 1;
+    for (let i = 0; i < amounts.length; i++) out[i] = amounts[i] * rate;
+    return out;
+  }
 
   static async getLatest(): Promise<ExchangeRate> {
-    return this.latest;
+    const table = await this.ensureFresh();
+    return { base: 'USD', quote: 'ZWL', rate: this.rate('USD', 'ZWL', table) ?? 1, asOf: table.asOf };
   }
 
   static async convert(amount: number, from: Currency, to: Currency): Promise<number> {
-    const { base, quote, rate } = this.latest;
-    if (from === to) return amount;
-    if (from === base && to === quote) {
-      return amount * rate;
-    }
-    if (from === quote && to === base) {
-      return amount / rate;
-    }
-    // If we get here, we don't know how to convert; return as-is
-    return amount;
+    return this.convertSync(amount, from, to, await this.ensureFresh());
   }
 }
 
@@ -1,11 +1,44 @@
 import axios from 'axios';
 import { toast } from 'react-hot-toast';
+import { requestCache } from './requestCache';
+import { AuthTokens } from './authTokens';
+import { telemetry } from './telemetry';
+
+declare module 'axios' {
+  interface AxiosRequestConfig {
+    /** true skips the error toasts below; the caller handles the failure itself */
+    silent?: boolean;
+  }
+}
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000/api';
 const REQUEST_TIMEOUT_MS = 15000;
 const TOAST_THROTTLE_MS = 2000;
 let lastNetworkToastAt = 0;
 
+type TokenListener = (access: string) => void;
+let tokenListener: TokenListener | null = null;
+
+// Lets the store mirror refreshed access tokens (the store imports this module,
+// so api.ts cannot import the store directly)
+export const onAccessTokenRefreshed = (listener: TokenListener | null) => {
+  tokenListener = listener;
+};
+
+// Access token kept in memory; one refresh at a time, renewed shortly before `exp`.
+// Uses bare axios so the refresh call does not go through the interceptors below.
+export const authTokens = new AuthTokens({
+  refresh: async (refresh) => {
+    const response = await axios.post(`${API_BASE_URL}/token/refresh/`, { refresh });
+    return response.data;
+  },
+});
+authTokens.subscribe((access) => {
+  if (access) tokenListener?.(access);
+});
+
+const bearer = (access: string) => `Bearer ${access}`;
+
 // Create axios instance
 const api = axios.create({
   baseURL: API_BASE_URL,
@@ -15,12 +48,24 @@ const api = axios.create({
   timeout: REQUEST_TIMEOUT_MS,
 });
 
+// Merge identical in-flight GETs and serve reference data from memory.
+// The cache wraps the transport, so every interceptor below still runs.
+api.defaults.adapter = requestCache.adapter(axios.getAdapter(api.defaults.adapter));
+
 // Request interceptor to add auth token
 api.interceptors.request.use(
-  (config) => {
-    const accessToken = localStorage.getItem('access');
-    if (accessToken) {
-      (config.headers as any).Authorization = `Bearer ${accessToken}`;
+  async (config) => {
+    // Hold requests while the token is being renewed, or renew it first if it is about to expire
+    if (authTokens.isRefreshing || authTokens.expiresSoon()) {
+      await authTokens.refresh().catch(() => undefined);
+    }
+    const accessToken = authTokens.getAccess();
+    // Keep an explicit per-request header (e.g. from useApi or a refresh retry),
+    // but not one merged in from api.defaults, which is never renewed
+    const sent = (config.headers as any).Authorization;
+    const explicit = !!sent && sent !== api.defaults.headers.common.Authorization;
+    if (accessToken && !explicit) {
+      (config.headers as any).Authorization = bearer(accessToken);
     }
     return config;
   },
@@ -48,7 +93,7 @@ api.interceptors.response.use(
     // If completely offline or network error, surface a clear message
     if (isNetworkError) {
       // Silent for refresh endpoint to avoid noisy toasts during tab wakes
-      if ((originalRequest.url || '').includes('/token/refresh/')) {
+      if (originalRequest.silent || (originalRequest.url || '').includes('/token/refresh/')) {
         return Promise.reject(error);
       }
       if (navigator && navigator.onLine === false) {
@@ -73,30 +118,25 @@ api.interceptors.response.use(
       return Promise.reject(error);
     }
 
-    if (error.response?.status === 401 && !originalRequest._retry) {
+    if (error.response?.status === 401 && !originalRequest._retry && authTokens.canRefresh) {
       originalRequest._retry = true;
 
       try {
-        const refreshToken = localStorage.getItem('refresh');
-        if (refreshToken) {
-          const response = await axios.post(`${API_BASE_URL}/token/refresh/`, {
-            refresh: refreshToken,
-          });
-
-          const { access } = response.data;
-          localStorage.setItem('access', access);
-          
-          // Retry original request with new token
-          originalRequest.headers = originalRequest.headers || {};
-          originalRequest.headers.Authorization = `Bearer ${access}`;
-          return api(originalRequest);
-        }
+        const sentWith = originalRequest.headers?.Authorization;
+        const current = authTokens.getAccess();
+        // Sent with a token that has since been renewed: replay it without refreshing again.
+        // Otherwise every 401 of a burst waits on the same refresh and is then replayed.
+        const access = current && sentWith && sentWith !== bearer(current) ? current : await authTokens.refresh();
+        originalRequest.headers = originalRequest.headers || {};
+        originalRequest.headers.Authorization = bearer(access);
+        return api(originalRequest);
       } catch (refreshError: any) {
         const status = refreshError?.response?.status;
         if (status === 401 || status === 403) {
-          toast.error('Session expired. Please log in again.');
-          localStorage.removeItem('access');
-          localStorage.removeItem('refresh');
+          // Every request waiting on the failed refresh lands here; show one toast
+          toast.error('Session expired. Please log in again.', { id: 'session-expired' });
+          requestCache.clear();
+          authTokens.clear();
           window.location.href = '/login';
           return Promise.reject(refreshError);
         }
@@ -112,6 +152,10 @@ api.interceptors.response.use(
       }
     }
 
+    if (originalRequest.silent) {
+      return Promise.reject(error);
+    }
+
     // Standard error handling for non-auth failures
     const detail = error.response?.data?.detail || error.response?.data?.error || error.message;
     if (status && status >= 500) {
@@ -136,7 +180,11 @@ api.interceptors.response.use(
   }
 );
 
+// Registered last so each request is timed once, across its retries
+telemetry.instrument(api);
+
 export default api;
+export { requestCache };
 
 // API Endpoints
 export const ENDPOINTS = {
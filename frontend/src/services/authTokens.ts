@@ -0,0 +1,147 @@
+export type TokenPair = {
+  access: string;
+  /** Present when the backend rotates refresh tokens */
+  refresh?: string;
+};
+
+export type AuthTokensOptions = {
+  /** Exchanges a refresh token for a new access token; must not go through the intercepted api instance */
+  refresh: (refreshToken: string) => Promise<TokenPair>;
+  /** Renew this long before `exp` (default 60s) */
+  leewayMs?: number;
+  storage?: Storage;
+};
+
+const ACCESS_KEY = 'access';
+const REFRESH_KEY = 'refresh';
+// setTimeout fires at once for longer delays (they overflow a 32-bit int)
+const MAX_TIMER_MS = 2 ** 31 - 1;
+
+/** Milliseconds since the epoch at which a JWT expires, or null if it has no readable `exp`. */
+export const tokenExpiry = (token: string | null): number | null => {
+  const payload = token?.split('.')[1];
+  if (!payload) return null;
+  try {
+    const json = atob(payload.replace(/-/g, '+').replace(/_/g, '/'));
+    const exp = JSON.parse(json).exp;
+    return typeof exp === 'number' ? exp * 1000 : null;
+  } catch {
+    return null;
+  }
+};
+
+/**
+ * Holds the JWT pair in memory (mirrored to localStorage for reloads and
+ * other tabs) and renews the access token. Concurrent refreshes share one
+ * request, and the token is renewed shortly before its `exp` so requests
+ * rarely meet a 401 at all.
+ */
+export class AuthTokens {
+  private access: string | null;
+  private refreshToken: string | null;
+  private refreshing: Promise<string> | null = null;
+  private timer: ReturnType<typeof setTimeout> | null = null;
+  private listeners = new Set<(access: string | null) => void>();
+  private leewayMs: number;
+  private storage?: Storage;
+
+  constructor(private options: AuthTokensOptions) {
+    this.leewayMs = options.leewayMs ?? 60 * 1000;
+    this.storage = options.storage ?? (typeof localStorage === 'undefined' ? undefined : localStorage);
+    this.access = this.storage?.getItem(ACCESS_KEY) ?? null;
+    this.refreshToken = this.storage?.getItem(REFRESH_KEY) ?? null;
+    if (typeof window !== 'undefined') {
+      // Another tab logged in, out or renewed the token
+      window.addEventListener('storage', (event) => {
+        if (event.key === ACCESS_KEY || event.key === REFRESH_KEY || event.key === null) {
+          this.access = this.storage?.getItem(ACCESS_KEY) ?? null;
+          this.refreshToken = this.storage?.getItem(REFRESH_KEY) ?? null;
+          this.schedule();
+        }
+      });
+    }
+    this.schedule();
+  }
+
+  getAccess(): string | null {
+    return this.access;
+  }
+
+  /** True when the access token expires within the renewal leeway and can be renewed. */
+  expiresSoon(now = Date.now()): boolean {
+    if (!this.refreshToken) return false;
+    const expiry = tokenExpiry(this.access);
+    return expiry !== null && expiry - now <= this.leewayMs;
+  }
+
+  get canRefresh(): boolean {
+    return this.refreshToken !== null;
+  }
+
+  get isRefreshing(): boolean {
+    return this.refreshing !== null;
+  }
+
+  set(access: string, refresh?: string | null) {
+    this.access = access;
+    this.storage?.setItem(ACCESS_KEY, access);
+    if (refresh) {
+      this.refreshToken = refresh;
+      this.storage?.setItem(REFRESH_KEY, refresh);
+    }
+    this.schedule();
+    this.listeners.forEach((listener) => listener(access));
+  }
+
+  clear() {
+    this.access = null;
+    this.refreshToken = null;
+    this.storage?.removeItem(ACCESS_KEY);
+    this.storage?.removeItem(REFRESH_KEY);
+    this.schedule();
+    this.listeners.forEach((listener) => listener(null));
+  }
+
+  /** Called with the new access token (null once cleared); returns an unsubscribe function. */
+  subscribe(listener: (access: string | null) => void): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /** Renew the access token; callers arriving while a renewal is in flight share it. */
+  refresh(): Promise<string> {
+    if (this.refreshing) return this.refreshing;
+    const refreshToken = this.refreshToken;
+    if (!refreshToken) return Promise.reject(new Error('No refresh token'));
+    this.refreshing = this.options
+      .refresh(refreshToken)
+      .then(({ access, refresh }) => {
+        this.set(access, refresh);
+        return access;
+      })
+      .finally(() => {
+        this.refreshing = null;
+      });
+    return this.refreshing;
+  }
+
+  private schedule() {
+    if (this.timer) clearTimeout(this.timer);
+    this.timer = null;
+    const expiry = tokenExpiry(this.access);
+    if (expiry === null || !this.refreshToken) return;
+    const delay = Math.max(0, expiry - Date.now() - this.leewayMs);
+    if (delay > MAX_TIMER_MS) {
+      // Long-lived token: wake up within range and schedule the rest then
+      this.timer = setTimeout(() => this.schedule(), MAX_TIMER_MS);
+      return;
+    }
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      // A failure here is retried by the next request that needs the token
+      this.refresh().catch(() => undefined);
+    }, delay);
+  }
+}
@@ -0,0 +1,234 @@
+import api from './api';
+
+export type BulkRowFailure = {
+  /** Index of the row in the input array */
+  index: number;
+  error: string;
+};
+
+export type BulkProgress = {
+  total: number;
+  /** Rows processed so far, including failed and resumed ones */
+  done: number;
+  failed: number;
+  chunksDone: number;
+  chunksTotal: number;
+  rowsPerSecond: number;
+};
+
+export type BulkWriteOptions = {
+  chunkSize?: number;
+  /** Chunks sent in parallel */
+  concurrency?: number;
+  /**
+   * Stable id for this import (e.g. derived from the file). Completed chunks
+   * are recorded under it, so calling again with the same id after an
+   * interruption skips them.
+   */
+  jobId?: string;
+  onProgress?: (progress: BulkProgress) => void;
+  signal?: AbortSignal;
+};
+
+export type BulkWriteResult = {
+  succeeded: number;
+  failed: BulkRowFailure[];
+  /** Rows skipped because an earlier run of the same job already sent them */
+  resumed: number;
+  /** True when a chunk could not be sent; call again with the same jobId to resume */
+  interrupted: boolean;
+};
+
+type JobState = {
+  endpoint: string;
+  total: number;
+  chunkSize: number;
+  done: number[];
+  failed: BulkRowFailure[];
+};
+
+/** Per-row outcome returned by a `<endpoint>bulk/` call, in request order. */
+type BulkResponseRow = { index: number; id?: number | string; errors?: unknown };
+
+const JOB_PREFIX = 'bulkWrite:';
+const CHUNK_RETRIES = 2;
+const RETRY_DELAY_MS = 1000;
+
+// Endpoints whose bulk route is missing; they fall back to one POST per row
+const unsupportedBulk = new Set<string>();
+
+const loadJob = (jobId: string): JobState | null => {
+  try {
+    const raw = localStorage.getItem(JOB_PREFIX + jobId);
+    return raw ? JSON.parse(raw) : null;
+  } catch {
+    return null;
+  }
+};
+
+const saveJob = (jobId: string, job: JobState) => {
+  try {
+    localStorage.setItem(JOB_PREFIX + jobId, JSON.stringify(job));
+  } catch {
+    // Quota exceeded: the import still runs, it just cannot be resumed
+  }
+};
+
+export const clearBulkJob = (jobId: string) => localStorage.removeItem(JOB_PREFIX + jobId);
+
+/** Rows already written by an interrupted run of `jobId`, or null if there is nothing to resume. */
+export const resumableBulkJob = (jobId: string) => {
+  const job = loadJob(jobId);
+  if (!job) return null;
+  const rows = job.done.reduce((sum, chunk) => sum + Math.min(job.chunkSize, job.total - chunk * job.chunkSize), 0);
+  return { done: rows, total: job.total };
+};
+
+const errorText = (error: any): string => {
+  const data = error?.response?.data ?? error;
+  if (typeof data === 'string') return data;
+  if (data?.detail) return String(data.detail);
+  if (data?.error) return String(data.error);
+  if (data && typeof data === 'object') {
+    const [field, value] = Object.entries(data)[0] || [];
+    if (field) return `${field}: ${Array.isArray(value) ? value[0] : value}`;
+  }
+  return error?.message || 'Failed';
+};
+
+const isRetryable = (error: any) => {
+  const status = error?.response?.status;
+  return error?.code !== 'ERR_CANCELED' && (!status || status === 408 || status === 429 || status >= 500);
+};
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/** Run `tasks` with at most `limit` in flight, stopping early once `stop()` is true. */
+const runBounded = async (count: number, limit: number, task: (i: number) => Promise<void>, stop: () => boolean) => {
+  let next = 0;
+  const worker = async () => {
+    while (!stop() && next < count) {
+      await task(next++);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, count) }, worker));
+};
+
+async function sendChunk(endpoint: string, rows: any[], key: string, signal?: AbortSignal): Promise<BulkRowFailure[]> {
+  if (!unsupportedBulk.has(endpoint)) {
+    try {
+      const response = await api.post<{ results: BulkResponseRow[] }>(
+        `${endpoint}bulk/`,
+        { items: rows },
+        { headers: { 'Idempotency-Key': key }, signal }
+      );
+      return (response.data.results || [])
+        .filter((row) => row.errors)
+        .map((row) => ({ index: row.index, error: errorText(row.errors) }));
+    } catch (error: any) {
+      const status = error?.response?.status;
+      if (status !== 404 && status !== 405) throw error;
+      unsupportedBulk.add(endpoint);
+    }
+  }
+
+  // No bulk route on this backend: same chunking, one request per row
+  const failures: BulkRowFailure[] = [];
+  await runBounded(
+    rows.length,
+    4,
+    async (i) => {
+      try {
+        await api.post(endpoint, rows[i], { headers: { 'Idempotency-Key': `${key}:${i}` }, signal });
+      } catch (error: any) {
+        if (isRetryable(error)) throw error;
+        failures.push({ index: i, error: errorText(error) });
+      }
+    },
+    () => !!signal?.aborted
+  );
+  return failures;
+}
+
+/**
+ * Create `rows` through `endpoint` in chunks, a bounded number of chunks in
+ * parallel. Rows the server rejects are reported individually and do not
+ * stop the import; a chunk that cannot be delivered after retries stops it
+ * and leaves the job resumable.
+ */
+export async function bulkWrite(endpoint: string, rows: any[], options: BulkWriteOptions = {}): Promise<BulkWriteResult> {
+  const chunkSize = options.chunkSize || 200;
+  const concurrency = options.concurrency || 3;
+  const chunksTotal = Math.ceil(rows.length / chunkSize);
+  const previous = options.jobId ? loadJob(options.jobId) : null;
+  const job: JobState =
+    previous && previous.endpoint === endpoint && previous.total === rows.length && previous.chunkSize === chunkSize
+      ? previous
+      : { endpoint, total: rows.length, chunkSize, done: [], failed: [] };
+
+  const completed = new Set(job.done);
+  const pending = Array.from({ length: chunksTotal }, (_, i) => i).filter((i) => !completed.has(i));
+  const rowsIn = (chunk: number) => Math.min(chunkSize, rows.length - chunk * chunkSize);
+  const resumed = job.done.reduce((sum, chunk) => sum + rowsIn(chunk), 0);
+
+  // Prefixes the per-chunk idempotency keys, so it must differ between imports
+  const jobKey = options.jobId || crypto.randomUUID?.() || `${Date.now()}-${Math.random()}`;
+  const startedAt = Date.now();
+  let sentRows = 0;
+  let interrupted = false;
+  let abortError: unknown = null;
+
+  const report = () => {
+    const seconds = (Date.now() - startedAt) / 1000;
+    options.onProgress?.({
+      total: rows.length,
+      done: resumed + sentRows,
+      failed: job.failed.length,
+      chunksDone: job.done.length,
+      chunksTotal,
+      rowsPerSecond: seconds > 0 ? sentRows / seconds : 0,
+    });
+  };
+  report();
+
+  await runBounded(
+    pending.length,
+    concurrency,
+    async (i) => {
+      const chunk = pending[i];
+      const start = chunk * chunkSize;
+      const slice = rows.slice(start, start + chunkSize);
+      for (let attempt = 0; ; attempt += 1) {
+        try {
+          const failures = await sendChunk(endpoint, slice, `${jobKey}:${chunk}`, options.signal);
+          job.failed.push(...failures.map((f) => ({ index: start + f.index, error: f.error })));
+          job.done.push(chunk);
+          sentRows += slice.length;
+          if (options.jobId) saveJob(options.jobId, job);
+          report();
+          return;
+        } catch (error: any) {
+          if (error?.code === 'ERR_CANCELED' || options.signal?.aborted) {
+            abortError = error;
+            return;
+          }
+          if (!isRetryable(error) || attempt >= CHUNK_RETRIES) {
+            interrupted = true;
+            return;
+          }
+          await sleep(RETRY_DELAY_MS * 2 ** attempt);
+        }
+      }
+    },
+    () => interrupted || !!abortError
+  );
+
+  if (abortError) throw abortError;
+  if (!interrupted && options.jobId) clearBulkJob(options.jobId);
+  return {
+    succeeded: job.done.reduce((sum, chunk) => sum + rowsIn(chunk), 0) - job.failed.length,
+    failed: job.failed.slice().sort((a, b) => a.index - b.index),
+    resumed,
+    interrupted,
+  };
+}
@@ -0,0 +1,174 @@
+import { aggregateColumns, columnBuffers, parseColumnsPage } from '../utils/aggregate';
+import type { AggregateColumns, AggregateRequest, AggregateResult, ColumnFields, ColumnsPage } from '../utils/aggregate';
+
+export type AggregateJobOptions = {
+  signal?: AbortSignal;
+  /** Force (true) or skip (false) the worker; by default only large inputs use it */
+  useWorker?: boolean;
+};
+
+type Job = {
+  id: number;
+  /** Posted to the worker along with the job id */
+  message: object;
+  transfer: Transferable[];
+  resolve: (result: any) => void;
+  reject: (error: unknown) => void;
+  signal?: AbortSignal;
+  onAbort?: () => void;
+};
+
+type Slot = {
+  worker: Worker;
+  job: Job | null;
+};
+
+// Below this many rows a worker round trip costs more than the aggregation
+export const WORKER_MIN_ROWS = 10000;
+
+const abortError = () => new DOMException('Aggregation superseded', 'AbortError');
+
+const createAggregateWorker = () =>
+  new Worker(new URL('../workers/aggregateWorker.ts', import.meta.url), { type: 'module' });
+
+/**
+ * A few aggregation workers shared by every report. Jobs queue when all
+ * workers are busy; aborting a queued job drops it, aborting a running one
+ * terminates its worker (a fresh one is started on demand) so a superseded
+ * run never delays the next.
+ */
+export class ComputePool {
+  private slots: Slot[] = [];
+  private queue: Job[] = [];
+  private nextId = 1;
+
+  constructor(
+    private createWorker: () => Worker = createAggregateWorker,
+    private size = Math.max(1, Math.min(4, (globalThis.navigator?.hardwareConcurrency || 2) - 1))
+  ) {}
+
+  /** Aggregate `columns`; their buffers are transferred, so build fresh columns per job. */
+  run(columns: AggregateColumns, request: AggregateRequest, options: AggregateJobOptions = {}): Promise<AggregateResult> {
+    const useWorker =
+      options.useWorker ?? (typeof Worker !== 'undefined' && columns.amount.length >= WORKER_MIN_ROWS);
+    return this.submit({ columns, request }, columnBuffers(columns), () => aggregateColumns(columns, request), {
+      ...options,
+      useWorker,
+    });
+  }
+
+  /**
+   * Parse one JSON list response into columns. The rows only ever exist as
+   * objects inside the worker, so a large ledger never walks the main thread.
+   */
+  parse(text: string, fields: ColumnFields, options: AggregateJobOptions = {}): Promise<ColumnsPage> {
+    const useWorker = options.useWorker ?? typeof Worker !== 'undefined';
+    return this.submit({ text, fields }, [], () => parseColumnsPage(text, fields), { ...options, useWorker });
+  }
+
+  private submit<R>(message: object, transfer: Transferable[], inline: () => R, options: AggregateJobOptions): Promise<R> {
+    if (options.signal?.aborted) return Promise.reject(abortError());
+    if (!options.useWorker) {
+      return Promise.resolve().then(() => {
+        if (options.signal?.aborted) throw abortError();
+        return inline();
+      });
+    }
+    return new Promise((resolve, reject) => {
+      const job: Job = { id: this.nextId++, message, transfer, resolve, reject, signal: options.signal };
+      if (job.signal) {
+        job.onAbort = () => this.cancel(job);
+        job.signal.addEventListener('abort', job.onAbort);
+      }
+      this.queue.push(job);
+      this.pump();
+    });
+  }
+
+  /** Stop every worker and reject pending jobs. */
+  terminate() {
+    this.queue.splice(0).forEach((job) => this.settle(job, abortError()));
+    this.slots.splice(0).forEach((slot) => {
+      slot.worker.terminate();
+      if (slot.job) this.settle(slot.job, abortError());
+    });
+  }
+
+  private pump() {
+    while (this.queue.length) {
+      let slot = this.slots.find((candidate) => !candidate.job);
+      if (!slot && this.slots.length < this.size) {
+        slot = this.spawn();
+      }
+      if (!slot) return;
+      const job = this.queue.shift()!;
+      slot.job = job;
+      slot.worker.postMessage({ id: job.id, ...job.message }, job.transfer);
+    }
+  }
+
+  private spawn(): Slot {
+    const slot: Slot = { worker: this.createWorker(), job: null };
+    slot.worker.onmessage = (event: MessageEvent<{ id: number; result?: unknown; error?: string }>) => {
+      const job = slot.job;
+      if (!job || job.id !== event.data.id) return;
+      slot.job = null;
+      this.settle(job, event.data.error ? new Error(event.data.error) : undefined, event.data.result);
+      this.pump();
+    };
+    slot.worker.onerror = (event) => {
+      const job = slot.job;
+      this.retire(slot);
+      if (job) this.settle(job, event.error || new Error(event.message));
+      this.pump();
+    };
+    this.slots.push(slot);
+    return slot;
+  }
+
+  private cancel(job: Job) {
+    const queued = this.queue.indexOf(job);
+    if (queued >= 0) {
+      this.queue.splice(queued, 1);
+    } else {
+      const slot = this.slots.find((candidate) => candidate.job === job);
+      if (!slot) return;
+      this.retire(slot);
+      this.pump();
+    }
+    this.settle(job, abortError());
+  }
+
+  private retire(slot: Slot) {
+    slot.worker.terminate();
+    this.slots = this.slots.filter((candidate) => candidate !== slot);
+  }
+
+  private settle(job: Job, error?: unknown, result?: unknown) {
+    if (job.onAbort) job.signal?.removeEventListener('abort', job.onAbort);
+    if (error) job.reject(error);
+    else job.resolve(result);
+  }
+}
+
+export const computePool = new ComputePool();
+
+/**
+ * Runs aggregations where only the latest matters (e.g. one per filter
+ * change): starting a job aborts the previous one from the same channel.
+ */
+export const createAggregationChannel = (pool: ComputePool = computePool) => {
+  let current: AbortController | null = null;
+  return {
+    run(columns: AggregateColumns, request: AggregateRequest, options: Omit<AggregateJobOptions, 'signal'> = {}) {
+      current?.abort();
+      const controller = new AbortController();
+      current = controller;
+      return pool.run(columns, request, { ...options, signal: controller.signal });
+    },
+    cancel() {
+      current?.abort();
+      current = null;
+    },
+  };
+};
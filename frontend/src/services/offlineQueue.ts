@@ -1,38 +1,430 @@
-type QueueItem = {
+import api, { authTokens } from './api';
+
+export type QueueItem = {
+  /** Idempotency key, sent as the Idempotency-Key header on replay */
   id: string;
   endpoint: string;
+  method: 'post' | 'put' | 'patch' | 'delete';
   payload: any;
   createdAt: string;
+  attempts: number;
+  /** Set once the server rejects the item outright; it is kept but no longer replayed */
+  failedAt?: string;
+  lastError?: string;
+  /** Kept with the item for `onSent` handlers; not sent to the server */
+  meta?: Record<string, unknown>;
 };
 
-const KEY = 'offlineQueue_v1';
+export type SyncProgress = {
+  running: boolean;
+  /** Items waiting to be sent (excludes rejected ones) */
+  pending: number;
+  rejected: number;
+  sent: number;
+  /** Items per second over the current or last run */
+  throughput: number;
+  /** When the next automatic attempt is scheduled after a failure */
+  retryAt: number | null;
+  /** Stopped on a 401/403; replay resumes once the user signs in */
+  waitingForAuth: boolean;
+};
 
-function readQueue(): QueueItem[] {
-  try {
-    const raw = localStorage.getItem(KEY);
-    return raw ? JSON.parse(raw) : [];
-  } catch {
-    return [];
+/** Storage behind the queue; items come back oldest first. */
+export interface QueueStore {
+  /** Resolves false when an item with the same id is already queued */
+  add(item: QueueItem): Promise<boolean>;
+  list(limit?: number): Promise<QueueItem[]>;
+  put(item: QueueItem): Promise<void>;
+  delete(id: string): Promise<void>;
+  clear(): Promise<void>;
+}
+
+type SendFn = (item: QueueItem) => Promise<unknown>;
+
+/** Runs after the server has the write; `response` is undefined when it already had it (409). */
+type SentHandler = (item: QueueItem, response: unknown) => unknown;
+
+type ReplayOptions = {
+  batchSize?: number;
+  concurrency?: number;
+};
+
+const DB_NAME = 'fronto-offline';
+const STORE = 'queue';
+const LEGACY_KEY = 'offlineQueue_v1';
+const BASE_BACKOFF_MS = 5000;
+const MAX_BACKOFF_MS = 5 * 60 * 1000;
+
+const promisify = <T>(request: IDBRequest<T>) =>
+  new Promise<T>((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+
+/**
+ * One object store with an auto-incremented key, so enqueue is a single
+ * append and replay reads the oldest items first. The idempotency key has a
+ * unique index, which makes enqueueing the same operation twice a no-op.
+ */
+export class IndexedDbQueueStore implements QueueStore {
+  private db: Promise<IDBDatabase> | null = null;
+
+  constructor(private dbName = DB_NAME) {}
+
+  private open() {
+    if (!this.db) {
+      this.db = new Promise((resolve, reject) => {
+        const request = indexedDB.open(this.dbName, 1);
+        request.onupgradeneeded = () => {
+          const store = request.result.createObjectStore(STORE, { keyPath: 'seq', autoIncrement: true });
+          store.createIndex('id', 'id', { unique: true });
+        };
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+      });
+    }
+    return this.db;
+  }
+
+  private async store(mode: IDBTransactionMode) {
+    return (await this.open()).transaction(STORE, mode).objectStore(STORE);
+  }
+
+  private async seqOf(id: string) {
+    const index = (await this.store('readonly')).index('id');
+    return promisify(index.getKey(id)) as Promise<IDBValidKey | undefined>;
+  }
+
+  async add(item: QueueItem) {
+    try {
+      await promisify((await this.store('readwrite')).add(item));
+      return true;
+    } catch (error) {
+      if ((error as DOMException)?.name !== 'ConstraintError') throw error;
+      return false;
+    }
+  }
+
+  async list(limit?: number) {
+    return promisify((await this.store('readonly')).getAll(undefined, limit)) as Promise<QueueItem[]>;
+  }
+
+  async put(item: QueueItem) {
+    const seq = await this.seqOf(item.id);
+    if (seq !== undefined) {
+      await promisify((await this.store('readwrite')).put({ ...item, seq }));
+    }
+  }
+
+  async delete(id: string) {
+    const seq = await this.seqOf(id);
+    if (seq !== undefined) {
+      await promisify((await this.store('readwrite')).delete(seq));
+    }
+  }
+
+  async clear() {
+    await promisify((await this.store('readwrite')).clear());
   }
 }
 
-function writeQueue(items: QueueItem[]) {
-  localStorage.setItem(KEY, JSON.stringify(items));
+/** Used where IndexedDB is unavailable (tests, some private browsing modes). */
+export class MemoryQueueStore implements QueueStore {
+  private items = new Map<string, QueueItem>();
+
+  async add(item: QueueItem) {
+    if (this.items.has(item.id)) return false;
+    this.items.set(item.id, item);
+    return true;
+  }
+
+  async list(limit?: number) {
+    return Array.from(this.items.values()).slice(0, limit);
+  }
+
+  async put(item: QueueItem) {
+    if (this.items.has(item.id)) this.items.set(item.id, item);
+  }
+
+  async delete(id: string) {
+    this.items.delete(id);
+  }
+
+  async clear() {
+    this.items.clear();
+  }
 }
 
-export const offlineQueue = {
-  enqueue(endpoint: string, payload: any) {
-    const items = readQueue();
-    items.push({ id: crypto.randomUUID?.() || String(Date.now()), endpoint, payload, createdAt: new Date().toISOString() });
-    writeQueue(items);
-  },
-  peekAll(): QueueItem[] {
-    return readQueue();
-  },
-  clear() {
-    writeQueue([]);
-  },
-  remove(id: string) {
-    writeQueue(readQueue().filter(i => i.id !== id));
-  }
-}; 
\ No newline at end of file
+const newKey = () => crypto.randomUUID?.() || `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+
+// Not signed in, or the session ended: nothing is wrong with the payload, so
+// keep it and replay once there is a token again
+const isAuthError = (error: any) => [401, 403].includes(error?.response?.status);
+
+// Network errors, timeouts, throttling and server errors are worth retrying;
+// any other 4xx means the payload itself was rejected.
+const isRetryable = (error: any) => {
+  const status = error?.response?.status;
+  return !status || status === 408 || status === 429 || status >= 500;
+};
+
+// The server already applied a write with this idempotency key
+const isDuplicate = (error: any) => error?.response?.status === 409;
+
+const sendWithApi: SendFn = (item) =>
+  api.request({
+    url: item.endpoint,
+    method: item.method,
+    data: item.payload,
+    headers: { 'Idempotency-Key': item.id },
+  });
+
+export class OfflineQueue {
+  private listeners = new Set<(progress: SyncProgress) => void>();
+  private sentHandlers = new Set<SentHandler>();
+  private running: Promise<void> | null = null;
+  private retryTimer: ReturnType<typeof setTimeout> | null = null;
+  private failures = 0;
+  private progress: SyncProgress = {
+    running: false,
+    pending: 0,
+    rejected: 0,
+    sent: 0,
+    throughput: 0,
+    retryAt: null,
+    waitingForAuth: false,
+  };
+
+  constructor(
+    private store: QueueStore,
+    private send: SendFn = sendWithApi
+  ) {}
+
+  /** Append a write to replay later; returns its idempotency key. */
+  async enqueue(
+    endpoint: string,
+    payload: any,
+    options: { method?: QueueItem['method']; idempotencyKey?: string; meta?: QueueItem['meta'] } = {}
+  ) {
+    const item: QueueItem = {
+      id: options.idempotencyKey || newKey(),
+      endpoint,
+      method: options.method || 'post',
+      payload,
+      createdAt: new Date().toISOString(),
+      attempts: 0,
+      ...(options.meta ? { meta: options.meta } : {}),
+    };
+    // Counted here rather than re-read so an enqueue costs one append
+    if (await this.store.add(item)) {
+      this.update({ pending: this.progress.pending + 1 });
+    }
+    return item.id;
+  }
+
+  peekAll() {
+    return this.store.list();
+  }
+
+  async remove(id: string) {
+    await this.store.delete(id);
+    await this.refreshCounts();
+  }
+
+  async clear() {
+    await this.store.clear();
+    await this.refreshCounts();
+  }
+
+  getProgress() {
+    return this.progress;
+  }
+
+  /** Put rejected items back in line (e.g. after fixing the cause) and replay them. */
+  async retryRejected(options: ReplayOptions = {}) {
+    const rejected = (await this.store.list()).filter((item) => item.failedAt);
+    await Promise.all(rejected.map((item) => this.store.put({ ...item, failedAt: undefined })));
+    await this.refreshCounts();
+    return this.replay(options);
+  }
+
+  /** Re-read the pending and rejected counts from storage. */
+  refresh() {
+    return this.refreshCounts();
+  }
+
+  subscribe(listener: (progress: SyncProgress) => void) {
+    this.listeners.add(listener);
+    listener(this.progress);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /**
+   * Follow-up work that must wait until a queued write reached the server,
+   * e.g. fiscalising an offline sale. Handlers run before the item is
+   * dropped from the queue; returns an unsubscribe function.
+   */
+  onSent(handler: SentHandler) {
+    this.sentHandlers.add(handler);
+    return () => {
+      this.sentHandlers.delete(handler);
+    };
+  }
+
+  private async notifySent(item: QueueItem, response: unknown) {
+    for (const handler of this.sentHandlers) {
+      try {
+        await handler(item, response);
+      } catch (error) {
+        console.error('Offline queue follow-up failed:', error);
+      }
+    }
+  }
+
+  /**
+   * Send queued writes oldest first, `batchSize` at a time with up to
+   * `concurrency` requests in flight. A retryable failure stops the run and
+   * schedules another with exponential backoff; concurrent calls share a run.
+   */
+  replay(options: ReplayOptions = {}) {
+    if (!this.running) {
+      this.running = this.run(options).finally(() => {
+        this.running = null;
+      });
+    }
+    return this.running;
+  }
+
+  private async run({ batchSize = 25, concurrency = 4 }: ReplayOptions) {
+    if (this.retryTimer) {
+      clearTimeout(this.retryTimer);
+      this.retryTimer = null;
+    }
+    const startedAt = Date.now();
+    let sent = 0;
+    // Why the run ended early: a retryable failure (backoff) or missing credentials (wait for login)
+    let stopped: 'retry' | 'auth' | null = null;
+    this.update({ running: true, sent: 0, throughput: 0, retryAt: null, waitingForAuth: false });
+
+    try {
+      while (!stopped) {
+        // One read per pass; writes enqueued meanwhile are picked up by the next pass
+        const items = (await this.store.list()).filter((item) => !item.failedAt);
+        if (!items.length) break;
+
+        for (let start = 0; start < items.length && !stopped; start += batchSize) {
+          const batch = items.slice(start, start + batchSize);
+          let cursor = 0;
+          const worker = async () => {
+            while (!stopped && cursor < batch.length) {
+              const item = batch[cursor++];
+              try {
+                const response = await this.send(item);
+                await this.notifySent(item, response);
+                await this.store.delete(item.id);
+                sent += 1;
+                this.update({ pending: Math.max(0, this.progress.pending - 1) });
+              } catch (error: any) {
+                if (isDuplicate(error)) {
+                  await this.notifySent(item, undefined);
+                  await this.store.delete(item.id);
+                  sent += 1;
+                  this.update({ pending: Math.max(0, this.progress.pending - 1) });
+                } else if (isAuthError(error) || isRetryable(error)) {
+                  stopped = isAuthError(error) ? 'auth' : 'retry';
+                  await this.store.put({ ...item, attempts: item.attempts + 1, lastError: error?.message });
+                } else {
+                  await this.store.put({
+                    ...item,
+                    attempts: item.attempts + 1,
+                    failedAt: new Date().toISOString(),
+                    lastError: JSON.stringify(error?.response?.data ?? error?.message ?? 'Rejected'),
+                  });
+                  this.update({
+                    pending: Math.max(0, this.progress.pending - 1),
+                    rejected: this.progress.rejected + 1,
+                  });
+                }
+              }
+              const seconds = (Date.now() - startedAt) / 1000;
+              this.update({ sent, throughput: seconds > 0 ? sent / seconds : sent });
+            }
+          };
+          await Promise.all(Array.from({ length: Math.min(concurrency, batch.length) }, worker));
+        }
+      }
+    } finally {
+      await this.refreshCounts().catch(() => undefined);
+      this.failures = stopped === 'retry' ? this.failures + 1 : 0;
+      this.update({
+        running: false,
+        // Not retried on a timer: a 401/403 will not clear until someone signs in
+        waitingForAuth: stopped === 'auth',
+        retryAt: stopped === 'retry' ? this.scheduleRetry({ batchSize, concurrency }) : null,
+      });
+    }
+  }
+
+  private scheduleRetry(options: ReplayOptions) {
+    const delay = Math.min(MAX_BACKOFF_MS, BASE_BACKOFF_MS * 2 ** (this.failures - 1));
+    // Jitter so a branch full of tills coming back online does not retry in lockstep
+    const wait = delay / 2 + Math.random() * (delay / 2);
+    this.retryTimer = setTimeout(() => {
+      this.retryTimer = null;
+      this.replay(options);
+    }, wait);
+    return Date.now() + wait;
+  }
+
+  private async refreshCounts() {
+    const items = await this.store.list();
+    const rejected = items.filter((item) => item.failedAt).length;
+    this.update({ pending: items.length - rejected, rejected });
+  }
+
+  private update(patch: Partial<SyncProgress>) {
+    this.progress = { ...this.progress, ...patch };
+    this.listeners.forEach((listener) => listener(this.progress));
+  }
+}
+
+// Items written by the previous localStorage-based queue
+const migrateLegacyQueue = async (queue: OfflineQueue) => {
+  try {
+    const raw = localStorage.getItem(LEGACY_KEY);
+    if (!raw) return;
+    const items: Array<{ id: string; endpoint: string; payload: any }> = JSON.parse(raw);
+    for (const item of items) {
+      await queue.enqueue(item.endpoint, item.payload, { idempotencyKey: item.id });
+    }
+    localStorage.removeItem(LEGACY_KEY);
+  } catch {
+    // Leave the legacy data in place and try again next start
+  }
+};
+
+export const offlineQueue = new OfflineQueue(
+  typeof indexedDB === 'undefined' ? new MemoryQueueStore() : new IndexedDbQueueStore()
+);
+
+let started = false;
+
+/** Replay queued writes now and whenever the browser reports it is back online. */
+export const startOfflineSync = () => {
+  if (started || typeof window === 'undefined') return;
+  started = true;
+  const replay = () => {
+    offlineQueue.replay().catch((error) => console.error('Offline sync failed:', error));
+  };
+  window.addEventListener('online', replay);
+  // Runs at startup, possibly before login: replay once there is a token
+  authTokens.subscribe((access) => {
+    if (access && navigator.onLine !== false) replay();
+  });
+  migrateLegacyQueue(offlineQueue).finally(() => {
+    if (navigator.onLine !== false && authTokens.getAccess()) replay();
+    else offlineQueue.refresh().catch(() => undefined);
+  });
+};
@@ -0,0 +1,423 @@
+import api, { authTokens } from './api';
+
+type RecordId = string | number;
+
+export type RealtimeEvent<T = any> =
+  | { resource: string; op: 'upsert'; id: RecordId; data: T }
+  | { resource: string; op: 'delete'; id: RecordId }
+  /** Events may have been missed (e.g. after a reconnect); reload the resource once */
+  | { resource: string; op: 'resync' };
+
+export type RealtimeStatus = 'idle' | 'connecting' | 'live' | 'polling';
+
+export type RealtimeListener = (events: RealtimeEvent[]) => void;
+
+export type SubscribeOptions = {
+  /** List endpoint polled with If-None-Match while push is unavailable */
+  pollUrl?: string;
+  pollIntervalMs?: number;
+};
+
+export type TransportHandlers = {
+  onOpen: () => void;
+  onEvents: (events: RealtimeEvent[], lastEventId?: string) => void;
+  /** Connection lost; the transport is reconnecting by itself */
+  onInterrupted: () => void;
+  /** Connection gone for good; `everOpened` false means push is not available */
+  onClosed: (everOpened: boolean) => void;
+};
+
+export type PushTransport = { close: () => void };
+
+export type TransportFactory = (url: string, handlers: TransportHandlers) => PushTransport;
+
+const DEFAULT_POLL_INTERVAL_MS = 30000;
+const RECONNECT_BASE_MS = 1000;
+const RECONNECT_MAX_MS = 30000;
+// How long to stay on polling before trying push again
+const PUSH_RETRY_MS = 5 * 60 * 1000;
+
+const parseEvents = (raw: string): RealtimeEvent[] => {
+  try {
+    const parsed = JSON.parse(raw);
+    return (Array.isArray(parsed) ? parsed : [parsed]).filter((event) => event && event.resource && event.op);
+  } catch {
+    return [];
+  }
+};
+
+/**
+ * Server-sent events. The browser's own reconnect would resend a ticket that
+ * has already been used, so errors close the stream and the client reconnects
+ * with a fresh ticket and `last_event_id`.
+ */
+export const sseTransport: TransportFactory = (url, handlers) => {
+  const source = new EventSource(url);
+  let opened = false;
+  source.onopen = () => {
+    opened = true;
+    handlers.onOpen();
+  };
+  source.onmessage = (event) => handlers.onEvents(parseEvents(event.data), event.lastEventId || undefined);
+  source.onerror = () => {
+    source.close();
+    handlers.onClosed(opened);
+  };
+  return { close: () => source.close() };
+};
+
+export const webSocketTransport: TransportFactory = (url, handlers) => {
+  const socket = new WebSocket(url.replace(/^http/, 'ws'));
+  let opened = false;
+  socket.onopen = () => {
+    opened = true;
+    handlers.onOpen();
+  };
+  socket.onmessage = (event) => handlers.onEvents(parseEvents(String(event.data)));
+  socket.onclose = () => handlers.onClosed(opened);
+  return {
+    close: () => {
+      socket.onclose = null;
+      socket.close();
+    },
+  };
+};
+
+type Subscription = { listener: RealtimeListener; options: SubscribeOptions };
+
+type Poller = {
+  timer: ReturnType<typeof setTimeout> | null;
+  etag: string | null;
+  /** Serialized rows from the previous poll, to turn snapshots into deltas */
+  seen: Map<RecordId, string> | null;
+};
+
+export type RealtimeClientOptions = {
+  url: string;
+  /** null disables push and always polls */
+  transport: TransportFactory | null;
+  /**
+   * Fetches a short-lived, single-use ticket for the stream URL through an
+   * authenticated request; EventSource cannot send headers, and the access
+   * token itself must not end up in URLs. Called again for every reconnect.
+   */
+  ticket?: () => Promise<string | null>;
+};
+
+/**
+ * One push connection shared by every subscriber, carrying delta events for
+ * the resources currently subscribed. When push is unavailable each
+ * resource with a `pollUrl` is polled instead, conditionally, so an
+ * unchanged list costs a 304 rather than a full payload.
+ */
+export class RealtimeClient {
+  private subscriptions = new Map<string, Set<Subscription>>();
+  private statusListeners = new Set<(status: RealtimeStatus) => void>();
+  private status: RealtimeStatus = 'idle';
+  private transport: PushTransport | null = null;
+  /** Set while a connection waits for its ticket; replaced or cleared to abandon it */
+  private pendingConnect: object | null = null;
+  private connectedResources = '';
+  private lastEventId: string | undefined;
+  private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+  private reconnectAttempts = 0;
+  private pushUnavailableUntil = 0;
+  private pollers = new Map<string, Poller>();
+  private reconcileQueued = false;
+
+  constructor(private options: RealtimeClientOptions) {}
+
+  subscribe(resource: string, listener: RealtimeListener, options: SubscribeOptions = {}) {
+    const subscription: Subscription = { listener, options };
+    let set = this.subscriptions.get(resource);
+    if (!set) {
+      set = new Set();
+      this.subscriptions.set(resource, set);
+    }
+    set.add(subscription);
+    this.scheduleReconcile();
+    return () => {
+      set!.delete(subscription);
+      if (!set!.size) this.subscriptions.delete(resource);
+      this.scheduleReconcile();
+    };
+  }
+
+  getStatus() {
+    return this.status;
+  }
+
+  onStatus(listener: (status: RealtimeStatus) => void) {
+    this.statusListeners.add(listener);
+    listener(this.status);
+    return () => {
+      this.statusListeners.delete(listener);
+    };
+  }
+
+  /** Close the connection and stop polling (subscriptions are kept). */
+  close() {
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+    this.disconnect();
+    this.stopPolling();
+    this.setStatus('idle');
+  }
+
+  // Subscriptions made in the same tick (one page mounting several lists)
+  // share a single reconnect
+  private scheduleReconcile() {
+    if (this.reconcileQueued) return;
+    this.reconcileQueued = true;
+    queueMicrotask(() => {
+      this.reconcileQueued = false;
+      this.reconcile();
+    });
+  }
+
+  private reconcile() {
+    const resources = Array.from(this.subscriptions.keys()).sort();
+    if (!resources.length) {
+      this.close();
+      return;
+    }
+    if (!this.options.transport || Date.now() < this.pushUnavailableUntil) {
+      this.startPolling();
+      return;
+    }
+    const key = resources.join(',');
+    if ((this.transport || this.pendingConnect) && key === this.connectedResources) return;
+    this.connect(resources);
+  }
+
+  private connect(resources: string[]) {
+    this.disconnect();
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+    const recovering = this.reconnectAttempts > 0 || this.status === 'polling';
+    this.connectedResources = resources.join(',');
+    this.setStatus('connecting');
+    const attempt = {};
+    this.pendingConnect = attempt;
+    (this.options.ticket ? this.options.ticket() : Promise.resolve(null)).then(
+      (ticket) => {
+        if (this.pendingConnect !== attempt) return;
+        this.pendingConnect = null;
+        this.open(resources, ticket, recovering);
+      },
+      (error) => {
+        if (this.pendingConnect !== attempt) return;
+        this.pendingConnect = null;
+        this.connectedResources = '';
+        const status = error?.response?.status;
+        // Unreachable or failing server: try again later. Anything else (no
+        // ticket endpoint, not signed in) means push is not available to us.
+        if (!status || status >= 500) this.scheduleReconnect();
+        else this.pushUnavailable();
+      }
+    );
+  }
+
+  private open(resources: string[], ticket: string | null, recovering: boolean) {
+    const url = new URL(this.options.url, window.location.href);
+    url.searchParams.set('resources', resources.join(','));
+    // Lets the server replay what a reconnecting client missed, if it can
+    if (this.lastEventId) url.searchParams.set('last_event_id', this.lastEventId);
+    if (ticket) url.searchParams.set('ticket', ticket);
+
+    let interrupted = false;
+    this.transport = this.options.transport!(url.toString(), {
+      onOpen: () => {
+        this.reconnectAttempts = 0;
+        this.stopPolling();
+        this.setStatus('live');
+        if (recovering || interrupted) this.broadcastResync();
+        interrupted = false;
+      },
+      onEvents: (events, lastEventId) => {
+        if (lastEventId) this.lastEventId = lastEventId;
+        this.dispatch(events);
+      },
+      onInterrupted: () => {
+        interrupted = true;
+        this.setStatus('connecting');
+      },
+      onClosed: (everOpened) => {
+        this.transport = null;
+        this.connectedResources = '';
+        // Never opened: no event stream on this backend (or it refused us)
+        if (everOpened) this.scheduleReconnect();
+        else this.pushUnavailable();
+      },
+    });
+  }
+
+  /** Poll for a while, then try push again. */
+  private pushUnavailable() {
+    this.pushUnavailableUntil = Date.now() + PUSH_RETRY_MS;
+    this.startPolling();
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
+      this.reconcile();
+    }, PUSH_RETRY_MS);
+  }
+
+  private scheduleReconnect() {
+    this.reconnectAttempts += 1;
+    const delay = Math.min(RECONNECT_MAX_MS, RECONNECT_BASE_MS * 2 ** (this.reconnectAttempts - 1));
+    this.setStatus('connecting');
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
+      this.reconcile();
+    }, delay / 2 + Math.random() * (delay / 2));
+  }
+
+  private disconnect() {
+    this.pendingConnect = null;
+    this.transport?.close();
+    this.transport = null;
+    this.connectedResources = '';
+  }
+
+  private dispatch(events: RealtimeEvent[]) {
+    const byResource = new Map<string, RealtimeEvent[]>();
+    events.forEach((event) => {
+      const list = byResource.get(event.resource) || [];
+      list.push(event);
+      byResource.set(event.resource, list);
+    });
+    byResource.forEach((list, resource) => {
+      this.subscriptions.get(resource)?.forEach((subscription) => subscription.listener(list));
+    });
+  }
+
+  private broadcastResync() {
+    this.dispatch(Array.from(this.subscriptions.keys(), (resource) => ({ resource, op: 'resync' as const })));
+  }
+
+  private startPolling() {
+    this.setStatus('polling');
+    this.subscriptions.forEach((set, resource) => {
+      if (this.pollers.has(resource)) return;
+      const options = Array.from(set).find((subscription) => subscription.options.pollUrl)?.options;
+      if (!options?.pollUrl) return;
+      const poller: Poller = { timer: null, etag: null, seen: null };
+      this.pollers.set(resource, poller);
+      this.schedulePoll(resource, poller, options);
+    });
+    this.pollers.forEach((poller, resource) => {
+      if (!this.subscriptions.has(resource)) {
+        if (poller.timer) clearTimeout(poller.timer);
+        this.pollers.delete(resource);
+      }
+    });
+  }
+
+  private stopPolling() {
+    this.pollers.forEach((poller) => poller.timer && clearTimeout(poller.timer));
+    this.pollers.clear();
+  }
+
+  private schedulePoll(resource: string, poller: Poller, options: SubscribeOptions) {
+    poller.timer = setTimeout(async () => {
+      // Background tabs skip the request; the next visible tick catches up
+      if (typeof document === 'undefined' || document.visibilityState !== 'hidden') {
+        await this.poll(resource, poller, options.pollUrl!).catch(() => undefined);
+      }
+      if (this.pollers.get(resource) === poller) this.schedulePoll(resource, poller, options);
+    }, options.pollIntervalMs || DEFAULT_POLL_INTERVAL_MS);
+  }
+
+  private async poll(resource: string, poller: Poller, pollUrl: string) {
+    const response = await api.get(pollUrl, {
+      headers: poller.etag ? { 'If-None-Match': poller.etag } : {},
+      validateStatus: (status) => status === 200 || status === 304,
+      cache: false,
+      dedupe: false,
+    });
+    if (response.status === 304 || this.pollers.get(resource) !== poller) return;
+    poller.etag = (response.headers?.etag as string) || null;
+
+    const rows: any[] = response.data?.results || response.data || [];
+    if (!Array.isArray(rows)) return;
+    const seen = new Map<RecordId, string>();
+    const events: RealtimeEvent[] = [];
+    rows.forEach((row) => {
+      const serialized = JSON.stringify(row);
+      seen.set(row.id, serialized);
+      if (poller.seen?.get(row.id) !== serialized) events.push({ resource, op: 'upsert', id: row.id, data: row });
+    });
+    poller.seen?.forEach((_, id) => {
+      if (!seen.has(id)) events.push({ resource, op: 'delete', id });
+    });
+    poller.seen = seen;
+    if (events.length) this.dispatch(events);
+  }
+
+  private setStatus(status: RealtimeStatus) {
+    if (status === this.status) return;
+    this.status = status;
+    this.statusListeners.forEach((listener) => listener(status));
+  }
+}
+
+/**
+ * Apply upserts and deletes to a list of records by id. An upsert carries
+ * the record as the list endpoint serializes it and replaces (by default,
+ * merges into) the existing one; new records are prepended. `normalize`
+ * maps raw payloads to the list's shape.
+ */
+export function mergeById<T extends { id: RecordId }>(
+  list: T[],
+  events: RealtimeEvent[],
+  normalize: (raw: any, existing?: T) => T = (raw, existing) => ({ ...existing, ...raw })
+): T[] {
+  if (!events.some((event) => event.op !== 'resync')) return list;
+  const index = new Map<string, number>();
+  list.forEach((item, i) => index.set(String(item.id), i));
+  const next = list.slice();
+  const added: T[] = [];
+  const removed = new Set<string>();
+  events.forEach((event) => {
+    if (event.op === 'resync') return;
+    const key = String(event.id);
+    if (event.op === 'delete') {
+      removed.add(key);
+      return;
+    }
+    removed.delete(key);
+    const position = index.get(key);
+    if (position !== undefined) {
+      next[position] = normalize({ ...event.data, id: event.id }, next[position]);
+    } else {
+      const existing = added.findIndex((item) => String(item.id) === key);
+      if (existing >= 0) added[existing] = normalize({ ...event.data, id: event.id }, added[existing]);
+      else added.unshift(normalize({ ...event.data, id: event.id }));
+    }
+  });
+  const merged = added.concat(next);
+  return removed.size ? merged.filter((item) => !removed.has(String(item.id))) : merged;
+}
+
+const transportFor = (name: string | undefined): TransportFactory | null => {
+  if (name === 'poll') return null;
+  if (name === 'ws') return typeof WebSocket === 'undefined' ? null : webSocketTransport;
+  return typeof EventSource === 'undefined' ? null : sseTransport;
+};
+
+// Signed-out pages connect without a ticket; the server decides what they may see
+const streamTicket = async (): Promise<string | null> => {
+  if (!authTokens.getAccess() && !authTokens.canRefresh) return null;
+  const response = await api.post('/events/ticket/', null, { silent: true });
+  return response.data?.ticket ?? null;
+};
+
+export const realtime = new RealtimeClient({
+  url: import.meta.env.VITE_REALTIME_URL || `${api.defaults.baseURL}/events/`,
+  transport: transportFor(import.meta.env.VITE_REALTIME_TRANSPORT),
+  ticket: streamTicket,
+});
@@ -1,6 +1,62 @@
-import api, { ENDPOINTS } from './api';
+import api, { ENDPOINTS, authTokens } from './api';
+import { openExportSink } from '../utils/exportStream';
 
 export const fetchReports = () => api.get(ENDPOINTS.reports);
 export const fetchDocumentTemplates = () => api.get(ENDPOINTS.documentTemplates);
 export const fetchLetters = () => api.get(ENDPOINTS.letters);
-export const fetchAuditLogs = () => api.get(ENDPOINTS.auditLogs); 
\ No newline at end of file
+export const fetchAuditLogs = () => api.get(ENDPOINTS.auditLogs);
+
+export type DownloadProgress = {
+  bytes: number;
+  /** From Content-Length; 0 when the server does not send one */
+  totalBytes: number;
+};
+
+type DownloadOptions = {
+  mimeType?: string;
+  onProgress?: (progress: DownloadProgress) => void;
+  signal?: AbortSignal;
+};
+
+/**
+ * Stream a generated report to disk as it arrives instead of buffering the
+ * whole file in an axios blob. Falls back to the axios client (and its token
+ * refresh) when the streamed request is rejected as unauthorised.
+ */
+export const downloadReportFile = async (endpoint: string, fileName: string, options: DownloadOptions = {}) => {
+  const sink = await openExportSink(fileName, options.mimeType || 'application/pdf');
+  try {
+    const accessToken = authTokens.getAccess();
+    const response = await fetch(`${api.defaults.baseURL}${endpoint}`, {
+      headers: accessToken ? { Authorization: `Bearer ${accessToken}` } : {},
+      signal: options.signal,
+    });
+
+    if (response.status === 401 || !response.body) {
+      const fallback = await api.get(endpoint, { responseType: 'blob', signal: options.signal });
+      const data = new Uint8Array(await (fallback.data as Blob).arrayBuffer());
+      await sink.write(data);
+      options.onProgress?.({ bytes: data.length, totalBytes: data.length });
+      await sink.close();
+      return;
+    }
+    if (!response.ok) {
+      throw new Error(`Download failed with status ${response.status}`);
+    }
+
+    const totalBytes = Number(response.headers.get('Content-Length')) || 0;
+    const reader = response.body.getReader();
+    let bytes = 0;
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      await sink.write(value);
+      bytes += value.length;
+      options.onProgress?.({ bytes, totalBytes });
+    }
+    await sink.close();
+  } catch (error) {
+    await sink.abort().catch(() => undefined);
+    throw error;
+  }
+};
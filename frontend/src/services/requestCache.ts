@@ -0,0 +1,331 @@
+import { AxiosError, CanceledError } from 'axios';
+import type { AxiosAdapter, AxiosResponse, InternalAxiosRequestConfig } from 'axios';
+
+export type CachePolicy = {
+  /** How long a response is served without contacting the server */
+  ttlMs: number;
+  /** Extra window in which a stale response is served while it is revalidated */
+  staleMs?: number;
+};
+
+export type RequestCacheOptions = {
+  /** Per-resource policies keyed by the first path segment, e.g. '/products/' */
+  policies: Record<string, CachePolicy>;
+  /** Extra resources a successful write invalidates, keyed by resource */
+  invalidates?: Record<string, string[]>;
+  /** Maximum number of cached GET responses (least recently used are dropped) */
+  maxEntries?: number;
+};
+
+declare module 'axios' {
+  interface AxiosRequestConfig {
+    /** false skips the response cache; an object overrides the resource policy */
+    cache?: false | CachePolicy;
+    /** false sends the request even if an identical GET is already in flight */
+    dedupe?: boolean;
+  }
+}
+
+/** How a GET was answered: from memory, from memory while revalidating, by joining an identical in-flight request, or by the server */
+export type CacheStatus = 'hit' | 'stale' | 'shared' | 'miss';
+
+type CacheEntry = {
+  response: AxiosResponse;
+  storedAt: number;
+  policy: CachePolicy;
+  resource: string;
+};
+
+/** A GET in flight, shared by every identical request that arrives before it settles */
+type Flight = {
+  response: Promise<AxiosResponse>;
+  controller: AbortController;
+  callers: number;
+  /** A stale-while-revalidate refresh, kept running when every caller leaves */
+  background: boolean;
+};
+
+const MINUTE = 60 * 1000;
+
+// Reference data that many pages load on mount and that changes rarely.
+export const DEFAULT_CACHE_POLICIES: Record<string, CachePolicy> = {
+  '/stores/': { ttlMs: 5 * MINUTE, staleMs: 30 * MINUTE },
+  '/locations/': { ttlMs: 5 * MINUTE, staleMs: 30 * MINUTE },
+  '/departments/': { ttlMs: 5 * MINUTE, staleMs: 30 * MINUTE },
+  '/modules/': { ttlMs: 10 * MINUTE, staleMs: 60 * MINUTE },
+  '/chart-of-accounts/': { ttlMs: 5 * MINUTE, staleMs: 30 * MINUTE },
+  '/bank-accounts/': { ttlMs: MINUTE, staleMs: 10 * MINUTE },
+  '/mobile-money-accounts/': { ttlMs: MINUTE, staleMs: 10 * MINUTE },
+  '/cash-tills/': { ttlMs: MINUTE, staleMs: 10 * MINUTE },
+  '/customers/': { ttlMs: MINUTE, staleMs: 10 * MINUTE },
+  '/products/': { ttlMs: 30 * 1000, staleMs: 5 * MINUTE },
+  '/services/': { ttlMs: 30 * 1000, staleMs: 5 * MINUTE },
+  '/inventory-items/': { ttlMs: 30 * 1000, staleMs: 5 * MINUTE },
+};
+
+// Writes whose side effects touch other resources.
+export const DEFAULT_CACHE_INVALIDATIONS: Record<string, string[]> = {
+  '/pos/': ['/products/', '/inventory-items/', '/cash-tills/', '/customers/'],
+  '/stock-movements/': ['/products/', '/inventory-items/'],
+  '/purchase-orders/': ['/products/', '/inventory-items/'],
+  '/bank-transactions/': ['/bank-accounts/'],
+  '/mobile-money-transactions/': ['/mobile-money-accounts/'],
+};
+
+const stableStringify = (value: unknown): string => {
+  if (value === null || typeof value !== 'object') return JSON.stringify(value) ?? '';
+  if (Array.isArray(value)) return `[${value.map(stableStringify).join(',')}]`;
+  const record = value as Record<string, unknown>;
+  return `{${Object.keys(record)
+    .filter((key) => record[key] !== undefined)
+    .sort()
+    .map((key) => `${JSON.stringify(key)}:${stableStringify(record[key])}`)
+    .join(',')}}`;
+};
+
+/** '/products/12/?x=1' or 'http://host/api/products/' (with baseURL) -> '/products/' */
+export const resourceOf = (url: string = '', baseURL: string = ''): string => {
+  let path = url;
+  if (baseURL && path.startsWith(baseURL)) path = path.slice(baseURL.length);
+  path = path.replace(/^[a-z]+:\/\/[^/]+/i, '').split(/[?#]/)[0];
+  if (baseURL) {
+    const basePath = baseURL.replace(/^[a-z]+:\/\/[^/]+/i, '').replace(/\/$/, '');
+    if (basePath && path.startsWith(`${basePath}/`)) path = path.slice(basePath.length);
+  }
+  const segment = path.split('/').filter(Boolean)[0];
+  return segment ? `/${segment}/` : '/';
+};
+
+const isSuccess = (response: AxiosResponse) => response.status >= 200 && response.status < 300;
+
+/**
+ * In-memory cache for GET responses with in-flight de-duplication,
+ * stale-while-revalidate and write-through invalidation. Installed on the
+ * shared axios instance as an adapter so it sits behind all interceptors.
+ */
+export class RequestCache {
+  private entries = new Map<string, CacheEntry>();
+  private inFlight = new Map<string, Flight>();
+  // Bumped on invalidation so responses already in flight are not stored
+  private generations = new Map<string, number>();
+  private statuses = new WeakMap<object, CacheStatus>();
+  private policies: Record<string, CachePolicy>;
+  private invalidations: Record<string, string[]>;
+  private maxEntries: number;
+
+  hits = 0;
+  misses = 0;
+
+  constructor(options: RequestCacheOptions) {
+    this.policies = options.policies;
+    this.invalidations = options.invalidates || {};
+    this.maxEntries = options.maxEntries ?? 200;
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+
+  /** Cache outcome for a request config (`response.config`), if it was a cacheable GET */
+  statusOf(config: object | undefined): CacheStatus | undefined {
+    return config ? this.statuses.get(config) : undefined;
+  }
+
+  keyFor(config: InternalAxiosRequestConfig) {
+    return `${config.baseURL || ''}|${config.url || ''}|${stableStringify(config.params ?? null)}`;
+  }
+
+  /** Drop cached responses for the given resources, or everything. */
+  invalidate(resources?: string[]) {
+    if (!resources) {
+      this.entries.clear();
+      this.generations.clear();
+      return;
+    }
+    resources.forEach((resource) => {
+      this.generations.set(resource, (this.generations.get(resource) || 0) + 1);
+    });
+    this.entries.forEach((entry, key) => {
+      if (resources.includes(entry.resource)) this.entries.delete(key);
+    });
+  }
+
+  clear() {
+    this.invalidate();
+    this.hits = 0;
+    this.misses = 0;
+  }
+
+  adapter(next: AxiosAdapter): AxiosAdapter {
+    return async (config) => {
+      const method = (config.method || 'get').toLowerCase();
+      const resource = resourceOf(config.url, config.baseURL);
+
+      if (method !== 'get') {
+        const response = await next(config);
+        if (isSuccess(response)) {
+          this.invalidate([resource, ...(this.invalidations[resource] || [])]);
+        }
+        return response;
+      }
+
+      const policy = config.cache === false ? undefined : config.cache || this.policies[resource];
+      const key = this.keyFor(config);
+      const entry = policy ? this.read(key) : undefined;
+
+      if (entry) {
+        const age = Date.now() - entry.storedAt;
+        if (age <= entry.policy.ttlMs) {
+          this.hits += 1;
+          this.statuses.set(config, 'hit');
+          return { ...entry.response, config };
+        }
+        if (age <= entry.policy.ttlMs + (entry.policy.staleMs || 0)) {
+          this.hits += 1;
+          this.revalidate(next, config, key, resource, policy);
+          this.statuses.set(config, 'stale');
+          return { ...entry.response, config };
+        }
+      }
+
+      this.misses += 1;
+      if (policy) this.statuses.set(config, 'miss');
+      return this.fetch(next, config, key, resource, policy);
+    };
+  }
+
+  private read(key: string) {
+    const entry = this.entries.get(key);
+    if (entry) {
+      // Re-insert to mark as most recently used
+      this.entries.delete(key);
+      this.entries.set(key, entry);
+    }
+    return entry;
+  }
+
+  private write(key: string, entry: CacheEntry) {
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value as string);
+    }
+  }
+
+  /** Answer from the identical GET in flight, or start one that others can join. */
+  private fetch(
+    next: AxiosAdapter,
+    config: InternalAxiosRequestConfig,
+    key: string,
+    resource: string,
+    policy?: CachePolicy
+  ): Promise<AxiosResponse> {
+    if (config.dedupe === false) return this.send(next, config, key, resource, policy);
+    let flight = this.inFlight.get(key);
+    if (flight) {
+      this.statuses.set(config, 'shared');
+    } else {
+      flight = this.start(next, config, key, resource, policy);
+    }
+    return this.join(flight, key, config);
+  }
+
+  /** Refresh a stale entry in the background; it finishes even if no caller waits for it. */
+  private revalidate(
+    next: AxiosAdapter,
+    config: InternalAxiosRequestConfig,
+    key: string,
+    resource: string,
+    policy?: CachePolicy
+  ) {
+    if (this.inFlight.has(key)) return;
+    this.start(next, config, key, resource, policy).background = true;
+  }
+
+  private async send(
+    next: AxiosAdapter,
+    config: InternalAxiosRequestConfig,
+    key: string,
+    resource: string,
+    policy?: CachePolicy
+  ): Promise<AxiosResponse> {
+    const generation = this.generations.get(resource) || 0;
+    const response = await next(config);
+    if (policy && isSuccess(response) && (this.generations.get(resource) || 0) === generation) {
+      this.write(key, { response, storedAt: Date.now(), policy, resource });
+    }
+    return response;
+  }
+
+  /**
+   * Send a request no caller owns: it runs on its own signal, so one caller
+   * cancelling cannot fail the others, and is aborted once all have left.
+   */
+  private start(
+    next: AxiosAdapter,
+    config: InternalAxiosRequestConfig,
+    key: string,
+    resource: string,
+    policy?: CachePolicy
+  ): Flight {
+    const controller = new AbortController();
+    const response = this.send(next, { ...config, signal: controller.signal, cancelToken: undefined }, key, resource, policy);
+    const flight: Flight = { response, controller, callers: 0, background: false };
+    this.inFlight.set(key, flight);
+    const done = () => {
+      if (this.inFlight.get(key) === flight) this.inFlight.delete(key);
+    };
+    response.then(done, done);
+    return flight;
+  }
+
+  /** Wait for `flight` on behalf of one caller, who can still cancel on their own signal. */
+  private join(flight: Flight, key: string, config: InternalAxiosRequestConfig): Promise<AxiosResponse> {
+    const signal = config.signal as AbortSignal | undefined;
+    flight.callers += 1;
+    return new Promise((resolve, reject) => {
+      let settled = false;
+      const leave = () => {
+        settled = true;
+        flight.callers -= 1;
+        signal?.removeEventListener?.('abort', onAbort);
+      };
+      const onAbort = () => {
+        if (settled) return;
+        leave();
+        reject(Object.assign(new CanceledError(), { config }));
+        if (flight.callers === 0 && !flight.background) {
+          flight.controller.abort();
+          if (this.inFlight.get(key) === flight) this.inFlight.delete(key);
+        }
+      };
+      if (signal?.aborted) {
+        onAbort();
+        return;
+      }
+      signal?.addEventListener?.('abort', onAbort);
+      flight.response.then(
+        (response) => {
+          if (settled) return;
+          leave();
+          resolve({ ...response, config });
+        },
+        (error) => {
+          if (settled) return;
+          leave();
+          // Give each caller an error carrying its own config so retry flags stay per request
+          reject(
+            error instanceof AxiosError
+              ? new AxiosError(error.message, error.code, config, error.request, error.response)
+              : error
+          );
+        }
+      );
+    });
+  }
+}
+
+export const requestCache = new RequestCache({
+  policies: DEFAULT_CACHE_POLICIES,
+  invalidates: DEFAULT_CACHE_INVALIDATIONS,
+});
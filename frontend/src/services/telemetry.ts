@@ -0,0 +1,324 @@
+import type { AxiosError, AxiosInstance, AxiosResponse, InternalAxiosRequestConfig } from 'axios';
+import type { ProfilerOnRenderCallback } from 'react';
+import { requestCache } from './requestCache';
+import type { CacheStatus, RequestCache } from './requestCache';
+
+declare module 'axios' {
+  interface AxiosRequestConfig {
+    /** performance.now() when the first attempt was sent; kept across retries */
+    startedAt?: number;
+  }
+}
+
+export type TelemetrySample = {
+  kind: 'request' | 'route' | 'longtask' | 'render';
+  /** 'GET /products/:id/' for requests, the route path otherwise */
+  name: string;
+  duration: number;
+  /** performance.now() when the sample was taken */
+  at: number;
+  status?: number;
+  /** Response body size in bytes, when known */
+  bytes?: number;
+  cache?: CacheStatus;
+  retries?: number;
+  /** React Profiler phase for render samples */
+  phase?: string;
+};
+
+export type SampleStats = {
+  kind: TelemetrySample['kind'];
+  name: string;
+  count: number;
+  p50: number;
+  p95: number;
+  max: number;
+  errors: number;
+  cacheHits: number;
+  retries: number;
+  bytes: number;
+};
+
+export type TelemetryOptions = {
+  /** Samples kept in memory for the overlay and the next batch */
+  capacity?: number;
+  /** Collector URL; without one samples are only kept in memory */
+  endpoint?: string;
+  batchSize?: number;
+  flushIntervalMs?: number;
+  /** Delivers one batch; resolves false (or throws) to keep it for the next flush */
+  send?: (endpoint: string, body: string) => Promise<boolean>;
+};
+
+/** Fixed-size buffer that overwrites its oldest entries once full. */
+export class RingBuffer<T> {
+  private items: T[] = [];
+  private next = 0;
+  /** Number of items ever pushed */
+  total = 0;
+
+  constructor(readonly capacity: number) {}
+
+  push(item: T) {
+    if (this.items.length < this.capacity) this.items.push(item);
+    else this.items[this.next] = item;
+    this.next = (this.next + 1) % this.capacity;
+    this.total += 1;
+  }
+
+  /** Items oldest first; `since` skips the first `since` items ever pushed. */
+  toArray(since = 0): T[] {
+    const ordered =
+      this.items.length < this.capacity ? this.items.slice() : [...this.items.slice(this.next), ...this.items.slice(0, this.next)];
+    const skip = Math.max(0, since - (this.total - ordered.length));
+    return skip ? ordered.slice(skip) : ordered;
+  }
+
+  clear() {
+    this.items = [];
+    this.next = 0;
+    this.total = 0;
+  }
+}
+
+const percentile = (sorted: number[], pct: number) =>
+  sorted.length ? sorted[Math.min(sorted.length - 1, Math.ceil((pct / 100) * sorted.length) - 1)] : 0;
+
+/** Per kind and name: latency percentiles, error, cache and retry counts. */
+export const summarize = (samples: TelemetrySample[]): SampleStats[] => {
+  const groups = new Map<string, TelemetrySample[]>();
+  for (const sample of samples) {
+    const key = `${sample.kind}|${sample.name}`;
+    const group = groups.get(key);
+    if (group) group.push(sample);
+    else groups.set(key, [sample]);
+  }
+  return Array.from(groups.values(), (group) => {
+    const durations = group.map((sample) => sample.duration).sort((a, b) => a - b);
+    return {
+      kind: group[0].kind,
+      name: group[0].name,
+      count: group.length,
+      p50: percentile(durations, 50),
+      p95: percentile(durations, 95),
+      max: durations[durations.length - 1],
+      errors: group[0].kind === 'request' ? group.filter((sample) => !sample.status || sample.status >= 400).length : 0,
+      cacheHits: group.filter((sample) => sample.cache === 'hit' || sample.cache === 'stale').length,
+      retries: group.reduce((sum, sample) => sum + (sample.retries || 0), 0),
+      bytes: group.reduce((sum, sample) => sum + (sample.bytes || 0), 0),
+    };
+  });
+};
+
+/** '/api/products/12/?q=x' -> '/products/:id/' so samples group per endpoint, not per record */
+export const endpointName = (method: string | undefined, url: string | undefined, baseURL = '') => {
+  let path = (url || '').split(/[?#]/)[0];
+  if (baseURL && path.startsWith(baseURL)) path = path.slice(baseURL.length);
+  path = path
+    .replace(/^[a-z]+:\/\/[^/]+/i, '')
+    .replace(/\/(\d+|[0-9a-f]{8}-[0-9a-f-]{27,})(?=\/|$)/gi, '/:id');
+  return `${(method || 'get').toUpperCase()} ${path || '/'}`;
+};
+
+const beaconOrFetch = async (endpoint: string, body: string) => {
+  if (typeof navigator !== 'undefined' && navigator.sendBeacon) {
+    return navigator.sendBeacon(endpoint, new Blob([body], { type: 'application/json' }));
+  }
+  const response = await fetch(endpoint, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body,
+    keepalive: true,
+  });
+  return response.ok;
+};
+
+const now = () => (typeof performance !== 'undefined' ? performance.now() : Date.now());
+
+/**
+ * Collects request, route, long task and render timings into a ring buffer
+ * and posts them to `endpoint` in batches. Recording is cheap; nothing is
+ * sent without a collector.
+ */
+export class Telemetry {
+  private buffer: RingBuffer<TelemetrySample>;
+  private sent = 0;
+  private listeners = new Set<() => void>();
+  private recorded = new WeakSet<object>();
+  private routeStartedAt: number | null = null;
+  // Route of the page on screen, used to attribute long tasks
+  private page = '';
+  private backoffUntil = 0;
+  private started = false;
+  private timer: ReturnType<typeof setInterval> | null = null;
+  private flushing: Promise<void> | null = null;
+  private options: Required<Omit<TelemetryOptions, 'endpoint'>> & { endpoint?: string };
+
+  constructor(options: TelemetryOptions = {}) {
+    this.options = {
+      capacity: 500,
+      batchSize: 100,
+      flushIntervalMs: 15000,
+      send: beaconOrFetch,
+      ...options,
+    };
+    this.buffer = new RingBuffer(this.options.capacity);
+  }
+
+  record(sample: Omit<TelemetrySample, 'at'> & { at?: number }) {
+    this.buffer.push({ at: now(), ...sample });
+    this.listeners.forEach((listener) => listener());
+    if (this.options.endpoint && this.buffer.total - this.sent >= this.options.batchSize && now() >= this.backoffUntil) {
+      this.flush();
+    }
+  }
+
+  /** Samples still in the buffer, oldest first. */
+  samples(): TelemetrySample[] {
+    return this.buffer.toArray();
+  }
+
+  /** Called after every recorded sample; returns an unsubscribe function. */
+  subscribe(listener: () => void): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /** Send samples recorded since the last successful batch. */
+  flush(): Promise<void> {
+    const { endpoint, send, batchSize } = this.options;
+    if (!endpoint || this.flushing) return this.flushing || Promise.resolve();
+    const pending = this.buffer.toArray(this.sent);
+    const batch = pending.slice(0, batchSize);
+    if (!batch.length) return Promise.resolve();
+    // Samples overwritten before they were sent are skipped
+    const upTo = this.buffer.total - pending.length + batch.length;
+    const body = JSON.stringify({ page: typeof location !== 'undefined' ? location.pathname : '', samples: batch });
+    this.flushing = send(endpoint, body)
+      .then((ok) => {
+        if (!ok) throw new Error('Telemetry batch rejected');
+        this.sent = upTo;
+      })
+      .catch(() => {
+        this.backoffUntil = now() + this.options.flushIntervalMs;
+      })
+      .finally(() => {
+        this.flushing = null;
+      });
+    return this.flushing;
+  }
+
+  /** Mark the start of a navigation; the next page to mount ends it. */
+  startRoute() {
+    this.routeStartedAt = now();
+  }
+
+  /** Called once the page for route `name` has mounted. */
+  endRoute(name: string) {
+    this.page = name;
+    if (this.routeStartedAt === null) return;
+    this.record({ kind: 'route', name, duration: now() - this.routeStartedAt });
+    this.routeStartedAt = null;
+  }
+
+  /** React Profiler callback; only called in development and profiling builds. */
+  onRender: ProfilerOnRenderCallback = (id, phase, actualDuration) => {
+    this.record({ kind: 'render', name: id, phase, duration: actualDuration });
+  };
+
+  /** Time every request made through `instance`. Install after the app's own interceptors. */
+  instrument(instance: AxiosInstance, cache: RequestCache = requestCache) {
+    instance.interceptors.request.use((config) => {
+      if (config.startedAt === undefined) config.startedAt = now();
+      return config;
+    });
+    instance.interceptors.response.use(
+      (response) => {
+        this.safely(() => this.recordRequest(response.config, response, cache));
+        return response;
+      },
+      (error: AxiosError) => {
+        if (error.code !== 'ERR_CANCELED' && error.config) {
+          this.safely(() => this.recordRequest(error.config!, error.response, cache));
+        }
+        return Promise.reject(error);
+      }
+    );
+  }
+
+  /** Watch for long tasks and flush on an interval and when the page is hidden. */
+  start() {
+    if (this.started || typeof window === 'undefined') return;
+    this.started = true;
+    if (typeof PerformanceObserver !== 'undefined' && PerformanceObserver.supportedEntryTypes?.includes('longtask')) {
+      new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) {
+          this.record({ kind: 'longtask', name: this.page || location.pathname, duration: entry.duration, at: entry.startTime });
+        }
+      }).observe({ type: 'longtask', buffered: true });
+    }
+    if (!this.options.endpoint) return;
+    this.timer = setInterval(() => this.flush(), this.options.flushIntervalMs);
+    window.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush();
+    });
+  }
+
+  stop() {
+    if (this.timer) clearInterval(this.timer);
+    this.timer = null;
+  }
+
+  // Telemetry must never turn a successful request into a failed one
+  private safely(fn: () => void) {
+    try {
+      fn();
+    } catch (error) {
+      console.warn('Telemetry sample dropped:', error);
+    }
+  }
+
+  private recordRequest(config: InternalAxiosRequestConfig, response: AxiosResponse | undefined, cache: RequestCache) {
+    // A retried request resolves the outer call too; count it once
+    if (this.recorded.has(config)) return;
+    this.recorded.add(config);
+    const anyConfig = config as any;
+    this.record({
+      kind: 'request',
+      name: endpointName(config.method, config.url, config.baseURL),
+      duration: now() - (config.startedAt ?? now()),
+      status: response?.status,
+      bytes: responseBytes(response),
+      cache: cache.statusOf(config),
+      retries: Number(!!anyConfig._retry) + Number(!!anyConfig._networkRetry) + Number(!!anyConfig._5xxRetry),
+    });
+  }
+}
+
+/**
+ * Body size from Content-Length, else from the body itself. `responseText`
+ * throws on an XHR whose responseType is blob/arraybuffer, so it is only read
+ * for text responses.
+ */
+export const responseBytes = (response: AxiosResponse | undefined): number | undefined => {
+  if (!response) return undefined;
+  try {
+    const length = Number(response.headers?.['content-length']);
+    if (Number.isFinite(length) && length > 0) return length;
+    const { data, request } = response;
+    if (typeof Blob !== 'undefined' && data instanceof Blob) return data.size;
+    if (data instanceof ArrayBuffer || ArrayBuffer.isView(data)) return data.byteLength;
+    if (request && (request.responseType === '' || request.responseType === 'text')) {
+      return request.responseText?.length;
+    }
+    return typeof data === 'string' ? data.length : undefined;
+  } catch {
+    return undefined;
+  }
+};
+
+export const telemetry = new Telemetry({ endpoint: import.meta.env.VITE_TELEMETRY_URL || undefined });
+
+export const startTelemetry = () => telemetry.start();
@@ -1,5 +1,8 @@
 import api from './api';
 import { ENDPOINTS } from './api';
+import { computePool } from './computePool';
+import { concatColumns } from '../utils/aggregate';
+import type { ColumnFields, ColumnsPage } from '../utils/aggregate';
 
 export interface Transaction {
   id: string;
@@ -20,6 +23,24 @@ export interface Transaction {
   value_date?: string;
 }
 
+/** A page of the unified `/transactions/` endpoint (a bare array when unpaginated) */
+export type TransactionPage = {
+  results?: Transaction[];
+  count?: number;
+  next?: string | null;
+  /** Ids removed since `updated_since` (delta responses only) */
+  deleted?: Array<string | number>;
+  /** Server clock at the time of the response, for `updated_since` */
+  server_time?: string;
+};
+
+export type TransactionFilters = {
+  type?: 'income' | 'expense';
+  account_type?: 'bank' | 'mobile' | 'cash' | 'pos' | 'purchase';
+  start_date?: string;
+  end_date?: string;
+};
+
 export interface CreateTransactionData {
   description: string;
   amount: number;
@@ -44,6 +65,32 @@ export const transactionService = {
     return response.data.results || [];
   },
 
+  // Every row matching `filters` as aggregation columns. Pages are fetched as
+  // text and parsed in the compute pool, so the rows never become objects on
+  // the main thread. A repeated or empty page ends the walk, so a server that
+  // ignores paging cannot loop.
+  async getTransactionColumns(
+    filters: TransactionFilters,
+    fields: ColumnFields,
+    options: { signal?: AbortSignal; pageSize?: number } = {}
+  ) {
+    const asText = { responseType: 'text' as const, transformResponse: (data: string) => data, signal: options.signal };
+    const pages: ColumnsPage[] = [];
+    const seen = new Set<string>();
+    let response = await api.get<string>('/transactions/', {
+      ...asText,
+      params: { ...filters, page_size: options.pageSize ?? 500 },
+    });
+    while (true) {
+      const page = await computePool.parse(response.data, fields, { signal: options.signal });
+      pages.push(page);
+      if (!page.next || !page.rows || seen.has(page.next)) break;
+      seen.add(page.next);
+      response = await api.get<string>(page.next, asText);
+    }
+    return concatColumns(pages);
+  },
+
   // Get transaction by ID (from unified transactions)
   async getTransaction(id: string, accountType?: string): Promise<Transaction | null> {
     // Extract the actual ID and type from the unified transaction ID
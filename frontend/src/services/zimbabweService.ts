@@ -1,4 +1,5 @@
 import { api } from './api';
+import { formatCurrency as formatMoney } from '../utils/formatters';
 
 // ==================== ZIMBABWE-SPECIFIC INTERFACES ====================
 
@@ -327,13 +328,8 @@ class ZimbabweService {
   }
 
   formatCurrency(amount: number, currencyCode: string): string {
-    const formatters: { [key: string]: Intl.NumberFormat } = {
-      USD: new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD' }),
-      ZWL: new Intl.NumberFormat('en-ZW', { style: 'currency', currency: 'ZWL' }),
-    };
-
-    const formatter = formatters[currencyCode] || formatters.USD;
-    return formatter.format(amount);
+    if (currencyCode === 'ZWL') return formatMoney(amount, 'ZWL', 'en-ZW');
+    return formatMoney(amount, 'USD', 'en-US');
   }
 
   calculateVATAmount(amount: number, vatRate: number = 15): number {
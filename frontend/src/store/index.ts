@@ -1,8 +1,9 @@
 import { configureStore } from '@reduxjs/toolkit';
-import authReducer from './slices/authSlice';
+import authReducer, { setAccessToken } from './slices/authSlice';
 import transactionReducer from './slices/transactionSlice';
 import notificationReducer from './slices/notificationSlice';
 import uiReducer from './slices/uiSlice';
+import { onAccessTokenRefreshed } from '../services/api';
 
 export const store = configureStore({
   reducer: {
@@ -19,5 +20,8 @@ export const store = configureStore({
     }),
 });
 
+// Keep state.auth.access in step with tokens renewed by the api interceptor
+onAccessTokenRefreshed((access) => store.dispatch(setAccessToken(access)));
+
 export type RootState = ReturnType<typeof store.getState>;
 export type AppDispatch = typeof store.dispatch;
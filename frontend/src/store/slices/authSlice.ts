@@ -1,5 +1,5 @@
 import { createSlice, createAsyncThunk, PayloadAction } from '@reduxjs/toolkit';
-import api from '../../services/api';
+import api, { authTokens, requestCache } from '../../services/api';
 
 interface User {
   id: number;
@@ -25,9 +25,9 @@ interface AuthState {
 
 const initialState: AuthState = {
   user: null,
-  access: localStorage.getItem('access'),
+  access: authTokens.getAccess(),
   refresh: localStorage.getItem('refresh'),
-  isAuthenticated: !!localStorage.getItem('access'),
+  isAuthenticated: !!authTokens.getAccess(),
   loading: false,
   error: null,
 };
@@ -41,8 +41,7 @@ export const login = createAsyncThunk(
       const { access, refresh, user_id, email, role } = response.data;
       
       // Store tokens
-      localStorage.setItem('access', access);
-      localStorage.setItem('refresh', refresh);
+      authTokens.set(access, refresh);
       
       return { access, refresh, user_id, email, role };
     } catch (error: any) {
@@ -54,14 +53,14 @@ export const login = createAsyncThunk(
 export const logout = createAsyncThunk(
   'auth/logout',
   async (_, { rejectWithValue }) => {
+    // Cached responses belong to the user who is signing out
+    requestCache.clear();
     try {
       await api.post('/logout/');
-      localStorage.removeItem('access');
-      localStorage.removeItem('refresh');
+      authTokens.clear();
     } catch (error: any) {
       // Even if logout fails on server, clear local storage
-      localStorage.removeItem('access');
-      localStorage.removeItem('refresh');
+      authTokens.clear();
     }
   }
 );
@@ -89,6 +88,9 @@ const authSlice = createSlice({
       state.user = action.payload;
       state.isAuthenticated = true;
     },
+    setAccessToken: (state, action: PayloadAction<string>) => {
+      state.access = action.payload;
+    },
   },
   extraReducers: (builder) => {
     builder
@@ -132,5 +134,5 @@ const authSlice = createSlice({
   },
 });
 
-export const { clearError, initializeAuth } = authSlice.actions;
+export const { clearError, initializeAuth, setAccessToken } = authSlice.actions;
 export default authSlice.reducer;
@@ -1,47 +1,167 @@
-import { createSlice, createAsyncThunk, PayloadAction } from '@reduxjs/toolkit';
+import { createSlice, createAsyncThunk, createEntityAdapter, createSelector, PayloadAction } from '@reduxjs/toolkit';
 import api from '../../services/api';
+import type { Transaction, TransactionPage } from '../../services/transactionService';
+import type { RootState } from '..';
+import type { AxiosResponse } from 'axios';
 
-interface Transaction {
-  id: number | string;
-  type: string;
-  amount: number;
-  description: string;
-  date: string;
-  category?: string;
-  source?: string;
-  status?: string;
-}
+export type TransactionQuery = {
+  type?: 'all' | 'income' | 'expense';
+  account_type?: 'all' | 'bank' | 'mobile' | 'cash' | 'pos' | 'purchase';
+};
+
+// Newest first; ties broken by id so the order is stable across pages
+const transactionsAdapter = createEntityAdapter({
+  selectId: (transaction: Transaction) => transaction.id,
+  sortComparer: (a: Transaction, b: Transaction) =>
+    (b.date || '').localeCompare(a.date || '') || String(b.id).localeCompare(String(a.id)),
+});
 
-interface TransactionState {
-  transactions: Transaction[];
+interface TransactionState extends ReturnType<typeof transactionsAdapter.getInitialState> {
+  query: TransactionQuery;
+  /** Cursor (the API's `next` URL) for the following page; null once everything is loaded */
+  next: string | null;
+  count: number;
+  /** Server time of the last load (or latest `updated_at` seen), sent as `updated_since` */
+  syncedAt: string | null;
   loading: boolean;
+  loadingMore: boolean;
+  syncing: boolean;
   error: string | null;
 }
 
-const initialState: TransactionState = {
-  transactions: [],
+const initialState: TransactionState = transactionsAdapter.getInitialState({
+  query: {},
+  next: null,
+  count: 0,
+  syncedAt: null,
   loading: false,
+  loadingMore: false,
+  syncing: false,
   error: null,
+});
+
+const TRANSACTIONS_ENDPOINT = '/transactions/';
+const PAGE_SIZE = 100;
+
+const toPage = (data: TransactionPage | Transaction[]): TransactionPage =>
+  Array.isArray(data) ? { results: data, count: data.length, next: null } : data;
+
+const latestUpdate = (transactions: Transaction[], current: string | null) =>
+  transactions.reduce<string | null>((latest, t) => {
+    const stamp = t.updated_at || t.created_at;
+    return stamp && (!latest || stamp > latest) ? stamp : latest;
+  }, current);
+
+/**
+ * The server's clock for `updated_since`, so the cursor does not depend on
+ * the till's clock: `server_time` in the body, else the Date header (only
+ * readable same-origin). Null when the server gives neither.
+ */
+const serverTime = (response: AxiosResponse<TransactionPage | Transaction[]>): string | null => {
+  const data = response.data;
+  if (!Array.isArray(data) && data?.server_time) return data.server_time;
+  const date = Date.parse(String(response.headers?.date ?? ''));
+  return Number.isNaN(date) ? null : new Date(date).toISOString();
 };
 
+const queryParams = (query: TransactionQuery) => ({
+  ...(query.type && query.type !== 'all' ? { type: query.type } : {}),
+  ...(query.account_type && query.account_type !== 'all' ? { account_type: query.account_type } : {}),
+});
+
 // Async thunks
+
+/** Load the first page for `query`, replacing whatever is in the store. */
 export const fetchTransactions = createAsyncThunk(
   'transaction/fetchTransactions',
-  async (_, { rejectWithValue }) => {
+  async (query: TransactionQuery | undefined, { getState, rejectWithValue }) => {
+    const effective = query ?? (getState() as RootState).transaction.query;
     try {
-      const response = await api.get('/bank-transactions/');
-      return response.data.results || response.data || [];
+      const response = await api.get<TransactionPage | Transaction[]>(TRANSACTIONS_ENDPOINT, {
+        params: { ...queryParams(effective), page_size: PAGE_SIZE },
+      });
+      return { query: effective, page: toPage(response.data), serverTime: serverTime(response) };
     } catch (error: any) {
       return rejectWithValue(error.response?.data?.error || 'Failed to fetch transactions');
     }
   }
 );
 
+/** Append the next page, if any. Safe to call on every scroll event. */
+export const fetchMoreTransactions = createAsyncThunk(
+  'transaction/fetchMoreTransactions',
+  async (_: void, { getState, rejectWithValue }) => {
+    const { next } = (getState() as RootState).transaction;
+    try {
+      const response = await api.get<TransactionPage | Transaction[]>(next as string);
+      return toPage(response.data);
+    } catch (error: any) {
+      return rejectWithValue(error.response?.data?.error || 'Failed to fetch transactions');
+    }
+  },
+  {
+    condition: (_, { getState }) => {
+      const { next, loading, loadingMore } = (getState() as RootState).transaction;
+      return !!next && !loading && !loadingMore;
+    },
+  }
+);
+
+/**
+ * Merge changes since the last load instead of refetching the list. Walks
+ * the pages of the delta, stopping at a page with nothing new: a server that
+ * ignores `updated_since` would otherwise send the whole ledger every time.
+ */
+export const syncTransactions = createAsyncThunk(
+  'transaction/syncTransactions',
+  async (_: void, { getState, rejectWithValue }) => {
+    const { query, syncedAt, entities } = (getState() as RootState).transaction;
+    const changed = new Map<string, Transaction>();
+    const deleted: Array<string | number> = [];
+    const isNew = (t: Transaction) =>
+      !changed.has(String(t.id)) && (!entities[t.id] || entities[t.id]!.updated_at !== t.updated_at);
+    try {
+      let response = await api.get<TransactionPage | Transaction[]>(TRANSACTIONS_ENDPOINT, {
+        params: { ...queryParams(query), updated_since: syncedAt, page_size: PAGE_SIZE },
+        cache: false,
+      });
+      const time = serverTime(response);
+      while (true) {
+        const page = toPage(response.data);
+        const fresh = (page.results || []).filter(isNew);
+        fresh.forEach((t) => changed.set(String(t.id), t));
+        deleted.push(...(page.deleted || []));
+        if (!page.next || (!fresh.length && !page.deleted?.length)) break;
+        response = await api.get<TransactionPage | Transaction[]>(page.next, { cache: false });
+      }
+      return { changed: Array.from(changed.values()), deleted, serverTime: time };
+    } catch (error: any) {
+      return rejectWithValue(error.response?.data?.error || 'Failed to sync transactions');
+    }
+  },
+  {
+    // Without a cursor there is nothing to diff against; load the first page instead
+    condition: (_, { getState }) => {
+      const { syncedAt, loading, syncing } = (getState() as RootState).transaction;
+      return !!syncedAt && !loading && !syncing;
+    },
+  }
+);
+
+/**
+ * The bank endpoints return their own record (numeric id, bank fields), not
+ * the unified row keyed `bank_<id>`, so the list is refreshed from
+ * `/transactions/` after a write instead of storing the response.
+ */
+const refreshAfterWrite = (dispatch: (action: any) => any, getState: () => unknown) =>
+  dispatch((getState() as RootState).transaction.syncedAt ? syncTransactions() : fetchTransactions(undefined));
+
 export const addTransaction = createAsyncThunk(
   'transaction/addTransaction',
-  async (transactionData: any, { rejectWithValue }) => {
+  async (transactionData: any, { dispatch, getState, rejectWithValue }) => {
     try {
       const response = await api.post('/bank-transactions/', transactionData);
+      await refreshAfterWrite(dispatch, getState);
       return response.data;
     } catch (error: any) {
       return rejectWithValue(error.response?.data?.error || 'Failed to add transaction');
@@ -51,9 +171,10 @@ export const addTransaction = createAsyncThunk(
 
 export const updateTransaction = createAsyncThunk(
   'transaction/updateTransaction',
-  async ({ id, data }: { id: number; data: any }, { rejectWithValue }) => {
+  async ({ id, data }: { id: number; data: any }, { dispatch, getState, rejectWithValue }) => {
     try {
       const response = await api.patch(`/bank-transactions/${id}/`, data);
+      await refreshAfterWrite(dispatch, getState);
       return response.data;
     } catch (error: any) {
       return rejectWithValue(error.response?.data?.error || 'Failed to update transaction');
@@ -81,51 +202,130 @@ const transactionSlice = createSlice({
       state.error = null;
     },
     setTransactions: (state, action: PayloadAction<Transaction[]>) => {
-      state.transactions = action.payload;
+      transactionsAdapter.setAll(state, action.payload);
+      state.count = action.payload.length;
+      state.next = null;
+      state.syncedAt = latestUpdate(action.payload, null);
+    },
+    transactionRemoved: (state, action: PayloadAction<string>) => {
+      if (state.entities[action.payload]) state.count -= 1;
+      transactionsAdapter.removeOne(state, action.payload);
     },
   },
   extraReducers: (builder) => {
     builder
-      // Fetch transactions
+      // Fetch first page
       .addCase(fetchTransactions.pending, (state) => {
         state.loading = true;
         state.error = null;
       })
       .addCase(fetchTransactions.fulfilled, (state, action) => {
+        const { query, page } = action.payload;
+        const results = page.results || [];
         state.loading = false;
-        state.transactions = action.payload as Transaction[];
+        state.query = query;
+        state.next = page.next || null;
+        state.count = page.count ?? results.length;
+        state.syncedAt = action.payload.serverTime || latestUpdate(results, null);
+        transactionsAdapter.setAll(state, results);
       })
       .addCase(fetchTransactions.rejected, (state, action) => {
         state.loading = false;
         state.error = action.payload as string;
       })
-      // Add transaction
+      // Next page
+      .addCase(fetchMoreTransactions.pending, (state) => {
+        state.loadingMore = true;
+      })
+      .addCase(fetchMoreTransactions.fulfilled, (state, action) => {
+        const results = action.payload.results || [];
+        state.loadingMore = false;
+        state.next = action.payload.next || null;
+        state.syncedAt = latestUpdate(results, state.syncedAt);
+        transactionsAdapter.upsertMany(state, results);
+      })
+      .addCase(fetchMoreTransactions.rejected, (state, action) => {
+        state.loadingMore = false;
+        state.error = action.payload as string;
+      })
+      // Delta merge
+      .addCase(syncTransactions.pending, (state) => {
+        state.syncing = true;
+      })
+      .addCase(syncTransactions.fulfilled, (state, action) => {
+        const { changed, deleted, serverTime: time } = action.payload;
+        state.syncing = false;
+        state.count += changed.filter((t) => !state.entities[t.id]).length;
+        state.count -= deleted.filter((id) => state.entities[id]).length;
+        state.syncedAt = time || latestUpdate(changed, state.syncedAt);
+        transactionsAdapter.upsertMany(state, changed);
+        transactionsAdapter.removeMany(state, deleted as string[]);
+      })
+      .addCase(syncTransactions.rejected, (state, action) => {
+        state.syncing = false;
+        state.error = action.payload as string;
+      })
+      // Add/update: rows arrive through the refresh dispatched by the thunk
       .addCase(addTransaction.pending, (state) => {
-        state.loading = true;
         state.error = null;
       })
-      .addCase(addTransaction.fulfilled, (state, action) => {
-        state.loading = false;
-        state.transactions.unshift(action.payload as Transaction);
-      })
       .addCase(addTransaction.rejected, (state, action) => {
-        state.loading = false;
         state.error = action.payload as string;
       })
-      // Update transaction
-      .addCase(updateTransaction.fulfilled, (state, action) => {
-        const updated = action.payload as Transaction;
-        const index = state.transactions.findIndex(t => t.id === updated.id);
-        if (index !== -1) {
-          state.transactions[index] = updated;
-        }
+      .addCase(updateTransaction.rejected, (state, action) => {
+        state.error = action.payload as string;
       })
-      // Delete transaction
+      // Delete transaction (the unified id of a bank transaction is `bank_<id>`)
       .addCase(deleteTransaction.fulfilled, (state, action) => {
-        state.transactions = state.transactions.filter(t => t.id !== action.payload);
+        const id = `bank_${action.payload}`;
+        if (state.entities[id]) state.count -= 1;
+        transactionsAdapter.removeOne(state, id);
       });
   },
 });
 
-export const { clearError, setTransactions } = transactionSlice.actions;
+// Selectors
+
+export const {
+  selectAll: selectAllTransactions,
+  selectById: selectTransactionById,
+  selectTotal: selectLoadedTransactionCount,
+} = transactionsAdapter.getSelectors((state: RootState) => state.transaction);
+
+export type TransactionTotals = { income: number; expense: number; net: number };
+export type CategoryTotals = Record<string, TransactionTotals & { count: number }>;
+
+const amountOf = (transaction: Transaction) => Number(transaction.amount) || 0;
+
+/** Income/expense/net and row count per category. */
+const totalsByCategory = (transactions: Transaction[]): CategoryTotals => {
+  const totals: CategoryTotals = {};
+  for (const t of transactions) {
+    const key = t.category || 'Uncategorized';
+    const bucket = totals[key] || (totals[key] = { income: 0, expense: 0, net: 0, count: 0 });
+    if (t.type === 'income') bucket.income += amountOf(t);
+    else if (t.type === 'expense') bucket.expense += amountOf(t);
+    bucket.net = bucket.income - bucket.expense;
+    bucket.count += 1;
+  }
+  return totals;
+};
+
+/** Income/expense over the loaded rows; recomputed only when the rows change. */
+export const selectTotalsByType = createSelector([selectAllTransactions], (transactions): TransactionTotals => {
+  let income = 0;
+  let expense = 0;
+  for (const t of transactions) {
+    if (t.type === 'income') income += amountOf(t);
+    else if (t.type === 'expense') expense += amountOf(t);
+  }
+  return { income, expense, net: income - expense };
+});
+
+/** Over the loaded (possibly filtered, partial) rows; for whole-ledger figures load them separately. */
+export const selectTotalsByCategory = createSelector([selectAllTransactions], totalsByCategory);
+
+export const selectHasMoreTransactions = (state: RootState) => !!state.transaction.next;
+
+export const { clearError, setTransactions, transactionRemoved } = transactionSlice.actions;
 export default transactionSlice.reducer;
@@ -0,0 +1,115 @@
+import { waitFor } from '@testing-library/react';
+import type { AxiosAdapter } from 'axios';
+import api, { requestCache } from '../services/api';
+
+/** Dataset sizes for the render benchmarks; override with e.g. BENCH_SIZES=1000,10000 */
+export const BENCH_SIZES = (process.env.BENCH_SIZES || '1000,10000,100000')
+  .split(',')
+  .map(Number)
+  .filter((size) => size > 0);
+
+/**
+ * A fixed number of samples instead of tinybench's default time budget: one
+ * 100k-row mount can take seconds, so the big datasets get fewer samples.
+ */
+export const benchOptions = (size: number) => ({
+  time: 0,
+  warmupTime: 0,
+  iterations: size >= 100_000 ? 3 : size >= 10_000 ? 10 : 30,
+  warmupIterations: size >= 100_000 ? 1 : 3,
+});
+
+/** Search terms typed one keystroke at a time, then cleared. */
+export const KEYSTROKES = ['g', 'gr', 'gre', 'gree', 'green', ''];
+
+const WORDS = ['Green', 'Black', 'Chai', 'Cement', 'Copper', 'Paper', 'Maize', 'Sugar', 'Soap', 'Cable', 'Bolt', 'Flour'];
+const CATEGORIES = ['Beverages', 'Hardware', 'Stationery', 'Groceries', 'Cleaning', 'Electrical'];
+const STATUSES = ['DRAFT', 'SENT', 'CONFIRMED', 'PARTIALLY_RECEIVED', 'RECEIVED', 'COMPLETED'];
+
+/** Zero-padded so every generated name is unique as a substring of the page text. */
+const serial = (i: number) => String(i + 1).padStart(6, '0');
+
+const cache = new Map<string, unknown[]>();
+
+const rows = <T>(kind: string, size: number, make: (i: number) => T): T[] => {
+  const key = `${kind}:${size}`;
+  if (!cache.has(key)) cache.set(key, Array.from({ length: size }, (_, i) => make(i)));
+  return cache.get(key) as T[];
+};
+
+export const productRows = (size: number) =>
+  rows('products', size, (i) => ({
+    id: i + 1,
+    name: `${WORDS[i % WORDS.length]} ${WORDS[(i * 7 + 3) % WORDS.length]} ${serial(i)}`,
+    sku: `SKU-${serial(i)}`,
+    description: '',
+    category: CATEGORIES[i % CATEGORIES.length],
+    unit_price: ((i * 37) % 5000) / 100 + 1,
+    cost_price: ((i * 29) % 4000) / 100 + 0.5,
+    quantity_in_stock: (i * 13) % 120,
+    minimum_stock_level: 10,
+    vat_rate: 15,
+    store: 1,
+    is_active: true,
+  }));
+
+export const transactionRows = (size: number) =>
+  rows('transactions', size, (i) => ({
+    id: String(i + 1),
+    description: `Ledger entry ${serial(i)}`,
+    amount: ((i * 7919) % 1_000_000) / 100,
+    type: (i % 3 === 0 ? 'expense' : 'income') as 'income' | 'expense',
+    category: CATEGORIES[i % CATEGORIES.length],
+    date: new Date(Date.UTC(2024, 0, 1 + (i % 365))).toISOString().slice(0, 10),
+    account_type: (['bank', 'mobile', 'pos', 'purchase'] as const)[i % 4],
+    status: 'completed',
+  }));
+
+export const purchaseOrderRows = (size: number) =>
+  rows('purchase-orders', size, (i) => ({
+    id: i + 1,
+    po_number: `PO-${serial(i)}`,
+    vendor: (i % 50) + 1,
+    vendor_name: `Vendor ${(i % 50) + 1}`,
+    status: STATUSES[i % STATUSES.length],
+    order_date: new Date(Date.UTC(2024, 0, 1 + (i % 365))).toISOString().slice(0, 10),
+    expected_delivery_date: new Date(Date.UTC(2024, 1, 1 + (i % 365))).toISOString().slice(0, 10),
+    total_amount: (((i * 7919) % 1_000_000) / 100).toFixed(2),
+    items: [],
+  }));
+
+type Fixture = unknown | ((params: Record<string, any>) => unknown);
+
+/**
+ * Answer `api` requests from in-memory fixtures keyed by path (query string
+ * ignored), so pages load through their real fetch code without a backend.
+ * Unknown paths get an empty list. Stays in place until the next call, so
+ * requests a page makes after its rows appear are answered too.
+ *
+ * Only the network transport is replaced: the request cache still sits in
+ * front of it, as in the app. It is emptied on each call, so every mount
+ * starts cold and never sees rows from another dataset size.
+ */
+export function serveFixtures(fixtures: Record<string, Fixture>) {
+  const transport: AxiosAdapter = async (config) => {
+    const path = (config.url ?? '').split('?')[0];
+    const fixture = fixtures[path];
+    const data = typeof fixture === 'function' ? fixture(config.params ?? {}) : fixture ?? [];
+    return { data, status: 200, statusText: 'OK', headers: {}, config };
+  };
+  requestCache.clear();
+  api.defaults.adapter = requestCache.adapter(transport);
+}
+
+/** Resolve once `condition` holds; re-checked on every DOM mutation. */
+export const until = (condition: () => boolean, what = 'condition') =>
+  waitFor(
+    () => {
+      if (!condition()) throw new Error(`Timed out waiting for ${what}`);
+    },
+    { timeout: 10 * 60 * 1000, interval: 5 }
+  );
+
+/** Resolve once `text` appears anywhere in `container`. */
+export const untilRendered = (container: HTMLElement, text: string) =>
+  until(() => !!container.textContent?.includes(text), `"${text}"`);
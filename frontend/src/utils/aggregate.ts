@@ -0,0 +1,267 @@
+// Columnar aggregation kernels for ledger-style data: grouped sums, running
+// balances and period buckets. Inputs are typed-array columns so they can be
+// transferred to a worker (see services/computePool.ts) without copying.
+
+export type AggregatePeriod = 'day' | 'month' | 'quarter' | 'year';
+
+export type AggregateColumns = {
+  amount: Float64Array;
+  /** Group index per row, into the `keys` list returned by toColumns */
+  key: Int32Array;
+  /** Epoch milliseconds; NaN when the row has no usable date */
+  date: Float64Array;
+};
+
+export type AggregateRequest = {
+  groupSums?: boolean;
+  /** Per-group cumulative balance in date order, reported per row */
+  runningBalance?: boolean;
+  period?: AggregatePeriod;
+};
+
+export type PeriodBuckets = {
+  /** Bucket start (UTC epoch ms), ascending */
+  starts: Float64Array;
+  sums: Float64Array;
+  counts: Int32Array;
+  /** Per-group sums, `bucket * groups + group`; present when groupSums was requested */
+  groupSums?: Float64Array;
+};
+
+export type AggregateResult = {
+  total: number;
+  /** Indexed by group */
+  groupSums?: Float64Array;
+  groupCounts?: Int32Array;
+  /** Indexed by row, in input order */
+  runningBalance?: Float64Array;
+  periods?: PeriodBuckets;
+};
+
+export type ColumnAccessors<T> = {
+  amount: (row: T) => number | string | null | undefined;
+  key?: (row: T) => string | number | null | undefined;
+  date?: (row: T) => string | number | Date | null | undefined;
+};
+
+/** Row fields to read into columns; unlike accessors, these can be posted to a worker. */
+export type ColumnFields = {
+  amount: string;
+  key?: string;
+  date?: string;
+  /** Sum magnitudes, for ledgers that store debits with either sign */
+  absolute?: boolean;
+};
+
+export type ColumnsPage = {
+  columns: AggregateColumns;
+  keys: string[];
+  /** The response's `next` link, null on the last page */
+  next: string | null;
+  rows: number;
+};
+
+/** Build columns from row objects; `keys[i]` is the group behind key index i. */
+export function toColumns<T>(rows: ArrayLike<T>, accessors: ColumnAccessors<T>) {
+  const count = rows.length;
+  const columns: AggregateColumns = {
+    amount: new Float64Array(count),
+    key: new Int32Array(count),
+    date: new Float64Array(count),
+  };
+  const keys: string[] = [];
+  const keyIndex = new Map<string, number>();
+
+  for (let i = 0; i < count; i += 1) {
+    const row = rows[i];
+    columns.amount[i] = Number(accessors.amount(row)) || 0;
+    if (accessors.key) {
+      const group = String(accessors.key(row) ?? '');
+      let index = keyIndex.get(group);
+      if (index === undefined) {
+        index = keys.length;
+        keys.push(group);
+        keyIndex.set(group, index);
+      }
+      columns.key[i] = index;
+    }
+    const value = accessors.date?.(row);
+    columns.date[i] = value == null || value === '' ? NaN : new Date(value).getTime();
+  }
+  if (!accessors.key) keys.push('');
+  return { columns, keys };
+}
+
+const fieldAccessors = (fields: ColumnFields): ColumnAccessors<Record<string, unknown>> => ({
+  amount: fields.absolute
+    ? (row) => Math.abs(Number(row[fields.amount]) || 0)
+    : (row) => row[fields.amount] as number | string | null | undefined,
+  key: fields.key ? (row) => row[fields.key!] as string | number | null | undefined : undefined,
+  date: fields.date ? (row) => row[fields.date!] as string | number | null | undefined : undefined,
+});
+
+/** Columns from one JSON list response, a bare array or a `{ results, next }` page. */
+export function parseColumnsPage(text: string, fields: ColumnFields): ColumnsPage {
+  const data = JSON.parse(text);
+  const paged = !Array.isArray(data);
+  const results = paged ? (Array.isArray(data?.results) ? data.results : []) : data;
+  const { columns, keys } = toColumns(results, fieldAccessors(fields));
+  return { columns, keys, next: paged ? data?.next ?? null : null, rows: results.length };
+}
+
+/** Join column sets end to end, re-indexing each part's keys into one list. */
+export function concatColumns(parts: Array<{ columns: AggregateColumns; keys: string[] }>) {
+  const count = parts.reduce((sum, part) => sum + part.columns.amount.length, 0);
+  const columns: AggregateColumns = {
+    amount: new Float64Array(count),
+    key: new Int32Array(count),
+    date: new Float64Array(count),
+  };
+  const keys: string[] = [];
+  const keyIndex = new Map<string, number>();
+  let offset = 0;
+  for (const part of parts) {
+    const remap = part.keys.map((group) => {
+      let index = keyIndex.get(group);
+      if (index === undefined) {
+        index = keys.length;
+        keys.push(group);
+        keyIndex.set(group, index);
+      }
+      return index;
+    });
+    const length = part.columns.amount.length;
+    columns.amount.set(part.columns.amount, offset);
+    columns.date.set(part.columns.date, offset);
+    for (let i = 0; i < length; i += 1) columns.key[offset + i] = remap[part.columns.key[i]];
+    offset += length;
+  }
+  if (!keys.length) keys.push('');
+  return { columns, keys };
+}
+
+/** A copy to hand to a job, which takes ownership of (transfers) what it is given. */
+export const copyColumns = (columns: AggregateColumns): AggregateColumns => ({
+  amount: columns.amount.slice(),
+  key: columns.key.slice(),
+  date: columns.date.slice(),
+});
+
+/** Buffers of a column set, for transferring it to or from a worker. */
+export const columnBuffers = (columns: AggregateColumns): ArrayBuffer[] =>
+  [columns.amount, columns.key, columns.date].map((column) => column.buffer as ArrayBuffer);
+
+export function periodStart(time: number, period: AggregatePeriod): number {
+  const d = new Date(time);
+  const year = d.getUTCFullYear();
+  switch (period) {
+    case 'day':
+      return Date.UTC(year, d.getUTCMonth(), d.getUTCDate());
+    case 'month':
+      return Date.UTC(year, d.getUTCMonth(), 1);
+    case 'quarter':
+      return Date.UTC(year, d.getUTCMonth() - (d.getUTCMonth() % 3), 1);
+    default:
+      return Date.UTC(year, 0, 1);
+  }
+}
+
+export function aggregateColumns(columns: AggregateColumns, request: AggregateRequest): AggregateResult {
+  const { amount, key, date } = columns;
+  const count = amount.length;
+  let groups = 0;
+  for (let i = 0; i < count; i += 1) {
+    if (key[i] >= groups) groups = key[i] + 1;
+  }
+
+  let total = 0;
+  const result: AggregateResult = { total: 0 };
+  if (request.groupSums) {
+    result.groupSums = new Float64Array(groups);
+    result.groupCounts = new Int32Array(groups);
+  }
+  for (let i = 0; i < count; i += 1) {
+    total += amount[i];
+    if (result.groupSums) {
+      result.groupSums[key[i]] += amount[i];
+      result.groupCounts![key[i]] += 1;
+    }
+  }
+  result.total = total;
+
+  if (request.runningBalance) {
+    // Date order, input order for ties; undated rows come last
+    const order = new Uint32Array(count);
+    for (let i = 0; i < count; i += 1) order[i] = i;
+    order.sort((a, b) => {
+      const da = date[a];
+      const db = date[b];
+      const undatedA = Number.isNaN(da);
+      const undatedB = Number.isNaN(db);
+      if (undatedA || undatedB) return undatedA === undatedB ? a - b : undatedA ? 1 : -1;
+      return da - db || a - b;
+    });
+    const balances = new Float64Array(groups);
+    const running = new Float64Array(count);
+    for (let n = 0; n < count; n += 1) {
+      const i = order[n];
+      balances[key[i]] += amount[i];
+      running[i] = balances[key[i]];
+    }
+    result.runningBalance = running;
+  }
+
+  if (request.period) {
+    const buckets = new Map<number, number>();
+    const starts: number[] = [];
+    // Bucket index per row, so per-group sums can be laid out after sorting
+    const rowBucket = new Int32Array(count).fill(-1);
+    for (let i = 0; i < count; i += 1) {
+      if (Number.isNaN(date[i])) continue;
+      const start = periodStart(date[i], request.period);
+      let bucket = buckets.get(start);
+      if (bucket === undefined) {
+        bucket = starts.length;
+        buckets.set(start, bucket);
+        starts.push(start);
+      }
+      rowBucket[i] = bucket;
+    }
+    const order = starts.map((_, i) => i).sort((a, b) => starts[a] - starts[b]);
+    const rank = new Int32Array(starts.length);
+    order.forEach((bucket, position) => {
+      rank[bucket] = position;
+    });
+    const periods: PeriodBuckets = {
+      starts: Float64Array.from(order, (i) => starts[i]),
+      sums: new Float64Array(starts.length),
+      counts: new Int32Array(starts.length),
+    };
+    if (request.groupSums) periods.groupSums = new Float64Array(starts.length * groups);
+    for (let i = 0; i < count; i += 1) {
+      if (rowBucket[i] < 0) continue;
+      const position = rank[rowBucket[i]];
+      periods.sums[position] += amount[i];
+      periods.counts[position] += 1;
+      if (periods.groupSums) periods.groupSums[position * groups + key[i]] += amount[i];
+    }
+    result.periods = periods;
+  }
+
+  return result;
+}
+
+/** Buffers of a result, for transferring it back from a worker. */
+export function resultBuffers(result: AggregateResult): ArrayBuffer[] {
+  return [
+    result.groupSums,
+    result.groupCounts,
+    result.runningBalance,
+    result.periods?.starts,
+    result.periods?.sums,
+    result.periods?.counts,
+    result.periods?.groupSums,
+  ]
+    .filter((column): column is Float64Array | Int32Array => !!column)
+    .map((column) => column.buffer as ArrayBuffer);
+}
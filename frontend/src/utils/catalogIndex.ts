@@ -0,0 +1,236 @@
+// In-memory lookup structures for the POS catalogue: exact barcode/SKU
+// lookup, prefix search over name tokens and per-category buckets.
+
+type ItemId = string | number;
+
+export type CatalogIndexOptions<T> = {
+  getId: (item: T) => ItemId;
+  /** Scannable codes (barcode, SKU, service code); matched exactly and by prefix */
+  getCodes: (item: T) => Array<string | undefined | null>;
+  /** Free text split into searchable word tokens */
+  getText: (item: T) => Array<string | undefined | null>;
+  getCategory?: (item: T) => string | undefined | null;
+};
+
+const normalize = (value: string) => value.trim().toLowerCase();
+
+export const tokenize = (text: string): string[] =>
+  text
+    .toLowerCase()
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(Boolean);
+
+const lowerBound = (sorted: string[], target: string) => {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sorted[mid] < target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+type Entry<T> = {
+  item: T;
+  position: number;
+  codes: string[];
+  tokens: string[];
+  category: string;
+};
+
+/**
+ * Built once from the loaded catalogue and kept current with `sync`, which
+ * only re-indexes items whose object identity changed. A search term matches
+ * an item when every word in it is a prefix of one of the item's tokens.
+ */
+export class CatalogIndex<T> {
+  private entries = new Map<ItemId, Entry<T>>();
+  private byCode = new Map<string, ItemId>();
+  private postings = new Map<string, Set<ItemId>>();
+  private buckets = new Map<string, Set<ItemId>>();
+  // Distinct tokens in sorted order for prefix range scans; rebuilt lazily
+  private sortedTokens: string[] | null = null;
+  private ordered: T[] | null = null;
+  private nextPosition = 0;
+
+  /** Bumped on every change so callers can memoize query results */
+  version = 0;
+
+  constructor(private options: CatalogIndexOptions<T>) {}
+
+  get size() {
+    return this.entries.size;
+  }
+
+  /** Make the index match `items`, touching only added, changed or removed entries. */
+  sync(items: T[]) {
+    const seen = new Set<ItemId>();
+    let changed = false;
+    items.forEach((item, position) => {
+      const id = this.options.getId(item);
+      seen.add(id);
+      const entry = this.entries.get(id);
+      if (entry && entry.item === item) {
+        if (entry.position !== position) {
+          entry.position = position;
+          changed = true;
+        }
+        return;
+      }
+      this.add(item, position);
+      changed = true;
+    });
+    this.nextPosition = items.length;
+    for (const id of Array.from(this.entries.keys())) {
+      if (!seen.has(id)) {
+        this.delete(id);
+        changed = true;
+      }
+    }
+    if (changed) this.touch();
+  }
+
+  upsert(items: T[]) {
+    items.forEach((item) => {
+      const existing = this.entries.get(this.options.getId(item));
+      this.add(item, existing ? existing.position : this.nextPosition++);
+    });
+    if (items.length) this.touch();
+  }
+
+  remove(ids: ItemId[]) {
+    ids.forEach((id) => this.delete(id));
+    if (ids.length) this.touch();
+  }
+
+  /** Exact barcode/SKU match, case-insensitive. */
+  lookupCode(code: string): T | undefined {
+    const id = this.byCode.get(normalize(code));
+    return id === undefined ? undefined : this.entries.get(id)?.item;
+  }
+
+  /** Items matching `term` within `category` ('all' or empty for every category), in catalogue order. */
+  search(term: string, category?: string): T[] {
+    const words = tokenize(term);
+    const filtered = !!category && category !== 'all';
+    const bucket = this.buckets.get(normalize(category || '')) || new Set<ItemId>();
+    // Uncategorised items are listed under every category
+    const uncategorised = this.buckets.get('') || new Set<ItemId>();
+
+    if (!words.length) {
+      if (!filtered) return this.all();
+      return this.inOrder(new Set([...bucket, ...uncategorised]));
+    }
+
+    // Start from the rarest word so the intersection stays small
+    const candidates = words
+      .map((word) => this.matchPrefix(word))
+      .sort((a, b) => a.size - b.size);
+    let result = candidates[0];
+    for (let i = 1; i < candidates.length && result.size; i += 1) {
+      const next = new Set<ItemId>();
+      result.forEach((id) => {
+        if (candidates[i].has(id)) next.add(id);
+      });
+      result = next;
+    }
+    if (filtered) {
+      const inCategory = new Set<ItemId>();
+      result.forEach((id) => {
+        if (bucket.has(id) || uncategorised.has(id)) inCategory.add(id);
+      });
+      result = inCategory;
+    }
+    return this.inOrder(result);
+  }
+
+  private all(): T[] {
+    if (!this.ordered) {
+      this.ordered = Array.from(this.entries.values())
+        .sort((a, b) => a.position - b.position)
+        .map((entry) => entry.item);
+    }
+    return this.ordered;
+  }
+
+  private inOrder(ids: Set<ItemId>): T[] {
+    const entries: Entry<T>[] = [];
+    ids.forEach((id) => {
+      const entry = this.entries.get(id);
+      if (entry) entries.push(entry);
+    });
+    return entries.sort((a, b) => a.position - b.position).map((entry) => entry.item);
+  }
+
+  private matchPrefix(word: string): Set<ItemId> {
+    if (!this.sortedTokens) {
+      this.sortedTokens = Array.from(this.postings.keys()).sort();
+    }
+    const tokens = this.sortedTokens;
+    const matches = new Set<ItemId>();
+    for (let i = lowerBound(tokens, word); i < tokens.length && tokens[i].startsWith(word); i += 1) {
+      this.postings.get(tokens[i])?.forEach((id) => matches.add(id));
+    }
+    return matches;
+  }
+
+  private add(item: T, position: number) {
+    const id = this.options.getId(item);
+    this.delete(id);
+
+    const codes = this.options
+      .getCodes(item)
+      .filter((code): code is string => !!code && !!String(code).trim())
+      .map((code) => normalize(String(code)));
+    const tokens = new Set<string>(codes);
+    this.options.getText(item).forEach((text) => {
+      if (text) tokenize(String(text)).forEach((token) => tokens.add(token));
+    });
+    const category = normalize(this.options.getCategory?.(item) || '');
+    const entry: Entry<T> = { item, position, codes, tokens: Array.from(tokens), category };
+
+    this.entries.set(id, entry);
+    codes.forEach((code) => this.byCode.set(code, id));
+    entry.tokens.forEach((token) => {
+      let posting = this.postings.get(token);
+      if (!posting) {
+        posting = new Set();
+        this.postings.set(token, posting);
+        this.sortedTokens = null;
+      }
+      posting.add(id);
+    });
+    let bucket = this.buckets.get(category);
+    if (!bucket) {
+      bucket = new Set();
+      this.buckets.set(category, bucket);
+    }
+    bucket.add(id);
+  }
+
+  private delete(id: ItemId) {
+    const entry = this.entries.get(id);
+    if (!entry) return;
+    this.entries.delete(id);
+    entry.codes.forEach((code) => {
+      if (this.byCode.get(code) === id) this.byCode.delete(code);
+    });
+    entry.tokens.forEach((token) => {
+      const posting = this.postings.get(token);
+      posting?.delete(id);
+      if (posting && !posting.size) {
+        this.postings.delete(token);
+        this.sortedTokens = null;
+      }
+    });
+    const bucket = this.buckets.get(entry.category);
+    bucket?.delete(id);
+    if (bucket && !bucket.size) this.buckets.delete(entry.category);
+  }
+
+  private touch() {
+    this.ordered = null;
+    this.version += 1;
+  }
+}
@@ -0,0 +1,27 @@
+// Opt-in debug logging. Off by default; enable a namespace with
+// VITE_DEBUG=pos (comma separated, or *) at build time, or at runtime with
+// localStorage.setItem('debug', 'pos') and a reload.
+
+const enabledNamespaces = (): string[] => {
+  let flags = import.meta.env.VITE_DEBUG || '';
+  try {
+    flags = `${flags},${localStorage.getItem('debug') || ''}`;
+  } catch {
+    // localStorage unavailable (private mode, workers)
+  }
+  return flags
+    .split(',')
+    .map((flag) => flag.trim())
+    .filter(Boolean);
+};
+
+export type DebugLogger = ((...args: unknown[]) => void) & { enabled: boolean };
+
+export const createDebugLogger = (namespace: string): DebugLogger => {
+  const namespaces = enabledNamespaces();
+  const enabled = namespaces.includes('*') || namespaces.includes(namespace);
+  const log = (...args: unknown[]) => {
+    if (enabled) console.log(`[${namespace}]`, ...args);
+  };
+  return Object.assign(log, { enabled });
+};
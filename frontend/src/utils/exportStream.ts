@@ -0,0 +1,432 @@
+// Chunked CSV/XLSX export: rows are encoded a slice at a time by generators
+// and written to a sink (a file on disk where the browser allows it, Blob
+// parts otherwise), so a large export never becomes one giant string.
+
+export type ExportFormat = 'csv' | 'xlsx';
+
+export type ExportColumn = {
+  header: string;
+  key: string;
+};
+
+export type ExportRow = Record<string, unknown>;
+
+export type ExportChunk = {
+  data: Uint8Array;
+  /** Rows encoded so far (including this chunk) */
+  rows: number;
+};
+
+export type ExportProgress = {
+  rows: number;
+  totalRows: number;
+  bytes: number;
+};
+
+export type ExportOptions = {
+  format?: ExportFormat;
+  fileName?: string;
+  chunkSize?: number;
+  onProgress?: (progress: ExportProgress) => void;
+  signal?: AbortSignal;
+  /** Encode in a Web Worker so the main thread only moves bytes */
+  useWorker?: boolean;
+  /**
+   * A sink opened earlier, for callers that must await something (e.g. the
+   * rows) after the click; exportRows closes or aborts it.
+   */
+  sink?: ExportSink;
+};
+
+export const EXPORT_MIME_TYPES: Record<ExportFormat, string> = {
+  csv: 'text/csv;charset=utf-8',
+  xlsx: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+};
+
+const DEFAULT_CHUNK_SIZE = 1000;
+const encoder = new TextEncoder();
+
+const cellText = (value: unknown) => (value === null || value === undefined ? '' : String(value));
+
+// ---------------------------------------------------------------------------
+// CSV
+
+const csvCell = (value: unknown) => `"${cellText(value).replace(/"/g, '""')}"`;
+
+export function* csvChunks(
+  rows: ArrayLike<ExportRow>,
+  columns: ExportColumn[],
+  chunkSize = DEFAULT_CHUNK_SIZE
+): Generator<ExportChunk> {
+  yield { data: encoder.encode(columns.map((c) => c.header).join(',')), rows: 0 };
+  for (let start = 0; start < rows.length; start += chunkSize) {
+    const end = Math.min(start + chunkSize, rows.length);
+    let text = '';
+    for (let i = start; i < end; i += 1) {
+      const row = rows[i];
+      text += '\n' + columns.map((c) => csvCell(row[c.key])).join(',');
+    }
+    yield { data: encoder.encode(text), rows: end };
+  }
+}
+
+// ---------------------------------------------------------------------------
+// XLSX (a single inline-string worksheet in a stored, uncompressed zip)
+
+const CRC_TABLE = (() => {
+  const table = new Uint32Array(256);
+  for (let n = 0; n < 256; n += 1) {
+    let c = n;
+    for (let k = 0; k < 8; k += 1) {
+      c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+    }
+    table[n] = c >>> 0;
+  }
+  return table;
+})();
+
+const crc32 = (crc: number, data: Uint8Array) => {
+  let c = crc ^ 0xffffffff;
+  for (let i = 0; i < data.length; i += 1) {
+    c = CRC_TABLE[(c ^ data[i]) & 0xff] ^ (c >>> 8);
+  }
+  return (c ^ 0xffffffff) >>> 0;
+};
+
+const dosDateTime = (date: Date) => ({
+  time: (date.getHours() << 11) | (date.getMinutes() << 5) | (date.getSeconds() >> 1),
+  date: ((date.getFullYear() - 1980) << 9) | ((date.getMonth() + 1) << 5) | date.getDate(),
+});
+
+type ZipEntry = { name: Uint8Array; crc: number; size: number; offset: number };
+
+// Entries use a trailing data descriptor so their content can be streamed
+// before its size and CRC are known.
+class ZipWriter {
+  private entries: ZipEntry[] = [];
+  private offset = 0;
+  private stamp = dosDateTime(new Date());
+
+  *file(name: string, chunks: Iterable<ExportChunk>): Generator<ExportChunk> {
+    const entry: ZipEntry = { name: encoder.encode(name), crc: 0, size: 0, offset: this.offset };
+    const header = new Uint8Array(30 + entry.name.length);
+    const view = new DataView(header.buffer);
+    view.setUint32(0, 0x04034b50, true);
+    view.setUint16(4, 20, true);
+    view.setUint16(6, 0x0808, true); // data descriptor + UTF-8 names
+    view.setUint16(8, 0, true); // stored
+    view.setUint16(10, this.stamp.time, true);
+    view.setUint16(12, this.stamp.date, true);
+    view.setUint16(26, entry.name.length, true);
+    header.set(entry.name, 30);
+    yield this.emit(header, 0);
+
+    let rows = 0;
+    for (const chunk of chunks) {
+      entry.crc = crc32(entry.crc, chunk.data);
+      entry.size += chunk.data.length;
+      rows = chunk.rows;
+      yield this.emit(chunk.data, rows);
+    }
+
+    const descriptor = new Uint8Array(16);
+    const dv = new DataView(descriptor.buffer);
+    dv.setUint32(0, 0x08074b50, true);
+    dv.setUint32(4, entry.crc, true);
+    dv.setUint32(8, entry.size, true);
+    dv.setUint32(12, entry.size, true);
+    this.entries.push(entry);
+    yield this.emit(descriptor, rows);
+  }
+
+  *finish(rows: number): Generator<ExportChunk> {
+    const start = this.offset;
+    for (const entry of this.entries) {
+      const record = new Uint8Array(46 + entry.name.length);
+      const view = new DataView(record.buffer);
+      view.setUint32(0, 0x02014b50, true);
+      view.setUint16(4, 20, true);
+      view.setUint16(6, 20, true);
+      view.setUint16(8, 0x0808, true);
+      view.setUint16(10, 0, true);
+      view.setUint16(12, this.stamp.time, true);
+      view.setUint16(14, this.stamp.date, true);
+      view.setUint32(16, entry.crc, true);
+      view.setUint32(20, entry.size, true);
+      view.setUint32(24, entry.size, true);
+      view.setUint16(28, entry.name.length, true);
+      view.setUint32(42, entry.offset, true);
+      record.set(entry.name, 46);
+      yield this.emit(record, rows);
+    }
+    const end = new Uint8Array(22);
+    const view = new DataView(end.buffer);
+    view.setUint32(0, 0x06054b50, true);
+    view.setUint16(8, this.entries.length, true);
+    view.setUint16(10, this.entries.length, true);
+    view.setUint32(12, this.offset - start, true);
+    view.setUint32(16, start, true);
+    yield this.emit(end, rows);
+  }
+
+  private emit(data: Uint8Array, rows: number): ExportChunk {
+    this.offset += data.length;
+    return { data, rows };
+  }
+}
+
+// Characters that are not allowed anywhere in an XML document
+const XML_INVALID = /[\u0000-\u0008\u000B\u000C\u000E-\u001F\uFFFE\uFFFF]/g;
+
+const xmlEscape = (text: string) =>
+  text
+    .replace(XML_INVALID, '')
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;');
+
+const xlsxCell = (value: unknown) => {
+  if (typeof value === 'number' && Number.isFinite(value)) {
+    return `<c><v>${value}</v></c>`;
+  }
+  return `<c t="inlineStr"><is><t xml:space="preserve">${xmlEscape(cellText(value))}</t></is></c>`;
+};
+
+function* sheetChunks(rows: ArrayLike<ExportRow>, columns: ExportColumn[], chunkSize: number): Generator<ExportChunk> {
+  yield {
+    data: encoder.encode(
+      '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' +
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>' +
+        `<row>${columns.map((c) => xlsxCell(c.header)).join('')}</row>`
+    ),
+    rows: 0,
+  };
+  for (let start = 0; start < rows.length; start += chunkSize) {
+    const end = Math.min(start + chunkSize, rows.length);
+    let xml = '';
+    for (let i = start; i < end; i += 1) {
+      const row = rows[i];
+      xml += `<row>${columns.map((c) => xlsxCell(row[c.key])).join('')}</row>`;
+    }
+    yield { data: encoder.encode(xml), rows: end };
+  }
+  yield { data: encoder.encode('</sheetData></worksheet>'), rows: rows.length };
+}
+
+function* staticPart(xml: string): Generator<ExportChunk> {
+  yield { data: encoder.encode('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + xml), rows: 0 };
+}
+
+const NS_RELS = 'http://schemas.openxmlformats.org/package/2006/relationships';
+const NS_DOC_RELS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships';
+
+export function* xlsxChunks(
+  rows: ArrayLike<ExportRow>,
+  columns: ExportColumn[],
+  chunkSize = DEFAULT_CHUNK_SIZE
+): Generator<ExportChunk> {
+  const zip = new ZipWriter();
+  yield* zip.file(
+    '[Content_Types].xml',
+    staticPart(
+      '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">' +
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>' +
+        '<Default Extension="xml" ContentType="application/xml"/>' +
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>' +
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>' +
+        '</Types>'
+    )
+  );
+  yield* zip.file(
+    '_rels/.rels',
+    staticPart(
+      `<Relationships xmlns="${NS_RELS}">` +
+        `<Relationship Id="rId1" Type="${NS_DOC_RELS}/officeDocument" Target="xl/workbook.xml"/>` +
+        '</Relationships>'
+    )
+  );
+  yield* zip.file(
+    'xl/workbook.xml',
+    staticPart(
+      `<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="${NS_DOC_RELS}">` +
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    )
+  );
+  yield* zip.file(
+    'xl/_rels/workbook.xml.rels',
+    staticPart(
+      `<Relationships xmlns="${NS_RELS}">` +
+        `<Relationship Id="rId1" Type="${NS_DOC_RELS}/worksheet" Target="worksheets/sheet1.xml"/>` +
+        '</Relationships>'
+    )
+  );
+  yield* zip.file('xl/worksheets/sheet1.xml', sheetChunks(rows, columns, chunkSize));
+  yield* zip.finish(rows.length);
+}
+
+export function encodeRows(
+  format: ExportFormat,
+  rows: ArrayLike<ExportRow>,
+  columns: ExportColumn[],
+  chunkSize = DEFAULT_CHUNK_SIZE
+): Generator<ExportChunk> {
+  return format === 'xlsx' ? xlsxChunks(rows, columns, chunkSize) : csvChunks(rows, columns, chunkSize);
+}
+
+// ---------------------------------------------------------------------------
+// Sinks
+
+export interface ExportSink {
+  write(chunk: Uint8Array): Promise<void>;
+  close(): Promise<void>;
+  abort(): Promise<void>;
+}
+
+const triggerDownload = (blob: Blob, fileName: string) => {
+  const url = URL.createObjectURL(blob);
+  const link = document.createElement('a');
+  link.href = url;
+  link.setAttribute('download', fileName);
+  document.body.appendChild(link);
+  link.click();
+  link.remove();
+  URL.revokeObjectURL(url);
+};
+
+/**
+ * Write straight to a user-chosen file when the File System Access API is
+ * available, otherwise collect Blob parts and download them at the end.
+ * Must be called from a user gesture (before any other await) so the save
+ * dialog is allowed to open.
+ */
+export async function openExportSink(fileName: string, mimeType: string): Promise<ExportSink> {
+  const picker = (window as any).showSaveFilePicker;
+  if (typeof picker === 'function') {
+    const extension = fileName.includes('.') ? fileName.slice(fileName.lastIndexOf('.')) : '';
+    const handle = await picker({
+      suggestedName: fileName,
+      types: extension ? [{ accept: { [mimeType.split(';')[0]]: [extension] } }] : undefined,
+    });
+    const writable = await handle.createWritable();
+    return {
+      write: (chunk) => writable.write(chunk),
+      close: () => writable.close(),
+      abort: () => writable.abort(),
+    };
+  }
+
+  let parts: BlobPart[] = [];
+  return {
+    write: async (chunk) => {
+      parts.push(chunk);
+    },
+    close: async () => {
+      triggerDownload(new Blob(parts, { type: mimeType }), fileName);
+      parts = [];
+    },
+    abort: async () => {
+      parts = [];
+    },
+  };
+}
+
+const abortError = () => new DOMException('Export cancelled', 'AbortError');
+
+const yieldToMainThread = () => new Promise<void>((resolve) => setTimeout(resolve, 0));
+
+async function* workerChunks(
+  rows: ArrayLike<ExportRow>,
+  columns: ExportColumn[],
+  format: ExportFormat,
+  chunkSize: number,
+  signal?: AbortSignal
+): AsyncGenerator<ExportChunk> {
+  const worker = new Worker(new URL('../workers/exportWorker.ts', import.meta.url), { type: 'module' });
+  const queue: ExportChunk[] = [];
+  let done = false;
+  let failure: unknown;
+  let wake: (() => void) | undefined;
+  const notify = () => {
+    wake?.();
+    wake = undefined;
+  };
+
+  worker.onmessage = (event: MessageEvent) => {
+    if (event.data.type === 'chunk') {
+      queue.push({ data: event.data.data, rows: event.data.rows });
+    } else {
+      done = true;
+    }
+    notify();
+  };
+  worker.onerror = (event) => {
+    failure = event.error || new Error(event.message);
+    notify();
+  };
+  const onAbort = () => {
+    failure = abortError();
+    notify();
+  };
+  signal?.addEventListener('abort', onAbort);
+
+  try {
+    worker.postMessage({ rows: Array.from(rows), columns, format, chunkSize });
+    while (true) {
+      if (failure) throw failure;
+      const chunk = queue.shift();
+      if (chunk) {
+        yield chunk;
+      } else if (done) {
+        return;
+      } else {
+        await new Promise<void>((resolve) => {
+          wake = resolve;
+        });
+      }
+    }
+  } finally {
+    signal?.removeEventListener('abort', onAbort);
+    worker.terminate();
+  }
+}
+
+/**
+ * Export `rows` chunk by chunk, reporting progress and honouring `signal`.
+ * Rejects with an AbortError when cancelled; a partly written file is discarded.
+ */
+export async function exportRows(
+  rows: ArrayLike<ExportRow>,
+  columns: ExportColumn[],
+  options: ExportOptions = {}
+): Promise<void> {
+  const format = options.format || 'csv';
+  const fileName = options.fileName || `export.${format}`;
+  const chunkSize = options.chunkSize || DEFAULT_CHUNK_SIZE;
+  const sink = options.sink ?? (await openExportSink(fileName, EXPORT_MIME_TYPES[format]));
+  const useWorker = options.useWorker && typeof Worker !== 'undefined';
+  const chunks = useWorker
+    ? workerChunks(rows, columns, format, chunkSize, options.signal)
+    : encodeRows(format, rows, columns, chunkSize);
+
+  let bytes = 0;
+  try {
+    for await (const chunk of chunks) {
+      if (options.signal?.aborted) throw abortError();
+      await sink.write(chunk.data);
+      bytes += chunk.data.length;
+      options.onProgress?.({ rows: chunk.rows, totalRows: rows.length, bytes });
+      if (!useWorker) {
+        // Let input and paint run between chunks
+        await yieldToMainThread();
+      }
+    }
+    await sink.close();
+  } catch (error) {
+    await sink.abort().catch(() => undefined);
+    throw error;
+  }
+}
+
+export const isAbortError = (error: unknown) =>
+  error instanceof DOMException && error.name === 'AbortError';
@@ -1,24 +1,108 @@
-export const formatCurrency = (amount: number): string => {
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-  }).format(amount);
-};
-
-export const formatDate = (date: string | Date): string => {
-  return new Intl.DateTimeFormat('en-US', {
-    year: 'numeric',
-    month: 'long',
-    day: 'numeric',
-  }).format(new Date(date));
-};
-
-export const formatDateTime = (date: string | Date): string => {
-  return new Intl.DateTimeFormat('en-US', {
-    year: 'numeric',
-    month: 'long',
-    day: 'numeric',
-    hour: '2-digit',
-    minute: '2-digit',
-  }).format(new Date(date));
-}; 
\ No newline at end of file
+// Building an Intl formatter is far slower than using one, so formatters are
+// cached per locale and options and shared by every caller.
+const numberFormats = new Map<string, Intl.NumberFormat>();
+const dateTimeFormats = new Map<string, Intl.DateTimeFormat>();
+
+/** Intl locale for each i18next language; unknown languages are used as-is */
+export const INTL_LOCALES: Record<string, string> = {
+  en: 'en-US',
+  sn: 'sn-ZW',
+  nd: 'nd-ZW',
+};
+
+let formatLocale = 'en-US';
+
+/** Follow the UI language, e.g. `i18n.on('languageChanged', setFormatLocale)`. */
+export const setFormatLocale = (language: string) => {
+  formatLocale = INTL_LOCALES[language] || language || 'en-US';
+};
+
+export const getFormatLocale = () => formatLocale;
+
+const optionsKey = (options: object) =>
+  Object.entries(options)
+    .sort(([a], [b]) => (a < b ? -1 : 1))
+    .map(([key, value]) => `${key}=${value}`)
+    .join(',');
+
+export const getNumberFormat = (options: Intl.NumberFormatOptions = {}, locale = formatLocale): Intl.NumberFormat => {
+  const key = `${locale}|${optionsKey(options)}`;
+  let format = numberFormats.get(key);
+  if (!format) {
+    format = new Intl.NumberFormat(locale, options);
+    numberFormats.set(key, format);
+  }
+  return format;
+};
+
+export const getDateTimeFormat = (options: Intl.DateTimeFormatOptions = {}, locale = formatLocale): Intl.DateTimeFormat => {
+  const key = `${locale}|${optionsKey(options)}`;
+  let format = dateTimeFormats.get(key);
+  if (!format) {
+    format = new Intl.DateTimeFormat(locale, options);
+    dateTimeFormats.set(key, format);
+  }
+  return format;
+};
+
+// formatCurrency runs once per table cell, so it skips the generic options key
+const currencyFormats = new Map<string, Intl.NumberFormat>();
+
+export const getCurrencyFormat = (currency = 'USD', locale = formatLocale): Intl.NumberFormat => {
+  const key = `${locale}|${currency}`;
+  let format = currencyFormats.get(key);
+  if (!format) {
+    format = new Intl.NumberFormat(locale, { style: 'currency', currency });
+    currencyFormats.set(key, format);
+  }
+  return format;
+};
+
+const DATE_OPTIONS: Intl.DateTimeFormatOptions = {
+  year: 'numeric',
+  month: 'long',
+  day: 'numeric',
+};
+
+const DATE_TIME_OPTIONS: Intl.DateTimeFormatOptions = {
+  ...DATE_OPTIONS,
+  hour: '2-digit',
+  minute: '2-digit',
+};
+
+export const formatCurrency = (amount: number, currency = 'USD', locale = formatLocale): string => {
+  return getCurrencyFormat(currency, locale).format(amount);
+};
+
+/** Plain grouped number, like `n.toLocaleString()` but with a cached formatter */
+export const formatNumber = (value: number, options?: Intl.NumberFormatOptions, locale = formatLocale): string => {
+  return getNumberFormat(options, locale).format(value);
+};
+
+export const formatDate = (date: string | Date, locale = formatLocale): string => {
+  return getDateTimeFormat(DATE_OPTIONS, locale).format(new Date(date));
+};
+
+export const formatDateTime = (date: string | Date, locale = formatLocale): string => {
+  return getDateTimeFormat(DATE_TIME_OPTIONS, locale).format(new Date(date));
+};
+
+/** Format a whole column with one formatter lookup. */
+export const formatMany = <T>(values: ArrayLike<T>, format: (value: T) => string): string[] => {
+  const out = new Array<string>(values.length);
+  for (let i = 0; i < values.length; i++) out[i] = format(values[i]);
+  return out;
+};
+
+export const formatCurrencyMany = (amounts: ArrayLike<number>, currency = 'USD', locale = formatLocale): string[] => {
+  return formatMany(amounts, getCurrencyFormat(currency, locale).format);
+};
+
+export const formatDateMany = (
+  dates: ArrayLike<string | number | Date>,
+  options: Intl.DateTimeFormatOptions = DATE_OPTIONS,
+  locale = formatLocale
+): string[] => {
+  const { format } = getDateTimeFormat(options, locale);
+  return formatMany(dates, (date) => format(new Date(date)));
+};
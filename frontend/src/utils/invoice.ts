@@ -1,15 +1,122 @@
+import api from '../services/api';
+import { IndexedDbQueueStore, MemoryQueueStore, offlineQueue } from '../services/offlineQueue';
+import type { QueueItem, QueueStore } from '../services/offlineQueue';
+
 export interface InvoiceNumberConfig {
   prefix: string; // e.g., INV-
   pad: number;    // e.g., 6 -> INV-000123
 }
 
+export function formatInvoiceNumber(sequence: number, cfg: InvoiceNumberConfig): string {
+  return `${cfg.prefix}${sequence.toString().padStart(cfg.pad, '0')}`;
+}
+
 export function generateInvoiceNumber(lastSequence: number, cfg: InvoiceNumberConfig): string {
-  const next = lastSequence + 1;
-  const padded = next.toString().padStart(cfg.pad, '0');
-  return `${cfg.prefix}${padded}`;
+  return formatInvoiceNumber(lastSequence + 1, cfg);
+}
+
+/** Reserved numbers `next`..`end` (inclusive) not yet handed out. */
+export type SequenceBlock = { next: number; end: number };
+
+/** Reserves `size` consecutive numbers for `prefix`; resolves the first and last. */
+export type ReserveBlock = (prefix: string, size: number) => Promise<{ start: number; end: number }>;
+
+export type InvoiceNumberBlocksOptions = InvoiceNumberConfig & {
+  /** Numbers reserved per request (default 50) */
+  blockSize?: number;
+  /** Reserve the next block in the background once this few are left (default 10) */
+  lowWater?: number;
+  reserve?: ReserveBlock;
+  storage?: Storage;
+};
+
+const BLOCKS_PREFIX = 'invoiceBlocks:';
+const RESERVE_RETRY_MS = 30 * 1000;
+
+const reserveWithApi: ReserveBlock = async (prefix, size) => {
+  // Runs in the background, so failures are handled here rather than toasted at the cashier
+  const response = await api.post('/invoice-sequences/reserve/', { prefix, size }, { silent: true });
+  return response.data;
+};
+
+/**
+ * Hands out invoice numbers from blocks reserved on the server, so tills do
+ * not contend for the sequence on every sale. Unused numbers are kept in
+ * storage across reloads, and the next block is reserved in the background
+ * before the current one runs out. Checkout never waits on the reservation.
+ */
+export class InvoiceNumberBlocks {
+  private reserving: Promise<void> | null = null;
+  private retryAfter = 0;
+  private unsupported = false;
+  private storage?: Storage;
+
+  constructor(private options: InvoiceNumberBlocksOptions) {
+    this.storage = options.storage ?? (typeof localStorage === 'undefined' ? undefined : localStorage);
+  }
+
+  /** Numbers reserved and not yet handed out. */
+  remaining(): number {
+    return this.load().reduce((sum, block) => sum + Math.max(0, block.end - block.next + 1), 0);
+  }
+
+  /** Next reserved invoice number, or null when none is left; never waits on the server. */
+  next(): string | null {
+    const sequence = this.take();
+    this.reserveAhead();
+    return sequence === null ? null : formatInvoiceNumber(sequence, this.options);
+  }
+
+  /**
+   * Reserves another block in the background once few numbers are left.
+   * Resolves when that reservation settles; it never rejects.
+   */
+  reserveAhead(): Promise<void> {
+    if (this.reserving) return this.reserving;
+    if (this.unsupported || Date.now() < this.retryAfter) return Promise.resolve();
+    if (this.remaining() > (this.options.lowWater ?? 10)) return Promise.resolve();
+    const reserve = this.options.reserve ?? reserveWithApi;
+    this.reserving = reserve(this.options.prefix, this.options.blockSize ?? 50)
+      .then(({ start, end }) => {
+        this.save([...this.load(), { next: start, end }]);
+      })
+      .catch((error) => {
+        // A backend without the endpoint will not grow one; stop asking
+        if (error?.response?.status === 404) this.unsupported = true;
+        else this.retryAfter = Date.now() + RESERVE_RETRY_MS;
+      })
+      .finally(() => {
+        this.reserving = null;
+      });
+    return this.reserving;
+  }
+
+  private get key() {
+    return BLOCKS_PREFIX + this.options.prefix;
+  }
+
+  private load(): SequenceBlock[] {
+    try {
+      return JSON.parse(this.storage?.getItem(this.key) || '[]');
+    } catch {
+      return [];
+    }
+  }
+
+  private save(blocks: SequenceBlock[]) {
+    this.storage?.setItem(this.key, JSON.stringify(blocks));
+  }
+
+  private take(): number | null {
+    // Re-read each time: another tab on the same till may have taken numbers
+    const blocks = this.load().filter((block) => block.next <= block.end);
+    if (!blocks.length) return null;
+    const sequence = blocks[0].next++;
+    this.save(blocks);
+    return sequence;
+  }
 }
 
-// Fiscalization placeholder: integrate with fiscal device or gateway
 export interface FiscalPayload {
   invoiceNumber: string;
   amount: number;
@@ -22,10 +129,350 @@ export interface FiscalizationResult {
   success: boolean;
   fiscalCode?: string;
   qrData?: string;
+  /** Why the gateway rejected the invoice, when `success` is false */
+  error?: string;
   raw?: any;
 }
 
+/** Submits invoices to the gateway; resolves one result per payload, in order. */
+export type FiscalSubmit = (payloads: FiscalPayload[]) => Promise<FiscalizationResult[]>;
+
+export type FiscalProgress = {
+  running: boolean;
+  /** Invoices waiting for the device (excludes rejected ones) */
+  pending: number;
+  inFlight: number;
+  rejected: number;
+  /** Invoices fiscalised since the page loaded */
+  fiscalized: number;
+  /** Pending has reached the high-water mark: the device is not keeping up */
+  backlogged: boolean;
+  /** Invoices per second over the current or last run */
+  throughput: number;
+  retryAt: number | null;
+};
+
+export type FiscalPipelineOptions = {
+  /** Invoices per gateway request (default 20) */
+  batchSize?: number;
+  /** Requests in flight (default 2) */
+  concurrency?: number;
+  /** Wait this long after an enqueue so a burst of sales goes out as one batch (default 250ms) */
+  lingerMs?: number;
+  /** Pending count at which progress reports `backlogged` (default 200) */
+  highWaterMark?: number;
+};
+
+const FISCAL_ENDPOINT = '/fiscal-receipts/';
+const FISCAL_DB = 'fronto-fiscal';
+const BASE_BACKOFF_MS = 5000;
+const MAX_BACKOFF_MS = 5 * 60 * 1000;
+// Fiscal codes kept for receipts that are still on screen
+const RESULTS_KEPT = 200;
+
+const isRetryable = (error: any) => {
+  const status = error?.response?.status;
+  return !status || status === 408 || status === 429 || status >= 500;
+};
+
+const errorText = (error: any) => JSON.stringify(error?.response?.data ?? error?.message ?? 'Rejected');
+
+const toReceipt = (payload: FiscalPayload) => ({
+  invoice_number: payload.invoiceNumber,
+  amount: payload.amount,
+  tax_amount: payload.taxAmount,
+  currency: payload.currency,
+  items: payload.items.map((item) => ({
+    description: item.description,
+    qty: item.qty,
+    unit_price: item.unitPrice,
+    tax_rate: item.taxRate,
+  })),
+});
+
+const fromReceipt = (data: any): FiscalizationResult => ({
+  success: true,
+  fiscalCode: data?.fiscal_code ?? data?.receipt_number,
+  qrData: data?.qr_data ?? data?.qr_code,
+  raw: data,
+});
+
+/** Fiscalise one invoice. The gateway answers a resubmitted invoice number with its first signature. */
 export async function sendToFiscalDevice(payload: FiscalPayload): Promise<FiscalizationResult> {
-  // TODO: integrate with device/service provider
-  return { success: true, fiscalCode: 'FISCAL-CODE-PLACEHOLDER', qrData: 'QR-PLACEHOLDER' };
-} 
\ No newline at end of file
+  const response = await api.post(FISCAL_ENDPOINT, toReceipt(payload), {
+    headers: { 'Idempotency-Key': `fiscal:${payload.invoiceNumber}` },
+  });
+  return fromReceipt(response.data);
+}
+
+// Set once the gateway has no bulk route; batches then go out one invoice per request
+let bulkUnsupported = false;
+
+/** Fiscalise several invoices in one `bulk/` request, or one request each where that route is missing. */
+export const sendBatchToFiscalDevice: FiscalSubmit = async (payloads) => {
+  if (payloads.length > 1 && !bulkUnsupported) {
+    try {
+      const response = await api.post<{ results: Array<{ index: number; errors?: unknown }> }>(`${FISCAL_ENDPOINT}bulk/`, {
+        items: payloads.map(toReceipt),
+      });
+      const results: FiscalizationResult[] = payloads.map(() => ({ success: false, error: 'No result from gateway' }));
+      for (const row of response.data.results || []) {
+        results[row.index] = row.errors ? { success: false, error: JSON.stringify(row.errors), raw: row } : fromReceipt(row);
+      }
+      return results;
+    } catch (error: any) {
+      const status = error?.response?.status;
+      if (status !== 404 && status !== 405) throw error;
+      bulkUnsupported = true;
+    }
+  }
+  return Promise.all(
+    payloads.map(async (payload) => {
+      try {
+        return await sendToFiscalDevice(payload);
+      } catch (error: any) {
+        if (isRetryable(error)) throw error;
+        return { success: false, error: errorText(error) };
+      }
+    })
+  );
+};
+
+/**
+ * Background fiscalisation: invoices are persisted on enqueue, so a sale
+ * completes without waiting on the device, and are submitted in batches
+ * with a bounded number of requests in flight. A device or network failure
+ * stops the run and retries with exponential backoff; an invoice the
+ * gateway rejects is kept for review and not retried automatically.
+ */
+export class FiscalPipeline {
+  private listeners = new Set<(progress: FiscalProgress) => void>();
+  private resultListeners = new Set<(invoiceNumber: string, result: FiscalizationResult) => void>();
+  private results = new Map<string, FiscalizationResult>();
+  private running: Promise<void> | null = null;
+  private timer: ReturnType<typeof setTimeout> | null = null;
+  private failures = 0;
+  private options: Required<FiscalPipelineOptions>;
+  private progress: FiscalProgress = {
+    running: false,
+    pending: 0,
+    inFlight: 0,
+    rejected: 0,
+    fiscalized: 0,
+    backlogged: false,
+    throughput: 0,
+    retryAt: null,
+  };
+
+  constructor(
+    private store: QueueStore,
+    private submit: FiscalSubmit = sendBatchToFiscalDevice,
+    options: FiscalPipelineOptions = {}
+  ) {
+    this.options = { batchSize: 20, concurrency: 2, lingerMs: 250, highWaterMark: 200, ...options };
+  }
+
+  /** Persist an invoice for fiscalisation and return without waiting on the device. */
+  async enqueue(payload: FiscalPayload): Promise<FiscalProgress> {
+    const item: QueueItem = {
+      id: payload.invoiceNumber,
+      endpoint: FISCAL_ENDPOINT,
+      method: 'post',
+      payload,
+      createdAt: new Date().toISOString(),
+      attempts: 0,
+    };
+    if (await this.store.add(item)) {
+      this.update({ pending: this.progress.pending + 1 });
+    }
+    this.schedule(this.options.lingerMs);
+    return this.progress;
+  }
+
+  /** Fiscal code for an invoice fiscalised by this page, if it is still known. */
+  resultFor(invoiceNumber: string) {
+    return this.results.get(invoiceNumber);
+  }
+
+  peekAll() {
+    return this.store.list();
+  }
+
+  getProgress() {
+    return this.progress;
+  }
+
+  subscribe(listener: (progress: FiscalProgress) => void) {
+    this.listeners.add(listener);
+    listener(this.progress);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /** Called as each invoice is fiscalised; returns an unsubscribe function. */
+  onResult(listener: (invoiceNumber: string, result: FiscalizationResult) => void) {
+    this.resultListeners.add(listener);
+    return () => {
+      this.resultListeners.delete(listener);
+    };
+  }
+
+  /** Queue rejected invoices again (e.g. after fixing the device configuration). */
+  async retryRejected() {
+    const rejected = (await this.store.list()).filter((item) => item.failedAt);
+    await Promise.all(rejected.map((item) => this.store.put({ ...item, failedAt: undefined })));
+    return this.drain();
+  }
+
+  /** Submit everything pending now; concurrent calls share a run. */
+  drain() {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (!this.running) {
+      this.running = this.run().finally(() => {
+        this.running = null;
+        // Invoices enqueued while the run was finishing
+        if (this.progress.pending > 0) this.schedule(this.options.lingerMs);
+      });
+    }
+    return this.running;
+  }
+
+  private schedule(delay: number) {
+    // A run in progress picks up new invoices; a pending backoff is left alone
+    if (this.running || this.timer) return;
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.drain().catch((error) => console.error('Fiscalisation failed:', error));
+    }, delay);
+  }
+
+  private async run() {
+    const { batchSize, concurrency } = this.options;
+    const startedAt = Date.now();
+    let sent = 0;
+    let interrupted = false;
+    this.update({ running: true, throughput: 0, retryAt: null });
+
+    const submitBatch = async (batch: QueueItem[]) => {
+      this.update({ inFlight: this.progress.inFlight + batch.length });
+      try {
+        const results = await this.submit(batch.map((item) => item.payload));
+        await Promise.all(
+          batch.map(async (item, i) => {
+            const result = results[i];
+            if (result?.success) {
+              await this.store.delete(item.id);
+              sent += 1;
+              this.settle(item.id, result);
+            } else {
+              await this.store.put({
+                ...item,
+                attempts: item.attempts + 1,
+                failedAt: new Date().toISOString(),
+                lastError: result?.error || 'Rejected',
+              });
+            }
+          })
+        );
+      } catch (error: any) {
+        const retryable = isRetryable(error);
+        interrupted ||= retryable;
+        await Promise.all(
+          batch.map((item) =>
+            this.store.put({
+              ...item,
+              attempts: item.attempts + 1,
+              failedAt: retryable ? undefined : new Date().toISOString(),
+              lastError: errorText(error),
+            })
+          )
+        );
+      } finally {
+        const seconds = (Date.now() - startedAt) / 1000;
+        this.update({
+          inFlight: this.progress.inFlight - batch.length,
+          throughput: seconds > 0 ? sent / seconds : sent,
+        });
+      }
+    };
+
+    try {
+      while (!interrupted) {
+        const ready = (await this.store.list())
+          .filter((item) => !item.failedAt)
+          .slice(0, batchSize * concurrency);
+        if (!ready.length) break;
+        const batches: QueueItem[][] = [];
+        for (let i = 0; i < ready.length; i += batchSize) batches.push(ready.slice(i, i + batchSize));
+        await Promise.all(batches.map(submitBatch));
+        await this.refreshCounts();
+      }
+    } finally {
+      await this.refreshCounts().catch(() => undefined);
+      this.failures = interrupted ? this.failures + 1 : 0;
+      this.update({ running: false, retryAt: interrupted ? this.scheduleRetry() : null });
+    }
+  }
+
+  private scheduleRetry() {
+    const delay = Math.min(MAX_BACKOFF_MS, BASE_BACKOFF_MS * 2 ** (this.failures - 1));
+    const wait = delay / 2 + Math.random() * (delay / 2);
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.drain().catch((error) => console.error('Fiscalisation failed:', error));
+    }, wait);
+    return Date.now() + wait;
+  }
+
+  private settle(invoiceNumber: string, result: FiscalizationResult) {
+    this.results.set(invoiceNumber, result);
+    if (this.results.size > RESULTS_KEPT) {
+      this.results.delete(this.results.keys().next().value as string);
+    }
+    this.progress = { ...this.progress, fiscalized: this.progress.fiscalized + 1 };
+    this.resultListeners.forEach((listener) => listener(invoiceNumber, result));
+  }
+
+  private async refreshCounts() {
+    const items = await this.store.list();
+    const rejected = items.filter((item) => item.failedAt).length;
+    this.update({ pending: items.length - rejected, rejected });
+  }
+
+  private update(patch: Partial<FiscalProgress>) {
+    const progress = { ...this.progress, ...patch };
+    progress.backlogged = progress.pending >= this.options.highWaterMark;
+    this.progress = progress;
+    this.listeners.forEach((listener) => listener(this.progress));
+  }
+}
+
+export const fiscalPipeline = new FiscalPipeline(
+  typeof indexedDB === 'undefined' ? new MemoryQueueStore() : new IndexedDbQueueStore(FISCAL_DB)
+);
+
+/** Sale numbers for the POS, reserved from the server in blocks. */
+export const saleNumbers = new InvoiceNumberBlocks({ prefix: 'SALE-', pad: 8 });
+
+let started = false;
+
+/** Submit invoices left over from a previous session, and again whenever the browser comes back online. */
+export const startFiscalSync = () => {
+  if (started || typeof window === 'undefined') return;
+  started = true;
+  const drain = () => {
+    fiscalPipeline.drain().catch((error) => console.error('Fiscalisation failed:', error));
+  };
+  // A sale made offline carries its fiscal payload and is fiscalised only once
+  // the replayed sale is on the server; a sale the server rejects never is
+  offlineQueue.onSent(async (item, response: any) => {
+    const payload = item.meta?.fiscalPayload as FiscalPayload | undefined;
+    if (payload && !response?.data?.fiscal_receipt_number) await fiscalPipeline.enqueue(payload);
+  });
+  window.addEventListener('online', drain);
+  drain();
+};
@@ -0,0 +1,31 @@
+import { lazy } from 'react';
+import type { ComponentType, LazyExoticComponent } from 'react';
+
+type PageModule<T> = { default: T };
+
+export type LazyPage<T extends ComponentType<any> = ComponentType<any>> = LazyExoticComponent<T> & {
+  preload: () => Promise<PageModule<T>>;
+};
+
+/**
+ * React.lazy wrapper whose chunk can also be fetched ahead of rendering,
+ * e.g. when a navigation link is hovered. A failed load is not cached so the
+ * next attempt (hover or navigation) retries the request.
+ */
+export function lazyPage<T extends ComponentType<any>>(loader: () => Promise<PageModule<T>>): LazyPage<T> {
+  let pending: Promise<PageModule<T>> | undefined;
+
+  const preload = () => {
+    if (!pending) {
+      pending = loader().catch((error) => {
+        pending = undefined;
+        throw error;
+      });
+    }
+    return pending;
+  };
+
+  const page = lazy(preload) as LazyPage<T>;
+  page.preload = preload;
+  return page;
+}
@@ -0,0 +1,78 @@
+// Helpers for large client-side tables (search index, typed sorting).
+
+export type SortDirection = 'asc' | 'desc';
+
+const collator = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
+const NUMERIC = /^[-+]?(\d+\.?\d*|\.\d+)(e[-+]?\d+)?$/i;
+const ISO_DATE = /^\d{4}-\d{2}-\d{2}([T ][\d:.]+(Z|[+-]\d{2}:?\d{2})?)?$/;
+
+/**
+ * One lowercase string per row covering every field, built once per data
+ * change so a search keystroke is a single `includes` per row instead of
+ * stringifying every value again. Fields are separated by a NUL character
+ * so a term cannot match across two fields.
+ */
+export function buildSearchIndex<T extends object>(rows: T[]): string[] {
+  return rows.map((row) =>
+    Object.values(row)
+      .map((value) => String(value).toLowerCase())
+      .join('\u0000')
+  );
+}
+
+export function searchRows<T>(rows: T[], index: string[], term: string): T[] {
+  const needle = term.trim().toLowerCase();
+  if (!needle) return rows;
+  const result: T[] = [];
+  for (let i = 0; i < rows.length; i += 1) {
+    if (index[i].includes(needle)) result.push(rows[i]);
+  }
+  return result;
+}
+
+type SortKey = number | string | null;
+
+/** Normalise a cell to something cheap to compare: numbers for numeric and date-like values. */
+export function toSortKey(value: unknown): SortKey {
+  if (value === null || value === undefined || value === '') return null;
+  if (typeof value === 'number') return Number.isNaN(value) ? null : value;
+  if (typeof value === 'boolean') return value ? 1 : 0;
+  if (value instanceof Date) return value.getTime();
+  const text = String(value).trim();
+  if (NUMERIC.test(text)) return Number(text);
+  if (ISO_DATE.test(text)) {
+    const time = Date.parse(text);
+    if (!Number.isNaN(time)) return time;
+  }
+  return text;
+}
+
+export function compareSortKeys(a: SortKey, b: SortKey): number {
+  if (a === b) return 0;
+  // Empty values always sort last
+  if (a === null) return 1;
+  if (b === null) return -1;
+  if (typeof a === 'number' && typeof b === 'number') return a - b;
+  if (typeof a === 'number') return -1;
+  if (typeof b === 'number') return 1;
+  return collator.compare(a, b);
+}
+
+/**
+ * Stable sort that computes each row's key once (decorate-sort-undecorate)
+ * rather than inside the comparator.
+ */
+export function sortRows<T>(rows: T[], key: keyof T, direction: SortDirection): T[] {
+  const keys = rows.map((row) => toSortKey(row[key]));
+  const order = rows.map((_, i) => i);
+  const sign = direction === 'asc' ? 1 : -1;
+  order.sort((i, j) => {
+    const a = keys[i];
+    const b = keys[j];
+    if (a === null || b === null) {
+      return compareSortKeys(a, b) || i - j;
+    }
+    return sign * compareSortKeys(a, b) || i - j;
+  });
+  return order.map((i) => rows[i]);
+}
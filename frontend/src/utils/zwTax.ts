@@ -93,4 +93,162 @@ export function computeZwPayrollDeductions(
     totalDeductions,
     taxableIncomeMonthly: grossMonthly,
   };
-} 
\ No newline at end of file
+} 
+// Batch engine for month-end runs. The band list is compiled once into
+// cumulative thresholds so each employee is a binary search plus one
+// multiply-add, and inputs/outputs are typed arrays that can be handed to a
+// worker without copying.
+
+export interface CompiledZwTaxTable {
+  /** Annual lower bound of each band, ascending */
+  lower: Float64Array;
+  /** Annual tax due on income up to `lower[i]` */
+  base: Float64Array;
+  rate: Float64Array;
+  annualTaxCredit: number;
+  aidsLevyRate: number;
+  nssaRate: number;
+  nssaMonthlyCap: number;
+}
+
+export interface ZwPayrollBatch {
+  paye: Float64Array;
+  aidsLevy: Float64Array;
+  nssa: Float64Array;
+  totalDeductions: Float64Array;
+  totals: { gross: number; paye: number; aidsLevy: number; nssa: number; totalDeductions: number };
+}
+
+// Workforce size above which runZwPayrollBatch moves the work to a worker
+export const PAYROLL_WORKER_THRESHOLD = 5000;
+
+const compiledTables = new WeakMap<ZwTaxConfig, CompiledZwTaxTable>();
+
+export function compileZwTaxTable(config: ZwTaxConfig = defaultZwTaxConfig): CompiledZwTaxTable {
+  const cached = compiledTables.get(config);
+  if (cached) return cached;
+
+  const lower: number[] = [];
+  const base: number[] = [];
+  const rate: number[] = [];
+  let from = 0;
+  let due = 0;
+  let capped = true;
+  for (const band of config.annualBands) {
+    lower.push(from);
+    base.push(due);
+    rate.push(band.rate);
+    if (band.upTo == null) {
+      capped = false;
+      break;
+    }
+    // Same as computeMonthlyPAYE: a band ending below its start taxes nothing
+    due += Math.max(0, band.upTo - from) * band.rate;
+    from = band.upTo;
+  }
+  if (capped) {
+    // computeMonthlyPAYE leaves income above the last finite band untaxed
+    lower.push(from);
+    base.push(due);
+    rate.push(0);
+  }
+
+  const table: CompiledZwTaxTable = {
+    lower: Float64Array.from(lower),
+    base: Float64Array.from(base),
+    rate: Float64Array.from(rate),
+    annualTaxCredit: config.annualTaxCredit,
+    aidsLevyRate: config.aidsLevyRate,
+    nssaRate: config.nssaRate,
+    nssaMonthlyCap: config.nssaMonthlyCap,
+  };
+  compiledTables.set(config, table);
+  return table;
+}
+
+/** PAYE, AIDS levy and NSSA for every entry of `grossMonthly` in one pass. */
+export function computeZwPayrollBatch(
+  grossMonthly: ArrayLike<number>,
+  config: ZwTaxConfig | CompiledZwTaxTable = defaultZwTaxConfig
+): ZwPayrollBatch {
+  const table = 'lower' in config ? config : compileZwTaxTable(config);
+  const { lower, base, rate, annualTaxCredit, aidsLevyRate, nssaRate, nssaMonthlyCap } = table;
+  const count = grossMonthly.length;
+  const paye = new Float64Array(count);
+  const aidsLevy = new Float64Array(count);
+  const nssa = new Float64Array(count);
+  const totalDeductions = new Float64Array(count);
+  const totals = { gross: 0, paye: 0, aidsLevy: 0, nssa: 0, totalDeductions: 0 };
+
+  for (let i = 0; i < count; i += 1) {
+    const gross = grossMonthly[i];
+    const annual = gross * 12;
+    let taxAnnual = 0;
+    if (annual > lower[0]) {
+      // Last band whose lower bound is below the annual income
+      let lo = 0;
+      let hi = lower.length - 1;
+      while (lo < hi) {
+        const mid = (lo + hi + 1) >>> 1;
+        if (lower[mid] < annual) lo = mid;
+        else hi = mid - 1;
+      }
+      taxAnnual = base[lo] + (annual - lower[lo]) * rate[lo];
+    }
+    const monthlyPaye = Math.max(0, taxAnnual - annualTaxCredit) / 12;
+    const levy = monthlyPaye * aidsLevyRate;
+    const pension = Math.min(gross, nssaMonthlyCap) * nssaRate;
+    const total = monthlyPaye + levy + pension;
+
+    paye[i] = monthlyPaye;
+    aidsLevy[i] = levy;
+    nssa[i] = pension;
+    totalDeductions[i] = total;
+    totals.gross += gross;
+    totals.paye += monthlyPaye;
+    totals.aidsLevy += levy;
+    totals.nssa += pension;
+    totals.totalDeductions += total;
+  }
+  return { paye, aidsLevy, nssa, totalDeductions, totals };
+}
+
+/**
+ * computeZwPayrollBatch, on a worker for large workforces so the page stays
+ * responsive. `grossMonthly` is copied before being sent, so the caller's
+ * array stays usable.
+ */
+export function runZwPayrollBatch(
+  grossMonthly: Float64Array,
+  options: { config?: ZwTaxConfig; signal?: AbortSignal; useWorker?: boolean } = {}
+): Promise<ZwPayrollBatch> {
+  const config = options.config || defaultZwTaxConfig;
+  const useWorker =
+    options.useWorker ?? (typeof Worker !== 'undefined' && grossMonthly.length >= PAYROLL_WORKER_THRESHOLD);
+  if (!useWorker) return Promise.resolve(computeZwPayrollBatch(grossMonthly, config));
+
+  return new Promise((resolve, reject) => {
+    const worker = new Worker(new URL('../workers/payrollWorker.ts', import.meta.url), { type: 'module' });
+    const finish = () => {
+      options.signal?.removeEventListener('abort', onAbort);
+      worker.terminate();
+    };
+    const onAbort = () => {
+      finish();
+      reject(new DOMException('Payroll run cancelled', 'AbortError'));
+    };
+    if (options.signal?.aborted) return onAbort();
+    options.signal?.addEventListener('abort', onAbort);
+
+    worker.onmessage = (event: MessageEvent<ZwPayrollBatch>) => {
+      finish();
+      resolve(event.data);
+    };
+    worker.onerror = (event) => {
+      finish();
+      reject(event.error || new Error(event.message));
+    };
+    const gross = grossMonthly.slice();
+    worker.postMessage({ gross, table: compileZwTaxTable(config) }, [gross.buffer]);
+  });
+}
@@ -0,0 +1,22 @@
+import { aggregateColumns, columnBuffers, parseColumnsPage, resultBuffers } from '../utils/aggregate';
+import type { AggregateColumns, AggregateRequest, ColumnFields } from '../utils/aggregate';
+
+type AggregateJob =
+  | { id: number; columns: AggregateColumns; request: AggregateRequest }
+  | { id: number; text: string; fields: ColumnFields };
+
+// One job at a time per worker; result columns are transferred back.
+self.onmessage = (event: MessageEvent<AggregateJob>) => {
+  const job = event.data;
+  try {
+    if ('text' in job) {
+      const page = parseColumnsPage(job.text, job.fields);
+      (self as unknown as Worker).postMessage({ id: job.id, result: page }, columnBuffers(page.columns));
+    } else {
+      const result = aggregateColumns(job.columns, job.request);
+      (self as unknown as Worker).postMessage({ id: job.id, result }, resultBuffers(result));
+    }
+  } catch (error) {
+    (self as unknown as Worker).postMessage({ id: job.id, error: (error as Error)?.message || String(error) });
+  }
+};
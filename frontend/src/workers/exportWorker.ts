@@ -0,0 +1,18 @@
+import { encodeRows } from '../utils/exportStream';
+import type { ExportColumn, ExportFormat, ExportRow } from '../utils/exportStream';
+
+type ExportJob = {
+  rows: ExportRow[];
+  columns: ExportColumn[];
+  format: ExportFormat;
+  chunkSize: number;
+};
+
+// Encodes an export off the main thread; each chunk's buffer is transferred, not copied.
+self.onmessage = (event: MessageEvent<ExportJob>) => {
+  const { rows, columns, format, chunkSize } = event.data;
+  for (const chunk of encodeRows(format, rows, columns, chunkSize)) {
+    (self as unknown as Worker).postMessage({ type: 'chunk', data: chunk.data, rows: chunk.rows }, [chunk.data.buffer]);
+  }
+  (self as unknown as Worker).postMessage({ type: 'done' });
+};
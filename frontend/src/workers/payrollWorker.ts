@@ -0,0 +1,18 @@
+import { computeZwPayrollBatch } from '../utils/zwTax';
+import type { CompiledZwTaxTable } from '../utils/zwTax';
+
+type PayrollJob = {
+  gross: Float64Array;
+  table: CompiledZwTaxTable;
+};
+
+// Runs a batch payroll off the main thread; the output columns are transferred back.
+self.onmessage = (event: MessageEvent<PayrollJob>) => {
+  const result = computeZwPayrollBatch(event.data.gross, event.data.table);
+  (self as unknown as Worker).postMessage(result, [
+    result.paye.buffer,
+    result.aidsLevy.buffer,
+    result.nssa.buffer,
+    result.totalDeductions.buffer,
+  ]);
+};
@@ -1,74 +0,0 @@
-#!/usr/bin/env python3
-import requests
-import time
-
-def test_auth_pages_update():
-    print("🧪 Testing Updated Authentication Pages...")
-    
-    # Test 1: Check if frontend is serving
-    try:
-        response = requests.get("http://localhost:5173", timeout=5)
-        if response.status_code == 200:
-            print("✅ Frontend server is running")
-        else:
-            print(f"⚠️  Frontend server returned status: {response.status_code}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Frontend server not running on port 5173")
-        return False
-    except Exception as e:
-        print(f"❌ Error connecting to frontend: {e}")
-        return False
-    
-    # Test 2: Check Login page
-    try:
-        response = requests.get("http://localhost:5173/src/pages/Login.tsx", timeout=5)
-        if response.status_code == 200:
-            print("✅ Login page is accessible")
-            # Check for key elements in the updated design
-            if "backdrop-blur-md bg-white/70" in response.text:
-                print("✅ Login page has modern glassmorphism design")
-            if "backgroundImage" in response.text:
-                print("✅ Login page has background image")
-            if "FaUser" in response.text and "FaLock" in response.text:
-                print("✅ Login page has proper icons")
-            if "Finance Plus" in response.text:
-                print("✅ Login page has consistent branding")
-        else:
-            print(f"⚠️  Login page status: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Login page test failed: {e}")
-    
-    # Test 3: Check Signup page
-    try:
-        response = requests.get("http://localhost:5173/src/pages/Signup.tsx", timeout=5)
-        if response.status_code == 200:
-            print("✅ Signup page is accessible")
-            # Check for key elements in the updated design
-            if "backdrop-blur-md bg-white/70" in response.text:
-                print("✅ Signup page has modern glassmorphism design")
-            if "backgroundImage" in response.text:
-                print("✅ Signup page has background image")
-            if "FaUser" in response.text and "FaEnvelope" in response.text:
-                print("✅ Signup page has proper icons")
-            if "Finance Plus" in response.text:
-                print("✅ Signup page has consistent branding")
-        else:
-            print(f"⚠️  Signup page status: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Signup page test failed: {e}")
-    
-    print("\n🎉 Authentication Pages Update Complete!")
-    print("📝 Updated features:")
-    print("   ✅ Centered form layout with glassmorphism design")
-    print("   ✅ Professional background image")
-    print("   ✅ Consistent branding with Finance Plus logo")
-    print("   ✅ Modern input fields with icons")
-    print("   ✅ Navigation buttons (Register, Tools & Calculators, ATM & Branch)")
-    print("   ✅ Responsive design for all screen sizes")
-    print("\n🔧 Both Login and Signup pages now match the professional banking interface design!")
-    print("🎯 Ready for testing in the browser at http://localhost:5173")
-    
-    return True
-
-if __name__ == "__main__":
-    test_auth_pages_update()
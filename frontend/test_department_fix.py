@@ -1,55 +0,0 @@
-#!/usr/bin/env python3
-import requests
-import json
-
-def test_department_api():
-    base_url = "http://localhost:8000/api"
-    
-    print("🧪 Testing Department API Fixes...")
-    
-    # Test 1: Check if departments endpoint exists
-    try:
-        response = requests.get(f"{base_url}/departments/")
-        print(f"✅ GET /departments/ - Status: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"   Response: {len(data)} departments found")
-        elif response.status_code == 401:
-            print("   ✅ Endpoint exists (authentication required)")
-        else:
-            print(f"   ⚠️  Unexpected status: {response.text[:100]}")
-            
-    except requests.exceptions.ConnectionError:
-        print("❌ Backend server not running on port 8000")
-        return False
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
-    
-    # Test 2: Check if project management endpoints exist
-    endpoints = [
-        "/projects/",
-        "/project-tasks/", 
-        "/project-timesheets/",
-        "/customers/"
-    ]
-    
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"{base_url}{endpoint}")
-            if response.status_code in [200, 401, 403]:
-                print(f"✅ {endpoint} - Status: {response.status_code}")
-            else:
-                print(f"⚠️  {endpoint} - Status: {response.status_code}")
-        except Exception as e:
-            print(f"❌ {endpoint} - Error: {e}")
-    
-    print("\n🎉 Department API fixes appear to be working!")
-    print("📝 The 500 error should now be resolved.")
-    print("🔧 Next: Test department creation in the frontend.")
-    
-    return True
-
-if __name__ == "__main__":
-    test_department_api()
@@ -1,57 +0,0 @@
-#!/usr/bin/env python3
-import requests
-import time
-
-def test_settransactions_fix():
-    print("🧪 Testing setTransactions Import Fix...")
-    
-    # Test 1: Check if frontend is serving
-    try:
-        response = requests.get("http://localhost:5173", timeout=5)
-        if response.status_code == 200:
-            print("✅ Frontend server is running")
-        else:
-            print(f"⚠️  Frontend server returned status: {response.status_code}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Frontend server not running on port 5173")
-        return False
-    except Exception as e:
-        print(f"❌ Error connecting to frontend: {e}")
-        return False
-    
-    # Test 2: Check if transactionSlice with setTransactions is accessible
-    try:
-        response = requests.get("http://localhost:5173/src/store/slices/transactionSlice.ts", timeout=5)
-        if response.status_code == 200:
-            print("✅ TransactionSlice is accessible")
-            # Check if setTransactions is in the response
-            if "setTransactions" in response.text:
-                print("✅ setTransactions export found in transactionSlice")
-            else:
-                print("⚠️  setTransactions export not found in transactionSlice")
-        else:
-            print(f"⚠️  TransactionSlice status: {response.status_code}")
-    except Exception as e:
-        print(f"❌ TransactionSlice test failed: {e}")
-    
-    # Test 3: Check Transactions.tsx
-    try:
-        response = requests.get("http://localhost:5173/src/pages/Transactions.tsx", timeout=5)
-        if response.status_code == 200:
-            print("✅ Transactions page is accessible")
-        else:
-            print(f"⚠️  Transactions page status: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Transactions page test failed: {e}")
-    
-    print("\n🎉 setTransactions import fix completed!")
-    print("📝 Fixed issues:")
-    print("   ✅ Added setTransactions action to transactionSlice")
-    print("   ✅ Exported setTransactions from transactionSlice")
-    print("   ✅ Resolved import error in Transactions.tsx")
-    print("\n🔧 The Transactions page should now load without import errors!")
-    
-    return True
-
-if __name__ == "__main__":
-    test_settransactions_fix()
@@ -0,0 +1 @@
+"""Developer tooling for the Finance Plus frontend (smoke checks, probes)."""
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Latency benchmark for modules served by the Vite dev server.
+
+Every module is requested ``--runs`` times in two phases:
+
+* ``cold``: a new connection per request and a unique ``?bench=`` query, so
+  Vite treats the URL as a module it has not seen and transforms it again;
+* ``warm``: repeated requests for the plain URL over a kept-alive connection
+  after one warm-up request, i.e. served from Vite's transform cache.
+
+Time-to-first-byte and total transfer time are summarised as p50/p95/p99
+and written to JSON and/or CSV so two runs can be compared:
+
+    python -m tools.bench --runs 20 --out before.json
+    python -m tools.bench --runs 20 --out after.json
+    python -m tools.bench --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .httpclient import DEFAULT_TIMEOUT, HttpClient, ProtocolError
+from .probes import FRONTEND_URL, build_manifest
+
+FRONTEND_ROOT = Path(__file__).resolve().parent.parent
+PERCENTILES = (50, 95, 99)
+PHASES = ("cold", "warm")
+# A failed sample: transport errors, a dropped connection (asyncio.IncompleteReadError
+# is an EOFError), a malformed response, a timeout, or a non-200 from _sample
+SAMPLE_ERRORS = (OSError, EOFError, ProtocolError, asyncio.TimeoutError, RuntimeError)
+CSV_FIELDS = [
+    "module", "phase", "samples", "errors", "bytes",
+    *(f"ttfb_p{p}_ms" for p in PERCENTILES),
+    *(f"total_p{p}_ms" for p in PERCENTILES),
+]
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of ``values`` (``pct`` in 0-100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarise(module, phase, samples, errors):
+    row = {
+        "module": module,
+        "phase": phase,
+        "samples": len(samples),
+        "errors": errors,
+        "bytes": samples[-1][2] if samples else 0,
+    }
+    for key, index in (("ttfb", 0), ("total", 1)):
+        values = [s[index] * 1000 for s in samples]
+        for p in PERCENTILES:
+            value = percentile(values, p)
+            row[f"{key}_p{p}_ms"] = round(value, 3) if value is not None else None
+    return row
+
+
+def default_modules():
+    return [p.path for p in build_manifest(targets=["frontend"])
+            if p.path.startswith("/src/")]
+
+
+async def _sample(client, url, headers=None):
+    response = await client.get(url, headers=headers)
+    if response.status != 200:
+        raise RuntimeError(f"HTTP {response.status}")
+    return response.ttfb, response.elapsed, len(response.body)
+
+
+async def bench_module(client, base_url, module, runs, run_id):
+    url = base_url.rstrip("/") + module
+    rows = []
+
+    samples, errors = [], 0
+    for i in range(runs):
+        sep = "&" if "?" in url else "?"
+        try:
+            samples.append(await _sample(
+                client, f"{url}{sep}bench={run_id}-{i}", headers={"Connection": "close"}
+            ))
+        except SAMPLE_ERRORS:
+            errors += 1
+    rows.append(summarise(module, "cold", samples, errors))
+
+    samples, errors = [], 0
+    try:
+        await _sample(client, url)
+    except SAMPLE_ERRORS:
+        pass
+    for _ in range(runs):
+        try:
+            samples.append(await _sample(client, url))
+        except SAMPLE_ERRORS:
+            errors += 1
+    rows.append(summarise(module, "warm", samples, errors))
+    return rows
+
+
+async def run_bench(modules, base_url=FRONTEND_URL, runs=10, concurrency=1, timeout=DEFAULT_TIMEOUT):
+    run_id = format(int(time.time() * 1000), "x")
+    async with HttpClient(concurrency=concurrency, timeout=timeout) as client:
+        per_module = await asyncio.gather(
+            *(bench_module(client, base_url, m, runs, run_id) for m in modules)
+        )
+    return [row for rows in per_module for row in rows]
+
+
+def run_metadata(base_url, runs, concurrency):
+    meta = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "frontend_url": base_url,
+        "runs": runs,
+        "concurrency": concurrency,
+    }
+    config = FRONTEND_ROOT / "vite.config.ts"
+    if config.exists():
+        meta["vite_config_sha256"] = hashlib.sha256(config.read_bytes()).hexdigest()[:12]
+    try:
+        meta["git_rev"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=FRONTEND_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return meta
+
+
+def write_results(path, meta, rows):
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with path.open("w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        path.write_text(json.dumps({"meta": meta, "results": rows}, indent=2) + "\n")
+
+
+def load_results(path):
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="") as fh:
+            rows = list(csv.DictReader(fh))
+        for row in rows:
+            for key in CSV_FIELDS[2:]:
+                row[key] = float(row[key]) if row[key] not in ("", None) else None
+        return rows
+    return json.loads(path.read_text())["results"]
+
+
+def print_table(rows):
+    print(f"{'module':<48} {'phase':<5} {'ttfb p50/p95/p99 ms':>24} {'total p50/p95/p99 ms':>24} {'err':>4}")
+    for row in rows:
+        ttfb = "/".join(_fmt(row[f"ttfb_p{p}_ms"]) for p in PERCENTILES)
+        total = "/".join(_fmt(row[f"total_p{p}_ms"]) for p in PERCENTILES)
+        print(f"{row['module']:<48} {row['phase']:<5} {ttfb:>24} {total:>24} {row['errors']:>4}")
+
+
+def compare(before_rows, after_rows, metric="total_p95_ms", threshold=10.0):
+    """Print per-module deltas; return the rows that regressed past ``threshold`` %."""
+    before = {(r["module"], r["phase"]): r for r in before_rows}
+    regressions = []
+    print(f"{'module':<48} {'phase':<5} {'before':>9} {'after':>9} {'delta':>8}")
+    for row in after_rows:
+        old = before.get((row["module"], row["phase"]))
+        if not old or not old.get(metric) or row.get(metric) is None:
+            continue
+        delta = (row[metric] - old[metric]) / old[metric] * 100
+        flag = ""
+        if delta > threshold:
+            flag = " ⚠️"
+            regressions.append(row)
+        print(f"{row['module']:<48} {row['phase']:<5} {old[metric]:>9.2f} {row[metric]:>9.2f} {delta:>+7.1f}%{flag}")
+    return regressions
+
+
+def _fmt(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frontend-url", default=FRONTEND_URL)
+    parser.add_argument("--module", action="append", dest="modules",
+                        help="Module path to benchmark, e.g. /src/App.tsx (repeatable; "
+                             "defaults to every module in the smoke manifest)")
+    parser.add_argument("--runs", type=int, default=10, help="Requests per module and phase")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Modules benchmarked in parallel (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--out", action="append", default=[],
+                        help="Write results to this .json or .csv file (repeatable)")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="Compare two result files instead of running a benchmark")
+    parser.add_argument("--metric", default="total_p95_ms", choices=CSV_FIELDS[5:])
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Regression threshold in percent for --compare (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        regressions = compare(load_results(args.compare[0]), load_results(args.compare[1]),
+                              args.metric, args.threshold)
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:g}% on {args.metric}")
+        return 1 if regressions else 0
+
+    modules = ["/" + m.lstrip("/") for m in (args.modules or default_modules())]
+    print(f"⏱️  Benchmarking {len(modules)} module(s), {args.runs} run(s) per phase...\n")
+    rows = asyncio.run(run_bench(modules, args.frontend_url, args.runs, args.concurrency, args.timeout))
+    print_table(rows)
+    meta = run_metadata(args.frontend_url, args.runs, args.concurrency)
+    for out in args.out:
+        write_results(out, meta, rows)
+        print(f"\n📝 Results written to {out}")
+    return 1 if any(row["errors"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Regression gate for the vitest render benchmarks.
+
+``npm run bench`` writes ``bench-results.json`` (the json benchmark reporter
+configured in ``vitest.config.ts``). This compares each benchmark's mean
+time with ``bench-baseline.json`` and fails when one got slower than the
+baseline by more than ``threshold_pct`` (and by more than ``min_delta_ms``,
+so sub-millisecond jitter does not trip it):
+
+    npm run bench
+    python -m tools.benchcheck            # fail on regressions
+    python -m tools.benchcheck --update   # record this run as the baseline
+
+Timings depend on the machine, so record the baseline where the check runs.
+An empty baseline, or a benchmark missing from it, fails the check: an
+unrecorded benchmark would otherwise pass whatever it measures. Pass
+``--allow-new`` while a new benchmark's baseline is being recorded.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+FRONTEND_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_FILE = FRONTEND_ROOT / "bench-results.json"
+BASELINE_FILE = FRONTEND_ROOT / "bench-baseline.json"
+DEFAULT_THRESHOLD_PCT = 25.0
+DEFAULT_MIN_DELTA_MS = 1.0
+
+
+def collect(results):
+    """``{"<suite> > <benchmark>": mean_ms}`` from a vitest benchmark report.
+
+    Walks the JSON instead of assuming one layout: the vitest 1.x json
+    reporter keys result lists by suite name, ``--outputJson`` (2.x) nests
+    them under ``files[].groups[]`` with a ``fullName``.
+    """
+    means = {}
+
+    def walk(node, group):
+        if isinstance(node, dict):
+            if "name" in node and isinstance(node.get("mean"), (int, float)):
+                means[f"{group} > {node['name']}" if group else node["name"]] = float(node["mean"])
+                return
+            for key, value in node.items():
+                child_group = node.get("fullName") or (key if isinstance(value, list) else group)
+                walk(value, child_group)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item, group)
+
+    walk(results, "")
+    return means
+
+
+def compare(means, baseline, allow_new=False):
+    """Rows of ``(name, baseline_ms, current_ms, status)`` plus the failures."""
+    threshold = baseline.get("threshold_pct", DEFAULT_THRESHOLD_PCT)
+    min_delta = baseline.get("min_delta_ms", DEFAULT_MIN_DELTA_MS)
+    recorded = baseline.get("benchmarks", {})
+    rows, failures = [], []
+    for name, current in sorted(means.items()):
+        before = recorded.get(name)
+        if before is None:
+            rows.append((name, None, current, "new"))
+            if not allow_new:
+                failures.append(f"{name}: no baseline recorded")
+            continue
+        limit = before * (1 + threshold / 100)
+        if current > limit and current - before > min_delta:
+            rows.append((name, before, current, "slower"))
+            failures.append(f"{name}: {current:.2f} ms > {before:.2f} ms +{threshold:g}%")
+        else:
+            rows.append((name, before, current, "ok"))
+    for name in sorted(set(recorded) - set(means)):
+        rows.append((name, recorded[name], None, "not run"))
+    return rows, failures
+
+
+def updated_baseline(means, baseline):
+    new = dict(baseline)
+    new.setdefault("threshold_pct", DEFAULT_THRESHOLD_PCT)
+    new.setdefault("min_delta_ms", DEFAULT_MIN_DELTA_MS)
+    new["benchmarks"] = {**baseline.get("benchmarks", {}), **{name: round(mean, 3) for name, mean in means.items()}}
+    return new
+
+
+def print_report(rows):
+    width = max([len(row[0]) for row in rows] + [20])
+
+    def fmt(ms):
+        return f"{ms:>11.2f}" if ms is not None else f"{'-':>11}"
+
+    print(f"{'':<{width}} {'baseline ms':>11} {'mean ms':>11} {'change':>8}")
+    for name, before, current, status in rows:
+        change = f"{(current - before) / before * 100:>+7.1f}%" if before and current is not None else f"{'':>8}"
+        note = "" if status == "ok" else f"  ({status})"
+        print(f"{name:<{width}} {fmt(before)} {fmt(current)} {change}{note}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", default=str(RESULTS_FILE))
+    parser.add_argument("--baseline", default=str(BASELINE_FILE))
+    parser.add_argument("--update", action="store_true",
+                        help="Record this run's means in the baseline instead of checking them")
+    parser.add_argument("--allow-new", action="store_true",
+                        help="Do not fail on benchmarks that have no baseline yet")
+    args = parser.parse_args(argv)
+
+    try:
+        means = collect(json.loads(Path(args.results).read_text()))
+    except FileNotFoundError:
+        print(f"❌ No benchmark results at {args.results}; run `npm run bench` first")
+        return 2
+    if not means:
+        print(f"❌ No benchmarks found in {args.results}")
+        return 2
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+
+    if args.update:
+        baseline_path.write_text(json.dumps(updated_baseline(means, baseline), indent=2) + "\n")
+        print(f"📝 Baseline for {len(means)} benchmark(s) written to {baseline_path}")
+        return 0
+
+    if not baseline.get("benchmarks"):
+        print(f"❌ No baseline recorded in {baseline_path}; run `python -m tools.benchcheck --update` on this machine")
+        return 2
+
+    rows, failures = compare(means, baseline, allow_new=args.allow_new)
+    print_report(rows)
+    if failures:
+        print(f"\n❌ {len(failures)} benchmark(s) regressed or have no baseline:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print(f"\n✅ No regressions beyond {baseline.get('threshold_pct', DEFAULT_THRESHOLD_PCT):g}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Bundle-size budget gate for the production build.
+
+Reads ``dist/.vite/manifest.json`` (``build.manifest`` is enabled in
+``vite.config.ts``), works out which chunks the entry and every route in
+``src/App.tsx`` / ``src/config/routes.ts`` need, measures them raw, gzipped and brotli-compressed and
+compares the result with ``bundle-budget.json``:
+
+    npm run build
+    python -m tools.budget                 # fail if over budget
+    python -m tools.budget --modules       # also attribute size to source modules
+    python -m tools.budget --update        # rewrite budgets from this build
+
+Budgets are measured, never guessed: until ``--update`` has recorded them the
+check reports the sizes and fails.
+
+Per-module attribution needs source maps, e.g.
+``npx vite build --sourcemap hidden``.  Brotli sizes are reported when the
+optional ``brotli`` package is installed.
+"""
+
+import argparse
+import gzip
+import json
+import math
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+FRONTEND_ROOT = Path(__file__).resolve().parent.parent
+DIST = FRONTEND_ROOT / "dist"
+BUDGET_FILE = FRONTEND_ROOT / "bundle-budget.json"
+ROUTE_FILES = (FRONTEND_ROOT / "src" / "App.tsx", FRONTEND_ROOT / "src" / "config" / "routes.ts")
+SOURCE_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js")
+
+PAGE_IMPORT_RE = re.compile(
+    r"""(?:import\s+(\w+)\s+from|const\s+(\w+)\s*=\s*\w+\(\s*\(\)\s*=>\s*import\()"""
+    r"""\s*['"](\.\.?/(?:pages|components)/[^'"]+)['"]"""
+)
+ROUTE_RE = re.compile(r"""<Route\s+path="([^"]+)"\s+element=\{(.*?)\}\s*/>""", re.S)
+ROUTE_TABLE_RE = re.compile(r"""\{\s*path:\s*['"]([^'"]+)['"],\s*page:\s*(\w+)\s*\}""")
+TAG_RE = re.compile(r"<(\w+)")
+VLQ_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+VLQ_VALUES = {c: i for i, c in enumerate(VLQ_CHARS)}
+
+
+@dataclass
+class Size:
+    raw: int = 0
+    gzip: int = 0
+    brotli: int = 0
+
+    def __add__(self, other):
+        return Size(self.raw + other.raw, self.gzip + other.gzip, self.brotli + other.brotli)
+
+    def get(self, compression):
+        return getattr(self, compression)
+
+
+def measure(data):
+    return Size(
+        raw=len(data),
+        gzip=len(gzip.compress(data, compresslevel=9, mtime=0)),
+        brotli=len(brotli.compress(data, quality=11)) if brotli else 0,
+    )
+
+
+def resolve_source(spec, importer):
+    """``../pages/POS`` -> ``src/pages/POS.tsx`` (manifest keys are root-relative)."""
+    base = (importer.parent / spec).resolve()
+    for candidate in [base, *(base.with_name(base.name + ext) for ext in SOURCE_EXTENSIONS)]:
+        if candidate.is_file():
+            return candidate.relative_to(FRONTEND_ROOT).as_posix()
+    return base.relative_to(FRONTEND_ROOT).as_posix()
+
+
+def route_sources(files=ROUTE_FILES):
+    """Map every route path to the page module it renders.
+
+    Understands both ``<Route path element={<Page />}>`` in JSX and the
+    ``{ path, page }`` table in ``config/routes.ts``.
+    """
+    sources = {Path(file): Path(file).read_text() for file in files}
+    components = {}
+    for file, source in sources.items():
+        for match in PAGE_IMPORT_RE.finditer(source):
+            components[match.group(1) or match.group(2)] = resolve_source(match.group(3), file)
+    routes = {}
+    for source in sources.values():
+        for path, element in ROUTE_RE.findall(source):
+            for tag in TAG_RE.findall(element):
+                if tag in components:
+                    routes[path] = components[tag]
+                    break
+        for path, name in ROUTE_TABLE_RE.findall(source):
+            if name in components:
+                routes[path] = components[name]
+    return routes
+
+
+class Build:
+    def __init__(self, dist=DIST):
+        self.dist = Path(dist)
+        manifest_path = self.dist / ".vite" / "manifest.json"
+        if not manifest_path.exists():
+            manifest_path = self.dist / "manifest.json"
+        self.manifest = json.loads(manifest_path.read_text())
+        self._sizes = {}
+
+    def entry_key(self):
+        return next(key for key, chunk in self.manifest.items() if chunk.get("isEntry"))
+
+    def files_for(self, key):
+        """Every JS and CSS file needed before ``key`` can execute."""
+        files, stack, seen = [], [key], set()
+        while stack:
+            current = stack.pop()
+            if current in seen or current not in self.manifest:
+                continue
+            seen.add(current)
+            chunk = self.manifest[current]
+            files.append(chunk["file"])
+            files.extend(chunk.get("css", []))
+            stack.extend(chunk.get("imports", []))
+        return list(dict.fromkeys(files))
+
+    def size_of(self, files):
+        total = Size()
+        for name in files:
+            if name not in self._sizes:
+                self._sizes[name] = measure((self.dist / name).read_bytes())
+            total = total + self._sizes[name]
+        return total
+
+    def module_sizes(self, files):
+        """Attribute bytes of ``files`` to source modules using their source maps.
+
+        Compressed sizes are estimated from each module's share of its chunk.
+        """
+        modules = {}
+        for name in files:
+            path = self.dist / name
+            map_path = path.with_name(path.name + ".map")
+            if not name.endswith(".js") or not map_path.exists():
+                continue
+            chunk_size = self.size_of([name])
+            raw_by_source = attribute_source_map(path.read_text(), json.loads(map_path.read_text()))
+            for source, raw in raw_by_source.items():
+                share = raw / chunk_size.raw if chunk_size.raw else 0
+                modules[source] = modules.get(source, Size()) + Size(
+                    raw, round(chunk_size.gzip * share), round(chunk_size.brotli * share)
+                )
+        return modules
+
+
+def _decode_vlq(segment):
+    values, shift, value = [], 0, 0
+    for char in segment:
+        digit = VLQ_VALUES[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        shift = value = 0
+    return values
+
+
+def attribute_source_map(code, source_map):
+    """Generated bytes per original source, from the map's ``mappings``."""
+    sources = source_map.get("sources", [])
+    totals = {}
+    source_index = 0
+    for line, mappings in zip(code.split("\n"), source_map.get("mappings", "").split(";")):
+        column = 0
+        spans = []
+        for segment in filter(None, mappings.split(",")):
+            fields = _decode_vlq(segment)
+            column += fields[0]
+            if len(fields) >= 4:
+                source_index += fields[1]
+                spans.append((column, source_index))
+            else:
+                spans.append((column, None))
+        for (start, source), (end, _) in zip(spans, spans[1:] + [(len(line), None)]):
+            if source is not None and 0 <= source < len(sources):
+                name = _normalise_source(sources[source])
+                totals[name] = totals.get(name, 0) + max(end - start, 0)
+    return totals
+
+
+def _normalise_source(source):
+    source = source.replace("\\", "/")
+    if "node_modules/" in source:
+        package = source.split("node_modules/")[-1].split("/")
+        return "node_modules/" + "/".join(package[:2] if package[0].startswith("@") else package[:1])
+    return source.split("../")[-1]
+
+
+def collect(build, routes):
+    entry = build.entry_key()
+    startup_files = build.files_for(entry)
+    report = {"entry": {"source": entry, "files": startup_files, "size": build.size_of(startup_files)},
+              "routes": {}}
+    startup = set(startup_files)
+    for route, source in sorted(routes.items()):
+        if source in build.manifest:
+            files = [f for f in build.files_for(source) if f not in startup]
+        else:
+            files = []  # bundled into the startup chunks
+        report["routes"][route] = {"source": source, "files": files, "size": build.size_of(files)}
+    return report
+
+
+def check(report, budget):
+    compression = budget.get("compression", "gzip")
+    failures = []
+    entry_limit = budget.get("entry", {}).get("max_kb")
+    entry_kb = report["entry"]["size"].get(compression) / 1024
+    if entry_limit is not None and entry_kb > entry_limit:
+        failures.append(f"entry ({report['entry']['source']}): {entry_kb:.1f} KB > {entry_limit} KB")
+    default_limit = budget.get("default_route_max_kb")
+    for route, info in report["routes"].items():
+        limit = budget.get("routes", {}).get(route, {}).get("max_kb", default_limit)
+        kb = info["size"].get(compression) / 1024
+        if limit is not None and kb > limit:
+            failures.append(f"route {route} ({info['source']}): {kb:.1f} KB > {limit} KB")
+    return failures
+
+
+def updated_budget(report, budget, headroom):
+    compression = budget.get("compression", "gzip")
+
+    def limit(size):
+        return math.ceil(size.get(compression) / 1024 * (1 + headroom / 100) * 10) / 10
+
+    new = dict(budget)
+    new["entry"] = {**budget.get("entry", {}), "max_kb": limit(report["entry"]["size"])}
+    new["routes"] = {
+        route: {"max_kb": limit(info["size"])}
+        for route, info in report["routes"].items()
+        if info["files"]
+    }
+    return new
+
+
+def print_report(report, compression, modules=None, top=20):
+    def fmt(size):
+        br = f"{size.brotli / 1024:>9.1f}" if brotli else f"{'-':>9}"
+        return f"{size.raw / 1024:>9.1f} {size.gzip / 1024:>9.1f} {br}"
+
+    print(f"{'':<44} {'raw KB':>9} {'gzip KB':>9} {'br KB':>9}")
+    print(f"{'entry  ' + report['entry']['source']:<44} {fmt(report['entry']['size'])}")
+    for route, info in sorted(report["routes"].items(),
+                              key=lambda item: item[1]["size"].get(compression), reverse=True):
+        note = "" if info["files"] else "  (in startup chunks)"
+        print(f"{route:<44} {fmt(info['size'])}{note}")
+
+    if modules:
+        print("\nLargest source modules in the startup chunks:")
+        ranked = sorted(modules.items(), key=lambda item: item[1].get(compression), reverse=True)
+        for source, size in ranked[:top]:
+            print(f"{source[:44]:<44} {fmt(size)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dist", default=str(DIST))
+    parser.add_argument("--budget", default=str(BUDGET_FILE))
+    parser.add_argument("--modules", action="store_true",
+                        help="Attribute startup size to source modules (needs source maps)")
+    parser.add_argument("--update", action="store_true",
+                        help="Rewrite the budget file from this build instead of checking it")
+    parser.add_argument("--headroom", type=float, default=5.0,
+                        help="Percent added on top of measured sizes by --update (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    try:
+        build = Build(args.dist)
+    except FileNotFoundError:
+        print(f"❌ No build manifest under {args.dist}; run `npm run build` first")
+        return 2
+    budget_path = Path(args.budget)
+    budget = json.loads(budget_path.read_text()) if budget_path.exists() else {}
+    compression = budget.get("compression", "gzip")
+    if compression == "brotli" and brotli is None:
+        print("⚠️  Budget uses brotli but the `brotli` package is not installed; using gzip")
+        compression = budget["compression"] = "gzip"
+
+    report = collect(build, route_sources())
+    modules = build.module_sizes(report["entry"]["files"]) if args.modules else None
+    print_report(report, compression, modules)
+
+    if args.update:
+        budget_path.write_text(json.dumps(updated_budget(report, budget, args.headroom), indent=2) + "\n")
+        print(f"\n📝 Budget written to {budget_path}")
+        return 0
+
+    if "entry" not in budget and not budget.get("routes"):
+        print(f"\n❌ No budgets recorded in {budget_path}; run `python -m tools.budget --update` on this build")
+        return 2
+
+    failures = check(report, budget)
+    if failures:
+        print(f"\n❌ {len(failures)} budget(s) exceeded ({compression}):")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print(f"\n✅ All bundles within budget ({compression})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Compare one-POST-per-row writes against chunked ``bulk/`` writes.
+
+Both modes create the same generated product rows through the same
+keep-alive pool, the way the Inventory CSV import would: ``per-row`` sends
+``--concurrency`` single-row POSTs at a time, ``bulk`` sends
+``--chunk-size`` rows per request with ``--concurrency`` chunks in flight.
+Rows per second and request latency percentiles are reported per mode.
+
+``--resource fiscal-receipts`` submits invoices to the fiscal gateway
+instead, the way the background fiscalisation queue does; against the stub
+this measures its fake device (``--device-ms`` per call).
+
+Without ``--api-url`` an in-process ``tools.stubapi`` is started, so the
+numbers reflect request overhead rather than a real database:
+
+    python -m tools.bulkbench --rows 5000 --latency-ms 30 --row-ms 1
+    python -m tools.bulkbench --resource fiscal-receipts --rows 1000 --chunk-size 20 --device-ms 15
+    python -m tools.bulkbench --api-url http://localhost:8000/api --token "$ACCESS"
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from .bench import percentile
+from .httpclient import HttpClient
+from .stubapi import StubConfig, start
+
+MODES = ("per-row", "bulk")
+
+
+def product_rows(count):
+    return [
+        {
+            "sku": f"BENCH-{i:06d}",
+            "name": f"Bench product {i}",
+            "category": f"Category {i % 12}",
+            "unit_price": round(1 + (i % 500) * 0.37, 2),
+            "cost_price": round(0.5 + (i % 500) * 0.21, 2),
+            "quantity_in_stock": i % 90,
+            "minimum_stock_level": 5,
+            "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+
+def receipt_rows(count):
+    run = int(time.time())
+    return [
+        {
+            "invoice_number": f"BENCH-{run}-{i:06d}",
+            "amount": round(1.15 * (1 + (i % 500) * 0.37), 2),
+            "tax_amount": round(0.15 * (1 + (i % 500) * 0.37), 2),
+            "currency": "USD",
+            "items": [{"description": f"Bench product {i}", "qty": 1,
+                       "unit_price": round(1 + (i % 500) * 0.37, 2), "tax_rate": 15}],
+        }
+        for i in range(count)
+    ]
+
+
+ROW_FACTORIES = {"products": product_rows, "fiscal-receipts": receipt_rows}
+
+
+async def run_mode(client, url, mode, rows, chunk_size, concurrency, run_id):
+    batches = [[row] for row in rows] if mode == "per-row" else [
+        rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)
+    ]
+    target = url if mode == "per-row" else url + "bulk/"
+    latencies, errors = [], 0
+    cursor = 0
+
+    async def worker():
+        nonlocal cursor, errors
+        while cursor < len(batches):
+            index = cursor
+            cursor += 1
+            batch = batches[index]
+            body = batch[0] if mode == "per-row" else {"items": batch}
+            key = f"bench-{run_id}-{mode}-{index}"
+            try:
+                response = await client.post(target, json=body, headers={"Idempotency-Key": key})
+                latencies.append(response.elapsed)
+                if response.status >= 400:
+                    errors += 1
+            except Exception:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(batches)))))
+    elapsed = time.perf_counter() - started
+    return {
+        "mode": mode,
+        "rows": len(rows),
+        "requests": len(batches),
+        "errors": errors,
+        "seconds": elapsed,
+        "rows_per_s": len(rows) / elapsed if elapsed else 0,
+        "p50_ms": (percentile(latencies, 50) or 0) * 1000,
+        "p95_ms": (percentile(latencies, 95) or 0) * 1000,
+    }
+
+
+async def run_bench(api_url, rows, chunk_size, concurrency, headers, timeout, resource="products"):
+    url = api_url.rstrip("/") + f"/{resource}/"
+    run_id = int(time.time())
+    results = []
+    async with HttpClient(concurrency=concurrency, timeout=timeout, headers=headers) as client:
+        for mode in MODES:
+            results.append(await run_mode(client, url, mode, rows, chunk_size, concurrency, run_id))
+    return results
+
+
+def print_table(results):
+    print(f"{'mode':<8} {'rows':>7} {'requests':>9} {'errors':>7} {'seconds':>8} "
+          f"{'rows/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['rows']:>7} {r['requests']:>9} {r['errors']:>7} {r['seconds']:>8.2f} "
+              f"{r['rows_per_s']:>9.0f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f}")
+    per_row, bulk = results
+    if per_row["rows_per_s"]:
+        print(f"\n🚀 bulk is {bulk['rows_per_s'] / per_row['rows_per_s']:.1f}x the per-row throughput")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--api-url", help="API base URL, e.g. http://localhost:8000/api "
+                                          "(default: start an in-process stub)")
+    parser.add_argument("--token", help="Bearer token for --api-url")
+    parser.add_argument("--resource", choices=ROW_FACTORIES, default="products",
+                        help="What to write (default: %(default)s)")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=200,
+                        help="Rows per bulk request (default: %(default)s, as in bulkWrite)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20.0,
+                        help="Stub only: latency added to every request (default: %(default)s)")
+    parser.add_argument("--row-ms", type=float, default=0.5,
+                        help="Stub only: latency added per row written (default: %(default)s)")
+    parser.add_argument("--device-ms", type=float, default=10.0,
+                        help="Stub only: fake fiscal device time per call (default: %(default)s)")
+    parser.add_argument("--device-receipt-ms", type=float, default=0.5,
+                        help="Stub only: fake fiscal device time per receipt (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args(argv)
+
+    server = None
+    api_url = args.api_url
+    if not api_url:
+        server, _ = start(0, StubConfig(latency_ms=args.latency_ms, row_ms=args.row_ms, device_ms=args.device_ms,
+                                        device_receipt_ms=args.device_receipt_ms))
+        api_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+
+    print(f"⏱️  Writing {args.rows} {args.resource} rows per mode to {api_url} "
+          f"(chunk {args.chunk_size}, concurrency {args.concurrency})...\n")
+    try:
+        results = asyncio.run(run_bench(api_url, ROW_FACTORIES[args.resource](args.rows), args.chunk_size,
+                                        args.concurrency, headers, args.timeout, args.resource))
+    finally:
+        if server:
+            server.shutdown()
+    print_table(results)
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Crawl the dev-server import graph starting from ``/src/main.tsx``.
+
+Vite serves every module already transformed, with import specifiers
+rewritten to absolute URLs, so the graph the browser walks on a cold start
+can be rebuilt by parsing the ``import`` statements of each response.  The
+crawl fetches each breadth-first level in parallel and reports, per module,
+fetch latency, byte size and depth, plus the critical path: the chain of
+fetches the browser cannot overlap before the last module is available.
+
+    python -m tools.crawl
+    python -m tools.crawl --follow-dynamic --pages --out crawl.json
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urljoin, urlsplit
+
+from .httpclient import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, HttpClient, ProtocolError
+from .probes import FRONTEND_URL
+
+ENTRY = "/src/main.tsx"
+STATIC_IMPORT_RE = re.compile(
+    r"""(?:^|[;\s])(?:import|export)\s*(?:[\w*{}\s,$]+?\s*from\s*)?["']([^"'\n]+)["']""",
+    re.M,
+)
+DYNAMIC_IMPORT_RE = re.compile(r"""\bimport\(\s*["']([^"'\n]+)["']\s*\)""")
+
+
+@dataclass
+class Module:
+    url: str
+    depth: int
+    status: int = 0
+    latency_ms: float = 0.0
+    bytes: int = 0
+    error: str = ""
+    imports: list = field(default_factory=list)
+    dynamic_imports: list = field(default_factory=list)
+
+
+def parse_imports(source, module_url):
+    """Return the (static, dynamic) same-origin module paths imported by ``source``."""
+    origin = urlsplit(module_url)
+
+    def resolve(specs):
+        paths = []
+        for spec in specs:
+            if spec.startswith(("data:", "blob:")):
+                continue
+            target = urlsplit(urljoin(module_url, spec))
+            if target.netloc != origin.netloc:
+                continue
+            path = target.path + (f"?{target.query}" if target.query else "")
+            if path not in paths:
+                paths.append(path)
+        return paths
+
+    return (resolve(STATIC_IMPORT_RE.findall(source)),
+            resolve(DYNAMIC_IMPORT_RE.findall(source)))
+
+
+async def fetch_module(client, base_url, module):
+    url = base_url.rstrip("/") + module.url
+    try:
+        response = await client.get(url)
+    except asyncio.TimeoutError:
+        module.error = "timeout"
+        return
+    except EOFError:  # asyncio.IncompleteReadError
+        module.error = "connection closed before a complete response"
+        return
+    except (OSError, ProtocolError) as exc:
+        module.error = str(exc) or exc.__class__.__name__
+        return
+    module.status = response.status
+    module.latency_ms = round(response.elapsed * 1000, 3)
+    module.bytes = len(response.body)
+    if response.status == 200:
+        module.imports, module.dynamic_imports = parse_imports(response.text, url)
+
+
+async def crawl(base_url=FRONTEND_URL, entry=ENTRY, follow_dynamic=False,
+                concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+    """Breadth-first crawl; every level is fetched concurrently."""
+    modules = {entry: Module(entry, 0)}
+    level = [modules[entry]]
+    async with HttpClient(concurrency=concurrency, timeout=timeout) as client:
+        while level:
+            await asyncio.gather(*(fetch_module(client, base_url, m) for m in level))
+            next_level = []
+            for module in level:
+                children = module.imports + (module.dynamic_imports if follow_dynamic else [])
+                for child in children:
+                    if child not in modules:
+                        modules[child] = Module(child, module.depth + 1)
+                        next_level.append(modules[child])
+            level = next_level
+    return modules
+
+
+def critical_path(modules, entry=ENTRY, follow_dynamic=False):
+    """Earliest time each module can finish loading, and the slowest chain.
+
+    A module can be requested as soon as any importer has finished, so its
+    finish time is ``min(importer finish) + own latency``: a shortest-path
+    problem over the import graph.  The critical path ends at the module
+    that finishes last.
+    """
+    finish = {entry: modules[entry].latency_ms}
+    parent = {entry: None}
+    queue = [(finish[entry], entry)]
+    while queue:
+        done_at, url = heapq.heappop(queue)
+        if done_at > finish[url]:
+            continue
+        module = modules[url]
+        children = module.imports + (module.dynamic_imports if follow_dynamic else [])
+        for child in children:
+            if child not in modules:
+                continue
+            candidate = done_at + modules[child].latency_ms
+            if candidate < finish.get(child, float("inf")):
+                finish[child] = candidate
+                parent[child] = url
+                heapq.heappush(queue, (candidate, child))
+
+    last = max(finish, key=finish.get)
+    path = []
+    while last is not None:
+        path.append(last)
+        last = parent[last]
+    return list(reversed(path)), finish
+
+
+def reachable(modules, start, skip=None, follow_dynamic=False):
+    seen, stack = set(), [start]
+    while stack:
+        url = stack.pop()
+        if url in seen or url == skip or url not in modules:
+            continue
+        seen.add(url)
+        module = modules[url]
+        stack.extend(module.imports)
+        if follow_dynamic:
+            stack.extend(module.dynamic_imports)
+    return seen
+
+
+def page_costs(modules, entry=ENTRY, follow_dynamic=False):
+    """Modules and bytes each ``/src/pages/*`` module pulls in.
+
+    ``exclusive`` counts only what would disappear from the crawl if the
+    page were no longer imported, i.e. what the page alone adds.
+    """
+    everything = reachable(modules, entry, follow_dynamic=follow_dynamic)
+    costs = []
+    for page in sorted(u for u in modules if u.startswith("/src/pages/")):
+        own = reachable(modules, page, follow_dynamic=follow_dynamic)
+        exclusive = everything - reachable(modules, entry, skip=page, follow_dynamic=follow_dynamic)
+        costs.append({
+            "page": page,
+            "modules": len(own),
+            "bytes": sum(modules[u].bytes for u in own),
+            "latency_ms": round(sum(modules[u].latency_ms for u in own), 3),
+            "exclusive_modules": len(exclusive),
+            "exclusive_bytes": sum(modules[u].bytes for u in exclusive),
+        })
+    return costs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frontend-url", default=FRONTEND_URL)
+    parser.add_argument("--entry", default=ENTRY)
+    parser.add_argument("--follow-dynamic", action="store_true",
+                        help="Also crawl import() targets such as lazily loaded routes")
+    parser.add_argument("--pages", action="store_true", help="Report per-page module cost")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--out", help="Write the full crawl to this JSON file")
+    args = parser.parse_args(argv)
+
+    print(f"🕸️  Crawling import graph from {args.entry}...\n")
+    started = time.perf_counter()
+    modules = asyncio.run(crawl(args.frontend_url, args.entry, args.follow_dynamic,
+                                args.concurrency, args.timeout))
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    failed = [m for m in modules.values() if m.error or m.status != 200]
+    for module in failed:
+        print(f"❌ {module.url} - {module.error or f'Status: {module.status}'}")
+
+    print(f"{'module':<64} {'depth':>5} {'ms':>8} {'bytes':>9}")
+    slowest = sorted(modules.values(), key=lambda m: m.latency_ms, reverse=True)[:args.top]
+    for m in slowest:
+        print(f"{m.url[:64]:<64} {m.depth:>5} {m.latency_ms:>8.1f} {m.bytes:>9}")
+
+    path, finish = critical_path(modules, args.entry, args.follow_dynamic)
+    print(f"\n🔗 Critical path ({len(path)} modules, {finish[path[-1]]:.1f} ms):")
+    for url in path:
+        print(f"   {modules[url].latency_ms:>8.1f} ms  {url}")
+
+    costs = page_costs(modules, args.entry, args.follow_dynamic) if args.pages else []
+    if costs:
+        print(f"\n{'page':<48} {'modules':>8} {'bytes':>10} {'excl. mods':>10} {'excl. bytes':>11}")
+        for c in sorted(costs, key=lambda c: c["exclusive_bytes"], reverse=True):
+            print(f"{c['page']:<48} {c['modules']:>8} {c['bytes']:>10} "
+                  f"{c['exclusive_modules']:>10} {c['exclusive_bytes']:>11}")
+
+    total_bytes = sum(m.bytes for m in modules.values())
+    max_depth = max(m.depth for m in modules.values())
+    print(f"\n{len(modules)} modules, {total_bytes / 1024:.0f} KiB, max depth {max_depth}, "
+          f"crawled in {wall_ms:.0f} ms")
+
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump({
+                "entry": args.entry,
+                "wall_ms": round(wall_ms, 3),
+                "critical_path": path,
+                "critical_path_ms": round(finish[path[-1]], 3),
+                "modules": [asdict(m) for m in modules.values()],
+                "pages": costs,
+            }, fh, indent=2)
+        print(f"📝 Crawl written to {args.out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Minimal pooled HTTP/1.1 client built on asyncio streams.
+
+The dev tooling only talks to local servers (Vite on :5173, the API on
+:8000), so a small keep-alive client on the standard library is enough and
+keeps the scripts free of third-party dependencies.  Connections are pooled
+per host, the number of requests in flight is bounded, and every response
+records time-to-first-byte alongside total transfer time.
+"""
+
+import asyncio
+import json as jsonlib
+import ssl
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_CONCURRENCY = 8
+USER_AGENT = "finance-plus-devtools/1.0"
+
+
+class ProtocolError(Exception):
+    """Raised when a server sends something that is not valid HTTP/1.x."""
+
+
+@dataclass
+class Response:
+    url: str
+    status: int
+    headers: dict
+    body: bytes
+    ttfb: float
+    elapsed: float
+    reused: bool = False
+
+    @property
+    def text(self):
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self):
+        return jsonlib.loads(self.body or b"null")
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    requests: int = 0
+
+    @property
+    def closed(self):
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def close(self):
+        if not self.writer.is_closing():
+            self.writer.close()
+
+
+@dataclass
+class _HostPool:
+    scheme: str
+    host: str
+    port: int
+    limit: int
+    idle: deque = field(default_factory=deque)
+    opened: int = 0
+
+    def __post_init__(self):
+        self.slots = asyncio.Semaphore(self.limit)
+
+    async def acquire(self, fresh=False):
+        await self.slots.acquire()
+        try:
+            while self.idle and not fresh:
+                conn = self.idle.popleft()
+                if not conn.closed:
+                    return conn
+            ctx = ssl.create_default_context() if self.scheme == "https" else None
+            reader, writer = await asyncio.open_connection(self.host, self.port, ssl=ctx)
+            self.opened += 1
+            return _Connection(reader, writer)
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def release(self, conn, reusable):
+        if reusable and not conn.closed:
+            self.idle.append(conn)
+        else:
+            conn.close()
+        self.slots.release()
+
+    def close(self):
+        while self.idle:
+            self.idle.popleft().close()
+
+
+class HttpClient:
+    """Keep-alive HTTP client shared by every probe in a run.
+
+    ``concurrency`` caps both the open connections per host and the total
+    number of requests in flight across hosts.
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT, headers=None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self._pools = {}
+        self._in_flight = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @property
+    def connections_opened(self):
+        return sum(pool.opened for pool in self._pools.values())
+
+    def _pool_for(self, scheme, host, port):
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(scheme, host, port, self.concurrency)
+        return pool
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def request(self, method, url, *, headers=None, body=None, json=None, timeout=None):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        if json is not None:
+            body = jsonlib.dumps(json).encode()
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        if isinstance(body, str):
+            body = body.encode()
+
+        request_headers = {
+            "Host": parts.netloc,
+            "User-Agent": USER_AGENT,
+            "Accept": "*/*",
+            "Accept-Encoding": "identity",
+            "Connection": "keep-alive",
+            **self.headers,
+            **(headers or {}),
+        }
+        if body is not None:
+            request_headers["Content-Length"] = str(len(body))
+
+        head = f"{method} {target} HTTP/1.1\r\n"
+        head += "".join(f"{k}: {v}\r\n" for k, v in request_headers.items())
+        payload = (head + "\r\n").encode("latin-1") + (body or b"")
+
+        pool = self._pool_for(parts.scheme, parts.hostname, port)
+        async with self._in_flight:
+            return await asyncio.wait_for(
+                self._exchange(pool, method, url, payload),
+                timeout if timeout is not None else self.timeout,
+            )
+
+    async def _exchange(self, pool, method, url, payload):
+        # A pooled connection may have been closed by the server while idle;
+        # in that case retry exactly once on a brand new connection.
+        for attempt in (0, 1):
+            conn = await pool.acquire(fresh=attempt > 0)
+            reused = conn.requests > 0
+            started = time.perf_counter()
+            reusable = False
+            try:
+                conn.writer.write(payload)
+                await conn.writer.drain()
+                status, headers, ttfb, body, reusable = await _read_response(
+                    conn.reader, method, started
+                )
+            except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                if reused and attempt == 0 and not getattr(exc, "partial", b""):
+                    continue
+                raise
+            finally:
+                conn.requests += 1
+                pool.release(conn, reusable)
+            return Response(
+                url=url,
+                status=status,
+                headers=headers,
+                body=body,
+                ttfb=ttfb,
+                elapsed=time.perf_counter() - started,
+                reused=reused,
+            )
+        raise ProtocolError(f"Connection dropped twice while requesting {url}")
+
+    async def close(self):
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+
+
+async def _read_response(reader, method, started):
+    status_line = await reader.readline()
+    if not status_line:
+        raise asyncio.IncompleteReadError(b"", None)
+    ttfb = time.perf_counter() - started
+    try:
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+        status = int(status)
+    except ValueError:
+        raise ProtocolError(f"Malformed status line: {status_line!r}") from None
+
+    headers = await _read_headers(reader)
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        body = b""
+    elif "chunked" in headers.get("transfer-encoding", "").lower():
+        body = await _read_chunked(reader)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return status, headers, ttfb, body, keep_alive
+
+
+async def _read_headers(reader):
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            return headers
+        if not line:
+            raise asyncio.IncompleteReadError(b"", None)
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        value = value.strip()
+        headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+
+async def _read_chunked(reader):
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        try:
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+        except ValueError:
+            raise ProtocolError(f"Malformed chunk size: {size_line!r}") from None
+        if size == 0:
+            await _read_headers(reader)  # trailers
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
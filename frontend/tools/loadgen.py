@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""Replay weighted ERP workflows against the API and report per-endpoint latency.
+
+Each virtual user picks a scenario by weight and runs it end to end over a
+shared keep-alive pool:
+
+* ``pos``: list stores, start a session, look products up and make a few
+  sales (with an ``Idempotency-Key`` like the POS page), end the session;
+* ``payroll``: list employees, process a period, generate some payslips;
+* ``reports``: list and generate a payroll, tax or financial report.
+
+Load is either closed (``--users`` run scenarios back to back) or open
+(``--rate`` scenario starts per second with Poisson arrivals, at most
+``--users`` in flight; arrivals beyond that are counted as dropped).
+Throughput, error rate, p50/p95/p99 and a latency histogram are reported
+per endpoint, with ids folded so ``/employees/12/`` and ``/employees/7/``
+count together.
+
+Without ``--api-url`` an in-process, seeded ``tools.stubapi`` is used:
+
+    python -m tools.loadgen --users 20 --duration 30 --latency-ms 15
+    python -m tools.loadgen --rate 40 --mix pos=6,payroll=1,reports=2 --histograms
+    python -m tools.loadgen --api-url http://localhost:8000/api --token "$ACCESS" --out load.json
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from urllib.parse import urlencode
+
+from .bench import percentile
+from .httpclient import HttpClient
+from .stubapi import StubConfig, start
+
+DEFAULT_MIX = "pos=6,payroll=1,reports=2"
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+SEARCH_TERMS = ("tea", "sugar", "bread", "soap", "oil", "1", "2")
+ID_SEGMENT = re.compile(r"/\d+(?=/)")
+
+
+@dataclass
+class EndpointStats:
+    latencies: list = field(default_factory=list)
+    errors: int = 0
+    statuses: dict = field(default_factory=dict)
+
+    def add(self, seconds, status):
+        self.latencies.append(seconds * 1000)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status is None or status >= 400:
+            self.errors += 1
+
+    def histogram(self):
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for ms in self.latencies:
+            counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        return counts
+
+
+@dataclass
+class RunStats:
+    endpoints: dict = field(default_factory=dict)
+    scenarios: dict = field(default_factory=dict)
+    failed_scenarios: int = 0
+    dropped: int = 0
+
+    def endpoint(self, name):
+        stats = self.endpoints.get(name)
+        if stats is None:
+            stats = self.endpoints[name] = EndpointStats()
+        return stats
+
+
+class ScenarioFailed(Exception):
+    """A step answered with an error, so the rest of the workflow is skipped."""
+
+
+class Session:
+    """One scenario run: issues requests and records them under their endpoint."""
+
+    def __init__(self, client, api_url, stats, rng, think_ms):
+        self.client = client
+        self.api_url = api_url
+        self.stats = stats
+        self.rng = rng
+        self.think_ms = think_ms
+
+    async def call(self, method, path, params=None, json=None, headers=None):
+        name = f"{method} {ID_SEGMENT.sub('/{id}', path)}"
+        url = self.api_url + path + (f"?{urlencode(params)}" if params else "")
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, json=json, headers=headers)
+        except Exception as exc:
+            self.stats.endpoint(name).add(time.perf_counter() - started, None)
+            raise ScenarioFailed(f"{name}: {exc!r}") from exc
+        self.stats.endpoint(name).add(response.elapsed, response.status)
+        if response.status >= 400:
+            raise ScenarioFailed(f"{name}: HTTP {response.status}")
+        return response.json() if response.body else None
+
+    async def think(self):
+        if self.think_ms:
+            await asyncio.sleep(self.rng.uniform(0, 2 * self.think_ms) / 1000)
+
+
+def _results(body):
+    return (body.get("results", []) if isinstance(body, dict) else body) or []
+
+
+async def pos_session(s):
+    stores = _results(await s.call("GET", "/stores/"))
+    store = s.rng.choice(stores)["id"] if stores else None
+    session = await s.call("POST", "/pos/start-session/", json={"store": store, "opening_balance": 0})
+    for _ in range(s.rng.randint(1, 4)):
+        cart = []
+        for _ in range(s.rng.randint(1, 3)):
+            await s.think()
+            found = _results(await s.call("GET", "/products/", params={
+                "search": s.rng.choice(SEARCH_TERMS), "page_size": 20,
+            }))
+            if found:
+                product = s.rng.choice(found)
+                quantity = s.rng.randint(1, 3)
+                price = float(product.get("unit_price") or 1)
+                cart.append({"product": product["id"], "item_name": product.get("name"), "quantity": quantity,
+                             "unit_price": price, "total_price": round(price * quantity, 2)})
+        if not cart:
+            continue
+        total = round(sum(item["total_price"] for item in cart), 2)
+        sale_number = f"LOAD-{s.rng.getrandbits(48):012x}"
+        await s.call("POST", "/pos/make-sale/", headers={"Idempotency-Key": sale_number}, json={
+            "sale_number": sale_number, "subtotal": total, "tax_amount": round(total * 0.15, 2),
+            "total_amount": round(total * 1.15, 2), "payment_method": "CASH", "status": "COMPLETED",
+            "items": cart,
+        })
+    await s.call("POST", "/pos/end-session/", json={"session": (session or {}).get("id")})
+
+
+async def payroll_run(s):
+    employees = _results(await s.call("GET", "/employees/", params={"page_size": 500}))
+    period = date.today().strftime("%Y-%m")
+    await s.think()
+    await s.call("POST", "/payrolls/process/", json={"period": period, "employees": [e["id"] for e in employees]})
+    await s.call("GET", "/payrolls/", params={"period": period})
+    for employee in s.rng.sample(employees, min(3, len(employees))):
+        await s.think()
+        await s.call("POST", "/payslips/generate/", json={"employee_id": employee["id"], "period": period})
+        await s.call("GET", f"/employees/{employee['id']}/")
+
+
+async def report_generation(s):
+    kind = s.rng.choice(("payroll", "tax", "financial"))
+    await s.call("GET", f"/{kind}-reports/")
+    await s.think()
+    today = date.today()
+    await s.call("POST", f"/{kind}-reports/generate/", json={
+        "start_date": today.replace(day=1).isoformat(), "end_date": today.isoformat(),
+    })
+    await s.call("GET", "/general-ledger/")
+
+
+SCENARIOS = {
+    "pos": pos_session,
+    "payroll": payroll_run,
+    "reports": report_generation,
+}
+
+
+def parse_mix(text):
+    """``'pos=6,payroll=1'`` -> ``{'pos': 6.0, 'payroll': 1.0}``"""
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    if not mix or not any(mix.values()):
+        raise argparse.ArgumentTypeError("the mix needs at least one scenario with a positive weight")
+    return mix
+
+
+async def run_load(api_url, mix, users, duration, rate=None, think_ms=0.0, headers=None,
+                   timeout=30.0, seed=None):
+    """Run scenarios for ``duration`` seconds; returns ``(RunStats, elapsed)``."""
+    stats = RunStats()
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    deadline = time.perf_counter() + duration
+
+    async with HttpClient(concurrency=users, timeout=timeout, headers=headers) as client:
+        async def run_one():
+            name = rng.choices(names, weights)[0]
+            session = Session(client, api_url, stats, random.Random(rng.random()), think_ms)
+            stats.scenarios[name] = stats.scenarios.get(name, 0) + 1
+            try:
+                await SCENARIOS[name](session)
+            except ScenarioFailed:
+                stats.failed_scenarios += 1
+
+        started = time.perf_counter()
+        if rate:
+            in_flight = set()
+            while True:
+                await asyncio.sleep(rng.expovariate(rate))
+                if time.perf_counter() >= deadline:
+                    break
+                if len(in_flight) >= users:
+                    stats.dropped += 1
+                    continue
+                task = asyncio.create_task(run_one())
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if in_flight:
+                await asyncio.wait(in_flight)
+        else:
+            async def user():
+                while time.perf_counter() < deadline:
+                    await run_one()
+
+            await asyncio.gather(*(user() for _ in range(users)))
+        return stats, time.perf_counter() - started
+
+
+def summary_rows(stats, elapsed):
+    rows = []
+    for name, endpoint in sorted(stats.endpoints.items()):
+        latencies = endpoint.latencies
+        count = len(latencies)
+        rows.append({
+            "endpoint": name,
+            "requests": count,
+            "rps": count / elapsed if elapsed else 0,
+            "errors": endpoint.errors,
+            "error_rate": endpoint.errors / count if count else 0,
+            **{f"p{p}_ms": round(percentile(latencies, p) or 0, 2) for p in (50, 95, 99)},
+            "max_ms": round(max(latencies, default=0), 2),
+            "statuses": {str(k): v for k, v in endpoint.statuses.items()},
+            "histogram": dict(zip([f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"],
+                                  endpoint.histogram())),
+        })
+    return rows
+
+
+def print_report(stats, elapsed, rows, histograms=False):
+    total = sum(r["requests"] for r in rows)
+    errors = sum(r["errors"] for r in rows)
+    print(f"{'endpoint':<34} {'reqs':>7} {'req/s':>8} {'err%':>6} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8}")
+    for r in rows:
+        print(f"{r['endpoint']:<34} {r['requests']:>7} {r['rps']:>8.1f} {r['error_rate'] * 100:>6.1f} "
+              f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['max_ms']:>8.1f}")
+    if histograms:
+        for r in rows:
+            peak = max(r["histogram"].values()) or 1
+            print(f"\n{r['endpoint']}")
+            for bucket, count in r["histogram"].items():
+                if count:
+                    print(f"  {bucket:>9} {'█' * max(1, round(30 * count / peak)):<30} {count}")
+    scenarios = ", ".join(f"{name} {count}" for name, count in sorted(stats.scenarios.items()))
+    print(f"\n📈 {total} requests in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.1f} req/s), "
+          f"{errors} errors ({errors / total * 100 if total else 0:.2f}%)")
+    print(f"🧾 scenarios: {scenarios or 'none'}; {stats.failed_scenarios} failed, {stats.dropped} dropped")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--api-url", help="API base URL, e.g. http://localhost:8000/api "
+                                          "(default: start an in-process seeded stub)")
+    parser.add_argument("--token", help="Bearer token for --api-url")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="Scenario weights (default: %(default)s)")
+    parser.add_argument("--users", type=int, default=10,
+                        help="Concurrent virtual users, or the in-flight cap with --rate (default: %(default)s)")
+    parser.add_argument("--rate", type=float, help="Open model: scenario starts per second")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds to generate load (default: %(default)s)")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between steps of a scenario")
+    parser.add_argument("--seed", type=int, help="Random seed, for repeatable scenario choices")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--latency-ms", type=float, default=10.0,
+                        help="Stub only: latency added to every request (default: %(default)s)")
+    parser.add_argument("--row-ms", type=float, default=0.2,
+                        help="Stub only: latency added per row written (default: %(default)s)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Stub only: fraction answered with 503")
+    parser.add_argument("--histograms", action="store_true", help="Print a latency histogram per endpoint")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Exit non-zero above this overall error rate (default: %(default)s)")
+    parser.add_argument("--out", help="Write the per-endpoint summary as JSON")
+    args = parser.parse_args(argv)
+
+    server = None
+    api_url = args.api_url
+    if not api_url:
+        server, state = start(0, StubConfig(args.latency_ms, args.row_ms, args.fail_rate))
+        state.seed()
+        api_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+
+    load = f"{args.rate}/s (max {args.users} in flight)" if args.rate else f"{args.users} users"
+    mix = ", ".join(f"{name}={weight:g}" for name, weight in args.mix.items())
+    print(f"🔥 {load} for {args.duration:g}s against {api_url} ({mix})...\n")
+    try:
+        stats, elapsed = asyncio.run(run_load(api_url.rstrip("/"), args.mix, args.users, args.duration,
+                                              args.rate, args.think_ms, headers, args.timeout, args.seed))
+    finally:
+        if server:
+            server.shutdown()
+
+    rows = summary_rows(stats, elapsed)
+    print_report(stats, elapsed, rows, args.histograms)
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump({"api_url": api_url, "elapsed_s": elapsed, "mix": args.mix, "users": args.users,
+                       "rate": args.rate, "scenarios": stats.scenarios, "failed_scenarios": stats.failed_scenarios,
+                       "dropped": stats.dropped, "endpoints": rows}, fh, indent=2)
+        print(f"💾 Wrote {args.out}")
+    total = sum(r["requests"] for r in rows)
+    errors = sum(r["errors"] for r in rows)
+    return 1 if total == 0 or errors / total > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
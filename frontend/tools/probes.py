@@ -0,0 +1,156 @@
+"""Probe manifest for the dev-server and backend smoke checks.
+
+Each entry below used to live in its own ad-hoc script at the root of the
+frontend (``final_comprehensive_test.py``, ``test_endpoints_fix.py``, ...).
+They are kept grouped by their original script so it is clear where a check
+came from; ``build_manifest`` merges them into one de-duplicated list.
+"""
+
+from dataclasses import dataclass, field
+
+FRONTEND_URL = "http://localhost:5173"
+BACKEND_URL = "http://localhost:8000/api"
+
+OK = (200,)
+# Backend endpoints only need to exist; authentication is not part of the check.
+EXISTS = (200, 401, 403)
+
+
+@dataclass(frozen=True)
+class ProbeSpec:
+    target: str  # "frontend" or "backend"
+    path: str
+    label: str = ""
+    contains: tuple = ()
+    ok_status: tuple = OK
+
+
+@dataclass
+class Probe:
+    target: str
+    path: str
+    labels: list = field(default_factory=list)
+    contains: list = field(default_factory=list)
+    ok_status: tuple = OK
+    sources: list = field(default_factory=list)
+
+    @property
+    def key(self):
+        return (self.target, self.path)
+
+    @property
+    def label(self):
+        return self.labels[0] if self.labels else self.path
+
+    def url(self, frontend_url=FRONTEND_URL, backend_url=BACKEND_URL):
+        base = frontend_url if self.target == "frontend" else backend_url
+        return base.rstrip("/") + "/" + self.path.lstrip("/")
+
+
+def _f(path, label="", contains=()):
+    return ProbeSpec("frontend", path, label, tuple(contains))
+
+
+def _b(path, label=""):
+    return ProbeSpec("backend", path, label, ok_status=EXISTS)
+
+
+SCRIPT_PROBES = {
+    "final_comprehensive_test": [
+        _f("/", "Frontend server"),
+        _f("src/services/api.ts", "API service with ENDPOINTS"),
+        _f("src/services/userService.ts", "UserService"),
+        _f("src/components/Modal.tsx", "Modal component"),
+        _f("src/components/UserModal.tsx", "UserModal component"),
+        _f("src/utils/cn.ts", "cn utility"),
+        _f("src/store/slices/authSlice.ts", "Auth slice"),
+        _f("src/store/slices/transactionSlice.ts", "Transaction slice with setTransactions"),
+        _f("src/pages/Transactions.tsx", "Transactions page"),
+        _f("src/main.tsx", "Main entry point"),
+        _f("src/App.tsx", "App component"),
+    ],
+    "final_import_test": [
+        _f("/", "Frontend server"),
+        _f("src/services/api.ts", "API service with ENDPOINTS"),
+        _f("src/services/userService.ts", "UserService"),
+        _f("src/components/Modal.tsx", "Modal component"),
+        _f("src/components/UserModal.tsx", "UserModal component"),
+        _f("src/utils/cn.ts", "cn utility"),
+        _f("src/store/slices/authSlice.ts", "Auth slice"),
+        _f("src/store/slices/transactionSlice.ts", "Transaction slice"),
+        _f("src/main.tsx", "Main entry point"),
+        _f("src/App.tsx", "App component"),
+    ],
+    "test_all_imports": [
+        _f("/", "Frontend server"),
+        _f("src/main.tsx"),
+        _f("src/App.tsx"),
+        _f("src/components/Modal.tsx"),
+        _f("src/components/UserModal.tsx"),
+        _f("src/utils/cn.ts"),
+        _f("src/services/api.ts"),
+        _f("src/store/slices/authSlice.ts"),
+    ],
+    "test_auth_pages_final": [
+        _f("/", "Frontend server"),
+        _f("node_modules/react-icons/fa/index.js", "react-icons package"),
+        _f("node_modules/react-hot-toast/dist/index.js", "react-hot-toast package"),
+    ],
+    "test_auth_pages_update": [
+        _f("/", "Frontend server"),
+        _f("src/pages/Login.tsx", "Login page",
+           contains=("backdrop-blur-md bg-white/70", "backgroundImage", "FaUser", "FaLock", "Finance Plus")),
+        _f("src/pages/Signup.tsx", "Signup page",
+           contains=("backdrop-blur-md bg-white/70", "backgroundImage", "FaUser", "FaEnvelope", "Finance Plus")),
+    ],
+    "test_department_fix": [
+        _b("departments/", "Departments API"),
+        _b("projects/", "Projects API"),
+        _b("project-tasks/", "Project tasks API"),
+        _b("project-timesheets/", "Project timesheets API"),
+        _b("customers/", "Customers API"),
+    ],
+    "test_endpoints_fix": [
+        _f("/", "Frontend server"),
+        _f("src/services/api.ts", "API service with ENDPOINTS", contains=("ENDPOINTS",)),
+        _f("src/services/userService.ts", "UserService"),
+    ],
+    "test_frontend_imports": [
+        _f("/", "Frontend server"),
+        _f("src/main.tsx", "Main entry point"),
+        _f("src/utils/cn.ts", "cn utility"),
+        _f("src/services/api.ts", "API service"),
+    ],
+    "test_settransactions_fix": [
+        _f("/", "Frontend server"),
+        _f("src/store/slices/transactionSlice.ts", "TransactionSlice", contains=("setTransactions",)),
+        _f("src/pages/Transactions.tsx", "Transactions page"),
+    ],
+}
+
+
+def build_manifest(scripts=None, targets=None):
+    """Merge the per-script probes into one list with one entry per URL.
+
+    Labels, content expectations and source scripts of duplicate probes are
+    unioned so that no check from any original script is lost.
+    """
+    merged = {}
+    for script, specs in SCRIPT_PROBES.items():
+        if scripts and script not in scripts:
+            continue
+        for spec in specs:
+            if targets and spec.target not in targets:
+                continue
+            key = (spec.target, "/" + spec.path.lstrip("/"))
+            probe = merged.get(key)
+            if probe is None:
+                probe = merged[key] = Probe(spec.target, key[1], ok_status=spec.ok_status)
+            if spec.label and spec.label not in probe.labels:
+                probe.labels.append(spec.label)
+            for needle in spec.contains:
+                if needle not in probe.contains:
+                    probe.contains.append(needle)
+            if script not in probe.sources:
+                probe.sources.append(script)
+    return list(merged.values())
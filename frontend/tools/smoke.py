@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Concurrent smoke check for the Vite dev server and the backend API.
+
+Runs every probe from ``tools.probes`` over one pooled keep-alive client:
+
+    python -m tools.smoke
+    python -m tools.smoke --target frontend --concurrency 16
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from dataclasses import dataclass
+
+from .httpclient import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, HttpClient, ProtocolError
+from .probes import BACKEND_URL, FRONTEND_URL, SCRIPT_PROBES, build_manifest
+
+
+@dataclass
+class ProbeResult:
+    probe: object
+    status: int = 0
+    elapsed: float = 0.0
+    missing: tuple = ()
+    error: str = ""
+
+    @property
+    def ok(self):
+        return not self.error and not self.missing and self.status in self.probe.ok_status
+
+
+async def run_probe(client, probe, frontend_url, backend_url):
+    url = probe.url(frontend_url, backend_url)
+    try:
+        response = await client.get(url)
+    except asyncio.TimeoutError:
+        return ProbeResult(probe, error=f"timed out after {client.timeout:g}s")
+    except EOFError:  # asyncio.IncompleteReadError
+        return ProbeResult(probe, error="connection closed before a complete response")
+    except (OSError, ProtocolError) as exc:
+        return ProbeResult(probe, error=str(exc) or exc.__class__.__name__)
+    missing = ()
+    if probe.contains and response.status == 200:
+        text = response.text
+        missing = tuple(needle for needle in probe.contains if needle not in text)
+    return ProbeResult(probe, response.status, response.elapsed, missing)
+
+
+async def run_smoke(probes, frontend_url=FRONTEND_URL, backend_url=BACKEND_URL,
+                    concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+    async with HttpClient(concurrency=concurrency, timeout=timeout) as client:
+        results = await asyncio.gather(
+            *(run_probe(client, probe, frontend_url, backend_url) for probe in probes)
+        )
+        return results, client.connections_opened
+
+
+def print_report(results, elapsed, connections):
+    for result in results:
+        probe = result.probe
+        if result.error:
+            print(f"❌ {probe.label} ({probe.path}) - Error: {result.error}")
+        elif result.status not in probe.ok_status:
+            print(f"⚠️  {probe.label} ({probe.path}) - Status: {result.status}")
+        elif result.missing:
+            missing = ", ".join(repr(m) for m in result.missing)
+            print(f"⚠️  {probe.label} ({probe.path}) - missing {missing}")
+        else:
+            print(f"✅ {probe.label} ({result.elapsed * 1000:.0f} ms)")
+
+    failed = sum(not r.ok for r in results)
+    print(f"\n{len(results) - failed}/{len(results)} probes passed "
+          f"in {elapsed * 1000:.0f} ms over {connections} connection(s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frontend-url", default=FRONTEND_URL)
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--target", action="append", choices=("frontend", "backend"),
+                        help="Only run probes for this target (repeatable)")
+    parser.add_argument("--script", action="append", choices=sorted(SCRIPT_PROBES),
+                        help="Only run probes that came from this original script (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Maximum requests in flight (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="Per-request timeout in seconds (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    probes = build_manifest(scripts=args.script, targets=args.target)
+    print(f"🧪 Running {len(probes)} smoke probes (concurrency {args.concurrency})...\n")
+    started = time.perf_counter()
+    results, connections = asyncio.run(
+        run_smoke(probes, args.frontend_url, args.backend_url, args.concurrency, args.timeout)
+    )
+    print_report(results, time.perf_counter() - started, connections)
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
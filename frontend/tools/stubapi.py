@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""In-memory stand-in for the REST API, for benchmarks and offline checks.
+
+Every ``/api/<resource>/`` path behaves like a DRF list endpoint backed by a
+dict: ``GET`` returns a paged ``{"count", "next", "results"}`` body and
+``POST`` creates a row.  ``POST /api/<resource>/bulk/`` accepts
+``{"items": [...]}`` and answers ``{"results": [{"index", "id"} | {"index",
+"errors"}]}`` in request order, which is the contract ``bulkWrite`` in
+``src/services/bulkWrite.ts`` expects.
+
+Writes honour the ``Idempotency-Key`` header: replaying a key returns the
+stored response without creating anything, so retried chunks are safe.
+List responses carry an ``ETag`` and answer ``If-None-Match`` with 304.
+
+A few action routes answer the way the POS, payroll and report pages
+expect (``POST /api/pos/start-session/``, ``pos/make-sale/``,
+``pos/end-session/``, ``payrolls/process/``, ``payslips/generate/`` and
+``<kind>-reports/generate/``), so ``tools.loadgen`` can replay whole
+workflows.  ``--seed`` fills stores, products and employees.
+
+``/api/fiscal-receipts/`` (and its ``bulk/`` route) is a fake fiscal device:
+it signs one receipt at a time, taking ``--device-ms`` per call plus
+``--device-receipt-ms`` per receipt, answers with a ``fiscal_code`` and
+``qr_data``, and returns the first signature when an invoice number is
+submitted again.  ``POST /api/invoice-sequences/reserve/`` with
+``{"prefix", "size"}`` reserves a block of invoice numbers.
+
+``GET /api/events/?resources=a,b`` is a server-sent event stream of the
+``{"resource", "op", "id", "data"}`` deltas ``services/realtime.ts``
+consumes; every POST, PATCH and DELETE is published on it.  ``POST
+/api/events/ticket/`` issues the single-use ``ticket`` a stream URL may
+carry; an unknown, used or expired ticket is refused with 401.  Latency and
+failures can be injected to approximate a remote backend:
+
+    python -m tools.stubapi --port 8001 --latency-ms 40 --row-ms 2
+    python -m tools.stubapi --fail-rate 0.05      # 5% of requests answer 503
+"""
+
+import argparse
+import hashlib
+import json
+import queue
+import random
+import secrets
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+DEFAULT_PORT = 8001
+PAGE_SIZE = 100
+KEEPALIVE_SECONDS = 15
+STREAM_TICKET_SECONDS = 30
+# Rows the stand-in rejects, so failure reporting can be exercised
+REQUIRED_FIELDS = {"products": ("sku", "name")}
+REPORT_KINDS = ("payroll", "tax", "financial")
+FISCAL_RESOURCE = "fiscal-receipts"
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 0.0
+    row_ms: float = 0.0
+    fail_rate: float = 0.0
+    bulk: bool = True
+    # Fake fiscal device: fixed cost per call and per receipt signed
+    device_ms: float = 0.0
+    device_receipt_ms: float = 0.0
+
+
+@dataclass
+class StubState:
+    resources: dict = field(default_factory=dict)
+    idempotent: dict = field(default_factory=dict)
+    next_id: int = 1
+    requests: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # (resources or None for all, queue) per connected event stream
+    listeners: list = field(default_factory=list)
+    event_seq: int = 0
+    # The fake fiscal device signs one call at a time
+    device_lock: threading.Lock = field(default_factory=threading.Lock)
+    signed: dict = field(default_factory=dict)
+    sequences: dict = field(default_factory=dict)
+    # stream ticket -> expiry (time.monotonic())
+    tickets: dict = field(default_factory=dict)
+
+    def publish(self, resource, op, row_id, data=None):
+        event = {"resource": resource, "op": op, "id": row_id}
+        if data is not None:
+            event["data"] = data
+        with self.lock:
+            self.event_seq += 1
+            seq = self.event_seq
+            listeners = list(self.listeners)
+        for resources, inbox in listeners:
+            if resources is None or resource in resources:
+                inbox.put((seq, event))
+
+    def update(self, resource, row_id, changes):
+        with self.lock:
+            row = self.resources.get(resource, {}).get(row_id)
+            if row is None:
+                return None
+            row.update({k: v for k, v in changes.items() if k != "id"})
+            row = dict(row)
+        self.publish(resource, "upsert", row_id, row)
+        return row
+
+    def delete(self, resource, row_id):
+        with self.lock:
+            removed = self.resources.get(resource, {}).pop(row_id, None)
+        if removed is not None:
+            self.publish(resource, "delete", row_id)
+        return removed is not None
+
+    def open_session(self, body):
+        return self.create("sale-sessions", {"store": body.get("store"), "status": "OPEN",
+                                             "opening_balance": body.get("opening_balance", 0)})
+
+    def close_session(self, body):
+        with self.lock:
+            sessions = self.resources.get("sale-sessions", {}).values()
+            open_ids = [s["id"] for s in sessions if s["status"] == "OPEN"
+                        and (not body or s["id"] == body.get("session", s["id"]))]
+        if not open_ids:
+            return 400, {"detail": "No open session."}
+        return 200, self.update("sale-sessions", open_ids[-1], {"status": "CLOSED"})
+
+    def record_sale(self, body):
+        if not body.get("items"):
+            return 400, {"items": ["A sale needs at least one item."]}
+        for item in body["items"]:
+            product = self.resources.get("products", {}).get(item.get("product"))
+            if product is not None:
+                self.update("products", product["id"], {
+                    "quantity_in_stock": product.get("quantity_in_stock", 0) - item.get("quantity", 1),
+                })
+        return self.create("pos-sales", body)
+
+    def process_payroll(self, body):
+        employees = list(self.resources.get("employees", {}).values())
+        wanted = set(body.get("employees") or [e["id"] for e in employees])
+        period = body.get("period", "")
+        processed = 0
+        for employee in employees:
+            if employee["id"] in wanted:
+                salary = employee.get("basic_salary", 0)
+                self.create("payrolls", {"employee": employee["id"], "period": period,
+                                         "basic_salary": salary, "gross_pay": salary,
+                                         "net_pay": round(salary * 0.8, 2), "status": "PROCESSED"})
+                processed += 1
+        return 200, {"processed": processed, "period": period}
+
+    def sign_receipt(self, body):
+        """Fiscalise one receipt; an invoice number already signed returns its first signature."""
+        number = body.get("invoice_number")
+        if not number:
+            return 400, {"invoice_number": ["This field is required."]}
+        existing = self.signed.get(number)
+        if existing is not None:
+            return 200, existing
+        code = f"ZW{self.next_id:010d}"
+        status, row = self.create(FISCAL_RESOURCE, {**body, "fiscal_code": code,
+                                                    "qr_data": f"https://fdms.stub/verify/{code}"})
+        if status == 201:
+            self.signed[number] = row
+        return status, row
+
+    def reserve_sequence(self, body):
+        size = int(body.get("size") or 50)
+        if size < 1:
+            return 400, {"size": ["Must be at least 1."]}
+        prefix = body.get("prefix", "")
+        with self.lock:
+            start = self.sequences.get(prefix, 0) + 1
+            self.sequences[prefix] = start + size - 1
+        return 200, {"prefix": prefix, "start": start, "end": start + size - 1}
+
+    def issue_stream_ticket(self, body):
+        ticket = secrets.token_urlsafe(24)
+        with self.lock:
+            self.tickets[ticket] = time.monotonic() + STREAM_TICKET_SECONDS
+        return 200, {"ticket": ticket, "expires_in": STREAM_TICKET_SECONDS}
+
+    def redeem_stream_ticket(self, ticket):
+        with self.lock:
+            expires = self.tickets.pop(ticket, None)
+        return expires is not None and time.monotonic() < expires
+
+    def seed(self, stores=3, products=500, employees=50):
+        """Demo rows for the load generator and offline checks."""
+        for i in range(stores):
+            self.create("stores", {"name": f"Store {i + 1}", "code": f"S{i + 1:02d}"})
+        for i in range(products):
+            self.create("products", {
+                "sku": f"SKU-{i:05d}", "name": f"Product {i} {('tea', 'sugar', 'bread', 'soap', 'oil')[i % 5]}",
+                "unit_price": round(1 + (i % 200) * 0.45, 2), "quantity_in_stock": 1000, "is_active": True,
+            })
+        for i in range(employees):
+            self.create("employees", {"employee_number": f"EMP{i:04d}", "first_name": f"Employee{i}",
+                                      "last_name": "Demo", "basic_salary": 400 + (i % 20) * 75, "is_active": True})
+
+    def create(self, resource, row):
+        """Validate and store one row; returns ``(status, body)``."""
+        missing = [f for f in REQUIRED_FIELDS.get(resource, ()) if not row.get(f)]
+        if missing:
+            return 400, {name: ["This field is required."] for name in missing}
+        with self.lock:
+            row = {**row, "id": self.next_id}
+            self.next_id += 1
+            self.resources.setdefault(resource, {})[row["id"]] = row
+        self.publish(resource, "upsert", row["id"], row)
+        return 201, row
+
+
+def _action_cost(state, resource, action, body):
+    """Rows an action touches, for the ``--row-ms`` delay."""
+    if (resource, action) == ("payrolls", "process"):
+        return len(body.get("employees") or state.resources.get("employees", {}))
+    if (resource, action) == ("pos", "make-sale"):
+        return len(body.get("items") or ())
+    return 1
+
+
+def _creates(resource, **defaults):
+    """Action that stores the request body as a new ``resource`` row."""
+    return lambda state, body: state.create(resource, {**body, **defaults})
+
+
+# (resource, action) -> handler(state, body) returning (status, body)
+ACTIONS = {
+    ("pos", "start-session"): StubState.open_session,
+    ("pos", "end-session"): StubState.close_session,
+    ("pos", "make-sale"): StubState.record_sale,
+    ("payrolls", "process"): StubState.process_payroll,
+    ("invoice-sequences", "reserve"): StubState.reserve_sequence,
+    ("events", "ticket"): StubState.issue_stream_ticket,
+    ("payslips", "generate"): _creates("payslips", status="GENERATED"),
+    **{(f"{kind}-reports", "generate"): _creates(f"{kind}-reports", status="READY") for kind in REPORT_KINDS},
+}
+
+
+def make_handler(config, state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out as separate writes; without this Nagle adds ~40ms per response
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body, headers=None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Expose-Headers", "ETag")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _send_list(self, body):
+            etag = '"%s"' % hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest()[:16]
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self._send(200, body, {"ETag": etag})
+
+        def _stream_events(self, query):
+            requested = query.get("resources", [""])[0]
+            resources = set(filter(None, requested.split(","))) or None
+            ticket = query.get("ticket", [None])[0]
+            if ticket is not None and not state.redeem_stream_ticket(ticket):
+                return self._send(401, {"detail": "Invalid or expired stream ticket."})
+            inbox = queue.Queue()
+            entry = (resources, inbox)
+            with state.lock:
+                state.listeners.append(entry)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.close_connection = True
+            try:
+                self.wfile.write(b"retry: 2000\n\n")
+                self.wfile.flush()
+                while True:
+                    try:
+                        seq, event = inbox.get(timeout=KEEPALIVE_SECONDS)
+                        chunk = f"id: {seq}\ndata: {json.dumps(event)}\n\n"
+                    except queue.Empty:
+                        chunk = ": keep-alive\n\n"
+                    self.wfile.write(chunk.encode())
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                with state.lock:
+                    state.listeners.remove(entry)
+
+        def _route(self):
+            """``(resource, tail, query)`` for ``/api/<resource>/<tail>``, or None."""
+            parts = urlsplit(self.path)
+            segments = [s for s in parts.path.split("/") if s]
+            if len(segments) < 2 or segments[0] != "api":
+                return None
+            return segments[1], segments[2:], parse_qs(parts.query)
+
+        def _read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"null") if length else None
+
+        def _delay(self, rows=0):
+            seconds = (config.latency_ms + config.row_ms * rows) / 1000
+            if seconds:
+                time.sleep(seconds)
+
+        def _device_delay(self, receipts):
+            seconds = (config.device_ms + config.device_receipt_ms * receipts) / 1000
+            if seconds:
+                time.sleep(seconds)
+
+        def _injected_failure(self):
+            if config.fail_rate and random.random() < config.fail_rate:
+                self._send(503, {"detail": "Injected failure"})
+                return True
+            return False
+
+        def do_OPTIONS(self):
+            # CORS preflight, so a dev server on another port can use the stub
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, PATCH, DELETE, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type, Idempotency-Key, If-None-Match")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            route = self._route()
+            with state.lock:
+                state.requests += 1
+            if not route:
+                return self._send(404, {"detail": "Not found."})
+            resource, tail, query = route
+            if resource == "events" and not tail:
+                return self._stream_events(query)
+            self._delay()
+            if self._injected_failure():
+                return
+            rows = list(state.resources.get(resource, {}).values())
+            search = query.get("search", [""])[0].lower()
+            if search:
+                rows = [r for r in rows if search in str(r.get("name", "")).lower()
+                        or search in str(r.get("sku", "")).lower()]
+            if tail:
+                row = state.resources.get(resource, {}).get(int(tail[0])) if tail[0].isdigit() else None
+                return self._send(200, row) if row else self._send(404, {"detail": "Not found."})
+            size = int(query.get("page_size", [PAGE_SIZE])[0])
+            page = int(query.get("page", [1])[0])
+            start = (page - 1) * size
+            more = start + size < len(rows)
+            next_url = None
+            if more:
+                params = {k: v[0] for k, v in query.items()}
+                params["page"] = page + 1
+                next_url = f"/api/{resource}/?{urlencode(params)}"
+            self._send_list({"count": len(rows), "next": next_url, "results": rows[start:start + size]})
+
+        def _row_route(self):
+            """``(resource, id)`` for ``/api/<resource>/<id>/``, or None after answering 404."""
+            route = self._route()
+            with state.lock:
+                state.requests += 1
+            if not route or len(route[1]) != 1 or not route[1][0].isdigit():
+                self._send(404, {"detail": "Not found."})
+                return None
+            return route[0], int(route[1][0])
+
+        def do_PATCH(self):
+            target = self._row_route()
+            if not target:
+                return
+            self._delay(1)
+            if self._injected_failure():
+                return
+            row = state.update(*target, self._read_json() or {})
+            self._send(200, row) if row else self._send(404, {"detail": "Not found."})
+
+        def do_DELETE(self):
+            target = self._row_route()
+            if not target:
+                return
+            self._delay(1)
+            if self._injected_failure():
+                return
+            if state.delete(*target):
+                self.send_response(204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            else:
+                self._send(404, {"detail": "Not found."})
+
+        def do_POST(self):
+            route = self._route()
+            with state.lock:
+                state.requests += 1
+            if not route:
+                return self._send(404, {"detail": "Not found."})
+            resource, tail, _ = route
+            is_bulk = tail == ["bulk"]
+            action = ACTIONS.get((resource, tail[0])) if len(tail) == 1 and not is_bulk else None
+            if tail and not is_bulk and not action:
+                return self._send(405, {"detail": "Method not allowed."})
+            if is_bulk and not config.bulk:
+                return self._send(404, {"detail": "Not found."})
+
+            body = self._read_json()
+            items = (body or {}).get("items", []) if is_bulk else [body or {}]
+            self._delay(_action_cost(state, resource, tail[0], items[0]) if action else len(items))
+            if self._injected_failure():
+                return
+
+            key = self.headers.get("Idempotency-Key")
+            if key:
+                with state.lock:
+                    replay = state.idempotent.get((resource, key))
+                if replay:
+                    return self._send(replay[0], replay[1], {"Idempotent-Replayed": "true"})
+
+            if action:
+                status, response = action(state, items[0])
+            elif resource == FISCAL_RESOURCE:
+                with state.device_lock:
+                    self._device_delay(len(items))
+                    signed = [state.sign_receipt(item) for item in items]
+                if is_bulk:
+                    status, response = 200, {"results": [
+                        {"index": index, "id": row["id"], "fiscal_code": row["fiscal_code"], "qr_data": row["qr_data"]}
+                        if status < 400 else {"index": index, "errors": row}
+                        for index, (status, row) in enumerate(signed)
+                    ]}
+                else:
+                    status, response = signed[0]
+            elif is_bulk:
+                results = []
+                for index, item in enumerate(items):
+                    status, created = state.create(resource, item)
+                    results.append({"index": index, "id": created["id"]} if status == 201
+                                   else {"index": index, "errors": created})
+                status, response = 200, {"results": results}
+            else:
+                status, response = state.create(resource, items[0])
+
+            if key:
+                with state.lock:
+                    state.idempotent[(resource, key)] = (status, response)
+            self._send(status, response)
+
+    return Handler
+
+
+def start(port=DEFAULT_PORT, config=None, host="127.0.0.1"):
+    """Serve on a background thread; returns ``(server, state)``. Port 0 picks a free one."""
+    state = StubState()
+    server = ThreadingHTTPServer((host, port), make_handler(config or StubConfig(), state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added to every request")
+    parser.add_argument("--row-ms", type=float, default=0.0, help="Added per row written")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with 503 (default: %(default)s)")
+    parser.add_argument("--no-bulk", action="store_true", help="Answer 404 on bulk/ routes")
+    parser.add_argument("--device-ms", type=float, default=0.0, help="Fake fiscal device: time per call")
+    parser.add_argument("--device-receipt-ms", type=float, default=0.0,
+                        help="Fake fiscal device: time per receipt signed")
+    parser.add_argument("--seed", action="store_true", help="Start with demo stores, products and employees")
+    args = parser.parse_args(argv)
+
+    config = StubConfig(args.latency_ms, args.row_ms, args.fail_rate, not args.no_bulk,
+                        args.device_ms, args.device_receipt_ms)
+    server, state = start(args.port, config, args.host)
+    if args.seed:
+        state.seed()
+    print(f"🧪 Stub API listening on http://{args.host}:{server.server_address[1]}/api/  (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
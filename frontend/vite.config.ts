@@ -23,6 +23,8 @@ export default defineConfig({
     }
   },
   build: {
+    // dist/.vite/manifest.json is read by `python -m tools.budget`
+    manifest: true,
     rollupOptions: {
       external: []
     }
@@ -8,6 +8,11 @@ export default defineConfig({
     globals: true,
     environment: 'jsdom',
     setupFiles: ['./src/test/setup.ts'],
+    benchmark: {
+      // bench-results.json is what `python -m tools.benchcheck` compares with bench-baseline.json
+      reporters: ['default', 'json'],
+      outputFile: 'bench-results.json',
+    },
     coverage: {
       provider: 'v8',
       reporter: ['text', 'json', 'html'],